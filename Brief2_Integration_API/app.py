@@ -6,15 +6,22 @@ and serves the frontend web interface.
 """
 
 import logging
+import os
 from datetime import datetime
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template
 from flask_cors import CORS
 
+from src.config.settings import settings
 from src.utils.api_client import APIClient
 from src.services.weather_service import WeatherService
 from src.services.marine_service import MarineService
 from src.services.cyclone_detector import CycloneDetector
-from src.utils.error_handler import APIError, ValidationError
+from src.services.detection_pipeline import DetectionPipeline
+from src.services.grid_scanner import GridScanner, SWIO_BASIN, build_grid
+from src.services.prefetch_scheduler import PrefetchScheduler
+from src.utils.error_handler import APIError, CircuitOpenError, RateLimitError, ValidationError
+from src.utils.http_cache import detection_validator
+from src.utils.streaming import ndjson_line, sse_event
 
 # Create Flask app
 app = Flask(__name__)
@@ -32,6 +39,13 @@ api_client = APIClient()
 weather_service = WeatherService(api_client)
 marine_service = MarineService(api_client)
 cyclone_detector = CycloneDetector()
+detection_pipeline = DetectionPipeline(weather_service, marine_service, cyclone_detector)
+grid_scanner = GridScanner(weather_service, cyclone_detector)
+prefetch_scheduler = PrefetchScheduler(detection_pipeline)
+
+# Keep the watchlist warm (not in the parent process of the debug reloader)
+if settings.PREFETCH_ENABLED and (__name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'):
+    prefetch_scheduler.start()
 
 logger.info("Services initialized successfully")
 
@@ -47,14 +61,20 @@ def detect_cyclone():
     """
     Detect cyclone conditions for a given location.
     
-    GET: Returns API info and usage
+    GET without coordinates: Returns API info and usage
+    GET with coordinates: Performs a cacheable cyclone detection
     POST: Performs cyclone detection
     
+    GET takes the same parameters as query string arguments and answers
+    with a strong ETag and a Cache-Control max-age lasting until the next
+    model run, or 304 Not Modified when If-None-Match still matches.
+    
     Expected JSON body for POST:
     {
         "latitude": float,
         "longitude": float,
-        "location_name": string (optional)
+        "location_name": string (optional),
+        "horizon": bool (optional, score every forecast day)
     }
     
     Returns:
@@ -72,17 +92,22 @@ def detect_cyclone():
     }
     """
     
-    # Handle GET request - return API info
-    if request.method == 'GET':
+    cacheable = request.method == 'GET'
+    
+    # Handle GET request without coordinates - return API info
+    if cacheable and 'latitude' not in request.args and 'longitude' not in request.args:
         return jsonify({
             "message": "Cyclone Tracker API",
             "status": "operational",
             "endpoint": "/api/detect",
+            "batch_endpoint": "/api/detect/batch",
+            "stream_endpoints": ["/api/detect/batch/stream", "/api/scan/stream"],
             "method": "POST",
+            "cacheable_method": "GET",
             "usage": {
                 "description": "Détecte les conditions cycloniques pour une localisation donnée",
                 "required_params": ["latitude", "longitude"],
-                "optional_params": ["location_name"],
+                "optional_params": ["location_name", "analysis_date", "horizon"],
                 "example": {
                     "latitude": -21.1151,
                     "longitude": 55.5364,
@@ -92,10 +117,10 @@ def detect_cyclone():
             "frontend_url": "http://127.0.0.1:5000/"
         })
     
-    # Handle POST request - perform detection
+    # Perform detection
     try:
         # Get request data
-        data = request.get_json()
+        data = request.args.to_dict() if cacheable else request.get_json()
         
         if not data:
             return jsonify({
@@ -108,6 +133,7 @@ def detect_cyclone():
         longitude = data.get('longitude')
         location_name = data.get('location_name', f"{latitude}, {longitude}")
         analysis_date = data.get('analysis_date')  # New parameter for historical analysis
+        horizon = _parse_flag(data.get('horizon', False))  # Score every forecast day
         
         # Validate parameters
         if latitude is None or longitude is None:
@@ -139,69 +165,58 @@ def detect_cyclone():
                     "error": "Invalid date format. Use YYYY-MM-DD format."
                 }), 400
         
+        validator = None
+        if cacheable:
+            validator = detection_validator(
+                latitude,
+                longitude,
+                _detector_thresholds(),
+                analysis_date=analysis_date if historical_analysis else None,
+                horizon=horizon,
+                location_name=location_name,
+                weather_resolution=weather_service.snap_resolution,
+                marine_resolution=marine_service.snap_resolution
+            )
+            if request.if_none_match.contains_weak(validator.etag):
+                return _cache_headers(Response(status=304), validator)
+        
         logger.info(f"Analyzing location: {location_name} ({latitude}, {longitude})")
         if historical_analysis:
             logger.info(f"Historical analysis for date: {analysis_date}")
         
-        # Get weather data (with date if historical)
-        if historical_analysis:
-            # Historical data with specific date
-            weather_data = weather_service.get_forecast(
-                latitude=latitude,
-                longitude=longitude,
-                start_date=analysis_date,
-                end_date=analysis_date
-            )
-        else:
-            weather_data = weather_service.get_forecast(
-                latitude=latitude,
-                longitude=longitude,
-                forecast_days=7
-            )
-        
-        # Get marine data (optional)
-        marine_data = None
-        try:
-            if historical_analysis:
-                # Historical marine data with specific date
-                marine_data = marine_service.get_marine_forecast(
-                    latitude=latitude,
-                    longitude=longitude,
-                    start_date=analysis_date,
-                    end_date=analysis_date
-                )
-            else:
-                marine_data = marine_service.get_marine_forecast(
-                    latitude=latitude,
-                    longitude=longitude,
-                    forecast_days=7
-                )
-        except Exception as e:
-            logger.warning(f"Could not fetch marine data: {e}")
-        
-        # Detect cyclone
-        detection_result = cyclone_detector.detect(
-            weather_data=weather_data,
-            marine_data=marine_data
+        # Fetch weather and marine data concurrently, then detect
+        detection_result = detection_pipeline.detect_location(
+            latitude=latitude,
+            longitude=longitude,
+            forecast_days=7,
+            analysis_date=analysis_date if historical_analysis else None,
+            horizon=horizon
         )
         
-        # Add analysis type and date to result
-        if historical_analysis:
-            detection_result['details']['analysis_type'] = 'historical'
-            detection_result['details']['requested_date'] = analysis_date
-        else:
-            detection_result['details']['analysis_type'] = 'real_time'
-        
-        detection_result['details']['analysis_date'] = analysis_date if analysis_date else datetime.now().isoformat()
+        # Add analysis type and date to result (the model run time for
+        # cacheable responses, so the body only changes with the run)
+        _annotate_analysis(
+            detection_result,
+            analysis_date if historical_analysis else None,
+            validator.model_run_iso if validator else None
+        )
         
         logger.info(f"Detection complete: {detection_result['category']}")
         
         # Return result
-        return jsonify({
+        response = jsonify({
             "success": True,
             "location_name": location_name,
             "data": detection_result
         })
+        if validator is not None:
+            details = detection_result['details']
+            if details.get('stale_data') or not details.get('marine_data_available'):
+                # Fallback or weather-only data must not be cached as the current run
+                response.cache_control.no_store = True
+            else:
+                _cache_headers(response, validator)
+        return response
     
     except ValidationError as e:
         logger.error(f"Validation error: {e}")
@@ -210,6 +225,23 @@ def detect_cyclone():
             "error": f"Validation error: {str(e)}"
         }), 400
     
+    except RateLimitError as e:
+        logger.warning(f"Rate limited: {e}")
+        retry_after = int(e.retry_after or 60)
+        return jsonify({
+            "success": False,
+            "error": f"Rate limit exceeded: {str(e)}"
+        }), 429, {"Retry-After": str(retry_after)}
+    
+    except CircuitOpenError as e:
+        # Upstream down and no last-known-good data to fall back on
+        logger.warning(f"Upstream unavailable: {e}")
+        retry_after = max(1, int(e.retry_after or 0))
+        return jsonify({
+            "success": False,
+            "error": f"Weather service temporarily unavailable: {str(e)}"
+        }), 503, {"Retry-After": str(retry_after)}
+    
     except APIError as e:
         logger.error(f"API error: {e}")
         return jsonify({
@@ -225,13 +257,510 @@ def detect_cyclone():
         }), 500
 
 
+@app.route('/api/detect/batch', methods=['POST'])
+def detect_cyclone_batch():
+    """
+    Detect cyclone conditions for many locations in one request.
+    
+    Points sharing an analysis date are fetched with batched
+    multi-coordinate upstream requests and all points are scored in one
+    vectorized pass. An invalid or failed point does not fail the batch:
+    it gets its own error entry.
+    
+    Expected JSON body:
+    {
+        "points": [
+            {
+                "latitude": float,
+                "longitude": float,
+                "location_name": string (optional),
+                "analysis_date": string (optional, YYYY-MM-DD)
+            },
+            ...
+        ],
+        "analysis_date": string (optional, default for every point),
+        "horizon": bool (optional, score every forecast day)
+    }
+    
+    Returns:
+    {
+        "success": bool,
+        "count": int,
+        "succeeded": int,
+        "failed": int,
+        "results": [
+            {"index": int, "success": true, "location_name": string, "data": {...}},
+            {"index": int, "success": false, "location_name": string, "error": string, "status": int},
+            ...
+        ],
+        "error": string (if the whole request is invalid)
+    }
+    """
+    try:
+        data = request.get_json(silent=True)
+        
+        if not data:
+            return jsonify({
+                "success": False,
+                "error": "No JSON data provided"
+            }), 400
+        
+        try:
+            results, valid = _parse_batch(data, settings.DETECTION_BATCH_MAX_POINTS)
+        except ValueError as e:
+            return jsonify({
+                "success": False,
+                "error": str(e)
+            }), 400
+        
+        horizon = _parse_flag(data.get('horizon', False))
+        
+        logger.info(f"Batch analysis: {len(valid)} valid points out of {len(results)}")
+        
+        detections = []
+        if valid:
+            detections = detection_pipeline.detect_many(
+                [(point["latitude"], point["longitude"]) for _, point in valid],
+                forecast_days=7,
+                horizon=horizon,
+                analysis_dates=[point["analysis_date"] for _, point in valid]
+            )
+        
+        for (index, point), detection in zip(valid, detections):
+            results[index] = _batch_entry(index, point, detection)
+        
+        succeeded = sum(1 for result in results if result["success"])
+        logger.info(f"Batch detection complete: {succeeded}/{len(results)} succeeded")
+        
+        return jsonify({
+            "success": True,
+            "count": len(results),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": results
+        })
+    
+    except ValidationError as e:
+        logger.error(f"Validation error: {e}")
+        return jsonify({
+            "success": False,
+            "error": f"Validation error: {str(e)}"
+        }), 400
+    
+    except Exception as e:
+        logger.exception(f"Unexpected error: {e}")
+        return jsonify({
+            "success": False,
+            "error": f"Internal server error: {str(e)}"
+        }), 500
+
+
+@app.route('/api/detect/batch/stream', methods=['POST'])
+def detect_cyclone_batch_stream():
+    """
+    Stream batch detection results as each point is scored.
+    
+    Same request body as /api/detect/batch. Points are fetched and scored
+    in chunks, at most DETECTION_STREAM_MAX_IN_FLIGHT chunks ahead of the
+    client, and every point is sent as soon as its chunk is done (in
+    completion order, invalid points first). Disconnecting cancels the
+    chunks not fetched yet.
+    
+    Formats (?format= or Accept header):
+    - ndjson (default, application/x-ndjson): one result entry per line,
+      then {"done": true, "count": int, "succeeded": int, "failed": int}
+    - sse (text/event-stream): "result" events with the entry as data
+      and the point index as id, then a "done" event with the summary
+    
+    Result entries have the same format as /api/detect/batch results.
+    """
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({
+            "success": False,
+            "error": "No JSON data provided"
+        }), 400
+    
+    try:
+        results, valid = _parse_batch(data, settings.DETECTION_STREAM_MAX_POINTS)
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+    
+    detections = detection_pipeline.iter_detect_many(
+        [(point["latitude"], point["longitude"]) for _, point in valid],
+        forecast_days=7,
+        horizon=_parse_flag(data.get('horizon', False)),
+        analysis_dates=[point["analysis_date"] for _, point in valid]
+    )
+    sse = _stream_format() == "sse"
+    logger.info(f"Streaming batch analysis: {len(valid)} valid points out of {len(results)}")
+    
+    def generate():
+        succeeded = 0
+        try:
+            for entry in results:
+                if entry is not None:
+                    yield sse_event(entry, "result", entry["index"]) if sse else ndjson_line(entry)
+            
+            for position, detection in detections:
+                index, point = valid[position]
+                entry = _batch_entry(index, point, detection)
+                succeeded += entry["success"]
+                yield sse_event(entry, "result", index) if sse else ndjson_line(entry)
+            
+            summary = {
+                "done": True,
+                "count": len(results),
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded
+            }
+            logger.info(f"Streaming batch complete: {succeeded}/{len(results)} succeeded")
+            yield sse_event(summary, "done") if sse else ndjson_line(summary)
+        finally:
+            # Client gone or stream done: cancel the chunks not fetched yet
+            detections.close()
+    
+    return _stream_response(generate(), sse)
+
+
+@app.route('/api/scan/stream', methods=['GET'])
+def scan_stream():
+    """
+    Stream a basin scan cell by cell.
+    
+    Query parameters (all optional):
+        lat_min, lat_max, lon_min, lon_max: Bounding box (default: SWIO basin)
+        resolution: Cell size in degrees (default: GRID_RESOLUTION)
+        days: Number of forecast days (1-16, default: 7)
+        format: ndjson (default) or sse
+    
+    Cells are sent as soon as their batch is scored (see
+    GridScanner.iter_scan for the cell format), at most
+    GRID_MAX_CONCURRENCY batches ahead of the client, then a summary
+    {"done": true, "count": int, "scored": int, "land": int, "missing": int}.
+    With sse, cells are "cell" events and the summary a "done" event.
+    Disconnecting cancels the batches not fetched yet.
+    """
+    try:
+        bbox = tuple(
+            float(request.args.get(name, default))
+            for name, default in zip(("lat_min", "lat_max", "lon_min", "lon_max"), SWIO_BASIN)
+        )
+        resolution = float(request.args.get('resolution', settings.GRID_RESOLUTION))
+        forecast_days = int(request.args.get('days', 7))
+        if not 1 <= forecast_days <= 16:
+            raise ValidationError(f"days must be between 1 and 16, got: {forecast_days}")
+        latitudes, longitudes = build_grid(bbox, resolution)
+    except (ValueError, TypeError):
+        return jsonify({
+            "success": False,
+            "error": "Invalid bounding box, resolution or days"
+        }), 400
+    except ValidationError as e:
+        return jsonify({
+            "success": False,
+            "error": f"Validation error: {str(e)}"
+        }), 400
+    
+    count = len(latitudes) * len(longitudes)
+    if count > settings.DETECTION_STREAM_MAX_POINTS:
+        return jsonify({
+            "success": False,
+            "error": f"Too many cells: {count} (maximum: {settings.DETECTION_STREAM_MAX_POINTS})"
+        }), 400
+    
+    cells = grid_scanner.iter_scan(bbox, resolution, forecast_days)
+    sse = _stream_format() == "sse"
+    logger.info(f"Streaming scan of {count} cells at {resolution}°")
+    
+    def generate():
+        totals = {"count": 0, "scored": 0, "land": 0, "missing": 0}
+        try:
+            for cell in cells:
+                totals["count"] += 1
+                if cell["land"]:
+                    totals["land"] += 1
+                elif cell["missing"]:
+                    totals["missing"] += 1
+                else:
+                    totals["scored"] += 1
+                yield sse_event(cell, "cell", totals["count"] - 1) if sse else ndjson_line(cell)
+            
+            logger.info(f"Streaming scan complete: {totals['scored']}/{totals['count']} cells scored")
+            yield sse_event({"done": True, **totals}, "done") if sse else ndjson_line({"done": True, **totals})
+        finally:
+            # Client gone or stream done: cancel the batches not fetched yet
+            cells.close()
+    
+    return _stream_response(generate(), sse)
+
+
+def _stream_format():
+    """Pick the stream format of the current request: "sse" or "ndjson"."""
+    requested = request.args.get('format')
+    if requested:
+        return "sse" if requested.lower() == "sse" else "ndjson"
+    return "sse" if "text/event-stream" in request.headers.get('Accept', '') else "ndjson"
+
+
+def _stream_response(stream, sse):
+    """
+    Wrap a generator of framed records in an unbuffered streaming response.
+    
+    Args:
+        stream: Generator of NDJSON lines or SSE events
+        sse: True for Server-Sent Events, False for NDJSON
+    
+    Returns:
+        Flask Response
+    """
+    return Response(
+        stream,
+        mimetype="text/event-stream" if sse else "application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Disable proxy buffering (nginx)
+        }
+    )
+
+
+def _parse_batch(data, max_points):
+    """
+    Validate the points of a batch request.
+    
+    Args:
+        data: Request body
+        max_points: Maximum number of points
+    
+    Returns:
+        Tuple of (entries aligned with the points, holding an error entry
+        for invalid points and None for valid ones, list of (index, parsed
+        point) for valid points)
+    
+    Raises:
+        ValueError: If the point list is missing, empty or too long
+    """
+    points = data.get('points')
+    if not isinstance(points, list) or not points:
+        raise ValueError("Missing required parameter: points (non-empty list)")
+    
+    if len(points) > max_points:
+        raise ValueError(f"Too many points: {len(points)} (maximum: {max_points})")
+    
+    default_date = data.get('analysis_date')
+    
+    # Invalid points get their error entry and are not fetched
+    results = [None] * len(points)
+    valid = []
+    for index, point in enumerate(points):
+        try:
+            valid.append((index, _parse_point(point, default_date)))
+        except ValidationError as e:
+            results[index] = {
+                "index": index,
+                "success": False,
+                "location_name": _point_name(point),
+                "error": f"Validation error: {str(e)}",
+                "status": 400
+            }
+    
+    return results, valid
+
+
+def _batch_entry(index, point, detection):
+    """
+    Build the batch result entry of one point.
+    
+    Args:
+        index: Index of the point in the request
+        point: Parsed point (see _parse_point)
+        detection: Detection result or the exception raised for the point
+    
+    Returns:
+        Success entry with the detection data, or error entry
+    """
+    if isinstance(detection, Exception):
+        return {
+            "index": index,
+            "success": False,
+            "location_name": point["location_name"],
+            **_point_error(detection)
+        }
+    
+    _annotate_analysis(detection, point["analysis_date"])
+    return {
+        "index": index,
+        "success": True,
+        "location_name": point["location_name"],
+        "data": detection
+    }
+
+
+def _parse_point(point, default_date):
+    """
+    Validate one point of a batch request.
+    
+    Args:
+        point: Point object from the request body
+        default_date: Request-level analysis date (None for real time)
+    
+    Returns:
+        Dictionary with latitude, longitude, location_name and analysis_date
+    
+    Raises:
+        ValidationError: If the point is malformed or out of range
+    """
+    if not isinstance(point, dict):
+        raise ValidationError("Point must be an object with latitude and longitude")
+    
+    latitude = point.get('latitude')
+    longitude = point.get('longitude')
+    if latitude is None or longitude is None:
+        raise ValidationError("Missing required parameters: latitude and longitude")
+    
+    try:
+        latitude = float(latitude)
+        longitude = float(longitude)
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid latitude or longitude format")
+    
+    if not -90 <= latitude <= 90:
+        raise ValidationError(f"Latitude must be between -90 and 90, got: {latitude}")
+    if not -180 <= longitude <= 180:
+        raise ValidationError(f"Longitude must be between -180 and 180, got: {longitude}")
+    
+    analysis_date = point.get('analysis_date', default_date) or None
+    if analysis_date:
+        try:
+            datetime.fromisoformat(analysis_date)
+        except (ValueError, TypeError):
+            raise ValidationError("Invalid date format. Use YYYY-MM-DD format.")
+    
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "location_name": point.get('location_name', f"{latitude}, {longitude}"),
+        "analysis_date": analysis_date
+    }
+
+
+def _point_name(point):
+    """Location name of a (possibly invalid) batch point."""
+    if isinstance(point, dict):
+        return point.get('location_name', f"{point.get('latitude')}, {point.get('longitude')}")
+    return None
+
+
+def _point_error(error):
+    """
+    Describe a per-point failure with the status /api/detect would return.
+    
+    Args:
+        error: Exception raised for the point
+    
+    Returns:
+        Dictionary with error message, HTTP status and, for rate limits and
+        open circuits, retry_after in seconds
+    """
+    if isinstance(error, ValidationError):
+        return {"error": f"Validation error: {str(error)}", "status": 400}
+    if isinstance(error, RateLimitError):
+        return {
+            "error": f"Rate limit exceeded: {str(error)}",
+            "status": 429,
+            "retry_after": int(error.retry_after or 60)
+        }
+    if isinstance(error, CircuitOpenError):
+        return {
+            "error": f"Weather service temporarily unavailable: {str(error)}",
+            "status": 503,
+            "retry_after": max(1, int(error.retry_after or 0))
+        }
+    if isinstance(error, APIError):
+        return {"error": f"API error: {str(error)}", "status": 502}
+    return {"error": f"Internal server error: {str(error)}", "status": 500}
+
+
+def _annotate_analysis(detection_result, analysis_date, analyzed_at=None):
+    """
+    Add the analysis type and date to a detection result.
+    
+    Args:
+        detection_result: Result from DetectionPipeline
+        analysis_date: Historical date, or None for real-time analysis
+        analyzed_at: Date reported for real-time analysis (default: now)
+    """
+    if analysis_date:
+        detection_result['details']['analysis_type'] = 'historical'
+        detection_result['details']['requested_date'] = analysis_date
+    else:
+        detection_result['details']['analysis_type'] = 'real_time'
+    
+    detection_result['details']['analysis_date'] = analysis_date or analyzed_at or datetime.now().isoformat()
+
+
+def _parse_flag(value):
+    """Read a boolean from JSON or a query string ("true", "1", "yes")."""
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
+
+
+def _detector_thresholds():
+    """Thresholds the detection results depend on."""
+    return {
+        "sst": cyclone_detector.sst_threshold,
+        "pressure": cyclone_detector.pressure_threshold,
+        "wind": cyclone_detector.wind_threshold
+    }
+
+
+def _cache_headers(response, validator):
+    """
+    Set the validator and freshness headers of a cacheable detection response.
+    
+    Args:
+        response: Flask response (200 or 304)
+        validator: DetectionValidator of the request
+    
+    Returns:
+        The response
+    """
+    response.set_etag(validator.etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = validator.max_age
+    return response
+
+
+@app.route('/api/prefetch/status', methods=['GET'])
+def prefetch_status():
+    """Watchlist prefetch status: schedule and outcome of the last refresh."""
+    return jsonify({
+        "enabled": settings.PREFETCH_ENABLED,
+        **prefetch_scheduler.status()
+    })
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
+    health = {
         "status": "healthy",
         "service": "Cyclone Tracker API"
-    })
+    }
+    
+    if api_client.cache is not None:
+        health["cache"] = api_client.cache.stats()
+    
+    health["circuits"] = api_client.circuit_breakers.snapshot()
+    health["latency"] = api_client.latency_tracker.snapshot()
+    if api_client.hedging:
+        health["hedging"] = api_client.hedge_budget.stats()
+    
+    return jsonify(health)
 
 
 if __name__ == '__main__':
@@ -241,6 +770,9 @@ if __name__ == '__main__':
     print("\nServer starting...")
     print("Frontend: http://127.0.0.1:5000")
     print("API endpoint: http://127.0.0.1:5000/api/detect")
+    print("Batch endpoint: http://127.0.0.1:5000/api/detect/batch")
+    print("Streaming: http://127.0.0.1:5000/api/detect/batch/stream, http://127.0.0.1:5000/api/scan/stream")
+    print("Prefetch status: http://127.0.0.1:5000/api/prefetch/status")
     print("\nPress CTRL+C to stop the server")
     print("=" * 60 + "\n")
     
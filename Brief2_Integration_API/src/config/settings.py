@@ -7,7 +7,7 @@ and provides a centralized Settings class with validation.
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load .env file
@@ -40,11 +40,39 @@ class Settings:
             "https://marine-api.open-meteo.com/v1/marine"
         )
         
+        # Upstream model grid steps for coordinate snapping (0 disables)
+        self.SNAP_RESOLUTION_WEATHER = float(os.getenv("SNAP_RESOLUTION_WEATHER", "0.1"))  # degrees, ~11 km
+        self.SNAP_RESOLUTION_MARINE = float(os.getenv("SNAP_RESOLUTION_MARINE", "0.1"))  # degrees
+        
         # Network Settings
         self.TIMEOUT = int(os.getenv("TIMEOUT", "10"))
         self.RETRY_COUNT = int(os.getenv("RETRY_COUNT", "3"))
         self.RETRY_DELAY = int(os.getenv("RETRY_DELAY", "2"))
         self.MAX_RETRY_DELAY = int(os.getenv("MAX_RETRY_DELAY", "60"))
+        self.MIN_ATTEMPT_TIMEOUT = float(os.getenv("MIN_ATTEMPT_TIMEOUT", "0.2"))
+        self.ASYNC_MAX_CONNECTIONS = int(os.getenv("ASYNC_MAX_CONNECTIONS", "100"))
+        self.RATE_LIMIT_PER_SECOND = float(os.getenv("RATE_LIMIT_PER_SECOND", "0"))
+        self.RATE_LIMIT_BURST = float(os.getenv("RATE_LIMIT_BURST", "0"))
+        self.RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "30"))
+        self.MAX_URL_LENGTH = int(os.getenv("MAX_URL_LENGTH", "4000"))
+        self.MAX_LOCATIONS_PER_REQUEST = int(os.getenv("MAX_LOCATIONS_PER_REQUEST", "100"))
+        self.JSON_DECODER = os.getenv("JSON_DECODER", "auto")  # auto, orjson or json
+        
+        # Resilience (circuit breaker and stale fallback)
+        self.CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+        self.CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv("CIRCUIT_RECOVERY_TIMEOUT", "30"))
+        self.STALE_MAX_AGE = int(os.getenv("STALE_MAX_AGE", "86400"))  # 24 hours
+        self.STALE_MAX_ENTRIES = int(os.getenv("STALE_MAX_ENTRIES", "1024"))
+        
+        # Hedged requests (tail latency)
+        self.HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "false").lower() == "true"
+        self.HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "95"))
+        self.HEDGE_MIN_DELAY = float(os.getenv("HEDGE_MIN_DELAY", "0.05"))
+        self.HEDGE_BUDGET_RATIO = float(os.getenv("HEDGE_BUDGET_RATIO", "0.05"))
+        self.HEDGE_BUDGET_BURST = float(os.getenv("HEDGE_BUDGET_BURST", "10"))
+        self.HEDGE_MAX_WORKERS = int(os.getenv("HEDGE_MAX_WORKERS", "16"))
+        self.LATENCY_WINDOW = int(os.getenv("LATENCY_WINDOW", "200"))
+        self.HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
         
         # Cache Configuration
         self.REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -52,6 +80,61 @@ class Settings:
         self.REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", "")
         self.CACHE_TTL = int(os.getenv("CACHE_TTL", "21600"))  # 6 hours
         self.CACHE_ENABLED = os.getenv("CACHE_ENABLED", "false").lower() == "true"
+        self.CACHE_BACKEND = os.getenv("CACHE_BACKEND", "redis").lower()  # redis, sqlite or none
+        self.CACHE_DISK_PATH = os.getenv("CACHE_DISK_PATH", "data/cache.sqlite3")
+        self.CACHE_DISK_MAX_BYTES = int(os.getenv("CACHE_DISK_MAX_BYTES", "268435456"))  # 256MB
+        self.CACHE_DISK_BUSY_TIMEOUT = float(os.getenv("CACHE_DISK_BUSY_TIMEOUT", "5"))
+        self.CACHE_TTL_WEATHER = int(os.getenv("CACHE_TTL_WEATHER", str(self.CACHE_TTL)))
+        self.CACHE_TTL_MARINE = int(os.getenv("CACHE_TTL_MARINE", str(self.CACHE_TTL)))
+        self.CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "1024"))
+        self.CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", "cyclone-tracker:")
+        self.CACHE_TTL_HISTORICAL = int(os.getenv("CACHE_TTL_HISTORICAL", "2592000"))  # 30 days
+        
+        # Model run schedules (UTC run hours, hours until published; empty = flat TTL)
+        self.MODEL_RUN_HOURS_WEATHER = self._parse_hours(os.getenv("MODEL_RUN_HOURS_WEATHER", "0,6,12,18"))
+        self.MODEL_RUN_DELAY_WEATHER = float(os.getenv("MODEL_RUN_DELAY_WEATHER", "4"))
+        self.MODEL_RUN_HOURS_MARINE = self._parse_hours(os.getenv("MODEL_RUN_HOURS_MARINE", "0,12"))
+        self.MODEL_RUN_DELAY_MARINE = float(os.getenv("MODEL_RUN_DELAY_MARINE", "7"))
+        self.REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.5"))
+        self.REDIS_RETRY_INTERVAL = int(os.getenv("REDIS_RETRY_INTERVAL", "30"))
+        
+        # Negative cache (failed upstream lookups, per error class)
+        self.NEGATIVE_CACHE_ENABLED = os.getenv("NEGATIVE_CACHE_ENABLED", "true").lower() == "true"
+        self.NEGATIVE_CACHE_TTL_NOT_FOUND = float(os.getenv("NEGATIVE_CACHE_TTL_NOT_FOUND", "3600"))  # 1 hour
+        self.NEGATIVE_CACHE_TTL_BAD_REQUEST = float(os.getenv("NEGATIVE_CACHE_TTL_BAD_REQUEST", "3600"))
+        self.NEGATIVE_CACHE_TTL_UPSTREAM = float(os.getenv("NEGATIVE_CACHE_TTL_UPSTREAM", "30"))
+        self.NEGATIVE_CACHE_MAX_ENTRIES = int(os.getenv("NEGATIVE_CACHE_MAX_ENTRIES", "4096"))
+        
+        # Detection Pipeline
+        self.DETECTION_DEADLINE = float(os.getenv("DETECTION_DEADLINE", "15"))
+        self.DETECTION_MAX_WORKERS = int(os.getenv("DETECTION_MAX_WORKERS", "16"))
+        self.DETECTION_BATCH_MAX_POINTS = int(os.getenv("DETECTION_BATCH_MAX_POINTS", "500"))
+        self.DETECTION_STREAM_MAX_POINTS = int(os.getenv("DETECTION_STREAM_MAX_POINTS", "10000"))
+        self.DETECTION_STREAM_MAX_IN_FLIGHT = int(os.getenv("DETECTION_STREAM_MAX_IN_FLIGHT", "4"))  # chunks
+        
+        # Watchlist prefetch (refreshed into the cache after each model run)
+        self.PREFETCH_ENABLED = os.getenv("PREFETCH_ENABLED", "false").lower() == "true"
+        self.PREFETCH_WATCHLIST = self._parse_watchlist(os.getenv(
+            "PREFETCH_WATCHLIST",
+            "La Réunion:-21.1151:55.5364;Maurice (Île):-20.1609:57.5012;"
+            "Madagascar (Antananarivo):-18.8792:47.5079;Comores (Moroni):-11.6986:43.2551"
+        ))
+        self.PREFETCH_DELAY = float(os.getenv("PREFETCH_DELAY", "120"))  # seconds after publication
+        self.PREFETCH_SPREAD = float(os.getenv("PREFETCH_SPREAD", "300"))  # seconds to spread calls over
+        
+        # Grid Scanner
+        self.GRID_RESOLUTION = float(os.getenv("GRID_RESOLUTION", "1.0"))  # degrees
+        self.GRID_MAX_CONCURRENCY = int(os.getenv("GRID_MAX_CONCURRENCY", "4"))
+        self.GRID_COARSE_RESOLUTION = float(os.getenv("GRID_COARSE_RESOLUTION", "2.0"))  # degrees
+        self.GRID_MIN_RESOLUTION = float(os.getenv("GRID_MIN_RESOLUTION", "0.25"))  # degrees
+        self.GRID_REFINE_SEVERITY = float(os.getenv("GRID_REFINE_SEVERITY", "0.3"))
+        self.GRID_REFINE_PRESSURE_GRADIENT = float(os.getenv("GRID_REFINE_PRESSURE_GRADIENT", "2.0"))  # hPa/degree
+        
+        # Land/sea mask (empty path disables inland skipping)
+        self.LAND_MASK_PATH = os.getenv("LAND_MASK_PATH", "data/land_mask.npy")
+        
+        # Monthly SST climatology (fallback when the marine API has no SST; empty path disables)
+        self.SST_CLIMATOLOGY_PATH = os.getenv("SST_CLIMATOLOGY_PATH", "data/sst_climatology.npy")
         
         # Cyclone Detection Thresholds
         self.CYCLONE_SST_THRESHOLD = float(os.getenv("CYCLONE_SST_THRESHOLD", "26.5"))
@@ -91,6 +174,10 @@ class Settings:
         if not self.MARINE_API_URL.startswith("https://"):
             raise ConfigurationError(f"MARINE_API_URL must start with https://, got: {self.MARINE_API_URL}")
         
+        for name in ("SNAP_RESOLUTION_WEATHER", "SNAP_RESOLUTION_MARINE"):
+            if not 0 <= getattr(self, name) <= 10:
+                raise ConfigurationError(f"{name} must be between 0 and 10, got: {getattr(self, name)}")
+        
         # Validate network settings
         if self.TIMEOUT <= 0:
             raise ConfigurationError(f"TIMEOUT must be > 0, got: {self.TIMEOUT}")
@@ -98,6 +185,132 @@ class Settings:
         if self.RETRY_COUNT < 0:
             raise ConfigurationError(f"RETRY_COUNT must be >= 0, got: {self.RETRY_COUNT}")
         
+        if self.MIN_ATTEMPT_TIMEOUT <= 0:
+            raise ConfigurationError(f"MIN_ATTEMPT_TIMEOUT must be > 0, got: {self.MIN_ATTEMPT_TIMEOUT}")
+        
+        if self.ASYNC_MAX_CONNECTIONS <= 0:
+            raise ConfigurationError(f"ASYNC_MAX_CONNECTIONS must be > 0, got: {self.ASYNC_MAX_CONNECTIONS}")
+        
+        if self.RATE_LIMIT_PER_SECOND < 0:
+            raise ConfigurationError(f"RATE_LIMIT_PER_SECOND must be >= 0, got: {self.RATE_LIMIT_PER_SECOND}")
+        
+        if self.MAX_LOCATIONS_PER_REQUEST <= 0:
+            raise ConfigurationError(f"MAX_LOCATIONS_PER_REQUEST must be > 0, got: {self.MAX_LOCATIONS_PER_REQUEST}")
+        
+        if self.JSON_DECODER not in ("auto", "orjson", "json"):
+            raise ConfigurationError(f"JSON_DECODER must be auto, orjson or json, got: {self.JSON_DECODER}")
+        
+        # Validate resilience settings
+        if self.CIRCUIT_FAILURE_THRESHOLD <= 0:
+            raise ConfigurationError(f"CIRCUIT_FAILURE_THRESHOLD must be > 0, got: {self.CIRCUIT_FAILURE_THRESHOLD}")
+        
+        if self.CIRCUIT_RECOVERY_TIMEOUT <= 0:
+            raise ConfigurationError(f"CIRCUIT_RECOVERY_TIMEOUT must be > 0, got: {self.CIRCUIT_RECOVERY_TIMEOUT}")
+        
+        if self.STALE_MAX_AGE <= 0:
+            raise ConfigurationError(f"STALE_MAX_AGE must be > 0, got: {self.STALE_MAX_AGE}")
+        
+        if self.STALE_MAX_ENTRIES <= 0:
+            raise ConfigurationError(f"STALE_MAX_ENTRIES must be > 0, got: {self.STALE_MAX_ENTRIES}")
+        
+        # Validate hedging settings
+        if not 0 < self.HEDGE_PERCENTILE < 100:
+            raise ConfigurationError(f"HEDGE_PERCENTILE must be between 0 and 100, got: {self.HEDGE_PERCENTILE}")
+        
+        if not 0 <= self.HEDGE_BUDGET_RATIO <= 1:
+            raise ConfigurationError(f"HEDGE_BUDGET_RATIO must be between 0 and 1, got: {self.HEDGE_BUDGET_RATIO}")
+        
+        if self.HEDGE_MAX_WORKERS <= 0:
+            raise ConfigurationError(f"HEDGE_MAX_WORKERS must be > 0, got: {self.HEDGE_MAX_WORKERS}")
+        
+        if self.LATENCY_WINDOW < self.HEDGE_MIN_SAMPLES:
+            raise ConfigurationError(
+                f"LATENCY_WINDOW must be >= HEDGE_MIN_SAMPLES, got: {self.LATENCY_WINDOW} < {self.HEDGE_MIN_SAMPLES}"
+            )
+        
+        # Validate cache settings
+        if self.CACHE_TTL <= 0:
+            raise ConfigurationError(f"CACHE_TTL must be > 0, got: {self.CACHE_TTL}")
+        
+        if self.CACHE_LOCAL_MAX_ENTRIES <= 0:
+            raise ConfigurationError(f"CACHE_LOCAL_MAX_ENTRIES must be > 0, got: {self.CACHE_LOCAL_MAX_ENTRIES}")
+        
+        if self.CACHE_BACKEND not in ("redis", "sqlite", "none"):
+            raise ConfigurationError(f"CACHE_BACKEND must be redis, sqlite or none, got: {self.CACHE_BACKEND}")
+        
+        if self.CACHE_DISK_MAX_BYTES <= 0:
+            raise ConfigurationError(f"CACHE_DISK_MAX_BYTES must be > 0, got: {self.CACHE_DISK_MAX_BYTES}")
+        
+        if self.CACHE_DISK_BUSY_TIMEOUT <= 0:
+            raise ConfigurationError(f"CACHE_DISK_BUSY_TIMEOUT must be > 0, got: {self.CACHE_DISK_BUSY_TIMEOUT}")
+        
+        if self.CACHE_TTL_HISTORICAL <= 0:
+            raise ConfigurationError(f"CACHE_TTL_HISTORICAL must be > 0, got: {self.CACHE_TTL_HISTORICAL}")
+        
+        for name in ("MODEL_RUN_HOURS_WEATHER", "MODEL_RUN_HOURS_MARINE"):
+            if any(not 0 <= hour <= 23 for hour in getattr(self, name)):
+                raise ConfigurationError(f"{name} must be hours between 0 and 23, got: {getattr(self, name)}")
+        
+        for name in ("MODEL_RUN_DELAY_WEATHER", "MODEL_RUN_DELAY_MARINE"):
+            if getattr(self, name) < 0:
+                raise ConfigurationError(f"{name} must be >= 0, got: {getattr(self, name)}")
+        
+        # Validate negative cache settings
+        for name in ("NEGATIVE_CACHE_TTL_NOT_FOUND", "NEGATIVE_CACHE_TTL_BAD_REQUEST", "NEGATIVE_CACHE_TTL_UPSTREAM"):
+            if getattr(self, name) < 0:
+                raise ConfigurationError(f"{name} must be >= 0, got: {getattr(self, name)}")
+        
+        if self.NEGATIVE_CACHE_MAX_ENTRIES <= 0:
+            raise ConfigurationError(f"NEGATIVE_CACHE_MAX_ENTRIES must be > 0, got: {self.NEGATIVE_CACHE_MAX_ENTRIES}")
+        
+        # Validate detection pipeline settings
+        if self.DETECTION_DEADLINE <= 0:
+            raise ConfigurationError(f"DETECTION_DEADLINE must be > 0, got: {self.DETECTION_DEADLINE}")
+        
+        if self.DETECTION_MAX_WORKERS <= 0:
+            raise ConfigurationError(f"DETECTION_MAX_WORKERS must be > 0, got: {self.DETECTION_MAX_WORKERS}")
+        
+        if self.DETECTION_BATCH_MAX_POINTS <= 0:
+            raise ConfigurationError(f"DETECTION_BATCH_MAX_POINTS must be > 0, got: {self.DETECTION_BATCH_MAX_POINTS}")
+        
+        if self.DETECTION_STREAM_MAX_POINTS <= 0:
+            raise ConfigurationError(f"DETECTION_STREAM_MAX_POINTS must be > 0, got: {self.DETECTION_STREAM_MAX_POINTS}")
+        
+        if self.DETECTION_STREAM_MAX_IN_FLIGHT <= 0:
+            raise ConfigurationError(
+                f"DETECTION_STREAM_MAX_IN_FLIGHT must be > 0, got: {self.DETECTION_STREAM_MAX_IN_FLIGHT}"
+            )
+        
+        # Validate prefetch settings
+        if self.PREFETCH_DELAY < 0 or self.PREFETCH_SPREAD < 0:
+            raise ConfigurationError(
+                f"PREFETCH_DELAY and PREFETCH_SPREAD must be >= 0, "
+                f"got: {self.PREFETCH_DELAY} and {self.PREFETCH_SPREAD}"
+            )
+        
+        for name, latitude, longitude in self.PREFETCH_WATCHLIST:
+            if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+                raise ConfigurationError(f"PREFETCH_WATCHLIST location {name} is out of range: {latitude}, {longitude}")
+        
+        # Validate grid scanner settings
+        if self.GRID_RESOLUTION <= 0:
+            raise ConfigurationError(f"GRID_RESOLUTION must be > 0, got: {self.GRID_RESOLUTION}")
+        
+        if self.GRID_MAX_CONCURRENCY <= 0:
+            raise ConfigurationError(f"GRID_MAX_CONCURRENCY must be > 0, got: {self.GRID_MAX_CONCURRENCY}")
+        
+        if not 0 < self.GRID_MIN_RESOLUTION <= self.GRID_COARSE_RESOLUTION:
+            raise ConfigurationError(
+                f"GRID_MIN_RESOLUTION must be > 0 and <= GRID_COARSE_RESOLUTION, "
+                f"got: {self.GRID_MIN_RESOLUTION} and {self.GRID_COARSE_RESOLUTION}"
+            )
+        
+        if self.GRID_REFINE_SEVERITY < 0 or self.GRID_REFINE_PRESSURE_GRADIENT < 0:
+            raise ConfigurationError(
+                f"GRID_REFINE_SEVERITY and GRID_REFINE_PRESSURE_GRADIENT must be >= 0, "
+                f"got: {self.GRID_REFINE_SEVERITY} and {self.GRID_REFINE_PRESSURE_GRADIENT}"
+            )
+        
         # Validate thresholds
         if self.CYCLONE_SST_THRESHOLD <= 0 or self.CYCLONE_SST_THRESHOLD > 40:
             raise ConfigurationError(f"CYCLONE_SST_THRESHOLD must be between 0 and 40, got: {self.CYCLONE_SST_THRESHOLD}")
@@ -105,6 +318,45 @@ class Settings:
         if self.CYCLONE_PRESSURE_THRESHOLD <= 0 or self.CYCLONE_PRESSURE_THRESHOLD > 1100:
             raise ConfigurationError(f"CYCLONE_PRESSURE_THRESHOLD must be between 0 and 1100, got: {self.CYCLONE_PRESSURE_THRESHOLD}")
     
+    @staticmethod
+    def _parse_hours(value: str) -> List[int]:
+        """
+        Parse a comma-separated list of hours.
+        
+        Raises:
+            ConfigurationError: If an entry is not an integer
+        """
+        try:
+            return [int(hour) for hour in value.split(",") if hour.strip()]
+        except ValueError:
+            raise ConfigurationError(f"Expected comma-separated hours, got: {value}")
+    
+    @staticmethod
+    def _parse_watchlist(value: str) -> List[Tuple[str, float, float]]:
+        """
+        Parse a semicolon-separated list of name:latitude:longitude entries.
+        
+        Raises:
+            ConfigurationError: If an entry is malformed
+        """
+        watchlist = []
+        for entry in value.split(";"):
+            if not entry.strip():
+                continue
+            try:
+                name, latitude, longitude = entry.rsplit(":", 2)
+                watchlist.append((name.strip(), float(latitude), float(longitude)))
+            except ValueError:
+                raise ConfigurationError(f"Expected name:latitude:longitude in PREFETCH_WATCHLIST, got: {entry}")
+        return watchlist
+    
+    @staticmethod
+    def _describe_runs(hours: List[int], delay: float) -> str:
+        """Format a model run schedule for display."""
+        if not hours:
+            return "flat TTL"
+        return f"{', '.join(f'{hour:02d}Z' for hour in hours)} (+{delay:g}h)"
+    
     def display(self):
         """
         Display configuration settings (masks sensitive values).
@@ -113,12 +365,34 @@ class Settings:
             "API Configuration": [
                 ("WEATHER_API_URL", self.WEATHER_API_URL),
                 ("MARINE_API_URL", self.MARINE_API_URL),
+                ("SNAP_RESOLUTION_WEATHER", f"{self.SNAP_RESOLUTION_WEATHER}°" if self.SNAP_RESOLUTION_WEATHER else "disabled"),
+                ("SNAP_RESOLUTION_MARINE", f"{self.SNAP_RESOLUTION_MARINE}°" if self.SNAP_RESOLUTION_MARINE else "disabled"),
             ],
             "Network Settings": [
                 ("TIMEOUT", self.TIMEOUT),
                 ("RETRY_COUNT", self.RETRY_COUNT),
                 ("RETRY_DELAY", self.RETRY_DELAY),
                 ("MAX_RETRY_DELAY", self.MAX_RETRY_DELAY),
+                ("MIN_ATTEMPT_TIMEOUT", f"{self.MIN_ATTEMPT_TIMEOUT}s"),
+                ("ASYNC_MAX_CONNECTIONS", self.ASYNC_MAX_CONNECTIONS),
+                ("RATE_LIMIT_PER_SECOND", self.RATE_LIMIT_PER_SECOND or "disabled"),
+                ("RATE_LIMIT_BURST", self.RATE_LIMIT_BURST),
+                ("RATE_LIMIT_MAX_WAIT", f"{self.RATE_LIMIT_MAX_WAIT}s"),
+                ("MAX_URL_LENGTH", self.MAX_URL_LENGTH),
+                ("MAX_LOCATIONS_PER_REQUEST", self.MAX_LOCATIONS_PER_REQUEST),
+                ("JSON_DECODER", self.JSON_DECODER),
+            ],
+            "Resilience": [
+                ("CIRCUIT_FAILURE_THRESHOLD", self.CIRCUIT_FAILURE_THRESHOLD),
+                ("CIRCUIT_RECOVERY_TIMEOUT", f"{self.CIRCUIT_RECOVERY_TIMEOUT}s"),
+                ("STALE_MAX_AGE", f"{self.STALE_MAX_AGE}s"),
+                ("STALE_MAX_ENTRIES", self.STALE_MAX_ENTRIES),
+            ],
+            "Hedged Requests": [
+                ("HEDGE_ENABLED", self.HEDGE_ENABLED),
+                ("HEDGE_PERCENTILE", f"p{self.HEDGE_PERCENTILE:g}"),
+                ("HEDGE_BUDGET_RATIO", self.HEDGE_BUDGET_RATIO),
+                ("LATENCY_WINDOW", self.LATENCY_WINDOW),
             ],
             "Cache Configuration": [
                 ("REDIS_HOST", self.REDIS_HOST),
@@ -126,6 +400,47 @@ class Settings:
                 ("REDIS_PASSWORD", "****" if self.REDIS_PASSWORD else ""),
                 ("CACHE_TTL", self.CACHE_TTL),
                 ("CACHE_ENABLED", self.CACHE_ENABLED),
+                ("CACHE_BACKEND", self.CACHE_BACKEND),
+                ("CACHE_DISK_PATH", self.CACHE_DISK_PATH),
+                ("CACHE_DISK_MAX_BYTES", self.CACHE_DISK_MAX_BYTES),
+                ("CACHE_TTL_WEATHER", self.CACHE_TTL_WEATHER),
+                ("CACHE_TTL_MARINE", self.CACHE_TTL_MARINE),
+                ("CACHE_LOCAL_MAX_ENTRIES", self.CACHE_LOCAL_MAX_ENTRIES),
+                ("CACHE_TTL_HISTORICAL", self.CACHE_TTL_HISTORICAL),
+                ("MODEL_RUNS_WEATHER", self._describe_runs(self.MODEL_RUN_HOURS_WEATHER, self.MODEL_RUN_DELAY_WEATHER)),
+                ("MODEL_RUNS_MARINE", self._describe_runs(self.MODEL_RUN_HOURS_MARINE, self.MODEL_RUN_DELAY_MARINE)),
+            ],
+            "Negative Cache": [
+                ("NEGATIVE_CACHE_ENABLED", self.NEGATIVE_CACHE_ENABLED),
+                ("NEGATIVE_CACHE_TTL_NOT_FOUND", f"{self.NEGATIVE_CACHE_TTL_NOT_FOUND:g}s"),
+                ("NEGATIVE_CACHE_TTL_BAD_REQUEST", f"{self.NEGATIVE_CACHE_TTL_BAD_REQUEST:g}s"),
+                ("NEGATIVE_CACHE_TTL_UPSTREAM", f"{self.NEGATIVE_CACHE_TTL_UPSTREAM:g}s"),
+                ("NEGATIVE_CACHE_MAX_ENTRIES", self.NEGATIVE_CACHE_MAX_ENTRIES),
+            ],
+            "Detection Pipeline": [
+                ("DETECTION_DEADLINE", f"{self.DETECTION_DEADLINE}s"),
+                ("DETECTION_MAX_WORKERS", self.DETECTION_MAX_WORKERS),
+                ("DETECTION_BATCH_MAX_POINTS", self.DETECTION_BATCH_MAX_POINTS),
+                ("DETECTION_STREAM_MAX_POINTS", self.DETECTION_STREAM_MAX_POINTS),
+                ("DETECTION_STREAM_MAX_IN_FLIGHT", self.DETECTION_STREAM_MAX_IN_FLIGHT),
+            ],
+            "Prefetch": [
+                ("PREFETCH_ENABLED", self.PREFETCH_ENABLED),
+                ("PREFETCH_WATCHLIST", f"{len(self.PREFETCH_WATCHLIST)} locations"),
+                ("PREFETCH_DELAY", f"{self.PREFETCH_DELAY:g}s"),
+                ("PREFETCH_SPREAD", f"{self.PREFETCH_SPREAD:g}s"),
+            ],
+            "Grid Scanner": [
+                ("GRID_RESOLUTION", f"{self.GRID_RESOLUTION}°"),
+                ("GRID_MAX_CONCURRENCY", self.GRID_MAX_CONCURRENCY),
+                ("GRID_COARSE_RESOLUTION", f"{self.GRID_COARSE_RESOLUTION}°"),
+                ("GRID_MIN_RESOLUTION", f"{self.GRID_MIN_RESOLUTION}°"),
+                ("GRID_REFINE_SEVERITY", self.GRID_REFINE_SEVERITY),
+                ("GRID_REFINE_PRESSURE_GRADIENT", f"{self.GRID_REFINE_PRESSURE_GRADIENT} hPa/°"),
+            ],
+            "Land/Sea Mask": [
+                ("LAND_MASK_PATH", self.LAND_MASK_PATH or "disabled"),
+                ("SST_CLIMATOLOGY_PATH", self.SST_CLIMATOLOGY_PATH or "disabled"),
             ],
             "Cyclone Thresholds": [
                 ("SST", f"{self.CYCLONE_SST_THRESHOLD}°C"),
@@ -0,0 +1,139 @@
+"""
+Cyclone Tracker - Basin Grid Scan
+
+Scans a lat/lon bounding box (default: South-West Indian Ocean basin)
+and writes the peak severity grid as a NumPy .npy file and the scored
+cells as GeoJSON.
+
+Usage:
+    python -m src.grid_scan --resolution 0.5 --days 7 --output output/swio
+    python -m src.grid_scan --adaptive --resolution 2 --min-resolution 0.25
+"""
+
+import argparse
+import logging
+import sys
+
+import numpy as np
+
+from src.config.settings import settings
+from src.utils.api_client import APIClient
+from src.services.weather_service import WeatherService
+from src.services.grid_scanner import GridScanner, SWIO_BASIN
+from src.utils.error_handler import ValidationError
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+    
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Basin-wide cyclone detection grid scan")
+    parser.add_argument(
+        "--bbox", nargs=4, type=float, default=list(SWIO_BASIN),
+        metavar=("LAT_MIN", "LAT_MAX", "LON_MIN", "LON_MAX"),
+        help="Bounding box in degrees (default: South-West Indian Ocean basin)"
+    )
+    parser.add_argument(
+        "--resolution", type=float, default=None,
+        help=f"Cell size in degrees, coarse cell size with --adaptive "
+             f"(default: {settings.GRID_RESOLUTION}, {settings.GRID_COARSE_RESOLUTION} with --adaptive)"
+    )
+    parser.add_argument(
+        "--adaptive", action="store_true",
+        help="Scan coarse-to-fine, subdividing only active cells"
+    )
+    parser.add_argument(
+        "--min-resolution", type=float, default=settings.GRID_MIN_RESOLUTION,
+        help=f"Smallest cell size with --adaptive (default: {settings.GRID_MIN_RESOLUTION})"
+    )
+    parser.add_argument(
+        "--refine-severity", type=float, default=settings.GRID_REFINE_SEVERITY,
+        help=f"Severity triggering refinement (default: {settings.GRID_REFINE_SEVERITY})"
+    )
+    parser.add_argument(
+        "--refine-gradient", type=float, default=settings.GRID_REFINE_PRESSURE_GRADIENT,
+        help=f"Pressure gradient in hPa/degree triggering refinement "
+             f"(default: {settings.GRID_REFINE_PRESSURE_GRADIENT})"
+    )
+    parser.add_argument("--days", type=int, default=7, help="Forecast days (1-16, default: 7)")
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.GRID_MAX_CONCURRENCY,
+        help=f"Batches fetched concurrently (default: {settings.GRID_MAX_CONCURRENCY})"
+    )
+    parser.add_argument("--deadline", type=float, default=None, help="Total time budget in seconds")
+    parser.add_argument(
+        "--min-severity", type=float, default=0.0,
+        help="Minimum peak severity of cells written to GeoJSON (default: 0)"
+    )
+    parser.add_argument(
+        "--output", default="output/grid_scan",
+        help="Output path without extension (default: output/grid_scan)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Grid scan entry point."""
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL),
+        format=settings.LOG_FORMAT,
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    logger = logging.getLogger(__name__)
+    args = parse_args(argv)
+    
+    api_client = APIClient()
+    scanner = GridScanner(WeatherService(api_client), max_concurrency=args.concurrency)
+    
+    try:
+        if args.adaptive:
+            result = scanner.scan_adaptive(
+                bbox=tuple(args.bbox),
+                coarse_resolution=args.resolution,
+                min_resolution=args.min_resolution,
+                severity_threshold=args.refine_severity,
+                gradient_threshold=args.refine_gradient,
+                forecast_days=args.days,
+                deadline=args.deadline
+            )
+        else:
+            result = scanner.scan(
+                bbox=tuple(args.bbox),
+                resolution=args.resolution,
+                forecast_days=args.days,
+                deadline=args.deadline
+            )
+    except ValidationError as e:
+        logger.error(f"[X] Erreur de validation: {e}")
+        return 2
+    finally:
+        api_client.close()
+    
+    npy_path, geojson_path = result.save(args.output, min_severity=args.min_severity)
+    
+    if args.adaptive:
+        report = result.call_report()
+        print(
+            f"Cellules: {report['cells_fetched']} récupérées en {report['calls']} lots "
+            f"(grille uniforme {report['finest_resolution']}°: {report['uniform_cells']} cellules "
+            f"en {report['uniform_calls']} lots, x{report['savings_ratio']})"
+        )
+        peak = result.to_dense()
+    else:
+        peak = result.peak_severity
+        print(f"Grille: {peak.shape[0]}x{peak.shape[1]} cellules ({result.failed_cells} sans données)")
+    if not np.isnan(peak).all():
+        print(f"Sévérité maximale: {float(np.nanmax(peak)):.2%}")
+    print(f"Fichiers: {npy_path}, {geojson_path}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,7 @@ from src.utils.api_client import APIClient
 from src.services.weather_service import WeatherService
 from src.services.marine_service import MarineService
 from src.services.cyclone_detector import CycloneDetector
+from src.services.detection_pipeline import DetectionPipeline
 from src.utils.error_handler import APIError, ValidationError
 
 
@@ -99,6 +100,7 @@ def main():
     weather_service = WeatherService(api_client)
     marine_service = MarineService(api_client)
     cyclone_detector = CycloneDetector()
+    detection_pipeline = DetectionPipeline(weather_service, marine_service, cyclone_detector)
     
     # Define locations to analyze (Indian Ocean region)
     locations = [
@@ -112,35 +114,23 @@ def main():
     print("ANALYSE DE DÉTECTION CYCLONIQUE - OCÉAN INDIEN")
     print("=" * 70)
     
+    coordinates = [(location["lat"], location["lon"]) for location in locations]
+    
+    # Fetch weather and marine data for all locations concurrently
+    try:
+        detections = detection_pipeline.detect_many(coordinates, forecast_days=7)
+    except APIError as e:
+        # Reported for each location below
+        detections = [e] * len(locations)
+    
     # Analyze each location
     results = []
-    for location in locations:
+    for location, detection_result in zip(locations, detections):
         try:
             logger.info(f"\nAnalyse de {location['name']}...")
             
-            # Get weather data
-            weather_data = weather_service.get_forecast(
-                latitude=location["lat"],
-                longitude=location["lon"],
-                forecast_days=7
-            )
-            
-            # Get marine data (optional, for better accuracy)
-            try:
-                marine_data = marine_service.get_marine_forecast(
-                    latitude=location["lat"],
-                    longitude=location["lon"],
-                    forecast_days=7
-                )
-            except APIError as e:
-                logger.warning(f"Marine data unavailable: {e}")
-                marine_data = None
-            
-            # Detect cyclone conditions
-            detection_result = cyclone_detector.detect(
-                weather_data=weather_data,
-                marine_data=marine_data
-            )
+            if isinstance(detection_result, Exception):
+                raise detection_result
             
             results.append({
                 "location": location["name"],
@@ -178,6 +168,7 @@ def main():
     print("=" * 70)
     
     # Cleanup
+    detection_pipeline.close()
     api_client.close()
     logger.info("\n[OK] Analyse terminee avec succes")
 
@@ -1,11 +1,22 @@
 """Services module exports."""
 
-from .weather_service import WeatherService
-from .marine_service import MarineService
+from .weather_service import WeatherService, AsyncWeatherService
+from .forecast_frame import ForecastFrame
+from .marine_service import MarineService, AsyncMarineService
 from .cyclone_detector import CycloneDetector
+from .detection_pipeline import DetectionPipeline
+from .grid_scanner import GridScanner, GridScanResult
+from .prefetch_scheduler import PrefetchScheduler
 
 __all__ = [
     "WeatherService",
+    "AsyncWeatherService",
+    "ForecastFrame",
     "MarineService",
+    "AsyncMarineService",
     "CycloneDetector",
+    "DetectionPipeline",
+    "GridScanner",
+    "GridScanResult",
+    "PrefetchScheduler",
 ]
@@ -6,10 +6,14 @@ tropical cyclone conditions using meteorological criteria.
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Union
 from enum import Enum
 
+import numpy as np
+
+from .forecast_frame import ForecastFrame
 from ..utils.error_handler import ValidationError
+from ..utils.sst_climatology import SSTClimatology, get_sst_climatology, month_index
 from ..config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -23,6 +27,24 @@ class CycloneCategory(Enum):
     CYCLONE = "Cyclone"
 
 
+# Category codes returned by CycloneDetector.detect_batch (index in this list)
+CATEGORY_CODES = [
+    CycloneCategory.NONE,
+    CycloneCategory.TROPICAL_DEPRESSION,
+    CycloneCategory.TROPICAL_STORM,
+    CycloneCategory.CYCLONE
+]
+
+# Wind gusts threshold for cyclone detection (km/h) - Strong cyclone indication
+WIND_GUSTS_THRESHOLD = 120.0
+
+# Bounds used to normalize severity scores
+SST_MAX = 30.0  # Maximum expected SST
+PRESSURE_MIN = 900.0  # Extreme low pressure
+WIND_MAX = 250.0  # Category 5 hurricane
+GUSTS_MAX = 300.0  # Extreme wind gusts
+
+
 class CycloneDetector:
     """
     Service for detecting cyclone conditions from weather and marine data.
@@ -34,13 +56,17 @@ class CycloneDetector:
     
     All three conditions must be met to classify as CYCLONE.
     Partial conditions indicate TROPICAL_STORM or TROPICAL_DEPRESSION.
+    
+    SST comes, in order, from the caller, the marine data, the monthly
+    climatology, and only then from an air temperature estimate.
     """
     
     def __init__(
         self,
         sst_threshold: Optional[float] = None,
         pressure_threshold: Optional[float] = None,
-        wind_threshold: Optional[float] = None
+        wind_threshold: Optional[float] = None,
+        sst_climatology: Optional[SSTClimatology] = None
     ):
         """
         Initialize Cyclone Detector.
@@ -49,10 +75,14 @@ class CycloneDetector:
             sst_threshold: SST threshold in °C (default: from settings)
             pressure_threshold: Pressure threshold in hPa (default: from settings)
             wind_threshold: Wind speed threshold in km/h (default: from settings)
+            sst_climatology: Optional monthly SST climatology used when no SST
+                is measured (default: shared grid from SST_CLIMATOLOGY_PATH,
+                if available)
         """
         self.sst_threshold = sst_threshold or settings.CYCLONE_SST_THRESHOLD
         self.pressure_threshold = pressure_threshold or settings.CYCLONE_PRESSURE_THRESHOLD
         self.wind_threshold = wind_threshold or settings.CYCLONE_WIND_THRESHOLD
+        self.sst_climatology = sst_climatology or get_sst_climatology()
         
         logger.info(
             f"CycloneDetector initialized: "
@@ -65,15 +95,21 @@ class CycloneDetector:
         self,
         weather_data: Dict[str, Any],
         marine_data: Optional[Dict[str, Any]] = None,
-        sst: Optional[float] = None
+        sst: Optional[float] = None,
+        horizon: bool = False
     ) -> Dict[str, Any]:
         """
         Detect cyclone conditions from weather and marine data.
         
+        The result describes the first forecast day. With horizon=True,
+        every fetched day is also scored (see detect_horizon) and the
+        result gets a "horizon" entry, without any additional API call.
+        
         Args:
             weather_data: Weather data from WeatherService
             marine_data: Optional marine data from MarineService
-            sst: Optional sea surface temperature in °C (if marine_data not provided)
+            sst: Optional sea surface temperature in °C (overrides marine_data)
+            horizon: Also score the full forecast horizon (default: False)
         
         Returns:
             Dictionary with detection results:
@@ -89,58 +125,21 @@ class CycloneDetector:
                 "details": {
                     "temperature_max": float,
                     "temperature_min": float,
-                    "analysis_date": str
+                    "analysis_date": str,
+                    "sst_source": "provided" | "marine" | "climatology" | "estimated"
                 }
             }
         
         Raises:
             ValidationError: If required data is missing or invalid
         """
-        # Extract location
-        try:
-            location = weather_data["location"]
-        except KeyError:
-            raise ValidationError("weather_data must contain 'location' field")
-        
-        # Extract weather parameters
-        try:
-            forecast = weather_data["forecast"]
-            if not forecast:
-                raise ValidationError("weather_data forecast is empty")
-            
-            # Use first day of forecast
-            first_day = forecast[0]
-            
-            temperature_max = first_day["temperature_2m_max"]
-            temperature_min = first_day["temperature_2m_min"]
-            surface_pressure = first_day["surface_pressure"]
-            wind_speed = first_day["wind_speed_10m_max"]
-            # Extract wind gusts if available
-            wind_gusts = first_day.get("wind_gusts_10m_max", wind_speed * 1.5)  # Estimate if not available
-            analysis_date = first_day["date"]
-        
-        except (KeyError, IndexError) as e:
-            raise ValidationError(f"Invalid weather_data structure: {e}")
-        
-        # Determine SST
-        if sst is None:
-            if marine_data:
-                # Try to extract SST from marine data
-                try:
-                    sst_data = marine_data.get("sst", {})
-                    sst = sst_data.get("temperature")
-                except (KeyError, AttributeError):
-                    pass
-            
-            # If still None, use simplified estimate based on air temperature
-            if sst is None:
-                sst = self._estimate_sst(temperature_max, temperature_min)
-                logger.warning(
-                    f"SST not provided, using estimated value: {sst:.1f}°C"
-                )
+        inputs = self._extract_inputs(weather_data, marine_data, sst)
+        location = inputs["location"]
         
         # Analyze conditions (including wind gusts)
-        conditions = self._analyze_conditions(sst, surface_pressure, wind_speed, wind_gusts)
+        conditions = self._analyze_conditions(
+            inputs["sst"], inputs["surface_pressure"], inputs["wind_speed"], inputs["wind_gusts"]
+        )
         
         # Calculate severity score and category
         severity_score = self._calculate_severity_score(conditions)
@@ -153,12 +152,17 @@ class CycloneDetector:
             "severity_score": severity_score,
             "conditions": conditions,
             "details": {
-                "temperature_max": temperature_max,
-                "temperature_min": temperature_min,
-                "analysis_date": analysis_date
+                "temperature_max": inputs["temperature_max"],
+                "temperature_min": inputs["temperature_min"],
+                "analysis_date": inputs["analysis_date"],
+                "sst_source": inputs["sst_source"]
             }
         }
         
+        if horizon:
+            # Days without marine or climatology SST are estimated from each day's air temperature
+            result["horizon"] = self.detect_horizon(inputs["forecast"], inputs["sst_horizon"])
+        
         logger.info(
             f"Cyclone detection for ({location['latitude']}, {location['longitude']}): "
             f"{category.value} (severity: {severity_score:.2f})"
@@ -166,6 +170,284 @@ class CycloneDetector:
         
         return result
     
+    def detect_many(
+        self,
+        weather_data: Sequence[Any],
+        marine_data: Optional[Sequence[Any]] = None,
+        horizon: bool = False
+    ) -> List[Any]:
+        """
+        Detect cyclone conditions for many locations in one vectorized pass.
+        
+        Each location is scored exactly as detect() scores it, but the
+        first forecast days of all locations go through a single
+        detect_batch call instead of one scalar evaluation per location.
+        
+        Args:
+            weather_data: Weather data from WeatherService per location, as
+                a dictionary or a ForecastFrame (whose columns are read
+                directly); an exception entry (failed fetch) is passed through
+            marine_data: Optional marine data per location, None or an
+                exception where unavailable
+            horizon: Also score the full forecast horizon (default: False)
+        
+        Returns:
+            List aligned with weather_data holding either a detection result
+            (same format as detect) or the exception for that location
+        """
+        if marine_data is None:
+            marine_data = [None] * len(weather_data)
+        
+        results: List[Any] = list(weather_data)
+        inputs: Dict[int, Dict[str, Any]] = {}
+        for index, (weather, marine) in enumerate(zip(weather_data, marine_data)):
+            if isinstance(weather, Exception):
+                continue
+            if isinstance(marine, Exception):
+                marine = None
+            try:
+                inputs[index] = self._extract_inputs(weather, marine, None)
+            except ValidationError as e:
+                results[index] = e
+        
+        if not inputs:
+            return results
+        
+        columns = {
+            name: np.array([point[name] for point in inputs.values()], dtype=float)
+            for name in ("sst", "surface_pressure", "wind_speed", "wind_gusts")
+        }
+        batch = self.detect_batch(
+            columns["sst"], columns["surface_pressure"], columns["wind_speed"], columns["wind_gusts"]
+        )
+        severity = batch["severity_score"].tolist()
+        codes = batch["category_code"].tolist()
+        met = {name: values.tolist() for name, values in batch["conditions"].items()}
+        thresholds = {
+            "sst": self.sst_threshold,
+            "pressure": self.pressure_threshold,
+            "wind": self.wind_threshold,
+            "wind_gusts": WIND_GUSTS_THRESHOLD
+        }
+        values = {"sst": "sst", "pressure": "surface_pressure", "wind": "wind_speed", "wind_gusts": "wind_gusts"}
+        
+        for row, (index, point) in enumerate(inputs.items()):
+            result = {
+                "location": point["location"],
+                "category": CATEGORY_CODES[codes[row]].value,
+                "severity_score": severity[row],
+                "conditions": {
+                    name: {
+                        "value": point[values[name]],
+                        "threshold": thresholds[name],
+                        "met": met[name][row]
+                    }
+                    for name in thresholds
+                },
+                "details": {
+                    "temperature_max": point["temperature_max"],
+                    "temperature_min": point["temperature_min"],
+                    "analysis_date": point["analysis_date"],
+                    "sst_source": point["sst_source"]
+                }
+            }
+            if horizon:
+                result["horizon"] = self.detect_horizon(point["forecast"], point["sst_horizon"])
+            results[index] = result
+        
+        logger.info(
+            f"Cyclone detection for {len(inputs)} locations: "
+            f"{sum(code == 3 for code in codes)} cyclone(s)"
+        )
+        
+        return results
+    
+    def detect_horizon(
+        self,
+        forecast: Union[List[Dict[str, Any]], ForecastFrame],
+        sst: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Score every forecast day in one vectorized pass.
+        
+        Each day is scored exactly as detect() scores the first day. Days
+        without SST get an estimate from their air temperature.
+        
+        Args:
+            forecast: Forecast days from WeatherService ("forecast" list),
+                or a ForecastFrame
+            sst: Optional sea surface temperature in °C, one value used for
+                every day or one per day (NaN where unknown)
+        
+        Returns:
+            Dictionary with horizon results:
+            {
+                "days": int,
+                "dates": [str],
+                "severity_series": [float],
+                "category_series": [str],
+                "peak": {"date": str, "day_index": int, "severity_score": float, "category": str},
+                "first_threshold_crossing": {"date": str, "day_index": int, "conditions": [str]} or None
+            }
+        
+        Raises:
+            ValidationError: If the forecast is empty or malformed
+        """
+        if not forecast:
+            raise ValidationError("weather_data forecast is empty")
+        
+        if isinstance(forecast, ForecastFrame):
+            # Gusts missing from the response are already estimated by the frame
+            dates = list(forecast.dates)
+            temperature_max = forecast["temperature_2m_max"]
+            temperature_min = forecast["temperature_2m_min"]
+            pressure = forecast["surface_pressure"]
+            wind_speed = forecast["wind_speed_10m_max"]
+            wind_gusts = forecast["wind_gusts_10m_max"]
+        else:
+            try:
+                dates = [day["date"] for day in forecast]
+                temperature_max = _forecast_column(forecast, "temperature_2m_max")
+                temperature_min = _forecast_column(forecast, "temperature_2m_min")
+                pressure = _forecast_column(forecast, "surface_pressure")
+                wind_speed = _forecast_column(forecast, "wind_speed_10m_max")
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValidationError(f"Invalid weather_data structure: {e}")
+            
+            # Gusts are estimated from wind speed when absent, as in detect()
+            gusts_missing = np.array(["wind_gusts_10m_max" not in day for day in forecast])
+            wind_gusts = np.where(
+                gusts_missing,
+                wind_speed * 1.5,
+                _forecast_column(forecast, "wind_gusts_10m_max")
+            )
+        
+        estimated_sst = self.estimate_sst_batch(temperature_max, temperature_min)
+        if sst is None:
+            sst = estimated_sst
+        else:
+            sst = np.asarray(sst, dtype=float)
+            sst = np.where(np.isnan(sst), estimated_sst, sst)
+        
+        batch = self.detect_batch(sst, pressure, wind_speed, wind_gusts)
+        severity = batch["severity_score"]
+        categories = [CATEGORY_CODES[code].value for code in batch["category_code"].tolist()]
+        
+        peak = int(np.argmax(severity))
+        crossed = np.flatnonzero(batch["met_count"] > 0)
+        
+        first_crossing = None
+        if crossed.size:
+            first = int(crossed[0])
+            first_crossing = {
+                "date": dates[first],
+                "day_index": first,
+                "conditions": [name for name, met in batch["conditions"].items() if met[first]]
+            }
+        
+        return {
+            "days": len(dates),
+            "dates": dates,
+            "severity_series": severity.tolist(),
+            "category_series": categories,
+            "peak": {
+                "date": dates[peak],
+                "day_index": peak,
+                "severity_score": float(severity[peak]),
+                "category": categories[peak]
+            },
+            "first_threshold_crossing": first_crossing
+        }
+    
+    def detect_batch(
+        self,
+        sst: Any,
+        pressure: Any,
+        wind_speed: Any,
+        wind_gusts: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Score many location-days at once with NumPy broadcasting.
+        
+        Applies the same thresholds, severity formula and classification as
+        detect() to arrays shaped (locations, days). Inputs only need to be
+        broadcastable, e.g. SST shaped (locations, 1) for one value per
+        location. For finite inputs the results are identical to the scalar
+        path; NaN (missing) values count as not met and score 0.
+        
+        Args:
+            sst: Sea surface temperatures in °C
+            pressure: Surface pressures in hPa
+            wind_speed: Wind speeds in km/h
+            wind_gusts: Wind gusts in km/h (default: estimated as 1.5x wind speed)
+        
+        Returns:
+            Dictionary of arrays with the broadcast shape:
+            {
+                "severity_score": float array (0-1),
+                "conditions": {"sst": bool array, "pressure": ..., "wind": ..., "wind_gusts": ...},
+                "met_count": int array,
+                "category_code": int array (index in CATEGORY_CODES)
+            }
+        
+        Raises:
+            ValidationError: If the input shapes cannot be broadcast together
+        """
+        sst = np.asarray(sst, dtype=float)
+        pressure = np.asarray(pressure, dtype=float)
+        wind_speed = np.asarray(wind_speed, dtype=float)
+        if wind_gusts is None:
+            wind_gusts = wind_speed * 1.5  # Same estimate as detect()
+        wind_gusts = np.asarray(wind_gusts, dtype=float)
+        
+        try:
+            sst, pressure, wind_speed, wind_gusts = np.broadcast_arrays(
+                sst, pressure, wind_speed, wind_gusts
+            )
+        except ValueError as e:
+            raise ValidationError(f"Incompatible input shapes: {e}")
+        
+        # Comparisons with NaN are False, as in _analyze_conditions
+        conditions = {
+            "sst": sst > self.sst_threshold,
+            "pressure": pressure < self.pressure_threshold,
+            "wind": wind_speed > self.wind_threshold,
+            "wind_gusts": wind_gusts >= WIND_GUSTS_THRESHOLD
+        }
+        
+        # Same operation order as _calculate_severity_score for identical floats
+        sst_score = _clip_score((sst - self.sst_threshold) / (SST_MAX - self.sst_threshold))
+        pressure_score = _clip_score(
+            (self.pressure_threshold - pressure) / (self.pressure_threshold - PRESSURE_MIN)
+        )
+        wind_score = _clip_score((wind_speed - self.wind_threshold) / (WIND_MAX - self.wind_threshold))
+        gusts_score = _clip_score(
+            (wind_gusts - WIND_GUSTS_THRESHOLD) / (GUSTS_MAX - WIND_GUSTS_THRESHOLD)
+        )
+        severity_score = (sst_score + pressure_score + wind_score + (gusts_score * 2)) / 5.0
+        
+        met_count = sum(met.astype(np.int8) for met in conditions.values())
+        
+        # Same precedence as _classify_cyclone (exactly 3 conditions for CYCLONE)
+        category_code = np.select(
+            [
+                met_count == 3,
+                (met_count == 2) | (severity_score > 0.5),
+                (met_count == 1) | (severity_score > 0.3)
+            ],
+            [3, 2, 1],
+            default=0
+        )
+        
+        logger.debug(f"Batch cyclone detection over {severity_score.size} points")
+        
+        return {
+            "severity_score": severity_score,
+            "conditions": conditions,
+            "met_count": met_count,
+            "category_code": category_code
+        }
+    
     def get_risk_level_from_gusts(self, wind_gusts_kmh: float) -> tuple[str, str]:
         """
         Determine cyclone risk level based on wind gusts speed.
@@ -208,6 +490,115 @@ class CycloneDetector:
         else:
             return "Rafales faibles. Conditions météorologiques stables dans la zone d'analyse."
     
+    def _extract_inputs(
+        self,
+        weather_data: Union[Dict[str, Any], ForecastFrame],
+        marine_data: Optional[Dict[str, Any]],
+        sst: Optional[float]
+    ) -> Dict[str, Any]:
+        """
+        Extract the first-day detection inputs of one location.
+        
+        Args:
+            weather_data: Weather data from WeatherService (dictionary or ForecastFrame)
+            marine_data: Optional marine data from MarineService
+            sst: Optional sea surface temperature in °C (overrides marine_data)
+        
+        Returns:
+            Dictionary with location, forecast, first-day weather values,
+            sst and sst_source, and sst_horizon (one SST for every day or
+            one per day, for detect_horizon)
+        
+        Raises:
+            ValidationError: If required data is missing or invalid
+        """
+        if isinstance(weather_data, ForecastFrame):
+            # Read the first day straight from the columns
+            if not len(weather_data):
+                raise ValidationError("weather_data forecast is empty")
+            
+            location = {"latitude": weather_data.latitude, "longitude": weather_data.longitude}
+            forecast = weather_data
+            dates = list(weather_data.dates)
+            temperature_max = _first_value(weather_data["temperature_2m_max"])
+            temperature_min = _first_value(weather_data["temperature_2m_min"])
+            surface_pressure = _first_value(weather_data["surface_pressure"])
+            wind_speed = _first_value(weather_data["wind_speed_10m_max"])
+            wind_gusts = _first_value(weather_data["wind_gusts_10m_max"])
+            analysis_date = dates[0]
+        else:
+            # Extract location
+            try:
+                location = weather_data["location"]
+            except KeyError:
+                raise ValidationError("weather_data must contain 'location' field")
+            
+            # Extract weather parameters
+            try:
+                forecast = weather_data["forecast"]
+                if not forecast:
+                    raise ValidationError("weather_data forecast is empty")
+                
+                # Use first day of forecast
+                first_day = forecast[0]
+                
+                temperature_max = first_day["temperature_2m_max"]
+                temperature_min = first_day["temperature_2m_min"]
+                surface_pressure = first_day["surface_pressure"]
+                wind_speed = first_day["wind_speed_10m_max"]
+                # Extract wind gusts if available
+                wind_gusts = first_day.get("wind_gusts_10m_max", wind_speed * 1.5)  # Estimate if not available
+                analysis_date = first_day["date"]
+            
+            except (KeyError, IndexError, TypeError) as e:
+                raise ValidationError(f"Invalid weather_data structure: {e}")
+            
+            dates = [day.get("date") for day in forecast]
+        
+        # Determine SST
+        sst_source = "provided"
+        sst_series = None
+        if sst is None and marine_data:
+            # SST from MarineService.get_sst applies to every day
+            try:
+                sst = marine_data.get("sst", {}).get("temperature")
+                sst_source = "marine"
+            except AttributeError:
+                pass
+        
+        if sst is None:
+            # Daily SST from the marine forecast, then the climatology
+            marine_series = self._marine_sst_series(dates, marine_data)
+            climatology_series = self.climatology_sst_batch(
+                location.get("latitude"), location.get("longitude"), dates
+            )
+            sst_series = np.where(np.isnan(marine_series), climatology_series, marine_series)
+            
+            if not np.isnan(marine_series[0]):
+                sst, sst_source = float(marine_series[0]), "marine"
+            elif not np.isnan(climatology_series[0]):
+                sst, sst_source = float(climatology_series[0]), "climatology"
+            else:
+                # Simplified estimate based on air temperature
+                sst, sst_source = self._estimate_sst(temperature_max, temperature_min), "estimated"
+                logger.warning(
+                    f"SST not provided, using estimated value: {sst:.1f}°C"
+                )
+        
+        return {
+            "location": location,
+            "forecast": forecast,
+            "temperature_max": temperature_max,
+            "temperature_min": temperature_min,
+            "surface_pressure": surface_pressure,
+            "wind_speed": wind_speed,
+            "wind_gusts": wind_gusts,
+            "analysis_date": analysis_date,
+            "sst": sst,
+            "sst_source": sst_source,
+            "sst_horizon": sst if sst_series is None else sst_series
+        }
+    
     def _analyze_conditions(
         self,
         sst: float,
@@ -227,8 +618,7 @@ class CycloneDetector:
         Returns:
             Dictionary with condition analysis
         """
-        # Define wind gusts thresholds for cyclone detection
-        wind_gusts_threshold = 120.0  # km/h - Strong cyclone indication
+        wind_gusts_threshold = WIND_GUSTS_THRESHOLD
         
         conditions = {
             "sst": {
@@ -275,25 +665,25 @@ class CycloneDetector:
         # SST score (0-1)
         sst_value = conditions["sst"]["value"]
         sst_threshold = conditions["sst"]["threshold"]
-        sst_max = 30.0  # Maximum expected SST
+        sst_max = SST_MAX
         sst_score = max(0, min(1, (sst_value - sst_threshold) / (sst_max - sst_threshold)))
         
         # Pressure score (0-1)
         pressure_value = conditions["pressure"]["value"]
         pressure_threshold = conditions["pressure"]["threshold"]
-        pressure_min = 900.0  # Extreme low pressure
+        pressure_min = PRESSURE_MIN
         pressure_score = max(0, min(1, (pressure_threshold - pressure_value) / (pressure_threshold - pressure_min)))
         
         # Wind score (0-1)
         wind_value = conditions["wind"]["value"]
         wind_threshold = conditions["wind"]["threshold"]
-        wind_max = 250.0  # Category 5 hurricane
+        wind_max = WIND_MAX
         wind_score = max(0, min(1, (wind_value - wind_threshold) / (wind_max - wind_threshold)))
         
         # Wind gusts score (0-1) - More heavily weighted
         gusts_value = conditions["wind_gusts"]["value"]
         gusts_threshold = conditions["wind_gusts"]["threshold"]
-        gusts_max = 300.0  # Extreme wind gusts
+        gusts_max = GUSTS_MAX
         gusts_score = max(0, min(1, (gusts_value - gusts_threshold) / (gusts_max - gusts_threshold)))
         
         # Weighted average score (wind gusts have 2x weight due to cyclone significance)
@@ -334,6 +724,69 @@ class CycloneDetector:
         else:
             return CycloneCategory.NONE
     
+    def climatology_sst_batch(self, latitudes: Any, longitudes: Any, dates: List[str]) -> np.ndarray:
+        """
+        Look up climatological SST for coordinates and forecast dates.
+        
+        Dates index the last axis, so latitudes shaped (locations, 1) give
+        an array shaped (locations, days).
+        
+        Args:
+            latitudes: Latitudes (-90 to 90)
+            longitudes: Longitudes (-180 to 180)
+            dates: Dates as YYYY-MM-DD
+        
+        Returns:
+            SST array in °C (NaN without climatology, over land or for
+            invalid dates)
+        """
+        months = np.array([_month_or_none(date) for date in dates], dtype=float)
+        latitudes = np.asarray(latitudes, dtype=float)
+        longitudes = np.asarray(longitudes, dtype=float)
+        shape = np.broadcast_shapes(latitudes.shape, longitudes.shape, months.shape)
+        known = ~np.isnan(months)
+        if self.sst_climatology is None or not known.any():
+            return np.full(shape, np.nan)
+        
+        sst = self.sst_climatology.lookup_many(latitudes, longitudes, np.where(known, months, 0))
+        return np.where(known, np.broadcast_to(sst, shape), np.nan)
+    
+    def _marine_sst_series(
+        self,
+        dates: List[str],
+        marine_data: Optional[Dict[str, Any]]
+    ) -> np.ndarray:
+        """
+        Align the daily SST of a marine forecast with forecast dates.
+        
+        Args:
+            dates: Forecast dates
+            marine_data: Optional marine data from MarineService.get_marine_forecast
+        
+        Returns:
+            SST array in °C, one per date (NaN where the marine forecast has none)
+        """
+        by_date = {}
+        if marine_data:
+            for day in marine_data.get("marine_forecast") or []:
+                if day.get("ocean_sst") is not None:
+                    by_date[day.get("date")] = day["ocean_sst"]
+        return np.array([by_date.get(date, np.nan) for date in dates], dtype=float)
+    
+    def estimate_sst_batch(self, temp_max: Any, temp_min: Any) -> np.ndarray:
+        """
+        Estimate SST from air temperature arrays (same formula as _estimate_sst).
+        
+        Args:
+            temp_max: Maximum air temperatures in °C
+            temp_min: Minimum air temperatures in °C
+        
+        Returns:
+            Estimated SST array in °C (NaN where a temperature is missing)
+        """
+        avg_temp = (np.asarray(temp_max, dtype=float) + np.asarray(temp_min, dtype=float)) / 2.0
+        return avg_temp + 1.5
+    
     def _estimate_sst(self, temp_max: float, temp_min: float) -> float:
         """
         Estimate SST from air temperature (simplified).
@@ -355,3 +808,27 @@ class CycloneDetector:
         logger.debug(f"Estimated SST: {estimated_sst:.1f}°C (from air temp: {avg_temp:.1f}°C)")
         
         return estimated_sst
+
+
+def _forecast_column(forecast: List[Dict[str, Any]], name: str) -> np.ndarray:
+    """Collect one field of every forecast day as a float array (None and absent as NaN)."""
+    return np.array([day.get(name) for day in forecast], dtype=float)
+
+
+def _first_value(values: np.ndarray) -> Optional[float]:
+    """First value of a frame column as a float, None if it is missing."""
+    value = float(values[0])
+    return None if np.isnan(value) else value
+
+
+def _month_or_none(date: Any) -> Optional[int]:
+    """Climatology month index of a date, None if it is missing or invalid."""
+    try:
+        return month_index(date)
+    except (TypeError, ValueError):
+        return None
+
+
+def _clip_score(values: np.ndarray) -> np.ndarray:
+    """Clip normalized scores to [0, 1], missing (NaN) values scoring 0."""
+    return np.nan_to_num(np.clip(values, 0.0, 1.0), nan=0.0)
@@ -0,0 +1,409 @@
+"""
+Detection Pipeline.
+
+This service orchestrates a complete cyclone detection for one location:
+it fetches weather and marine data concurrently under an overall deadline
+and runs the CycloneDetector on the result.
+"""
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .forecast_frame import ForecastFrame
+from .weather_service import WeatherService
+from .marine_service import MarineService
+from .cyclone_detector import CycloneDetector
+from ..utils.batching import Coordinate
+from ..utils.error_handler import ValidationError, TimeoutError as CustomTimeoutError
+from ..utils.streaming import iter_completed
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DetectionPipeline:
+    """
+    Concurrent weather + marine fetch followed by cyclone detection.
+    
+    End-to-end latency is the slower of the two upstream calls instead of
+    their sum. Marine data is optional: if the marine leg fails or misses
+    the deadline, a weather-only detection is returned.
+    """
+    
+    def __init__(
+        self,
+        weather_service: WeatherService,
+        marine_service: MarineService,
+        cyclone_detector: Optional[CycloneDetector] = None,
+        deadline: Optional[float] = None,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initialize Detection Pipeline.
+        
+        Args:
+            weather_service: Service used for weather forecasts
+            marine_service: Service used for marine forecasts
+            cyclone_detector: Detector (default: new CycloneDetector)
+            deadline: Default overall deadline in seconds (default: from settings)
+            max_workers: Size of the fetch thread pool (default: from settings)
+        """
+        self.weather_service = weather_service
+        self.marine_service = marine_service
+        self.cyclone_detector = cyclone_detector or CycloneDetector()
+        self.deadline = deadline or settings.DETECTION_DEADLINE
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or settings.DETECTION_MAX_WORKERS,
+            thread_name_prefix="detection"
+        )
+        
+        logger.info(f"DetectionPipeline initialized: deadline={self.deadline}s")
+    
+    def detect_location(
+        self,
+        latitude: float,
+        longitude: float,
+        forecast_days: int = 7,
+        analysis_date: Optional[str] = None,
+        deadline: Optional[float] = None,
+        horizon: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Fetch weather and marine data concurrently and detect cyclone conditions.
+        
+        Args:
+            latitude: Latitude (-90 to 90)
+            longitude: Longitude (-180 to 180)
+            forecast_days: Number of forecast days (1-7, default: 7)
+            analysis_date: Optional historical date (YYYY-MM-DD)
+            deadline: Overall deadline in seconds (default: pipeline deadline)
+            horizon: Also score every fetched forecast day (default: False)
+        
+        Returns:
+            Detection result from CycloneDetector.detect, with
+            details["marine_data_available"] telling whether marine data
+            was used and details["stale_data"] whether any input was a
+            last-known-good response served during an upstream outage
+        
+        Raises:
+            ValidationError: If parameters are invalid
+            CustomTimeoutError: If weather data is not available before the deadline
+            APIError: If weather data cannot be fetched
+        """
+        deadline = deadline or self.deadline
+        expires_at = time.monotonic() + deadline
+        
+        # The services get the same budget so their retries stop in time too
+        fetch_kwargs = {"deadline": deadline}
+        if analysis_date:
+            fetch_kwargs.update(start_date=analysis_date, end_date=analysis_date)
+        
+        weather_future = self.executor.submit(
+            self.weather_service.get_forecast,
+            latitude=latitude,
+            longitude=longitude,
+            forecast_days=forecast_days,
+            **fetch_kwargs
+        )
+        marine_future = self.executor.submit(
+            self.marine_service.get_marine_forecast,
+            latitude=latitude,
+            longitude=longitude,
+            forecast_days=forecast_days,
+            **fetch_kwargs
+        )
+        
+        # Weather data is mandatory
+        try:
+            weather_data = weather_future.result(timeout=_remaining(expires_at))
+        except FutureTimeoutError:
+            weather_future.cancel()
+            marine_future.cancel()
+            raise CustomTimeoutError(
+                f"Weather data not available within {deadline}s deadline"
+            )
+        except Exception:
+            marine_future.cancel()
+            raise
+        
+        # Marine data is optional
+        marine_data = None
+        try:
+            marine_data = marine_future.result(timeout=_remaining(expires_at))
+        except FutureTimeoutError:
+            marine_future.cancel()
+            logger.warning(
+                f"Marine data missed the {deadline}s deadline, "
+                f"using weather-only detection"
+            )
+        except Exception as e:
+            logger.warning(f"Could not fetch marine data: {e}")
+        
+        detection_result = self.cyclone_detector.detect(
+            weather_data=weather_data,
+            marine_data=marine_data,
+            horizon=horizon
+        )
+        detection_result["details"]["marine_data_available"] = marine_data is not None
+        detection_result["details"]["stale_data"] = _is_stale(weather_data, marine_data)
+        
+        return detection_result
+    
+    def detect_many(
+        self,
+        locations: Sequence[Coordinate],
+        forecast_days: int = 7,
+        analysis_date: Optional[str] = None,
+        deadline: Optional[float] = None,
+        horizon: bool = False,
+        analysis_dates: Optional[Sequence[Optional[str]]] = None
+    ) -> List[Any]:
+        """
+        Detect cyclone conditions for many locations.
+        
+        Locations are grouped by analysis date; each group is fetched with
+        batched multi-location weather and marine requests, all groups and
+        both legs running concurrently under the deadline. Weather data
+        is fetched as ForecastFrame columns and the first days are scored
+        in a single vectorized detector pass, without per-day dicts.
+        
+        Args:
+            locations: Sequence of (latitude, longitude) pairs
+            forecast_days: Number of forecast days (1-7, default: 7)
+            analysis_date: Optional historical date (YYYY-MM-DD) for every location
+            deadline: Overall deadline in seconds (default: pipeline deadline)
+            horizon: Also score every fetched forecast day (default: False)
+            analysis_dates: Optional historical date per location (None for
+                real time), overriding analysis_date
+        
+        Returns:
+            List aligned with locations holding either a detection result
+            or the exception raised for that location (including a
+            CustomTimeoutError or APIError when the weather data of its
+            date group could not be fetched)
+        
+        Raises:
+            ValidationError: If any location or parameter is invalid
+        """
+        deadline = deadline or self.deadline
+        expires_at = time.monotonic() + deadline
+        
+        locations = list(locations)
+        groups = _group_by_date(len(locations), analysis_date, analysis_dates)
+        
+        futures = []
+        for date, indices in groups.items():
+            fetch_kwargs = {
+                "forecast_days": forecast_days,
+                "return_exceptions": True,
+                "deadline": deadline
+            }
+            if date:
+                fetch_kwargs.update(start_date=date, end_date=date)
+            group_locations = [locations[index] for index in indices]
+            futures.append((
+                indices,
+                self.executor.submit(
+                    self.weather_service.get_forecast_many, group_locations, as_frame=True, **fetch_kwargs
+                ),
+                self.executor.submit(self.marine_service.get_marine_forecast_many, group_locations, **fetch_kwargs)
+            ))
+        
+        weather_results: List[Any] = [None] * len(locations)
+        marine_results: List[Any] = [None] * len(locations)
+        for indices, weather_future, marine_future in futures:
+            weather_group = self._group_weather(weather_future, marine_future, expires_at, deadline)
+            marine_group = self._group_marine(marine_future, expires_at, deadline)
+            for position, index in enumerate(indices):
+                weather_results[index] = (
+                    weather_group if isinstance(weather_group, Exception) else weather_group[position]
+                )
+                marine_results[index] = None if marine_group is None else marine_group[position]
+        
+        results = self.cyclone_detector.detect_many(weather_results, marine_results, horizon=horizon)
+        for result, weather_data, marine_data in zip(results, weather_results, marine_results):
+            if isinstance(result, Exception):
+                continue
+            if isinstance(marine_data, Exception):
+                marine_data = None
+            result["details"]["marine_data_available"] = marine_data is not None
+            result["details"]["stale_data"] = _is_stale(weather_data, marine_data)
+        
+        return results
+    
+    def iter_detect_many(
+        self,
+        locations: Sequence[Coordinate],
+        forecast_days: int = 7,
+        analysis_date: Optional[str] = None,
+        deadline: Optional[float] = None,
+        horizon: bool = False,
+        analysis_dates: Optional[Sequence[Optional[str]]] = None,
+        chunk_size: Optional[int] = None,
+        max_in_flight: Optional[int] = None
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Detect cyclone conditions for many locations, yielding results as they are scored.
+        
+        Locations are split into chunks of one date and at most chunk_size
+        points, each detected like detect_many. At most max_in_flight
+        chunks are fetched ahead of the consumer, so the first results
+        arrive after one chunk whatever the number of locations, and a
+        slow consumer holds back upstream calls. Closing the iterator
+        cancels the chunks not started yet.
+        
+        Args:
+            locations: Sequence of (latitude, longitude) pairs
+            forecast_days: Number of forecast days (1-7, default: 7)
+            analysis_date: Optional historical date (YYYY-MM-DD) for every location
+            deadline: Deadline in seconds per chunk (default: pipeline deadline)
+            horizon: Also score every fetched forecast day (default: False)
+            analysis_dates: Optional historical date per location (None for
+                real time), overriding analysis_date
+            chunk_size: Maximum locations per chunk (default: MAX_LOCATIONS_PER_REQUEST)
+            max_in_flight: Maximum chunks fetched ahead (default: DETECTION_STREAM_MAX_IN_FLIGHT)
+        
+        Yields:
+            (index in locations, detection result or exception) tuples in
+            completion order
+        
+        Raises:
+            ValidationError: If analysis_dates does not match locations
+        """
+        locations = list(locations)
+        groups = _group_by_date(len(locations), analysis_date, analysis_dates)
+        chunk_size = chunk_size or settings.MAX_LOCATIONS_PER_REQUEST
+        max_in_flight = max_in_flight or settings.DETECTION_STREAM_MAX_IN_FLIGHT
+        chunks = (
+            (date, indices[offset:offset + chunk_size])
+            for date, indices in groups.items()
+            for offset in range(0, len(indices), chunk_size)
+        )
+        
+        def detect_chunk(chunk):
+            date, indices = chunk
+            return self.detect_many(
+                [locations[index] for index in indices],
+                forecast_days=forecast_days,
+                analysis_date=date,
+                deadline=deadline,
+                horizon=horizon
+            )
+        
+        logger.info(f"Streaming detection for {len(locations)} locations in chunks of {chunk_size}")
+        
+        # Chunks wait on the fetch pool, so they run on their own threads
+        executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="detection-stream")
+        try:
+            for (_, indices), future in iter_completed(executor, detect_chunk, chunks, max_in_flight):
+                try:
+                    results = future.result()
+                except Exception as e:
+                    results = [e] * len(indices)
+                yield from zip(indices, results)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _group_weather(
+        self,
+        weather_future: Future,
+        marine_future: Future,
+        expires_at: float,
+        deadline: float
+    ) -> Any:
+        """
+        Wait for the weather results of one date group.
+        
+        Args:
+            weather_future: Pending get_forecast_many call
+            marine_future: Pending marine call of the same group
+            expires_at: Monotonic time of the overall deadline
+            deadline: Overall deadline in seconds (for messages)
+        
+        Returns:
+            List of per-location results, or the exception shared by the
+            whole group
+        
+        Raises:
+            ValidationError: If the group's locations or parameters are invalid
+        """
+        try:
+            return weather_future.result(timeout=_remaining(expires_at))
+        except FutureTimeoutError:
+            weather_future.cancel()
+            marine_future.cancel()
+            return CustomTimeoutError(f"Weather data not available within {deadline}s deadline")
+        except ValidationError:
+            marine_future.cancel()
+            raise
+        except Exception as e:
+            marine_future.cancel()
+            logger.warning(f"Could not fetch weather data: {e}")
+            return e
+    
+    def _group_marine(self, marine_future: Future, expires_at: float, deadline: float) -> Optional[List[Any]]:
+        """
+        Wait for the optional marine results of one date group.
+        
+        Args:
+            marine_future: Pending get_marine_forecast_many call
+            expires_at: Monotonic time of the overall deadline
+            deadline: Overall deadline in seconds (for messages)
+        
+        Returns:
+            List of per-location results, or None if the marine leg failed
+            or missed the deadline
+        """
+        try:
+            return marine_future.result(timeout=_remaining(expires_at))
+        except FutureTimeoutError:
+            marine_future.cancel()
+            logger.warning(
+                f"Marine data missed the {deadline}s deadline, "
+                f"using weather-only detection"
+            )
+        except Exception as e:
+            logger.warning(f"Could not fetch marine data: {e}")
+        return None
+    
+    def close(self):
+        """Shut down the fetch thread pool."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("DetectionPipeline closed")
+
+
+def _group_by_date(
+    count: int,
+    analysis_date: Optional[str],
+    analysis_dates: Optional[Sequence[Optional[str]]]
+) -> Dict[Optional[str], List[int]]:
+    """
+    Group location indices by analysis date (None for real time).
+    
+    Raises:
+        ValidationError: If analysis_dates does not have one date per location
+    """
+    if analysis_dates is None:
+        analysis_dates = [analysis_date] * count
+    elif len(analysis_dates) != count:
+        raise ValidationError(f"Got {len(analysis_dates)} analysis dates for {count} locations")
+    
+    groups: Dict[Optional[str], List[int]] = {}
+    for index, date in enumerate(analysis_dates):
+        groups.setdefault(date or None, []).append(index)
+    return groups
+
+
+def _remaining(expires_at: float) -> float:
+    """Return the seconds left before expires_at (never negative)."""
+    return max(0.0, expires_at - time.monotonic())
+
+
+def _is_stale(*responses: Optional[Union[Dict[str, Any], ForecastFrame]]) -> bool:
+    """Return True if any of the given service results (dict or ForecastFrame) is marked stale."""
+    return any(
+        response.stale if isinstance(response, ForecastFrame) else response.get("stale", False)
+        for response in responses if response is not None
+    )
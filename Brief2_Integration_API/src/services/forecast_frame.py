@@ -0,0 +1,278 @@
+"""
+Columnar representation of parsed weather forecasts.
+
+A ForecastFrame holds one NumPy array per daily variable, with missing
+values stored as NaN, and aggregates hourly surface pressure into daily
+mean/min/max with a single reshape instead of a per-day Python loop.
+WeatherService.get_forecast_frame and get_forecast_many(as_frame=True)
+hand the frame itself to vectorized callers; the list-of-dicts format
+returned by WeatherService.get_forecast is produced from the frame only
+when it is requested (ForecastFrame.to_dict).
+"""
+
+import logging
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.error_handler import DataNotFoundError
+
+logger = logging.getLogger(__name__)
+
+
+HOURS_PER_DAY = 24
+
+# Daily fields that must be present in a forecast response
+REQUIRED_DAILY_FIELDS = [
+    "time",
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "wind_speed_10m_max"
+]
+
+# Gusts are estimated from wind speed when the API does not provide them
+GUST_FACTOR = 1.4
+
+# Columns exposed in the dict view, in output order
+DICT_COLUMNS = [
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "surface_pressure",
+    "wind_speed_10m_max",
+    "wind_gusts_10m_max"
+]
+
+
+def to_float_array(values: Optional[Sequence[Any]], length: int) -> np.ndarray:
+    """
+    Convert an API value list to a float array, None becoming NaN.
+    
+    Args:
+        values: Values from the API response (None for a missing list)
+        length: Number of values to keep
+    
+    Returns:
+        Float array of the given length
+    
+    Raises:
+        DataNotFoundError: If the list is shorter than length or not numeric
+    """
+    if values is None:
+        return np.full(length, np.nan)
+    
+    if len(values) < length:
+        raise DataNotFoundError(
+            f"Invalid response structure: expected {length} values, got {len(values)}"
+        )
+    
+    try:
+        return np.array(values[:length], dtype=float)
+    except (TypeError, ValueError) as e:
+        raise DataNotFoundError(f"Invalid response structure: {e}")
+
+
+def aggregate_hourly(
+    hourly: np.ndarray,
+    days: int,
+    hours_per_day: int = HOURS_PER_DAY
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Aggregate hourly values into daily mean, min and max, ignoring NaN.
+    
+    Hour h belongs to day h // hours_per_day; hours past the last day are
+    ignored and missing hours count as NaN. A day without any valid hour
+    gets NaN for all three statistics.
+    
+    Args:
+        hourly: Hourly values
+        days: Number of days
+        hours_per_day: Hours per day (default: 24)
+    
+    Returns:
+        Tuple of (mean, min, max) arrays of length days
+    """
+    size = days * hours_per_day
+    padded = np.full(size, np.nan)
+    padded[:min(size, len(hourly))] = hourly[:size]
+    grid = padded.reshape(days, hours_per_day)
+    
+    valid = ~np.isnan(grid)
+    counts = valid.sum(axis=1)
+    has_data = counts > 0
+    
+    # Sequential (cumulative) sum so means match a plain left-to-right sum
+    totals = np.cumsum(np.where(valid, grid, 0.0), axis=1)[:, -1]
+    mean = np.full(days, np.nan)
+    np.divide(totals, counts, out=mean, where=has_data)
+    
+    minimum = np.where(valid, grid, np.inf).min(axis=1)
+    maximum = np.where(valid, grid, -np.inf).max(axis=1)
+    minimum[~has_data] = np.nan
+    maximum[~has_data] = np.nan
+    
+    return mean, minimum, maximum
+
+
+class ForecastFrame:
+    """
+    Columnar daily forecast for one location.
+    
+    Columns:
+    - temperature_2m_max, temperature_2m_min, wind_speed_10m_max
+    - wind_gusts_10m_max (estimated as 1.4x wind speed when missing)
+    - surface_pressure (daily mean of hourly values),
+      surface_pressure_min, surface_pressure_max
+    
+    Missing values are NaN; `mask` tells which values are missing.
+    """
+    
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        dates: List[str],
+        columns: Dict[str, np.ndarray],
+        stale: bool = False,
+        stale_age: Optional[float] = None
+    ):
+        """
+        Initialize forecast frame.
+        
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            dates: Forecast dates (YYYY-MM-DD), one per row
+            columns: Float arrays keyed by variable name, one value per date
+            stale: Whether the data is a last-known-good fallback
+            stale_age: Age of stale data in seconds
+        """
+        self.latitude = latitude
+        self.longitude = longitude
+        self.dates = dates
+        self.columns = columns
+        self.stale = stale
+        self.stale_age = stale_age
+    
+    @classmethod
+    def from_response(
+        cls,
+        response: Dict[str, Any],
+        latitude: float,
+        longitude: float
+    ) -> "ForecastFrame":
+        """
+        Build a frame from a forecast API response.
+        
+        Args:
+            response: Raw API response
+            latitude: Request latitude
+            longitude: Request longitude
+        
+        Returns:
+            ForecastFrame
+        
+        Raises:
+            DataNotFoundError: If required fields are missing or malformed
+        """
+        try:
+            daily = response["daily"]
+            
+            for field in REQUIRED_DAILY_FIELDS:
+                if field not in daily:
+                    raise DataNotFoundError(f"Missing field in response: {field}")
+            
+            dates = list(daily["time"])
+            days = len(dates)
+            
+            wind_speed = to_float_array(daily["wind_speed_10m_max"], days)
+            wind_gusts = to_float_array(daily.get("wind_gusts_10m_max"), days)
+            wind_gusts = np.where(np.isnan(wind_gusts), wind_speed * GUST_FACTOR, wind_gusts)
+            
+            hourly = response.get("hourly", {})
+            hourly_pressure = hourly.get("surface_pressure", [])
+            pressure = to_float_array(hourly_pressure, len(hourly_pressure))
+            pressure_mean, pressure_min, pressure_max = aggregate_hourly(pressure, days)
+            
+            columns = {
+                "temperature_2m_max": to_float_array(daily["temperature_2m_max"], days),
+                "temperature_2m_min": to_float_array(daily["temperature_2m_min"], days),
+                "wind_speed_10m_max": wind_speed,
+                "wind_gusts_10m_max": wind_gusts,
+                "surface_pressure": pressure_mean,
+                "surface_pressure_min": pressure_min,
+                "surface_pressure_max": pressure_max,
+            }
+        
+        except KeyError as e:
+            raise DataNotFoundError(f"Missing required field in response: {e}")
+        except TypeError as e:
+            raise DataNotFoundError(f"Invalid response structure: {e}")
+        
+        return cls(
+            latitude, longitude, dates, columns,
+            stale=bool(response.get("stale")), stale_age=response.get("stale_age")
+        )
+    
+    def __len__(self) -> int:
+        return len(self.dates)
+    
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+    
+    @property
+    def mask(self) -> Dict[str, np.ndarray]:
+        """Boolean arrays, True where a value is missing, keyed by column."""
+        return {name: np.isnan(values) for name, values in self.columns.items()}
+    
+    def head(self, days: int) -> "ForecastFrame":
+        """
+        Return a frame limited to the first days rows (arrays are views).
+        
+        Args:
+            days: Number of rows to keep
+        
+        Returns:
+            ForecastFrame
+        """
+        return ForecastFrame(
+            self.latitude,
+            self.longitude,
+            self.dates[:days],
+            {name: values[:days] for name, values in self.columns.items()},
+            self.stale,
+            self.stale_age
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Produce the WeatherService.get_forecast dictionary view.
+        
+        Returns:
+            {"location": {...}, "forecast": [per-day dicts]} with None for
+            missing values, plus "stale" and "stale_age" for stale data
+        """
+        values = {name: _to_python(self.columns[name]) for name in DICT_COLUMNS}
+        
+        forecast_list = []
+        for i, date in enumerate(self.dates):
+            day = {"date": date}
+            for name in DICT_COLUMNS:
+                day[name] = values[name][i]
+            forecast_list.append(day)
+        
+        result = {
+            "location": {
+                "latitude": self.latitude,
+                "longitude": self.longitude
+            },
+            "forecast": forecast_list
+        }
+        if self.stale:
+            result["stale"] = True
+            result["stale_age"] = self.stale_age
+        return result
+
+
+def _to_python(values: np.ndarray) -> List[Optional[float]]:
+    """Convert a float array to a list of Python floats with None for NaN."""
+    return np.where(np.isnan(values), None, values.astype(object)).tolist()
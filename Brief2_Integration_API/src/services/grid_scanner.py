@@ -0,0 +1,893 @@
+"""
+Basin Grid Scanner.
+
+This service tiles a latitude/longitude bounding box at a fixed
+resolution, fetches every cell with batched multi-coordinate requests
+(a bounded number of batches in flight) and scores all cells and days
+at once with CycloneDetector.detect_batch. An adaptive mode starts
+coarse and only subdivides cells around active weather.
+"""
+
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .weather_service import WeatherService
+from .cyclone_detector import CycloneDetector, CATEGORY_CODES
+from .forecast_frame import ForecastFrame
+from ..utils.api_client import deadline_expiry, deadline_remaining
+from ..utils.batching import Coordinate
+from ..utils.error_handler import ValidationError, APIError
+from ..utils.land_mask import LandSeaMask, get_land_mask
+from ..utils.streaming import iter_completed
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+BoundingBox = Tuple[float, float, float, float]  # (lat_min, lat_max, lon_min, lon_max)
+
+# South-West Indian Ocean cyclone basin (RSMC La Réunion area of responsibility)
+SWIO_BASIN: BoundingBox = (-40.0, 0.0, 30.0, 90.0)
+
+# Category code for cells without data
+MISSING_CATEGORY = -1
+
+# Per-cell columns of an adaptive scan
+ADAPTIVE_COLUMNS = [
+    "latitude",
+    "longitude",
+    "size",
+    "level",
+    "severity",
+    "category_code",
+    "min_pressure",
+    "pressure_gradient",
+    "land",
+    "refined"
+]
+
+
+def build_grid(bbox: BoundingBox, resolution: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the cell-center axes of a bounding box.
+    
+    Args:
+        bbox: (lat_min, lat_max, lon_min, lon_max) in degrees, bounds included
+        resolution: Cell size in degrees
+    
+    Returns:
+        Tuple of (latitudes, longitudes) in ascending order
+    
+    Raises:
+        ValidationError: If the bounding box or resolution is invalid
+    """
+    lat_min, lat_max, lon_min, lon_max = bbox
+    
+    if resolution <= 0:
+        raise ValidationError(f"Resolution must be > 0, got: {resolution}")
+    if not -90 <= lat_min <= lat_max <= 90:
+        raise ValidationError(f"Invalid latitude range: {lat_min} to {lat_max}")
+    if not -180 <= lon_min <= lon_max <= 180:
+        raise ValidationError(f"Invalid longitude range: {lon_min} to {lon_max}")
+    
+    # Integer steps avoid accumulating float error along the axis
+    lat_steps = int(np.floor((lat_max - lat_min) / resolution + 1e-9)) + 1
+    lon_steps = int(np.floor((lon_max - lon_min) / resolution + 1e-9)) + 1
+    latitudes = np.round(lat_min + np.arange(lat_steps) * resolution, 4)
+    longitudes = np.round(lon_min + np.arange(lon_steps) * resolution, 4)
+    
+    return latitudes, longitudes
+
+
+class GridScanResult:
+    """
+    Dense detection results for a scanned grid.
+    
+    Arrays are indexed [day, latitude, longitude], latitudes and
+    longitudes ascending. Cells whose data could not be fetched, and land
+    cells skipped by the land/sea mask, hold NaN severity and
+    MISSING_CATEGORY.
+    """
+    
+    def __init__(
+        self,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        resolution: float,
+        dates: List[str],
+        severity: np.ndarray,
+        category_code: np.ndarray,
+        failed_cells: int = 0,
+        land: Optional[np.ndarray] = None
+    ):
+        """
+        Initialize scan result.
+        
+        Args:
+            latitudes: Cell-center latitudes
+            longitudes: Cell-center longitudes
+            resolution: Cell size in degrees
+            dates: Forecast dates, one per day
+            severity: Severity scores shaped (days, latitudes, longitudes)
+            category_code: Category codes (index in CATEGORY_CODES), same shape
+            failed_cells: Number of ocean cells without data
+            land: Land cells skipped, shaped (latitudes, longitudes)
+                (default: none)
+        """
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.resolution = resolution
+        self.dates = dates
+        self.severity = severity
+        self.category_code = category_code
+        self.failed_cells = failed_cells
+        self.land = land if land is not None else np.zeros(severity.shape[1:], dtype=bool)
+    
+    @property
+    def peak_severity(self) -> np.ndarray:
+        """Highest severity over the forecast days, shaped (latitudes, longitudes)."""
+        return np.fmax.reduce(self.severity, axis=0)
+    
+    @property
+    def peak_category(self) -> np.ndarray:
+        """Most severe category code over the forecast days."""
+        return self.category_code.max(axis=0)
+    
+    def to_geojson(self, min_severity: float = 0.0) -> Dict[str, Any]:
+        """
+        Build a GeoJSON FeatureCollection with one square polygon per cell.
+        
+        Args:
+            min_severity: Only include cells whose peak severity is at
+                least this value (cells without data are always skipped)
+        
+        Returns:
+            GeoJSON dictionary
+        """
+        peak = self.peak_severity
+        peak_day = np.where(np.isnan(self.severity), -np.inf, self.severity).argmax(axis=0)
+        category = self.peak_category
+        half = self.resolution / 2
+        
+        features = []
+        for i, j in zip(*np.nonzero(peak >= min_severity)):
+            lat = float(self.latitudes[i])
+            lon = float(self.longitudes[j])
+            features.append(_cell_feature(lat, lon, self.resolution, {
+                "severity_score": float(peak[i, j]),
+                "category": CATEGORY_CODES[category[i, j]].value,
+                "peak_date": self.dates[peak_day[i, j]] if self.dates else None
+            }))
+        
+        return {
+            "type": "FeatureCollection",
+            "bbox": [
+                float(self.longitudes[0]) - half,
+                float(self.latitudes[0]) - half,
+                float(self.longitudes[-1]) + half,
+                float(self.latitudes[-1]) + half
+            ],
+            "features": features
+        }
+    
+    def save(self, output: str, min_severity: float = 0.0) -> Tuple[Path, Path]:
+        """
+        Write the peak severity grid (.npy) and the GeoJSON cells (.geojson).
+        
+        Args:
+            output: Output path without extension
+            min_severity: Minimum peak severity of cells written to GeoJSON
+        
+        Returns:
+            Tuple of (npy path, geojson path)
+        """
+        return _write_outputs(output, self.peak_severity, self.to_geojson(min_severity))
+
+
+class AdaptiveScanResult:
+    """
+    Cells of a coarse-to-fine scan, with the upstream call report.
+    
+    `cells` holds one array per ADAPTIVE_COLUMNS entry, one value per
+    fetched cell at any level. Leaf cells (not refined) tile the box
+    without overlap; severity and category are peaks over the forecast
+    days, NaN and MISSING_CATEGORY for cells without data.
+    """
+    
+    def __init__(
+        self,
+        bbox: BoundingBox,
+        finest_resolution: float,
+        dates: List[str],
+        cells: Dict[str, np.ndarray],
+        calls: int,
+        uniform_calls: int,
+        uniform_cells: int
+    ):
+        """
+        Initialize adaptive scan result.
+        
+        Args:
+            bbox: Outer cell edges (lat_min, lat_max, lon_min, lon_max)
+            finest_resolution: Size of the smallest possible cell in degrees
+            dates: Forecast dates
+            cells: Per-cell arrays keyed by ADAPTIVE_COLUMNS
+            calls: Batched requests issued by the scan
+            uniform_calls: Batched requests a uniform finest grid would need
+            uniform_cells: Cells of the uniform finest grid
+        """
+        self.bbox = bbox
+        self.finest_resolution = finest_resolution
+        self.dates = dates
+        self.cells = cells
+        self.calls = calls
+        self.uniform_calls = uniform_calls
+        self.uniform_cells = uniform_cells
+    
+    @property
+    def leaves(self) -> np.ndarray:
+        """Boolean mask of the cells that were not subdivided."""
+        return ~self.cells["refined"].astype(bool)
+    
+    def call_report(self) -> Dict[str, Any]:
+        """Return fetched cells and requests against the equivalent uniform grid."""
+        land = self.cells["land"].astype(bool)
+        return {
+            "cells_fetched": int((~land).sum()),
+            "land_cells_skipped": int(land.sum()),
+            "calls": self.calls,
+            "uniform_cells": self.uniform_cells,
+            "uniform_calls": self.uniform_calls,
+            "finest_resolution": self.finest_resolution,
+            "savings_ratio": round(self.uniform_calls / self.calls, 2) if self.calls else None
+        }
+    
+    def to_dense(self) -> np.ndarray:
+        """
+        Rasterize leaf severities onto the uniform finest grid.
+        
+        Returns:
+            Array shaped (latitudes, longitudes), latitudes ascending
+        """
+        lat_min, lat_max, lon_min, lon_max = self.bbox
+        step = self.finest_resolution
+        rows = int(round((lat_max - lat_min) / step))
+        cols = int(round((lon_max - lon_min) / step))
+        grid = np.full((rows, cols), np.nan)
+        
+        cells = self.cells
+        for index in np.flatnonzero(self.leaves):
+            span = int(round(cells["size"][index] / step))
+            row = int(round((cells["latitude"][index] - lat_min) / step - span / 2))
+            col = int(round((cells["longitude"][index] - lon_min) / step - span / 2))
+            grid[row:row + span, col:col + span] = cells["severity"][index]
+        
+        return grid
+    
+    def to_geojson(self, min_severity: float = 0.0) -> Dict[str, Any]:
+        """
+        Build a GeoJSON FeatureCollection with one polygon per leaf cell.
+        
+        Args:
+            min_severity: Only include leaves whose peak severity is at
+                least this value (cells without data are always skipped)
+        
+        Returns:
+            GeoJSON dictionary
+        """
+        cells = self.cells
+        keep = self.leaves & (cells["severity"] >= min_severity)
+        
+        features = [
+            _cell_feature(
+                float(cells["latitude"][index]),
+                float(cells["longitude"][index]),
+                float(cells["size"][index]),
+                {
+                    "severity_score": float(cells["severity"][index]),
+                    "category": CATEGORY_CODES[cells["category_code"][index]].value,
+                    "level": int(cells["level"][index]),
+                    "pressure_gradient": _finite_or_none(cells["pressure_gradient"][index])
+                }
+            )
+            for index in np.flatnonzero(keep)
+        ]
+        
+        lat_min, lat_max, lon_min, lon_max = self.bbox
+        return {
+            "type": "FeatureCollection",
+            "bbox": [lon_min, lat_min, lon_max, lat_max],
+            "features": features
+        }
+    
+    def save(self, output: str, min_severity: float = 0.0) -> Tuple[Path, Path]:
+        """
+        Write the rasterized severity grid (.npy) and the leaf cells (.geojson).
+        
+        Args:
+            output: Output path without extension
+            min_severity: Minimum peak severity of cells written to GeoJSON
+        
+        Returns:
+            Tuple of (npy path, geojson path)
+        """
+        return _write_outputs(output, self.to_dense(), self.to_geojson(min_severity))
+
+
+class GridScanner:
+    """
+    Basin-wide cyclone detection over a regular lat/lon grid.
+    
+    Cells are split into batches of MAX_LOCATIONS_PER_REQUEST coordinates;
+    at most max_concurrency batches are fetched at the same time, each one
+    through WeatherService.get_forecast_many as ForecastFrame columns,
+    stacked into arrays without per-day dicts. SST comes from the monthly
+    climatology, or is estimated from air temperature where it has no
+    value, as in CycloneDetector.detect without marine data. Cells the
+    land/sea mask marks as land are not fetched.
+    """
+    
+    def __init__(
+        self,
+        weather_service: WeatherService,
+        cyclone_detector: Optional[CycloneDetector] = None,
+        max_concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        land_mask: Optional[LandSeaMask] = None,
+        skip_land: bool = True
+    ):
+        """
+        Initialize Grid Scanner.
+        
+        Args:
+            weather_service: Service used for weather forecasts
+            cyclone_detector: Detector (default: new CycloneDetector)
+            max_concurrency: Batches fetched concurrently (default: from settings)
+            batch_size: Cells per batch (default: MAX_LOCATIONS_PER_REQUEST)
+            land_mask: Optional land/sea mask (default: shared mask from
+                LAND_MASK_PATH, if available)
+            skip_land: Drop land cells from scans (default: True)
+        """
+        self.weather_service = weather_service
+        self.cyclone_detector = cyclone_detector or CycloneDetector()
+        self.max_concurrency = max_concurrency or settings.GRID_MAX_CONCURRENCY
+        self.batch_size = batch_size or settings.MAX_LOCATIONS_PER_REQUEST
+        self.land_mask = (land_mask or get_land_mask()) if skip_land else None
+        
+        logger.info(
+            f"GridScanner initialized: concurrency={self.max_concurrency}, "
+            f"batch_size={self.batch_size}"
+        )
+    
+    def scan(
+        self,
+        bbox: BoundingBox = SWIO_BASIN,
+        resolution: Optional[float] = None,
+        forecast_days: int = 7,
+        deadline: Optional[float] = None
+    ) -> GridScanResult:
+        """
+        Fetch and score every cell of a bounding box.
+        
+        Args:
+            bbox: (lat_min, lat_max, lon_min, lon_max) (default: SWIO basin)
+            resolution: Cell size in degrees (default: from settings)
+            forecast_days: Number of forecast days (1-16, default: 7)
+            deadline: Optional total time budget in seconds for all batches
+        
+        Returns:
+            GridScanResult
+        
+        Raises:
+            ValidationError: If the grid or parameters are invalid
+        """
+        resolution = resolution or settings.GRID_RESOLUTION
+        latitudes, longitudes = build_grid(bbox, resolution)
+        lat_grid, lon_grid = np.meshgrid(latitudes, longitudes, indexing="ij")
+        cells = list(zip(lat_grid.ravel().tolist(), lon_grid.ravel().tolist()))
+        
+        logger.info(
+            f"Scanning {len(latitudes)}x{len(longitudes)} grid ({len(cells)} cells) "
+            f"at {resolution}°, {forecast_days} days"
+        )
+        start = time.monotonic()
+        
+        scored = self._score_cells(cells, forecast_days, deadline)
+        land = scored["land"]
+        failed = scored["missing"] & ~land
+        
+        # (cells, days) -> (days, latitudes, longitudes)
+        shape = (len(latitudes), len(longitudes), forecast_days)
+        severity = scored["severity"].reshape(shape).transpose(2, 0, 1)
+        category_code = scored["category_code"].reshape(shape).transpose(2, 0, 1)
+        
+        logger.info(
+            f"Grid scan complete in {time.monotonic() - start:.1f}s: "
+            f"{len(cells) - int(scored['missing'].sum())}/{len(cells)} cells scored, "
+            f"{int(land.sum())} land cells skipped"
+        )
+        
+        return GridScanResult(
+            latitudes, longitudes, resolution, scored["dates"],
+            severity, category_code, failed_cells=int(failed.sum()),
+            land=land.reshape(shape[:2])
+        )
+    
+    def iter_scan(
+        self,
+        bbox: BoundingBox = SWIO_BASIN,
+        resolution: Optional[float] = None,
+        forecast_days: int = 7,
+        deadline: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch and score every cell of a bounding box, yielding cells as they are scored.
+        
+        Cells are scored batch by batch exactly as in scan(), but each batch
+        is handed out as soon as it is done instead of being assembled
+        into a dense grid. At most max_concurrency batches are fetched
+        ahead of the consumer; closing the iterator cancels the batches
+        not started yet.
+        
+        Args:
+            bbox: (lat_min, lat_max, lon_min, lon_max) (default: SWIO basin)
+            resolution: Cell size in degrees (default: from settings)
+            forecast_days: Number of forecast days (1-16, default: 7)
+            deadline: Optional time budget in seconds per batch
+        
+        Yields:
+            One dictionary per cell, in batch completion order:
+            {
+                "latitude": float,
+                "longitude": float,
+                "land": bool (skipped by the land/sea mask),
+                "missing": bool (no data),
+                "dates": [str],
+                "severity_series": [float or None],
+                "category_series": [str or None],
+                "peak_severity": float or None,
+                "min_pressure": float or None
+            }
+        
+        Raises:
+            ValidationError: If the grid or parameters are invalid
+        """
+        resolution = resolution or settings.GRID_RESOLUTION
+        latitudes, longitudes = build_grid(bbox, resolution)
+        lat_grid, lon_grid = np.meshgrid(latitudes, longitudes, indexing="ij")
+        cells = list(zip(lat_grid.ravel().tolist(), lon_grid.ravel().tolist()))
+        batches = (cells[offset:offset + self.batch_size] for offset in range(0, len(cells), self.batch_size))
+        
+        logger.info(f"Streaming scan of {len(cells)} cells at {resolution}°, {forecast_days} days")
+        
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="grid-stream")
+        try:
+            for batch, future in iter_completed(
+                executor,
+                lambda batch: self._score_cells(batch, forecast_days, deadline),
+                batches,
+                self.max_concurrency
+            ):
+                yield from _cell_records(batch, future.result())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def scan_adaptive(
+        self,
+        bbox: BoundingBox = SWIO_BASIN,
+        coarse_resolution: Optional[float] = None,
+        min_resolution: Optional[float] = None,
+        severity_threshold: Optional[float] = None,
+        gradient_threshold: Optional[float] = None,
+        forecast_days: int = 7,
+        deadline: Optional[float] = None
+    ) -> AdaptiveScanResult:
+        """
+        Scan coarse-to-fine, only subdividing cells that look active.
+        
+        The box is first scanned at coarse_resolution. A cell is split
+        into 4 half-size cells when its peak severity or its pressure
+        gradient (largest minimum-pressure difference with a same-size
+        neighbour, in hPa per degree) reaches the threshold, until cells
+        reach min_resolution. Calm water is therefore only fetched once,
+        at the coarse resolution. A cell whose center is on land is not
+        fetched but still split while its footprint has any water, so
+        the land/sea mask only drops whole cells at min_resolution.
+        
+        Args:
+            bbox: (lat_min, lat_max, lon_min, lon_max) (default: SWIO basin)
+            coarse_resolution: First-pass cell size in degrees (default: from settings)
+            min_resolution: Smallest cell size in degrees (default: from settings)
+            severity_threshold: Peak severity triggering refinement (default: from settings)
+            gradient_threshold: Pressure gradient in hPa/° triggering
+                refinement (default: from settings)
+            forecast_days: Number of forecast days (1-16, default: 7)
+            deadline: Optional total time budget in seconds for all levels
+        
+        Returns:
+            AdaptiveScanResult
+        
+        Raises:
+            ValidationError: If the grid or parameters are invalid
+        """
+        coarse_resolution = coarse_resolution or settings.GRID_COARSE_RESOLUTION
+        min_resolution = min_resolution or settings.GRID_MIN_RESOLUTION
+        if severity_threshold is None:
+            severity_threshold = settings.GRID_REFINE_SEVERITY
+        if gradient_threshold is None:
+            gradient_threshold = settings.GRID_REFINE_PRESSURE_GRADIENT
+        
+        if min_resolution > coarse_resolution:
+            raise ValidationError(
+                f"min_resolution ({min_resolution}) must not exceed "
+                f"coarse_resolution ({coarse_resolution})"
+            )
+        
+        latitudes, longitudes = build_grid(bbox, coarse_resolution)
+        levels = int(np.floor(np.log2(coarse_resolution / min_resolution) + 1e-9))
+        
+        # Cells are (row, col) indices at their level; level-l cells have
+        # size coarse / 2**l and share the edges of the coarse grid
+        lat_edge = float(latitudes[0]) - coarse_resolution / 2
+        lon_edge = float(longitudes[0]) - coarse_resolution / 2
+        pending = [(i, j) for i in range(len(latitudes)) for j in range(len(longitudes))]
+        
+        logger.info(
+            f"Adaptive scan: {len(pending)} coarse cells at {coarse_resolution}°, "
+            f"up to {levels} refinement levels (min {coarse_resolution / 2 ** levels}°)"
+        )
+        expires_at = deadline_expiry(deadline)
+        
+        columns: Dict[str, List[Any]] = {name: [] for name in ADAPTIVE_COLUMNS}
+        calls = 0
+        dates: List[str] = []
+        for level in range(levels + 1):
+            if not pending:
+                break
+            size = coarse_resolution / 2 ** level
+            cells = [
+                (round(lat_edge + (row + 0.5) * size, 4), round(lon_edge + (col + 0.5) * size, 4))
+                for row, col in pending
+            ]
+            scored = self._score_cells(cells, forecast_days, deadline_remaining(expires_at))
+            calls += scored["calls"]
+            dates = scored["dates"] or dates
+            
+            peak = np.fmax.reduce(scored["severity"], axis=1)
+            gradient = _pressure_gradient(pending, scored["min_pressure"], size)
+            refine = (peak >= severity_threshold) | (gradient >= gradient_threshold)
+            refine |= self._coastal(cells, scored["land"], size)
+            if level == levels:
+                refine[:] = False
+            
+            columns["latitude"].extend(lat for lat, _ in cells)
+            columns["longitude"].extend(lon for _, lon in cells)
+            columns["size"].extend([size] * len(cells))
+            columns["level"].extend([level] * len(cells))
+            columns["severity"].extend(peak.tolist())
+            columns["category_code"].extend(scored["category_code"].max(axis=1).tolist())
+            columns["min_pressure"].extend(scored["min_pressure"].tolist())
+            columns["pressure_gradient"].extend(gradient.tolist())
+            columns["land"].extend(scored["land"].tolist())
+            columns["refined"].extend(refine.tolist())
+            
+            pending = [
+                (2 * row + d_row, 2 * col + d_col)
+                for (row, col), split in zip(pending, refine) if split
+                for d_row in (0, 1) for d_col in (0, 1)
+            ]
+        
+        finest = coarse_resolution / 2 ** levels
+        uniform_cells = len(latitudes) * len(longitudes) * 4 ** levels
+        result = AdaptiveScanResult(
+            bbox=(lat_edge, lat_edge + len(latitudes) * coarse_resolution,
+                  lon_edge, lon_edge + len(longitudes) * coarse_resolution),
+            finest_resolution=finest,
+            dates=dates,
+            cells={name: np.array(values) for name, values in columns.items()},
+            calls=calls,
+            uniform_calls=-(-uniform_cells // self.batch_size),
+            uniform_cells=uniform_cells
+        )
+        
+        logger.info(
+            f"Adaptive scan complete: {len(columns['level'])} cells fetched in {calls} requests "
+            f"(uniform {finest}° grid: {uniform_cells} cells in {result.uniform_calls} batches)"
+        )
+        
+        return result
+    
+    def _coastal(self, cells: Sequence[Coordinate], land: np.ndarray, size: float) -> np.ndarray:
+        """
+        Find land-centered cells whose footprint still has some water.
+        
+        Args:
+            cells: Cell-center (latitude, longitude) pairs
+            land: Cells the point mask marked as land
+            size: Cell size in degrees
+        
+        Returns:
+            Boolean array, True for land-centered cells that are not
+            entirely land at the mask resolution
+        """
+        coastal = land.copy()
+        if self.land_mask is not None and coastal.any():
+            indices = np.flatnonzero(coastal)
+            latitudes, longitudes = np.array([cells[index] for index in indices], dtype=float).T
+            coastal[indices] = ~self.land_mask.is_all_land_many(latitudes, longitudes, size)
+        return coastal
+    
+    def _score_cells(
+        self,
+        cells: Sequence[Coordinate],
+        forecast_days: int,
+        deadline: Optional[float]
+    ) -> Dict[str, Any]:
+        """
+        Fetch and score a list of cells.
+        
+        Args:
+            cells: Cell-center (latitude, longitude) pairs
+            forecast_days: Number of forecast days
+            deadline: Optional total time budget in seconds
+        
+        Returns:
+            Dictionary with "severity" and "category_code" arrays shaped
+            (cells, days), "min_pressure" per cell, the "missing" (no data)
+            and "land" (not fetched) cell masks, the forecast "dates" and
+            the number of batched "calls" sent upstream
+        """
+        if self.land_mask is not None and cells:
+            latitudes, longitudes = zip(*cells)
+            land = self.land_mask.is_land_many(latitudes, longitudes)
+        else:
+            land = np.zeros(len(cells), dtype=bool)
+        
+        ocean = np.flatnonzero(~land).tolist()
+        forecasts: List[Optional[ForecastFrame]] = [None] * len(cells)
+        ocean_forecasts, calls = self._fetch([cells[index] for index in ocean], forecast_days, deadline)
+        for index, forecast in zip(ocean, ocean_forecasts):
+            forecasts[index] = forecast
+        arrays, dates = _stack_forecasts(forecasts, forecast_days)
+        
+        detector = self.cyclone_detector
+        sst = detector.estimate_sst_batch(arrays["temperature_2m_max"], arrays["temperature_2m_min"])
+        if dates:
+            latitudes, longitudes = np.array(cells, dtype=float).T
+            climatology = detector.climatology_sst_batch(latitudes[:, None], longitudes[:, None], dates)
+            estimated = sst[:, :len(dates)]
+            sst[:, :len(dates)] = np.where(np.isnan(climatology), estimated, climatology)
+        batch = detector.detect_batch(
+            sst,
+            arrays["surface_pressure"],
+            arrays["wind_speed_10m_max"],
+            arrays["wind_gusts_10m_max"]
+        )
+        
+        # Cells without data keep NaN severity instead of a score of 0
+        missing = np.array([forecast is None for forecast in forecasts], dtype=bool)
+        severity = batch["severity_score"]
+        severity[missing] = np.nan
+        category_code = batch["category_code"].astype(np.int8)
+        category_code[missing] = MISSING_CATEGORY
+        
+        return {
+            "severity": severity,
+            "category_code": category_code,
+            "min_pressure": np.fmin.reduce(arrays["surface_pressure"], axis=1),
+            "missing": missing,
+            "land": land,
+            "dates": dates,
+            "calls": calls
+        }
+    
+    def _fetch(
+        self,
+        cells: Sequence[Coordinate],
+        forecast_days: int,
+        deadline: Optional[float]
+    ) -> Tuple[List[Optional[ForecastFrame]], int]:
+        """
+        Fetch forecasts for all cells, a bounded number of batches at a time.
+        
+        Args:
+            cells: Cell-center (latitude, longitude) pairs
+            forecast_days: Number of forecast days
+            deadline: Optional total time budget in seconds
+        
+        Returns:
+            Tuple of (forecasts aligned with cells, None where the data is
+            unavailable, and the number of requests sent, failed ones included)
+        """
+        expires_at = deadline_expiry(deadline)
+        forecasts: List[Optional[ForecastFrame]] = [None] * len(cells)
+        
+        def fetch_batch(offset: int) -> int:
+            batch = cells[offset:offset + self.batch_size]
+            stats = {"requests": 0}
+            try:
+                results = self.weather_service.get_forecast_many(
+                    batch,
+                    forecast_days=forecast_days,
+                    return_exceptions=True,
+                    deadline=deadline_remaining(expires_at),
+                    stats=stats,
+                    as_frame=True
+                )
+            except APIError as e:
+                logger.warning(f"Grid batch at cell {offset} failed: {e}")
+                return stats["requests"]
+            
+            for index, result in enumerate(results):
+                if not isinstance(result, Exception):
+                    forecasts[offset + index] = result
+            return stats["requests"]
+        
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="grid-scan"
+        ) as executor:
+            calls = sum(executor.map(fetch_batch, range(0, len(cells), self.batch_size)))
+        
+        return forecasts, calls
+
+
+def _cell_records(cells: Sequence[Coordinate], scored: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Describe each scored cell as a plain dictionary (see GridScanner.iter_scan).
+    
+    Args:
+        cells: Cell-center (latitude, longitude) pairs
+        scored: Result of GridScanner._score_cells for these cells
+    
+    Yields:
+        One dictionary per cell, NaN values as None
+    """
+    severity = scored["severity"]
+    peak = np.fmax.reduce(severity, axis=1)
+    for index, (latitude, longitude) in enumerate(cells):
+        yield {
+            "latitude": latitude,
+            "longitude": longitude,
+            "land": bool(scored["land"][index]),
+            "missing": bool(scored["missing"][index]),
+            "dates": scored["dates"],
+            "severity_series": [_finite_or_none(value) for value in severity[index]],
+            "category_series": [
+                None if code == MISSING_CATEGORY else CATEGORY_CODES[code].value
+                for code in scored["category_code"][index].tolist()
+            ],
+            "peak_severity": _finite_or_none(peak[index]),
+            "min_pressure": _finite_or_none(scored["min_pressure"][index])
+        }
+
+
+def _finite_or_none(value: float) -> Optional[float]:
+    """Return value as a float, None if it is NaN."""
+    return None if np.isnan(value) else float(value)
+
+
+def _stack_forecasts(
+    forecasts: Sequence[Optional[ForecastFrame]],
+    days: int
+) -> Tuple[Dict[str, np.ndarray], List[str]]:
+    """
+    Stack per-cell forecast frames into (cells, days) float arrays.
+    
+    Frame columns are copied row by row; missing cells, days and values
+    are NaN. Gusts absent from the response were already estimated by
+    the frame.
+    
+    Args:
+        forecasts: Forecast frames from WeatherService (None for missing cells)
+        days: Number of forecast days
+    
+    Returns:
+        Tuple of (arrays keyed by field name, forecast dates)
+    """
+    fields = [
+        "temperature_2m_max",
+        "temperature_2m_min",
+        "surface_pressure",
+        "wind_speed_10m_max",
+        "wind_gusts_10m_max"
+    ]
+    arrays = {name: np.full((len(forecasts), days), np.nan) for name in fields}
+    dates: List[str] = []
+    
+    for row, frame in enumerate(forecasts):
+        if frame is None:
+            continue
+        length = min(len(frame), days)
+        if length > len(dates):
+            dates = list(frame.dates[:length])
+        for name in fields:
+            arrays[name][row, :length] = frame[name][:length]
+    
+    return arrays, dates
+
+
+def _pressure_gradient(
+    indices: Sequence[Tuple[int, int]],
+    min_pressure: np.ndarray,
+    size: float
+) -> np.ndarray:
+    """
+    Largest pressure difference with a same-level neighbour, per degree.
+    
+    Args:
+        indices: (row, col) of each cell at its level
+        min_pressure: Minimum pressure of each cell in hPa (NaN if missing)
+        size: Cell size in degrees
+    
+    Returns:
+        Gradient in hPa per degree (0 for cells without a scored neighbour)
+    """
+    pressure_at = {index: value for index, value in zip(indices, min_pressure.tolist())}
+    gradient = np.zeros(len(indices))
+    
+    for n, ((row, col), value) in enumerate(zip(indices, min_pressure.tolist())):
+        for neighbour in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            other = pressure_at.get(neighbour)
+            if other is not None:
+                # NaN differences compare False and are ignored
+                difference = abs(value - other) / size
+                if difference > gradient[n]:
+                    gradient[n] = difference
+    
+    return gradient
+
+
+def _cell_feature(
+    latitude: float,
+    longitude: float,
+    size: float,
+    properties: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build a GeoJSON square polygon feature centered on a cell."""
+    half = size / 2
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[
+                [longitude - half, latitude - half],
+                [longitude + half, latitude - half],
+                [longitude + half, latitude + half],
+                [longitude - half, latitude + half],
+                [longitude - half, latitude - half]
+            ]]
+        },
+        "properties": {"latitude": latitude, "longitude": longitude, **properties}
+    }
+
+
+def _write_outputs(output: str, grid: np.ndarray, geojson: Dict[str, Any]) -> Tuple[Path, Path]:
+    """
+    Write a severity grid as .npy and cells as .geojson next to each other.
+    
+    Args:
+        output: Output path without extension
+        grid: Severity grid
+        geojson: GeoJSON FeatureCollection
+    
+    Returns:
+        Tuple of (npy path, geojson path)
+    """
+    base = Path(output)
+    base.parent.mkdir(parents=True, exist_ok=True)
+    npy_path = base.with_suffix(".npy")
+    geojson_path = base.with_suffix(".geojson")
+    
+    np.save(npy_path, grid)
+    with open(geojson_path, "w", encoding="utf-8") as f:
+        json.dump(geojson, f)
+    
+    logger.info(f"Grid scan written to {npy_path} and {geojson_path}")
+    
+    return npy_path, geojson_path
@@ -5,12 +5,27 @@ This service handles all interactions with the Marine Weather API,
 including marine forecasts and sea surface temperature data.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
-from ..utils.api_client import APIClient
-from ..utils.error_handler import ValidationError, DataNotFoundError
+import numpy as np
+
+from ..utils.api_client import APIClient, copy_stale_marker, deadline_expiry, deadline_remaining
+from ..utils.async_api_client import AsyncAPIClient
+from ..utils.batching import (
+    Coordinate,
+    group_by_cell,
+    iter_coordinate_chunks,
+    snap_coordinate,
+    split_multi_response
+)
+from ..utils.error_handler import APIError, ValidationError, DataNotFoundError
+from ..utils.land_mask import LandSeaMask, get_land_mask
+from ..utils.negative_cache import NegativeCache
+from ..utils.sst_climatology import SSTClimatology, get_sst_climatology, month_index
 from ..config.settings import settings
+from .forecast_frame import aggregate_hourly, to_float_array
 
 logger = logging.getLogger(__name__)
 
@@ -21,19 +36,48 @@ class MarineService:
     
     Features:
     - Get marine weather forecasts (up to 7 days)
-    - Sea surface temperature (SST)
+    - Sea surface temperature (SST), daily means of hourly values fetched
+      in the same call as waves, with a monthly climatology fallback
     - Wave height and direction
     - Automatic validation and parsing
+    - Inland locations rejected without an API call (land/sea mask)
+    - Recently failed locations rejected without an API call (negative cache)
+    - Coordinates snapped to the model grid (shared cache entries for
+      nearby points), requested location kept in results
     """
     
-    def __init__(self, api_client: Optional[APIClient] = None):
+    def __init__(
+        self,
+        api_client: Optional[APIClient] = None,
+        land_mask: Optional[LandSeaMask] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        snap_resolution: Optional[float] = None,
+        sst_climatology: Optional[SSTClimatology] = None
+    ):
         """
         Initialize Marine Service.
         
         Args:
             api_client: Optional custom API client (default: new APIClient)
+            land_mask: Optional land/sea mask (default: shared mask from
+                LAND_MASK_PATH, if available)
+            negative_cache: Optional cache of failed lookups (default: new
+                NegativeCache if NEGATIVE_CACHE_ENABLED)
+            snap_resolution: Model grid step in degrees requests are snapped
+                to, 0 to disable (default: SNAP_RESOLUTION_MARINE)
+            sst_climatology: Optional monthly SST climatology used when the
+                API has no SST (default: shared grid from SST_CLIMATOLOGY_PATH,
+                if available)
         """
         self.api_client = api_client or APIClient()
+        self.land_mask = land_mask or get_land_mask()
+        if negative_cache is None and settings.NEGATIVE_CACHE_ENABLED:
+            negative_cache = NegativeCache()
+        self.negative_cache = negative_cache
+        self.snap_resolution = (
+            settings.SNAP_RESOLUTION_MARINE if snap_resolution is None else snap_resolution
+        )
+        self.sst_climatology = sst_climatology or get_sst_climatology()
         self.base_url = settings.MARINE_API_URL
         logger.info(f"MarineService initialized with URL: {self.base_url}")
     
@@ -43,15 +87,20 @@ class MarineService:
         longitude: float,
         forecast_days: int = 7,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Get marine weather forecast for a location.
         
+        A request that failed recently is answered from the negative cache
+        with an error of the same class, without an API call.
+        
         Args:
             latitude: Latitude (-90 to 90)
             longitude: Longitude (-180 to 180)
             forecast_days: Number of forecast days (1-7, default: 7)
+            deadline: Optional total time budget in seconds, retries included
         
         Returns:
             Dictionary with marine forecast data:
@@ -70,35 +119,226 @@ class MarineService:
         
         Raises:
             ValidationError: If parameters are invalid
-            DataNotFoundError: If required data is missing from response
+            DataNotFoundError: If the location is inland or required data is missing from response
+        """
+        params = self._build_marine_params(
+            latitude, longitude, forecast_days, start_date, end_date
+        )
+        self._raise_known_failure(params)
+        
+        # Make API call
+        try:
+            response = self.api_client.get(self.base_url, params=params, deadline=deadline)
+            return self._build_marine_result(response, latitude, longitude, forecast_days)
+        except APIError as e:
+            self._remember_failure(params, e)
+            raise
+    
+    def get_marine_forecast_many(
+        self,
+        locations: Sequence[Coordinate],
+        forecast_days: int = 7,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        return_exceptions: bool = False,
+        deadline: Optional[float] = None
+    ) -> List[Any]:
+        """
+        Get marine forecasts for many locations with batched requests.
+        
+        Locations are sent as comma-separated coordinate lists, split into
+        URL-length-safe chunks, so N points cost one HTTP call per chunk
+        instead of one per point.
+        
+        Args:
+            locations: Sequence of (latitude, longitude) pairs
+            forecast_days: Number of forecast days (1-7, default: 7)
+            start_date: Optional historical start date (YYYY-MM-DD)
+            end_date: Optional historical end date (YYYY-MM-DD)
+            return_exceptions: If True, a location whose data cannot be
+                parsed gets its DataNotFoundError in place of a result
+                instead of failing the whole batch
+            deadline: Optional total time budget in seconds for all chunks,
+                retries included
+        
+        Returns:
+            List of marine forecast dictionaries (same format as
+            get_marine_forecast), in the same order as locations
+        
+        Raises:
+            ValidationError: If any location or parameter is invalid
+            DataNotFoundError: If a location is inland or required data is missing from a response
+        """
+        locations = list(locations)
+        for latitude, longitude in locations:
+            self._validate_coordinates(latitude, longitude)
+        query = self._build_marine_query(forecast_days, start_date, end_date)
+        
+        results: List[Any] = [None] * len(locations)
+        ocean = self._ocean_indices(locations, results, return_exceptions)
+        ocean = self._drop_known_failures(ocean, locations, query, results, return_exceptions)
+        
+        logger.info(
+            f"Fetching marine forecast for {len(ocean)} locations "
+            f"({len(locations) - len(ocean)} inland or known bad skipped), {forecast_days} days"
+        )
+        
+        expires_at = deadline_expiry(deadline)
+        cells, members = self._group_cells(ocean, locations)
+        for indices, params in iter_coordinate_chunks(self.base_url, query, cells):
+            response = self.api_client.get(
+                self.base_url, params=params, deadline=deadline_remaining(expires_at)
+            )
+            self._collect_many(
+                response, [members[i] for i in indices], locations, query, forecast_days,
+                results, return_exceptions
+            )
+        
+        return results
+    
+    def get_sst(
+        self,
+        latitude: float,
+        longitude: float,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Get sea surface temperature for a location.
+        
+        The temperature is the mean of the first day's hourly SST. When the
+        API has no SST there (e.g. near the coast), the climatological value
+        for the month is used instead, without any additional call.
+        
+        Args:
+            latitude: Latitude (-90 to 90)
+            longitude: Longitude (-180 to 180)
+            deadline: Optional total time budget in seconds, retries included
+        
+        Returns:
+            Dictionary with SST data:
+            {
+                "location": {"latitude": float, "longitude": float},
+                "sst": {
+                    "date": str,
+                    "temperature": float or None,
+                    "source": "marine" | "climatology" | "unavailable"
+                }
+            }
+        
+        Raises:
+            ValidationError: If coordinates are invalid
+            DataNotFoundError: If the location is inland or SST data is missing
+        """
+        params = self._build_sst_params(latitude, longitude)
+        self._raise_known_failure(params)
+        
+        # Make API call
+        try:
+            response = self.api_client.get(self.base_url, params=params, deadline=deadline)
+            return self._parse_sst_response(response, latitude, longitude)
+        except APIError as e:
+            self._remember_failure(params, e)
+            raise
+    
+    def _build_marine_params(
+        self,
+        latitude: float,
+        longitude: float,
+        forecast_days: int,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Validate inputs and build marine forecast request parameters.
+        
+        Args:
+            latitude: Latitude (-90 to 90)
+            longitude: Longitude (-180 to 180)
+            forecast_days: Number of forecast days (1-7)
+            start_date: Optional historical start date (YYYY-MM-DD)
+            end_date: Optional historical end date (YYYY-MM-DD)
+        
+        Returns:
+            Query parameters for the marine endpoint
+        
+        Raises:
+            ValidationError: If parameters are invalid
         """
         # Validate parameters
         self._validate_coordinates(latitude, longitude)
-        self._validate_forecast_days(forecast_days)
+        self._check_ocean(latitude, longitude)
         
         # Build request parameters
-        params = {
-            "latitude": latitude,
-            "longitude": longitude,
+        params = self._grid_params(
+            latitude, longitude, self._build_marine_query(forecast_days, start_date, end_date)
+        )
+        
+        # Add forecast_days parameter if API supports it (currently always 7 days)
+        logger.info(
+            f"Fetching marine forecast for ({latitude}, {longitude}) "
+            f"at grid point ({params['latitude']}, {params['longitude']}), {forecast_days} days"
+        )
+        
+        return params
+    
+    def _build_marine_query(
+        self,
+        forecast_days: int,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Build the location-independent part of a marine request.
+        
+        Args:
+            forecast_days: Number of forecast days (1-7)
+            start_date: Optional historical start date (YYYY-MM-DD)
+            end_date: Optional historical end date (YYYY-MM-DD)
+        
+        Returns:
+            Query parameters without latitude/longitude
+        
+        Raises:
+            ValidationError: If forecast_days is invalid
+        """
+        self._validate_forecast_days(forecast_days)
+        
+        query = {
             "daily": ["wave_height_max", "wave_direction_dominant", "ocean_current_velocity", "ocean_current_direction"],
+            "hourly": ["sea_surface_temperature"],
             "timezone": "auto"
         }
         
         # Add date parameters for historical analysis
         if start_date and end_date:
-            params["start_date"] = start_date
-            params["end_date"] = end_date
+            query["start_date"] = start_date
+            query["end_date"] = end_date
             logger.info(f"Historical marine data requested for {start_date} to {end_date}")
         
-        # Add forecast_days parameter if API supports it (currently always 7 days)
-        logger.info(
-            f"Fetching marine forecast for ({latitude}, {longitude}), "
-            f"{forecast_days} days"
-        )
+        return query
+    
+    def _build_marine_result(
+        self,
+        response: Dict[str, Any],
+        latitude: float,
+        longitude: float,
+        forecast_days: int
+    ) -> Dict[str, Any]:
+        """
+        Parse a marine response and trim it to the requested number of days.
         
-        # Make API call
-        response = self.api_client.get(self.base_url, params=params)
+        Args:
+            response: Raw API response
+            latitude: Request latitude
+            longitude: Request longitude
+            forecast_days: Number of forecast days to keep
         
+        Returns:
+            Parsed marine forecast data
+        
+        Raises:
+            DataNotFoundError: If required fields are missing
+        """
         # Parse and validate response
         marine_data = self._parse_marine_response(response, latitude, longitude)
         
@@ -111,55 +351,67 @@ class MarineService:
         
         return marine_data
     
-    def get_sst(
-        self,
-        latitude: float,
-        longitude: float
-    ) -> Dict[str, Any]:
+    def _build_sst_params(self, latitude: float, longitude: float) -> Dict[str, Any]:
         """
-        Get sea surface temperature for a location.
+        Validate coordinates and build SST request parameters.
         
         Args:
             latitude: Latitude (-90 to 90)
             longitude: Longitude (-180 to 180)
         
         Returns:
-            Dictionary with SST data:
-            {
-                "location": {"latitude": float, "longitude": float},
-                "sst": {
-                    "date": str,
-                    "temperature": float
-                }
-            }
+            Query parameters for the SST request
         
         Raises:
             ValidationError: If coordinates are invalid
-            DataNotFoundError: If SST data is missing
         """
         # Validate coordinates
         self._validate_coordinates(latitude, longitude)
+        self._check_ocean(latitude, longitude)
         
         # Build request parameters
-        params = {
-            "latitude": latitude,
-            "longitude": longitude,
+        params = self._grid_params(latitude, longitude, {
             "daily": ["wave_height_max"],
+            "hourly": ["sea_surface_temperature"],
+            "forecast_days": 1,
             "timezone": "auto"
-        }
+        })
         
-        logger.info(f"Fetching SST for ({latitude}, {longitude})")
+        logger.info(
+            f"Fetching SST for ({latitude}, {longitude}) "
+            f"at grid point ({params['latitude']}, {params['longitude']})"
+        )
         
-        # Make API call
-        response = self.api_client.get(self.base_url, params=params)
+        return params
+    
+    def _parse_sst_response(
+        self,
+        response: Dict[str, Any],
+        latitude: float,
+        longitude: float
+    ) -> Dict[str, Any]:
+        """
+        Extract SST data from a marine API response.
+        
+        Args:
+            response: Raw API response
+            latitude: Request latitude
+            longitude: Request longitude
+        
+        Returns:
+            Parsed SST data
         
+        Raises:
+            DataNotFoundError: If the location is inland or SST data is missing
+        """
         # Parse SST from response (use first day)
         try:
-            daily = response["daily"]
-            
-            # Note: Marine API doesn't provide direct SST in daily data
-            # This is a simplified implementation for demonstration
-            # In production, use hourly data or dedicated SST endpoint
+            date = response["daily"]["time"][0]
+            temperature = self._daily_sst(response, 1)[0]
+            source = "marine"
+            if temperature is None:
+                temperature = self.climatology_sst(latitude, longitude, date)
+                source = "climatology" if temperature is not None else "unavailable"
             
             sst_data = {
                 "location": {
@@ -167,18 +419,256 @@ class MarineService:
                     "longitude": longitude
                 },
                 "sst": {
-                    "date": daily["time"][0],
-                    "temperature": None  # Would come from hourly data
+                    "date": date,
+                    "temperature": temperature,
+                    "source": source
                 }
             }
             
-            logger.info("Successfully fetched SST data")
+            logger.info(f"Successfully fetched SST data ({source})")
             
-            return sst_data
+            return copy_stale_marker(response, sst_data)
         
         except (KeyError, IndexError, TypeError) as e:
             raise DataNotFoundError(f"Failed to extract SST from response: {e}")
     
+    def climatology_sst(self, latitude: float, longitude: float, date: str) -> Optional[float]:
+        """
+        Look up the climatological SST of a location for the month of a date.
+        
+        Args:
+            latitude: Latitude (-90 to 90)
+            longitude: Longitude (-180 to 180)
+            date: Date as YYYY-MM-DD
+        
+        Returns:
+            SST in °C, or None without climatology or over land
+        """
+        if self.sst_climatology is None:
+            return None
+        try:
+            return self.sst_climatology.lookup(latitude, longitude, month_index(date))
+        except ValueError:
+            return None
+    
+    def _daily_sst(self, response: Dict[str, Any], days: int) -> List[Optional[float]]:
+        """
+        Aggregate hourly SST of a response into daily means.
+        
+        Args:
+            response: Raw API response
+            days: Number of days
+        
+        Returns:
+            Daily mean SST in °C per day, None for days without any value
+        
+        Raises:
+            DataNotFoundError: If the hourly SST is not numeric
+        """
+        values = (response.get("hourly") or {}).get("sea_surface_temperature")
+        if not values:
+            return [None] * days
+        
+        mean, _, _ = aggregate_hourly(to_float_array(values, len(values)), days)
+        return [None if np.isnan(value) else value for value in mean.tolist()]
+    
+    def _collect_many(
+        self,
+        response: Any,
+        groups: List[List[int]],
+        locations: List[Coordinate],
+        query: Dict[str, Any],
+        forecast_days: int,
+        results: List[Any],
+        return_exceptions: bool
+    ):
+        """
+        Parse a multi-location marine response into results.
+        
+        Locations whose data cannot be parsed are remembered in the
+        negative cache.
+        
+        Args:
+            response: Raw API response for one chunk of grid points
+            groups: For each grid point of the chunk, the positions in
+                locations of the requested points snapped to it
+            locations: All requested (latitude, longitude) pairs
+            query: Location-independent request parameters
+            forecast_days: Number of forecast days to keep
+            results: Output list, filled in place
+            return_exceptions: Store parse errors instead of raising them
+        
+        Raises:
+            DataNotFoundError: If a response is invalid and return_exceptions is False
+        """
+        for group, item in zip(groups, split_multi_response(response, len(groups))):
+            for index in group:
+                latitude, longitude = locations[index]
+                try:
+                    results[index] = self._build_marine_result(item, latitude, longitude, forecast_days)
+                except DataNotFoundError as e:
+                    self._remember_failure(self._grid_params(latitude, longitude, query), e)
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
+    
+    def _check_ocean(self, latitude: float, longitude: float):
+        """
+        Reject inland locations before any API call.
+        
+        Args:
+            latitude: Latitude
+            longitude: Longitude
+        
+        Raises:
+            DataNotFoundError: If the land/sea mask marks the location as land
+        """
+        if self.land_mask is not None and self.land_mask.is_land(latitude, longitude):
+            raise DataNotFoundError(
+                f"No marine data for inland location ({latitude}, {longitude})"
+            )
+    
+    def _ocean_indices(
+        self,
+        locations: List[Coordinate],
+        results: List[Any],
+        return_exceptions: bool
+    ) -> List[int]:
+        """
+        Select the locations worth a marine request.
+        
+        Args:
+            locations: All requested (latitude, longitude) pairs
+            results: Output list; inland entries get their DataNotFoundError
+            return_exceptions: Store inland errors instead of raising them
+        
+        Returns:
+            Indices of the locations that are not on land
+        
+        Raises:
+            DataNotFoundError: If a location is inland and return_exceptions is False
+        """
+        if self.land_mask is None or not locations:
+            return list(range(len(locations)))
+        
+        latitudes, longitudes = zip(*locations)
+        land = self.land_mask.is_land_many(latitudes, longitudes)
+        
+        for index in np.flatnonzero(land).tolist():
+            error = DataNotFoundError(
+                f"No marine data for inland location ({latitudes[index]}, {longitudes[index]})"
+            )
+            if not return_exceptions:
+                raise error
+            results[index] = error
+        
+        return np.flatnonzero(~land).tolist()
+    
+    def _drop_known_failures(
+        self,
+        indices: List[int],
+        locations: List[Coordinate],
+        query: Dict[str, Any],
+        results: List[Any],
+        return_exceptions: bool
+    ) -> List[int]:
+        """
+        Select the locations not remembered as failed.
+        
+        Args:
+            indices: Candidate positions in locations
+            locations: All requested (latitude, longitude) pairs
+            query: Location-independent request parameters
+            results: Output list; known failures get their cached error
+            return_exceptions: Store cached errors instead of raising them
+        
+        Returns:
+            Indices still worth a marine request
+        
+        Raises:
+            APIError: The cached error of a known failure if return_exceptions is False
+        """
+        if self.negative_cache is None:
+            return indices
+        
+        remaining = []
+        for index in indices:
+            latitude, longitude = locations[index]
+            error = self.negative_cache.get(
+                self.base_url, self._grid_params(latitude, longitude, query)
+            )
+            if error is None:
+                remaining.append(index)
+            elif not return_exceptions:
+                raise error
+            else:
+                results[index] = error
+        
+        return remaining
+    
+    def _grid_params(self, latitude: float, longitude: float, query: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build single-location request parameters at the snapped grid point.
+        
+        Args:
+            latitude: Requested latitude
+            longitude: Requested longitude
+            query: Location-independent request parameters
+        
+        Returns:
+            Query parameters with the snapped latitude/longitude
+        """
+        grid_latitude, grid_longitude = snap_coordinate(latitude, longitude, self.snap_resolution)
+        return {"latitude": grid_latitude, "longitude": grid_longitude, **query}
+    
+    def _group_cells(
+        self,
+        indices: List[int],
+        locations: List[Coordinate]
+    ) -> Tuple[List[Coordinate], List[List[int]]]:
+        """
+        Snap the selected locations and merge those sharing a grid point.
+        
+        Args:
+            indices: Positions in locations to request
+            locations: All requested (latitude, longitude) pairs
+        
+        Returns:
+            Tuple of (grid points to request, positions in locations
+            answered by each grid point)
+        """
+        cells, members = group_by_cell([locations[index] for index in indices], self.snap_resolution)
+        return cells, [[indices[i] for i in group] for group in members]
+    
+    def _raise_known_failure(self, params: Dict[str, Any]):
+        """
+        Fail fast on a request that recently failed.
+        
+        Args:
+            params: Single-location request parameters
+        
+        Raises:
+            APIError: The cached error, if the request is in the negative cache
+        """
+        if self.negative_cache is not None:
+            error = self.negative_cache.get(self.base_url, params)
+            if error is not None:
+                raise error
+    
+    def _remember_failure(self, params: Dict[str, Any], error: APIError):
+        """
+        Store a failed request in the negative cache.
+        
+        Args:
+            params: Single-location request parameters
+            error: Raised error; its class decides the TTL
+        """
+        if self.negative_cache is not None and self.negative_cache.remember(self.base_url, params, error):
+            logger.info(
+                f"Remembering failed marine lookup ({params['latitude']}, {params['longitude']}) "
+                f"for {self.negative_cache.ttl_for(error):g}s: {error}"
+            )
+    
     def _validate_coordinates(self, latitude: float, longitude: float):
         """
         Validate geographic coordinates.
@@ -263,25 +753,152 @@ class MarineService:
                     raise DataNotFoundError(f"Missing field in response: {field}")
             
             # Build marine forecast list
+            ocean_sst = self._daily_sst(response, len(daily["time"]))
             marine_list = []
             for i in range(len(daily["time"])):
                 marine_list.append({
                     "date": daily["time"][i],
+                    "ocean_sst": ocean_sst[i],
                     "wave_height": daily["wave_height_max"][i],
                     "wave_direction": daily["wave_direction_dominant"][i],
                     "ocean_current_velocity": daily.get("ocean_current_velocity", [None] * len(daily["time"]))[i],
                     "ocean_current_direction": daily.get("ocean_current_direction", [None] * len(daily["time"]))[i]
                 })
             
-            return {
+            return copy_stale_marker(response, {
                 "location": {
                     "latitude": latitude,
                     "longitude": longitude
                 },
                 "marine_forecast": marine_list
-            }
+            })
         
         except KeyError as e:
             raise DataNotFoundError(f"Missing required field in response: {e}")
         except (IndexError, TypeError) as e:
             raise DataNotFoundError(f"Invalid response structure: {e}")
+
+
+class AsyncMarineService(MarineService):
+    """
+    Asyncio counterpart of MarineService.
+    
+    Shares validation and parsing with MarineService but performs the
+    upstream calls through an AsyncAPIClient, so many marine forecasts can
+    be fetched concurrently from one event loop.
+    """
+    
+    def __init__(
+        self,
+        api_client: Optional[AsyncAPIClient] = None,
+        land_mask: Optional[LandSeaMask] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        snap_resolution: Optional[float] = None,
+        sst_climatology: Optional[SSTClimatology] = None
+    ):
+        """
+        Initialize async Marine Service.
+        
+        Args:
+            api_client: Optional custom async API client (default: new AsyncAPIClient)
+            land_mask: Optional land/sea mask (default: shared mask from settings)
+            negative_cache: Optional cache of failed lookups (default: from settings)
+            snap_resolution: Model grid step in degrees (default: from settings)
+            sst_climatology: Optional monthly SST climatology (default: from settings)
+        """
+        super().__init__(
+            api_client or AsyncAPIClient(), land_mask, negative_cache, snap_resolution, sst_climatology
+        )
+    
+    async def get_marine_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        forecast_days: int = 7,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Get marine weather forecast (see MarineService.get_marine_forecast).
+        
+        Raises:
+            ValidationError: If parameters are invalid
+            DataNotFoundError: If the location is inland or required data is missing from response
+        """
+        params = self._build_marine_params(
+            latitude, longitude, forecast_days, start_date, end_date
+        )
+        self._raise_known_failure(params)
+        
+        try:
+            response = await self.api_client.get(self.base_url, params=params, deadline=deadline)
+            return self._build_marine_result(response, latitude, longitude, forecast_days)
+        except APIError as e:
+            self._remember_failure(params, e)
+            raise
+    
+    async def get_marine_forecast_many(
+        self,
+        locations: Sequence[Coordinate],
+        forecast_days: int = 7,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        return_exceptions: bool = False,
+        deadline: Optional[float] = None
+    ) -> List[Any]:
+        """
+        Get marine forecasts for many locations (see MarineService.get_marine_forecast_many).
+        
+        Chunks are fetched concurrently, each within the whole deadline.
+        
+        Raises:
+            ValidationError: If any location or parameter is invalid
+            DataNotFoundError: If a location is inland or required data is missing from a response
+        """
+        locations = list(locations)
+        for latitude, longitude in locations:
+            self._validate_coordinates(latitude, longitude)
+        query = self._build_marine_query(forecast_days, start_date, end_date)
+        
+        results: List[Any] = [None] * len(locations)
+        ocean = self._ocean_indices(locations, results, return_exceptions)
+        ocean = self._drop_known_failures(ocean, locations, query, results, return_exceptions)
+        cells, members = self._group_cells(ocean, locations)
+        
+        chunks = list(iter_coordinate_chunks(self.base_url, query, cells))
+        responses = await asyncio.gather(*(
+            self.api_client.get(self.base_url, params=params, deadline=deadline)
+            for _, params in chunks
+        ))
+        
+        for (indices, _), response in zip(chunks, responses):
+            self._collect_many(
+                response, [members[i] for i in indices], locations, query, forecast_days,
+                results, return_exceptions
+            )
+        
+        return results
+    
+    async def get_sst(
+        self,
+        latitude: float,
+        longitude: float,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Get sea surface temperature (see MarineService.get_sst).
+        
+        Raises:
+            ValidationError: If coordinates are invalid
+            DataNotFoundError: If the location is inland or SST data is missing
+        """
+        params = self._build_sst_params(latitude, longitude)
+        self._raise_known_failure(params)
+        
+        try:
+            response = await self.api_client.get(self.base_url, params=params, deadline=deadline)
+            return self._parse_sst_response(response, latitude, longitude)
+        except APIError as e:
+            self._remember_failure(params, e)
+            raise
@@ -0,0 +1,267 @@
+"""
+Prefetch Scheduler.
+
+This service keeps a watchlist of frequently queried locations warm in
+the response cache: shortly after each model run is published (when the
+cached forecasts expire) it runs the same detection an interactive
+request would, so the next interactive detect for these locations is
+served from the cache. Calls are spread evenly over a window instead of
+being fired at once, and the outcome of the last refresh is kept for the
+status endpoint.
+
+Run it inside the Flask app (PREFETCH_ENABLED=true) or standalone to warm
+a shared Redis/SQLite tier:
+
+    python -m src.services.prefetch_scheduler [--once]
+"""
+
+import argparse
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .detection_pipeline import DetectionPipeline
+from ..config.settings import settings
+from ..utils.cache import ModelRunSchedule, default_schedules
+
+logger = logging.getLogger(__name__)
+
+WatchlistEntry = Tuple[str, float, float]
+
+
+class PrefetchScheduler:
+    """
+    Background refresh of watchlist detections after each model run.
+    
+    A refresh fires PREFETCH_DELAY seconds after the next publication of
+    any scheduled model (every CACHE_TTL_WEATHER seconds without a
+    schedule) and issues one detection per location, PREFETCH_SPREAD /
+    len(watchlist) seconds apart.
+    """
+    
+    def __init__(
+        self,
+        detection_pipeline: DetectionPipeline,
+        watchlist: Optional[Sequence[WatchlistEntry]] = None,
+        schedules: Optional[Dict[str, ModelRunSchedule]] = None,
+        delay: Optional[float] = None,
+        spread: Optional[float] = None,
+        forecast_days: int = 7
+    ):
+        """
+        Initialize Prefetch Scheduler.
+        
+        Args:
+            detection_pipeline: Pipeline whose upstream calls are warmed
+            watchlist: (name, latitude, longitude) entries (default: PREFETCH_WATCHLIST)
+            schedules: Schedule per upstream endpoint (default: from settings)
+            delay: Seconds between a publication and the refresh (default: PREFETCH_DELAY)
+            spread: Seconds the refresh calls are spread over (default: PREFETCH_SPREAD)
+            forecast_days: Forecast days requested, as in interactive detects
+        """
+        self.detection_pipeline = detection_pipeline
+        self.watchlist = list(settings.PREFETCH_WATCHLIST if watchlist is None else watchlist)
+        self.schedules = default_schedules() if schedules is None else schedules
+        self.delay = settings.PREFETCH_DELAY if delay is None else delay
+        self.spread = settings.PREFETCH_SPREAD if spread is None else spread
+        self.forecast_days = forecast_days
+        
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._last_refresh: Optional[Dict[str, Any]] = None
+        self._next_refresh: Optional[float] = None
+        self._refreshing = False
+        
+        logger.info(
+            f"PrefetchScheduler initialized: {len(self.watchlist)} locations, "
+            f"delay={self.delay:g}s, spread={self.spread:g}s"
+        )
+    
+    def next_refresh(self, now: Optional[float] = None) -> float:
+        """
+        Get the time of the next refresh.
+        
+        Args:
+            now: Current time.time() timestamp (default: now)
+        
+        Returns:
+            time.time() timestamp delay seconds after the next publication
+            (a refresh still due for the current run counts as next)
+        """
+        now = time.time() if now is None else now
+        shifted = now - self.delay
+        if self.schedules:
+            publication = min(schedule.next_publication(shifted) for schedule in self.schedules.values())
+        else:
+            window = float(settings.CACHE_TTL_WEATHER)
+            publication = shifted - shifted % window + window
+        return publication + self.delay
+    
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Refresh every watchlist location now.
+        
+        Detections run one by one, spread over the spread window; stop()
+        interrupts the remaining ones.
+        
+        Returns:
+            Refresh report (see status()["last_refresh"])
+        """
+        started_at = time.time()
+        interval = self.spread / len(self.watchlist) if self.watchlist else 0.0
+        refreshed = 0
+        stale = 0
+        errors: List[Dict[str, str]] = []
+        
+        with self._lock:
+            self._refreshing = True
+        
+        try:
+            for position, (name, latitude, longitude) in enumerate(self.watchlist):
+                if position and self._stop.wait(interval):
+                    break
+                try:
+                    result = self.detection_pipeline.detect_location(
+                        latitude=latitude,
+                        longitude=longitude,
+                        forecast_days=self.forecast_days
+                    )
+                    refreshed += 1
+                    stale += bool(result["details"].get("stale_data"))
+                except Exception as e:
+                    logger.warning(f"Prefetch failed for {name} ({latitude}, {longitude}): {e}")
+                    errors.append({"location_name": name, "error": str(e)})
+        finally:
+            report = {
+                "started_at": _iso(started_at),
+                "finished_at": _iso(time.time()),
+                "duration": round(time.time() - started_at, 3),
+                "locations": len(self.watchlist),
+                "refreshed": refreshed,
+                "stale": stale,
+                "failed": len(errors),
+                "errors": errors
+            }
+            with self._lock:
+                self._refreshing = False
+                self._last_refresh = report
+        
+        logger.info(
+            f"Prefetch refreshed {refreshed}/{len(self.watchlist)} locations "
+            f"in {report['duration']}s ({len(errors)} failed)"
+        )
+        return report
+    
+    def start(self, refresh_now: bool = True):
+        """
+        Start the background refresh thread.
+        
+        Args:
+            refresh_now: Warm the cache immediately instead of waiting for
+                the next publication
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if not settings.CACHE_ENABLED:
+            logger.warning("Prefetch started with CACHE_ENABLED=false: refreshed data will not be reused")
+        
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(refresh_now,), name="prefetch", daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop the background thread, interrupting a refresh in progress.
+        
+        Args:
+            timeout: Seconds to wait for the thread to exit (default: no wait limit)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def status(self) -> Dict[str, Any]:
+        """
+        Get the scheduler status.
+        
+        Returns:
+            Dictionary with running, refreshing, watchlist, next_refresh
+            (ISO time) and last_refresh (None before the first refresh)
+        """
+        with self._lock:
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "refreshing": self._refreshing,
+                "watchlist": [
+                    {"location_name": name, "latitude": latitude, "longitude": longitude}
+                    for name, latitude, longitude in self.watchlist
+                ],
+                "next_refresh": _iso(self._next_refresh) if self._next_refresh else None,
+                "last_refresh": self._last_refresh
+            }
+    
+    def _run(self, refresh_now: bool):
+        """Refresh loop run by the background thread."""
+        if refresh_now:
+            self._guarded_refresh()
+        
+        while not self._stop.is_set():
+            next_refresh = self.next_refresh()
+            with self._lock:
+                self._next_refresh = next_refresh
+            if self._stop.wait(max(0.0, next_refresh - time.time())):
+                break
+            self._guarded_refresh()
+    
+    def _guarded_refresh(self):
+        """Refresh without letting an unexpected error kill the thread."""
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.exception(f"Prefetch refresh failed: {e}")
+
+
+def _iso(timestamp: float) -> str:
+    """Format a time.time() timestamp as ISO 8601 UTC."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def main(argv=None):
+    """Run the prefetch scheduler in the foreground."""
+    from .marine_service import MarineService
+    from .weather_service import WeatherService
+    from ..utils.api_client import APIClient
+    
+    parser = argparse.ArgumentParser(description="Keep the PREFETCH_WATCHLIST locations warm in the cache")
+    parser.add_argument("--once", action="store_true", help="Refresh once and exit")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL), format=settings.LOG_FORMAT)
+    api_client = APIClient()
+    pipeline = DetectionPipeline(WeatherService(api_client), MarineService(api_client))
+    scheduler = PrefetchScheduler(pipeline)
+    
+    try:
+        if args.once:
+            report = scheduler.refresh()
+            print(f"Refreshed {report['refreshed']}/{report['locations']} locations ({report['failed']} failed)")
+        else:
+            scheduler.start()
+            while True:
+                time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduler.stop()
+        pipeline.close()
+        api_client.close()
+
+
+if __name__ == "__main__":
+    main()
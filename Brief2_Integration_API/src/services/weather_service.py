@@ -5,13 +5,23 @@ This service handles all interactions with the Weather Forecast API,
 including current weather and forecasts.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 from datetime import datetime
 
-from ..utils.api_client import APIClient
+from ..utils.api_client import APIClient, copy_stale_marker, deadline_expiry, deadline_remaining
+from ..utils.async_api_client import AsyncAPIClient
+from ..utils.batching import (
+    Coordinate,
+    group_by_cell,
+    iter_coordinate_chunks,
+    snap_coordinate,
+    split_multi_response
+)
 from ..utils.error_handler import ValidationError, DataNotFoundError
 from ..config.settings import settings
+from .forecast_frame import ForecastFrame
 
 logger = logging.getLogger(__name__)
 
@@ -25,16 +35,27 @@ class WeatherService:
     - Get weather forecasts (up to 16 days)
     - Temperature, pressure, wind speed data
     - Automatic validation and parsing
+    - Coordinates snapped to the model grid (shared cache entries for
+      nearby points), requested location kept in results
     """
     
-    def __init__(self, api_client: Optional[APIClient] = None):
+    def __init__(
+        self,
+        api_client: Optional[APIClient] = None,
+        snap_resolution: Optional[float] = None
+    ):
         """
         Initialize Weather Service.
         
         Args:
             api_client: Optional custom API client (default: new APIClient)
+            snap_resolution: Model grid step in degrees requests are snapped
+                to, 0 to disable (default: SNAP_RESOLUTION_WEATHER)
         """
         self.api_client = api_client or APIClient()
+        self.snap_resolution = (
+            settings.SNAP_RESOLUTION_WEATHER if snap_resolution is None else snap_resolution
+        )
         self.base_url = settings.WEATHER_API_URL
         logger.info(f"WeatherService initialized with URL: {self.base_url}")
     
@@ -44,7 +65,8 @@ class WeatherService:
         longitude: float,
         forecast_days: int = 7,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        deadline: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Get weather forecast for a location.
@@ -53,6 +75,7 @@ class WeatherService:
             latitude: Latitude (-90 to 90)
             longitude: Longitude (-180 to 180)
             forecast_days: Number of forecast days (1-16, default: 7)
+            deadline: Optional total time budget in seconds, retries included
         
         Returns:
             Dictionary with forecast data:
@@ -74,46 +97,117 @@ class WeatherService:
             ValidationError: If parameters are invalid
             DataNotFoundError: If required data is missing from response
         """
-        # Validate parameters
-        self._validate_coordinates(latitude, longitude)
-        self._validate_forecast_days(forecast_days)
+        return self.get_forecast_frame(
+            latitude, longitude, forecast_days, start_date, end_date, deadline
+        ).to_dict()
+    
+    def get_forecast_frame(
+        self,
+        latitude: float,
+        longitude: float,
+        forecast_days: int = 7,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> ForecastFrame:
+        """
+        Get weather forecast for a location as a columnar frame.
         
-        # Build request parameters
-        params = {
-            "latitude": latitude,
-            "longitude": longitude,
-            "daily": ["temperature_2m_max", "temperature_2m_min", "wind_speed_10m_max", "wind_gusts_10m_max"],
-            "hourly": ["surface_pressure"],
-            "timezone": "auto"
-        }
+        Same request as get_forecast, without building the per-day dicts.
         
-        # Add date parameters for historical analysis
-        if start_date and end_date:
-            params["start_date"] = start_date
-            params["end_date"] = end_date
-            logger.info(f"Historical data requested for {start_date} to {end_date}")
-        else:
-            params["forecast_days"] = forecast_days
+        Returns:
+            ForecastFrame
         
-        logger.info(
-            f"Fetching weather forecast for ({latitude}, {longitude}), "
-            f"{forecast_days} days"
+        Raises:
+            ValidationError: If parameters are invalid
+            DataNotFoundError: If required data is missing from response
+        """
+        params = self._build_forecast_params(
+            latitude, longitude, forecast_days, start_date, end_date
         )
         
         # Make API call
-        response = self.api_client.get(self.base_url, params=params)
+        response = self.api_client.get(self.base_url, params=params, deadline=deadline)
         
         # Parse and validate response
-        forecast_data = self._parse_forecast_response(response, latitude, longitude)
+        frame = ForecastFrame.from_response(response, latitude, longitude)
+        
+        logger.info(f"Successfully fetched {len(frame)} days of forecast")
+        
+        return frame
+    
+    def get_forecast_many(
+        self,
+        locations: Sequence[Coordinate],
+        forecast_days: int = 7,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        return_exceptions: bool = False,
+        deadline: Optional[float] = None,
+        stats: Optional[Dict[str, int]] = None,
+        as_frame: bool = False
+    ) -> List[Any]:
+        """
+        Get weather forecasts for many locations with batched requests.
+        
+        Locations are sent as comma-separated coordinate lists, split into
+        URL-length-safe chunks, so N points cost one HTTP call per chunk
+        instead of one per point.
+        
+        Args:
+            locations: Sequence of (latitude, longitude) pairs
+            forecast_days: Number of forecast days (1-16, default: 7)
+            start_date: Optional historical start date (YYYY-MM-DD)
+            end_date: Optional historical end date (YYYY-MM-DD)
+            return_exceptions: If True, a location whose data cannot be
+                parsed gets its DataNotFoundError in place of a result
+                instead of failing the whole batch
+            deadline: Optional total time budget in seconds for all chunks,
+                retries included
+            stats: Optional dictionary whose "requests" entry is increased
+                by the number of batched requests sent
+            as_frame: Return ForecastFrame objects instead of dictionaries
         
-        logger.info(f"Successfully fetched {len(forecast_data['forecast'])} days of forecast")
+        Returns:
+            List of forecast dictionaries (same format as get_forecast), or
+            of ForecastFrame with as_frame, in the same order as locations
+        
+        Raises:
+            ValidationError: If any location or parameter is invalid
+            DataNotFoundError: If required data is missing from a response
+        """
+        locations = list(locations)
+        for latitude, longitude in locations:
+            self._validate_coordinates(latitude, longitude)
+        query = self._build_forecast_query(forecast_days, start_date, end_date)
+        cells, members = group_by_cell(locations, self.snap_resolution)
         
-        return forecast_data
+        logger.info(
+            f"Fetching weather forecast for {len(locations)} locations "
+            f"({len(cells)} grid points), {forecast_days} days"
+        )
+        
+        expires_at = deadline_expiry(deadline)
+        results: List[Any] = [None] * len(locations)
+        for indices, params in iter_coordinate_chunks(self.base_url, query, cells):
+            if stats is not None:
+                stats["requests"] = stats.get("requests", 0) + 1
+            response = self.api_client.get(
+                self.base_url, params=params, deadline=deadline_remaining(expires_at)
+            )
+            self._collect_many(
+                response, [members[i] for i in indices], locations, results, return_exceptions, as_frame
+            )
+        
+        logger.info(f"Successfully fetched forecasts for {len(locations)} locations")
+        
+        return results
     
     def get_current_weather(
         self,
         latitude: float,
-        longitude: float
+        longitude: float,
+        deadline: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Get current weather conditions for a location.
@@ -121,6 +215,7 @@ class WeatherService:
         Args:
             latitude: Latitude (-90 to 90)
             longitude: Longitude (-180 to 180)
+            deadline: Optional total time budget in seconds, retries included
         
         Returns:
             Dictionary with current weather:
@@ -138,28 +233,165 @@ class WeatherService:
             ValidationError: If coordinates are invalid
             DataNotFoundError: If required data is missing
         """
+        params = self._build_current_params(latitude, longitude)
+        
+        # Make API call
+        response = self.api_client.get(self.base_url, params=params, deadline=deadline)
+        
+        # Parse and validate response
+        current_data = self._parse_current_response(response, latitude, longitude)
+        
+        logger.info("Successfully fetched current weather")
+        
+        return current_data
+    
+    def _build_forecast_params(
+        self,
+        latitude: float,
+        longitude: float,
+        forecast_days: int,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Validate inputs and build forecast request parameters.
+        
+        Args:
+            latitude: Latitude (-90 to 90)
+            longitude: Longitude (-180 to 180)
+            forecast_days: Number of forecast days (1-16)
+            start_date: Optional historical start date (YYYY-MM-DD)
+            end_date: Optional historical end date (YYYY-MM-DD)
+        
+        Returns:
+            Query parameters for the forecast endpoint
+        
+        Raises:
+            ValidationError: If parameters are invalid
+        """
+        # Validate parameters
+        self._validate_coordinates(latitude, longitude)
+        grid_latitude, grid_longitude = snap_coordinate(latitude, longitude, self.snap_resolution)
+        
+        # Build request parameters
+        params = {
+            "latitude": grid_latitude,
+            "longitude": grid_longitude,
+            **self._build_forecast_query(forecast_days, start_date, end_date)
+        }
+        
+        logger.info(
+            f"Fetching weather forecast for ({latitude}, {longitude}) "
+            f"at grid point ({grid_latitude}, {grid_longitude}), {forecast_days} days"
+        )
+        
+        return params
+    
+    def _build_forecast_query(
+        self,
+        forecast_days: int,
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Build the location-independent part of a forecast request.
+        
+        Args:
+            forecast_days: Number of forecast days (1-16)
+            start_date: Optional historical start date (YYYY-MM-DD)
+            end_date: Optional historical end date (YYYY-MM-DD)
+        
+        Returns:
+            Query parameters without latitude/longitude
+        
+        Raises:
+            ValidationError: If forecast_days is invalid
+        """
+        self._validate_forecast_days(forecast_days)
+        
+        query = {
+            "daily": ["temperature_2m_max", "temperature_2m_min", "wind_speed_10m_max", "wind_gusts_10m_max"],
+            "hourly": ["surface_pressure"],
+            "timezone": "auto"
+        }
+        
+        # Add date parameters for historical analysis
+        if start_date and end_date:
+            query["start_date"] = start_date
+            query["end_date"] = end_date
+            logger.info(f"Historical data requested for {start_date} to {end_date}")
+        else:
+            query["forecast_days"] = forecast_days
+        
+        return query
+    
+    def _build_current_params(self, latitude: float, longitude: float) -> Dict[str, Any]:
+        """
+        Validate coordinates and build current weather request parameters.
+        
+        Args:
+            latitude: Latitude (-90 to 90)
+            longitude: Longitude (-180 to 180)
+        
+        Returns:
+            Query parameters for the current weather request
+        
+        Raises:
+            ValidationError: If coordinates are invalid
+        """
         # Validate coordinates
         self._validate_coordinates(latitude, longitude)
+        grid_latitude, grid_longitude = snap_coordinate(latitude, longitude, self.snap_resolution)
         
         # Build request parameters
         params = {
-            "latitude": latitude,
-            "longitude": longitude,
+            "latitude": grid_latitude,
+            "longitude": grid_longitude,
             "current": ["temperature_2m", "surface_pressure", "wind_speed_10m"],
             "timezone": "auto"
         }
         
-        logger.info(f"Fetching current weather for ({latitude}, {longitude})")
-        
-        # Make API call
-        response = self.api_client.get(self.base_url, params=params)
+        logger.info(
+            f"Fetching current weather for ({latitude}, {longitude}) "
+            f"at grid point ({grid_latitude}, {grid_longitude})"
+        )
         
-        # Parse and validate response
-        current_data = self._parse_current_response(response, latitude, longitude)
+        return params
+    
+    def _collect_many(
+        self,
+        response: Any,
+        groups: List[List[int]],
+        locations: List[Coordinate],
+        results: List[Any],
+        return_exceptions: bool,
+        as_frame: bool = False
+    ):
+        """
+        Parse a multi-location forecast response into results.
         
-        logger.info("Successfully fetched current weather")
+        Args:
+            response: Raw API response for one chunk of grid points
+            groups: For each grid point of the chunk, the positions in
+                locations of the requested points snapped to it
+            locations: All requested (latitude, longitude) pairs
+            results: Output list, filled in place
+            return_exceptions: Store parse errors instead of raising them
+            as_frame: Store ForecastFrame objects instead of dictionaries
         
-        return current_data
+        Raises:
+            DataNotFoundError: If a response is invalid and return_exceptions is False
+        """
+        for group, item in zip(groups, split_multi_response(response, len(groups))):
+            for index in group:
+                latitude, longitude = locations[index]
+                try:
+                    frame = ForecastFrame.from_response(item, latitude, longitude)
+                    results[index] = frame if as_frame else frame.to_dict()
+                except DataNotFoundError as e:
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
     
     def _validate_coordinates(self, latitude: float, longitude: float):
         """
@@ -212,89 +444,6 @@ class WeatherService:
                 f"forecast_days must be between 1 and 16, got: {forecast_days}"
             )
     
-    def _parse_forecast_response(
-        self,
-        response: Dict[str, Any],
-        latitude: float,
-        longitude: float
-    ) -> Dict[str, Any]:
-        """
-        Parse and validate forecast API response.
-        
-        Args:
-            response: Raw API response
-            latitude: Request latitude
-            longitude: Request longitude
-        
-        Returns:
-            Parsed forecast data
-        
-        Raises:
-            DataNotFoundError: If required fields are missing
-        """
-        try:
-            daily = response["daily"]
-            
-            # Verify all required fields are present
-            required_fields = [
-                "time",
-                "temperature_2m_max",
-                "temperature_2m_min",
-                "wind_speed_10m_max"
-            ]
-            
-            # wind_gusts_10m_max is optional
-            optional_fields = ["wind_gusts_10m_max"]
-            
-            for field in required_fields:
-                if field not in daily:
-                    raise DataNotFoundError(f"Missing field in response: {field}")
-            
-            # Get hourly pressure data and calculate daily averages
-            hourly = response.get("hourly", {})
-            hourly_pressure = hourly.get("surface_pressure", [])
-            
-            # Build forecast list
-            forecast_list = []
-            for i in range(len(daily["time"])):
-                # Calculate average pressure for this day (24 hours)
-                start_hour = i * 24
-                end_hour = start_hour + 24
-                day_pressures = hourly_pressure[start_hour:end_hour]
-                # Filter out None values and calculate average
-                valid_pressures = [p for p in day_pressures if p is not None]
-                avg_pressure = sum(valid_pressures) / len(valid_pressures) if valid_pressures else None
-                
-                # Get wind gusts if available, otherwise estimate from wind speed
-                wind_gusts = None
-                if "wind_gusts_10m_max" in daily and daily["wind_gusts_10m_max"][i] is not None:
-                    wind_gusts = daily["wind_gusts_10m_max"][i]
-                elif daily["wind_speed_10m_max"][i] is not None:
-                    # Estimate wind gusts as 1.4x wind speed if not available
-                    wind_gusts = daily["wind_speed_10m_max"][i] * 1.4
-                
-                forecast_list.append({
-                    "date": daily["time"][i],
-                    "temperature_2m_max": daily["temperature_2m_max"][i],
-                    "temperature_2m_min": daily["temperature_2m_min"][i],
-                    "surface_pressure": avg_pressure,
-                    "wind_speed_10m_max": daily["wind_speed_10m_max"][i],
-                    "wind_gusts_10m_max": wind_gusts
-                })
-            
-            return {
-                "location": {
-                    "latitude": latitude,
-                    "longitude": longitude
-                },
-                "forecast": forecast_list
-            }
-        
-        except KeyError as e:
-            raise DataNotFoundError(f"Missing required field in response: {e}")
-        except (IndexError, TypeError) as e:
-            raise DataNotFoundError(f"Invalid response structure: {e}")
-    
     def _parse_current_response(
         self,
         response: Dict[str, Any],
@@ -330,7 +479,7 @@ class WeatherService:
                 if field not in current:
                     raise DataNotFoundError(f"Missing field in response: {field}")
             
-            return {
+            return copy_stale_marker(response, {
                 "location": {
                     "latitude": latitude,
                     "longitude": longitude
@@ -341,9 +490,147 @@ class WeatherService:
                     "surface_pressure": current["surface_pressure"],
                     "wind_speed_10m": current["wind_speed_10m"]
                 }
-            }
+            })
         
         except KeyError as e:
             raise DataNotFoundError(f"Missing required field in response: {e}")
         except TypeError as e:
             raise DataNotFoundError(f"Invalid response structure: {e}")
+
+
+class AsyncWeatherService(WeatherService):
+    """
+    Asyncio counterpart of WeatherService.
+    
+    Shares validation and parsing with WeatherService but performs the
+    upstream calls through an AsyncAPIClient, so many forecasts can be
+    fetched concurrently from one event loop.
+    """
+    
+    def __init__(
+        self,
+        api_client: Optional[AsyncAPIClient] = None,
+        snap_resolution: Optional[float] = None
+    ):
+        """
+        Initialize async Weather Service.
+        
+        Args:
+            api_client: Optional custom async API client (default: new AsyncAPIClient)
+            snap_resolution: Model grid step in degrees (default: from settings)
+        """
+        super().__init__(api_client or AsyncAPIClient(), snap_resolution)
+    
+    async def get_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        forecast_days: int = 7,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Get weather forecast for a location (see WeatherService.get_forecast).
+        
+        Raises:
+            ValidationError: If parameters are invalid
+            DataNotFoundError: If required data is missing from response
+        """
+        frame = await self.get_forecast_frame(
+            latitude, longitude, forecast_days, start_date, end_date, deadline
+        )
+        return frame.to_dict()
+    
+    async def get_forecast_frame(
+        self,
+        latitude: float,
+        longitude: float,
+        forecast_days: int = 7,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> ForecastFrame:
+        """
+        Get weather forecast as a columnar frame (see WeatherService.get_forecast_frame).
+        
+        Raises:
+            ValidationError: If parameters are invalid
+            DataNotFoundError: If required data is missing from response
+        """
+        params = self._build_forecast_params(
+            latitude, longitude, forecast_days, start_date, end_date
+        )
+        
+        response = await self.api_client.get(self.base_url, params=params, deadline=deadline)
+        
+        frame = ForecastFrame.from_response(response, latitude, longitude)
+        
+        logger.info(f"Successfully fetched {len(frame)} days of forecast")
+        
+        return frame
+    
+    async def get_forecast_many(
+        self,
+        locations: Sequence[Coordinate],
+        forecast_days: int = 7,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        return_exceptions: bool = False,
+        deadline: Optional[float] = None,
+        stats: Optional[Dict[str, int]] = None,
+        as_frame: bool = False
+    ) -> List[Any]:
+        """
+        Get weather forecasts for many locations (see WeatherService.get_forecast_many).
+        
+        Chunks are fetched concurrently, each within the whole deadline.
+        
+        Raises:
+            ValidationError: If any location or parameter is invalid
+            DataNotFoundError: If required data is missing from a response
+        """
+        locations = list(locations)
+        for latitude, longitude in locations:
+            self._validate_coordinates(latitude, longitude)
+        query = self._build_forecast_query(forecast_days, start_date, end_date)
+        cells, members = group_by_cell(locations, self.snap_resolution)
+        
+        chunks = list(iter_coordinate_chunks(self.base_url, query, cells))
+        if stats is not None:
+            stats["requests"] = stats.get("requests", 0) + len(chunks)
+        responses = await asyncio.gather(*(
+            self.api_client.get(self.base_url, params=params, deadline=deadline)
+            for _, params in chunks
+        ))
+        
+        results: List[Any] = [None] * len(locations)
+        for (indices, _), response in zip(chunks, responses):
+            self._collect_many(
+                response, [members[i] for i in indices], locations, results, return_exceptions, as_frame
+            )
+        
+        return results
+    
+    async def get_current_weather(
+        self,
+        latitude: float,
+        longitude: float,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Get current weather conditions (see WeatherService.get_current_weather).
+        
+        Raises:
+            ValidationError: If coordinates are invalid
+            DataNotFoundError: If required data is missing
+        """
+        params = self._build_current_params(latitude, longitude)
+        
+        response = await self.api_client.get(self.base_url, params=params, deadline=deadline)
+        
+        current_data = self._parse_current_response(response, latitude, longitude)
+        
+        logger.info("Successfully fetched current weather")
+        
+        return current_data
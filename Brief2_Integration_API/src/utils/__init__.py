@@ -4,20 +4,54 @@ from .error_handler import (
     APIError,
     ValidationError,
     RateLimitError,
+    CircuitOpenError,
     TimeoutError,
     CacheError,
     ConfigurationError,
     DataNotFoundError
 )
 from .api_client import APIClient
+from .async_api_client import AsyncAPIClient
+from .cache import LRUCache, RedisCache, SQLiteCache, ResponseCache, make_cache_key
+from .single_flight import SingleFlight, AsyncSingleFlight
+from .rate_limiter import TokenBucketRateLimiter, get_shared_rate_limiter
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState
+from .hedging import HedgeBudget, LatencyTracker, get_shared_hedge_budget
+from .json_codec import get_decoder
+from .land_mask import LandSeaMask, get_land_mask
+from .negative_cache import NegativeCache
+from .sst_climatology import SSTClimatology, get_sst_climatology
 
 __all__ = [
     "APIError",
     "ValidationError",
     "RateLimitError",
+    "CircuitOpenError",
     "TimeoutError",
     "CacheError",
     "ConfigurationError",
     "DataNotFoundError",
     "APIClient",
+    "AsyncAPIClient",
+    "LRUCache",
+    "RedisCache",
+    "SQLiteCache",
+    "ResponseCache",
+    "make_cache_key",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "TokenBucketRateLimiter",
+    "get_shared_rate_limiter",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitState",
+    "HedgeBudget",
+    "LatencyTracker",
+    "get_shared_hedge_budget",
+    "get_decoder",
+    "LandSeaMask",
+    "get_land_mask",
+    "NegativeCache",
+    "SSTClimatology",
+    "get_sst_climatology",
 ]
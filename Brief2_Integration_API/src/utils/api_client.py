@@ -5,40 +5,417 @@ This module provides a reusable API client for making HTTP requests
 with automatic retry, exponential backoff, and comprehensive error handling.
 """
 
+import json
+import random
+import threading
 import time
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Mapping, Optional, Union
 import requests
 
 from ..config.settings import settings
+from .cache import LRUCache, ResponseCache, make_cache_key
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState
+from .hedging import HedgeBudget, LatencyTracker, get_shared_hedge_budget
+from .json_codec import Decoder, get_decoder
+from .rate_limiter import TokenBucketRateLimiter, get_shared_rate_limiter
+from .single_flight import SingleFlight
 from .error_handler import (
     APIError,
     ValidationError,
     RateLimitError,
+    CircuitOpenError,
     TimeoutError as CustomTimeoutError,
 )
 
 logger = logging.getLogger(__name__)
 
 
-class APIClient:
+USER_AGENT = "CycloneTracker/1.0.0 (Educational Project)"
+
+
+class BaseAPIClient:
+    """
+    Transport-independent logic shared by the sync and async API clients.
+    
+    Holds the retry configuration, parameter validation, HTTP status
+    handling and backoff calculation so that both clients behave the same.
+    """
+    
+    def __init__(
+        self,
+        timeout: Optional[int] = None,
+        retry_count: Optional[int] = None,
+        retry_delay: Optional[int] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        decoder: Optional[Decoder] = None
+    ):
+        """
+        Initialize retry configuration.
+        
+        Args:
+            timeout: Request timeout in seconds (default: from settings)
+            retry_count: Number of retry attempts (default: from settings)
+            retry_delay: Initial delay between retries (default: from settings)
+            rate_limiter: Optional token bucket (default: the shared limiter
+                when RATE_LIMIT_PER_SECOND > 0)
+            circuit_breakers: Optional per-endpoint breakers (default: new registry)
+            decoder: Optional JSON decoder for response bodies (default:
+                from JSON_DECODER, orjson when installed)
+        """
+        self.timeout = timeout or settings.TIMEOUT
+        self.retry_count = retry_count or settings.RETRY_COUNT
+        self.retry_delay = retry_delay or settings.RETRY_DELAY
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.circuit_breakers = circuit_breakers or CircuitBreakerRegistry()
+        self.decoder = decoder or get_decoder()
+        # Last-known-good response bodies, served when the upstream is unavailable
+        self.stale_store = LRUCache(max_entries=settings.STALE_MAX_ENTRIES)
+    
+    def _decode(self, body: bytes) -> Any:
+        """
+        Decode a JSON response body.
+        
+        Args:
+            body: Raw response body
+        
+        Returns:
+            Decoded response
+        
+        Raises:
+            APIError: If the body is not valid JSON
+        """
+        try:
+            return self.decoder(body)
+        except ValueError as e:
+            raise APIError(f"Invalid JSON in response: {e}") from e
+    
+    def _circuit_open_error(self, url: str, breaker: CircuitBreaker) -> CircuitOpenError:
+        """Build the error raised when a breaker rejects a call."""
+        retry_after = breaker.retry_after()
+        logger.warning(f"Circuit open for {url}, failing fast")
+        return CircuitOpenError(
+            f"Upstream {url} unavailable (circuit open, retry in {retry_after:.0f}s)",
+            retry_after=retry_after
+        )
+    
+    def _remember_response(self, request_key: str, body: bytes):
+        """
+        Keep a successful response as last-known-good data.
+        
+        Args:
+            request_key: Normalized request key
+            body: Raw response body
+        """
+        self.stale_store.set(request_key, (body, time.time()), settings.STALE_MAX_AGE)
+    
+    def _serve_stale(self, request_key: str, error: APIError) -> Optional[Any]:
+        """
+        Return the last-known-good response for a failed request.
+        
+        Args:
+            request_key: Normalized request key
+            error: Error that prevented a fresh response
+        
+        Returns:
+            Copy of the last-known-good response marked as stale, or None
+            if no response younger than STALE_MAX_AGE is available
+        """
+        entry = self.stale_store.get(request_key)
+        if entry is None:
+            return None
+        
+        body, stored_at = entry[0]
+        age = time.time() - stored_at
+        logger.warning(f"Serving stale response ({age:.0f}s old) after error: {error}")
+        return mark_stale(self._decode(body), age)
+    
+    def _check_status(self, status_code: int, headers: Mapping[str, str], body: str):
+        """
+        Raise the matching exception for error HTTP status codes.
+        
+        Args:
+            status_code: HTTP status code
+            headers: Response headers
+            body: Response body as text
+        
+        Raises:
+            RateLimitError: On HTTP 429
+            ValidationError: On HTTP 400
+            APIError: On HTTP 5xx
+        """
+        if status_code == 429:
+            try:
+                retry_after = int(headers.get("Retry-After", 60))
+            except ValueError:
+                retry_after = 60
+            logger.warning(f"Rate limit exceeded. Retry after {retry_after}s")
+            raise RateLimitError(
+                f"Rate limit exceeded. Retry after {retry_after} seconds",
+                retry_after=retry_after
+            )
+        
+        if status_code == 400:
+            error_msg = json.loads(body).get("reason", "Bad request")
+            logger.error(f"Bad request (400): {error_msg}")
+            raise ValidationError(f"Bad request: {error_msg}")
+        
+        if status_code >= 500:
+            logger.error(f"Server error ({status_code})")
+            raise APIError(
+                f"Server error ({status_code}): {body[:200]}"
+            )
+    
+    def _should_retry_rate_limit(self, error: RateLimitError, attempt: int) -> bool:
+        """
+        Pause the rate limiter on HTTP 429 and decide whether to retry.
+        
+        Without a rate limiter, 429 responses are never retried. With one,
+        the whole client is paused for Retry-After and the request is
+        retried once the pause is over, if attempts remain and the pause
+        fits within RATE_LIMIT_MAX_WAIT.
+        
+        Args:
+            error: Rate limit error raised for the response
+            attempt: Current attempt number (0-indexed)
+        
+        Returns:
+            True if the request should be retried
+        """
+        if self.rate_limiter is None:
+            return False
+        
+        retry_after = error.retry_after or 0
+        self.rate_limiter.pause(retry_after)
+        
+        return attempt < self.retry_count and retry_after <= settings.RATE_LIMIT_MAX_WAIT
+    
+    def _validate_params(self, params: Dict[str, Any]):
+        """
+        Validate request parameters.
+        
+        Latitude and longitude may be single values or comma-separated
+        lists (multi-location requests).
+        
+        Args:
+            params: Parameters to validate
+        
+        Raises:
+            ValidationError: If parameters are invalid
+        """
+        for lat in _split_coordinate_param(params.get("latitude")):
+            try:
+                lat = float(lat)
+            except (ValueError, TypeError):
+                raise ValidationError(
+                    f"Latitude must be a number, got: {type(lat).__name__}"
+                )
+            
+            if not -90 <= lat <= 90:
+                raise ValidationError(
+                    f"Latitude must be between -90 and 90, got: {lat}"
+                )
+        
+        for lon in _split_coordinate_param(params.get("longitude")):
+            try:
+                lon = float(lon)
+            except (ValueError, TypeError):
+                raise ValidationError(
+                    f"Longitude must be a number, got: {type(lon).__name__}"
+                )
+            
+            if not -180 <= lon <= 180:
+                raise ValidationError(
+                    f"Longitude must be between -180 and 180, got: {lon}"
+                )
+    
+    def _calculate_backoff_delay(
+        self,
+        attempt: int,
+        previous_delay: Optional[float] = None
+    ) -> float:
+        """
+        Calculate exponential backoff delay with decorrelated jitter.
+        
+        Formula: min(uniform(RETRY_DELAY, previous_delay * 3), MAX_RETRY_DELAY),
+        with previous_delay = RETRY_DELAY for the first retry. The random
+        spread keeps many workers from retrying in lockstep.
+        
+        Args:
+            attempt: Current attempt number (0-indexed)
+            previous_delay: Delay used before the previous retry, if any
+        
+        Returns:
+            Delay in seconds
+        """
+        previous_delay = previous_delay or self.retry_delay
+        delay = random.uniform(self.retry_delay, previous_delay * 3)
+        return min(delay, settings.MAX_RETRY_DELAY)
+    
+    def _rate_limit_wait(self, expires_at: Optional[float]) -> float:
+        """
+        Return how long to wait for a rate limiter token.
+        
+        Args:
+            expires_at: Monotonic time at which the deadline expires, if any
+        
+        Returns:
+            RATE_LIMIT_MAX_WAIT, capped to the remaining deadline budget
+        """
+        if expires_at is None:
+            return settings.RATE_LIMIT_MAX_WAIT
+        return min(settings.RATE_LIMIT_MAX_WAIT, max(0.0, expires_at - time.monotonic()))
+    
+    def _attempt_timeout(
+        self,
+        request_timeout: float,
+        expires_at: Optional[float]
+    ) -> Optional[float]:
+        """
+        Fit the per-attempt timeout into the remaining deadline budget.
+        
+        Args:
+            request_timeout: Configured per-attempt timeout in seconds
+            expires_at: Monotonic time at which the deadline expires, if any
+        
+        Returns:
+            Timeout for the next attempt, or None if less than
+            MIN_ATTEMPT_TIMEOUT is left
+        """
+        if expires_at is None:
+            return request_timeout
+        
+        remaining = expires_at - time.monotonic()
+        if remaining < settings.MIN_ATTEMPT_TIMEOUT:
+            return None
+        return min(request_timeout, remaining)
+    
+    def _retry_fits_budget(self, delay: float, expires_at: Optional[float]) -> bool:
+        """
+        Tell whether a retry after delay still leaves time for an attempt.
+        
+        Args:
+            delay: Backoff delay before the retry
+            expires_at: Monotonic time at which the deadline expires, if any
+        
+        Returns:
+            True if the retry can start with at least MIN_ATTEMPT_TIMEOUT left
+        """
+        if expires_at is None:
+            return True
+        return time.monotonic() + delay + settings.MIN_ATTEMPT_TIMEOUT <= expires_at
+
+
+def _split_coordinate_param(value: Any) -> List[Any]:
+    """
+    Return the individual values of a latitude/longitude parameter.
+    
+    Args:
+        value: Single value or comma-separated string
+    
+    Returns:
+        List of values (empty if the parameter is absent)
+    """
+    if value is None:
+        return []
+    if isinstance(value, str) and "," in value:
+        return value.split(",")
+    return [value]
+
+
+def deadline_expiry(deadline: Optional[float]) -> Optional[float]:
+    """
+    Convert a time budget into a monotonic expiry time.
+    
+    Args:
+        deadline: Time budget in seconds, or None for no deadline
+    
+    Returns:
+        Monotonic expiry time, or None
+    """
+    if deadline is None:
+        return None
+    return time.monotonic() + deadline
+
+
+def deadline_remaining(expires_at: Optional[float]) -> Optional[float]:
+    """
+    Return the budget left before a monotonic expiry time.
+    
+    Args:
+        expires_at: Monotonic expiry time, or None for no deadline
+    
+    Returns:
+        Seconds left (never negative), or None
+    """
+    if expires_at is None:
+        return None
+    return max(0.0, expires_at - time.monotonic())
+
+
+def mark_stale(payload: Any, age: float) -> Any:
+    """
+    Return a copy of a response marked as stale.
+    
+    Args:
+        payload: Decoded response (object or list of objects)
+        age: Age of the response in seconds
+    
+    Returns:
+        Copy with "stale": True and "stale_age" added to each object
+    """
+    if isinstance(payload, list):
+        return [mark_stale(item, age) for item in payload]
+    return {**payload, "stale": True, "stale_age": round(age, 1)}
+
+
+def copy_stale_marker(response: Any, result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Propagate the stale marker of a raw response into a parsed result.
+    
+    Args:
+        response: Raw API response
+        result: Parsed result, updated in place
+    
+    Returns:
+        The result
+    """
+    if isinstance(response, dict) and response.get("stale"):
+        result["stale"] = True
+        result["stale_age"] = response.get("stale_age")
+    return result
+
+
+class APIClient(BaseAPIClient):
     """
     HTTP client for API calls with retry logic and error handling.
     
     Features:
     - Automatic retry with exponential backoff
-    - Rate limit handling (HTTP 429)
+    - Rate limit handling (HTTP 429) with optional client-side token bucket
     - Timeout management
     - Request validation
     - Detailed logging
-    - Optional Redis caching
+    - Optional two-tier response cache (in-process LRU + Redis)
+    - Coalescing of identical concurrent requests (single-flight)
+    - Per-endpoint circuit breaker with last-known-good (stale) fallback
+    - Per-endpoint latency tracking and opt-in hedged requests
     """
     
     def __init__(
         self,
         timeout: Optional[int] = None,
         retry_count: Optional[int] = None,
-        retry_delay: Optional[int] = None
+        retry_delay: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        hedging: Optional[bool] = None,
+        hedge_budget: Optional[HedgeBudget] = None,
+        decoder: Optional[Decoder] = None
     ):
         """
         Initialize API client.
@@ -47,180 +424,431 @@ class APIClient:
             timeout: Request timeout in seconds (default: from settings)
             retry_count: Number of retry attempts (default: from settings)
             retry_delay: Initial delay between retries (default: from settings)
+            cache: Optional response cache (default: built from settings
+                when CACHE_ENABLED is true)
+            single_flight: Optional coalescing registry, to share in-flight
+                requests between clients (default: private registry)
+            rate_limiter: Optional token bucket (default: the shared limiter
+                when RATE_LIMIT_PER_SECOND > 0)
+            circuit_breakers: Optional per-endpoint breakers (default: new registry)
+            hedging: Send a duplicate GET when the first is slower than the
+                endpoint's HEDGE_PERCENTILE latency (default: HEDGE_ENABLED)
+            hedge_budget: Optional hedge budget (default: the shared budget)
+            decoder: Optional JSON decoder for response bodies (default:
+                from JSON_DECODER, orjson when installed)
         """
-        self.timeout = timeout or settings.TIMEOUT
-        self.retry_count = retry_count or settings.RETRY_COUNT
-        self.retry_delay = retry_delay or settings.RETRY_DELAY
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "CycloneTracker/1.0.0 (Educational Project)"
-        })
+        super().__init__(
+            timeout, retry_count, retry_delay, rate_limiter, circuit_breakers, decoder
+        )
+        self.session = self._new_session()
+        
+        if cache is None and settings.CACHE_ENABLED:
+            cache = ResponseCache.from_settings()
+        self.cache = cache
+        self.single_flight = single_flight or SingleFlight()
+        self.latency_tracker = LatencyTracker()
+        self.hedging = settings.HEDGE_ENABLED if hedging is None else hedging
+        self.hedge_budget = hedge_budget or get_shared_hedge_budget()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        # requests.Session is not thread-safe: one session per hedge worker
+        self._hedge_local = threading.local()
+        self._hedge_sessions: List[requests.Session] = []
+        self._hedge_lock = threading.Lock()
         
         logger.info(
             f"APIClient initialized: timeout={self.timeout}s, "
-            f"retry_count={self.retry_count}"
+            f"retry_count={self.retry_count}, "
+            f"cache={'enabled' if self.cache is not None else 'disabled'}"
         )
     
     def get(
         self,
         url: str,
         params: Optional[Dict[str, Any]] = None,
-        timeout: Optional[int] = None
-    ) -> Dict[str, Any]:
+        timeout: Optional[int] = None,
+        deadline: Optional[float] = None,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], bytes]:
         """
         Make GET request with retry logic.
         
+        When the upstream fails (or its circuit is open) and a response for
+        the same request succeeded within STALE_MAX_AGE, that response is
+        returned with "stale": True instead of raising (decoded requests
+        only).
+        
+        With a deadline, per-attempt timeouts are shrunk to the remaining
+        budget and retries that cannot start in time are skipped, so the
+        call returns or raises within the deadline.
+        
         Args:
             url: API endpoint URL
             params: Query parameters
             timeout: Request timeout (overrides default)
+            deadline: Total time budget in seconds, retries and backoff
+                included (default: none)
+            raw: Return the undecoded body bytes (wrap in memoryview() for
+                zero-copy slicing) instead of the parsed JSON
         
         Returns:
-            Parsed JSON response
+            Parsed JSON response, or the raw body when raw is True
         
         Raises:
             ValidationError: If parameters are invalid
             RateLimitError: If rate limit exceeded (429)
+            CircuitOpenError: If the endpoint circuit is open
             CustomTimeoutError: If request times out
-            APIError: For other API errors
+            APIError: For other API errors (including invalid JSON)
         """
+        expires_at = deadline_expiry(deadline)
+        
         # Validate parameters
         if params:
             self._validate_params(params)
         
+        request_key = make_cache_key(url, params)
+        
+        # Serve from cache when possible
+        if self.cache is not None:
+            cached = self.cache.get(request_key)
+            if cached is not None:
+                logger.info(f"Cache hit: GET {url} with params {params}")
+                return cached if raw else self._decode(cached)
+        
         # Use provided timeout or default
         request_timeout = timeout or self.timeout
         
+        # Identical concurrent requests share one upstream call
+        leader_decoded: Dict[str, Any] = {}
+        try:
+            body = self.single_flight.do(
+                request_key,
+                lambda: self._fetch(
+                    url, params, request_timeout, request_key, expires_at,
+                    decoded=None if raw else leader_decoded
+                ),
+                timeout=deadline_remaining(expires_at)
+            )
+        except ValidationError:
+            raise
+        except APIError as e:
+            # Fall back to the last-known-good response when there is one
+            stale = None if raw else self._serve_stale(request_key, e)
+            if stale is None:
+                raise
+            return stale
+        
+        # The leader already decoded the body; followers decode their own copy
+        if "value" in leader_decoded:
+            return leader_decoded["value"]
+        return body if raw else self._decode(body)
+    
+    def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        request_timeout: float,
+        request_key: str,
+        expires_at: Optional[float] = None,
+        decoded: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Perform the upstream GET with retries and store the body in cache.
+        
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+            request_timeout: Per-attempt timeout in seconds
+            request_key: Normalized request key (cache key)
+            expires_at: Monotonic time at which the deadline expires, if any
+            decoded: When given, the body is decoded before it is cached
+                (an invalid body counts as a failed attempt) and stored
+                under "value"
+        
+        Returns:
+            Raw response body
+        
+        Raises:
+            RateLimitError: If rate limit exceeded (429)
+            CircuitOpenError: If the endpoint circuit is open
+            CustomTimeoutError: If request times out
+            APIError: For other API errors
+            requests.exceptions.HTTPError: For other 4xx responses (not retried)
+        """
+        breaker = self.circuit_breakers.get(url)
+        
         # Log request
         logger.info(f"API call: GET {url} with params {params}")
         
         # Retry loop
         last_exception = None
+        previous_delay = None
         for attempt in range(self.retry_count + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(timeout=self._rate_limit_wait(expires_at))
+            
+            attempt_timeout = self._attempt_timeout(request_timeout, expires_at)
+            if attempt_timeout is None:
+                logger.warning(f"Deadline budget exhausted for {url}")
+                last_exception = last_exception or CustomTimeoutError("Request deadline exceeded")
+                break
+            
+            if not breaker.allow_request():
+                raise self._circuit_open_error(url, breaker)
+            
             try:
                 start_time = time.time()
                 
-                response = self.session.get(
-                    url,
-                    params=params,
-                    timeout=request_timeout
-                )
+                response = self._send(url, params, attempt_timeout)
                 
                 elapsed = time.time() - start_time
                 
-                # Handle HTTP errors
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 60))
-                    logger.warning(f"Rate limit exceeded. Retry after {retry_after}s")
-                    raise RateLimitError(
-                        f"Rate limit exceeded. Retry after {retry_after} seconds"
-                    )
-                
-                if response.status_code == 400:
-                    error_msg = response.json().get("reason", "Bad request")
-                    logger.error(f"Bad request (400): {error_msg}")
-                    raise ValidationError(f"Bad request: {error_msg}")
+                # Any answer other than a server error means the upstream is up
+                if response.status_code < 500:
+                    breaker.record_success()
                 
-                if response.status_code >= 500:
-                    logger.error(f"Server error ({response.status_code})")
-                    raise APIError(
-                        f"Server error ({response.status_code}): {response.text[:200]}"
-                    )
+                # Handle HTTP errors
+                if response.status_code >= 400:
+                    self._check_status(response.status_code, response.headers, response.text)
                 
                 response.raise_for_status()
                 
                 # Success
                 logger.info(f"API call successful (status: 200, time: {elapsed:.2f}s)")
-                return response.json()
+                body = response.content
+                
+                # Never cache a body that cannot be decoded
+                if decoded is not None:
+                    decoded["value"] = self._decode(body)
+                
+                if self.cache is not None:
+                    self.cache.set(request_key, body, self.cache.ttl_for(url, params))
+                self._remember_response(request_key, body)
+                
+                return body
             
             except requests.exceptions.Timeout as e:
+                breaker.record_failure()
                 last_exception = CustomTimeoutError(
-                    f"Request timeout after {request_timeout}s"
+                    f"Request timeout after {attempt_timeout:g}s"
                 )
                 logger.warning(
                     f"Timeout on attempt {attempt + 1}/{self.retry_count + 1}"
                 )
             
             except requests.exceptions.ConnectionError as e:
+                breaker.record_failure()
                 last_exception = APIError(f"Connection failed: {e}")
                 logger.warning(
                     f"Connection error on attempt {attempt + 1}/{self.retry_count + 1}: {e}"
                 )
             
-            except (RateLimitError, ValidationError) as e:
-                # Don't retry on validation or rate limit errors
+            except requests.exceptions.HTTPError:
+                # Other 4xx answers come from a live upstream: neither
+                # retried nor counted as a breaker failure
+                raise
+            
+            except requests.exceptions.RequestException as e:
+                # Any other transport failure (e.g. truncated body) must
+                # still settle the breaker, or a half-open probe stays in flight
+                breaker.record_failure()
+                last_exception = APIError(f"Request failed: {e}")
+                logger.warning(
+                    f"Request error on attempt {attempt + 1}/{self.retry_count + 1}: {e}"
+                )
+            
+            except RateLimitError as e:
+                # Only retried once the rate limiter pause is over
+                if not self._should_retry_rate_limit(e, attempt):
+                    raise
+                last_exception = e
+                logger.warning(
+                    f"Rate limited on attempt {attempt + 1}/{self.retry_count + 1}, "
+                    f"waiting {e.retry_after}s"
+                )
+                continue
+            
+            except ValidationError as e:
+                # Don't retry on validation errors
                 raise
             
             except APIError as e:
+                breaker.record_failure()
                 last_exception = e
                 logger.warning(
                     f"API error on attempt {attempt + 1}/{self.retry_count + 1}: {e}"
                 )
             
+            # Stop retrying once the circuit has opened
+            if breaker.state is CircuitState.OPEN:
+                break
+            
             # Calculate backoff delay
             if attempt < self.retry_count:
-                delay = self._calculate_backoff_delay(attempt)
-                logger.info(f"Retrying in {delay}s...")
+                delay = self._calculate_backoff_delay(attempt, previous_delay)
+                if not self._retry_fits_budget(delay, expires_at):
+                    logger.warning(f"Skipping retry for {url}: not enough deadline budget left")
+                    break
+                previous_delay = delay
+                logger.info(f"Retrying in {delay:.2f}s...")
                 time.sleep(delay)
         
-        # All retries exhausted
-        logger.error(f"All {self.retry_count + 1} attempts failed")
+        # All retries exhausted (or circuit opened, or deadline reached)
+        logger.error(f"Request to {url} failed after {attempt + 1} attempts")
         raise last_exception or APIError("Request failed after all retries")
     
-    def _validate_params(self, params: Dict[str, Any]):
+    def _send(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        timeout: float
+    ) -> requests.Response:
         """
-        Validate request parameters.
+        Send one GET attempt, hedged when enabled, and track its latency.
         
         Args:
-            params: Parameters to validate
+            url: API endpoint URL
+            params: Query parameters
+            timeout: Attempt timeout in seconds
+        
+        Returns:
+            HTTP response
         
         Raises:
-            ValidationError: If parameters are invalid
+            requests.exceptions.RequestException: If the attempt fails
         """
-        if "latitude" in params:
-            lat = params["latitude"]
-            try:
-                lat = float(lat)
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Latitude must be a number, got: {type(lat).__name__}"
-                )
-            
-            if not -90 <= lat <= 90:
-                raise ValidationError(
-                    f"Latitude must be between -90 and 90, got: {lat}"
-                )
+        hedge_delay = self._hedge_delay(url, timeout)
+        if hedge_delay is not None:
+            return self._send_hedged(url, params, timeout, hedge_delay)
         
-        if "longitude" in params:
-            lon = params["longitude"]
-            try:
-                lon = float(lon)
-            except (ValueError, TypeError):
-                raise ValidationError(
-                    f"Longitude must be a number, got: {type(lon).__name__}"
-                )
-            
-            if not -180 <= lon <= 180:
-                raise ValidationError(
-                    f"Longitude must be between -180 and 180, got: {lon}"
-                )
+        start_time = time.monotonic()
+        response = self.session.get(url, params=params, timeout=timeout)
+        self.latency_tracker.record(url, time.monotonic() - start_time)
+        return response
+    
+    def _new_session(self) -> requests.Session:
+        """Create an HTTP session with the client headers."""
+        session = requests.Session()
+        session.headers.update({"User-Agent": USER_AGENT})
+        return session
     
-    def _calculate_backoff_delay(self, attempt: int) -> float:
+    def _hedge_delay(self, url: str, timeout: float) -> Optional[float]:
         """
-        Calculate exponential backoff delay.
+        Return how long to wait before hedging a request.
         
-        Formula: min(RETRY_DELAY * (2 ^ attempt), MAX_RETRY_DELAY)
+        Args:
+            url: API endpoint URL
+            timeout: Attempt timeout in seconds
+        
+        Returns:
+            The endpoint's HEDGE_PERCENTILE latency, or None when hedging
+            is disabled, not enough latency samples exist yet, or the
+            hedge could not start before the attempt times out
+        """
+        if not self.hedging:
+            return None
+        
+        self.hedge_budget.record_request()
+        delay = self.latency_tracker.percentile(url, settings.HEDGE_PERCENTILE)
+        if delay is None or delay >= timeout:
+            return None
+        return max(delay, settings.HEDGE_MIN_DELAY)
+    
+    def _send_hedged(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+        hedge_delay: float
+    ) -> requests.Response:
+        """
+        Send a GET and a duplicate after hedge_delay, keep the first answer.
+        
+        The duplicate is only sent if the hedge budget allows it and the
+        rate limiter has a token available right away. The slower
+        request is left to finish in the background and its answer dropped.
+        Only the first request's own latency is tracked, once it completes,
+        so hedging does not bias the percentile it is based on.
         
         Args:
-            attempt: Current attempt number (0-indexed)
+            url: API endpoint URL
+            params: Query parameters
+            timeout: Attempt timeout in seconds
+            hedge_delay: Seconds to wait before sending the duplicate
         
         Returns:
-            Delay in seconds
+            First HTTP response received
+        
+        Raises:
+            requests.exceptions.RequestException: If every request fails
         """
-        delay = self.retry_delay * (2 ** attempt)
-        return min(delay, settings.MAX_RETRY_DELAY)
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=settings.HEDGE_MAX_WORKERS,
+                thread_name_prefix="api-hedge"
+            )
+        
+        pending = {self._hedge_executor.submit(self._hedge_get, url, params, timeout, True)}
+        
+        done, _ = wait(pending, timeout=hedge_delay)
+        if not done and self.hedge_budget.try_acquire() and (
+            self.rate_limiter is None or self.rate_limiter.try_acquire()
+        ):
+            logger.info(f"Hedging GET {url} after {hedge_delay:.2f}s")
+            pending.add(self._hedge_executor.submit(
+                self._hedge_get, url, params, timeout - hedge_delay, False
+            ))
+        
+        last_exception = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except requests.exceptions.RequestException as e:
+                    last_exception = e
+                    continue
+                return response
+        
+        raise last_exception
+    
+    def _hedge_get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+        track_latency: bool
+    ) -> requests.Response:
+        """
+        Send a GET from a hedge worker through the worker's own session.
+        
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+            timeout: Request timeout in seconds
+            track_latency: Record the request latency once it completes
+        
+        Returns:
+            HTTP response
+        """
+        session = getattr(self._hedge_local, "session", None)
+        if session is None:
+            session = self._hedge_local.session = self._new_session()
+            with self._hedge_lock:
+                self._hedge_sessions.append(session)
+        
+        start_time = time.monotonic()
+        response = session.get(url, params=params, timeout=timeout)
+        if track_latency:
+            self.latency_tracker.record(url, time.monotonic() - start_time)
+        return response
     
     def close(self):
-        """Close HTTP session."""
+        """Close HTTP sessions."""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        with self._hedge_lock:
+            for session in self._hedge_sessions:
+                session.close()
         self.session.close()
         logger.info("APIClient session closed")
@@ -0,0 +1,365 @@
+"""
+Asyncio HTTP API Client with retry logic and error handling.
+
+This module provides the asyncio counterpart of APIClient. It shares the
+same retry, rate limit (HTTP 429) and timeout semantics, but never blocks
+the event loop, so a single process can keep hundreds of upstream calls
+in flight.
+"""
+
+import asyncio
+import time
+import logging
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+import aiohttp
+
+from ..config.settings import settings
+from .api_client import BaseAPIClient, USER_AGENT, deadline_expiry, deadline_remaining
+from .cache import make_cache_key
+from .circuit_breaker import CircuitBreakerRegistry, CircuitState
+from .json_codec import Decoder
+from .rate_limiter import TokenBucketRateLimiter
+from .single_flight import AsyncSingleFlight
+from .error_handler import (
+    APIError,
+    ValidationError,
+    RateLimitError,
+    TimeoutError as CustomTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAPIClient(BaseAPIClient):
+    """
+    Asyncio HTTP client for API calls with retry logic and error handling.
+    
+    Features:
+    - Automatic retry with exponential backoff (non-blocking sleep)
+    - Rate limit handling (HTTP 429) with optional client-side token bucket
+    - Timeout management
+    - Request validation
+    - Bounded connection pool shared by all concurrent calls
+    - Coalescing of identical concurrent requests (single-flight)
+    - Per-endpoint circuit breaker with last-known-good (stale) fallback
+    
+    The underlying aiohttp session is created lazily on the first call so
+    the client can be instantiated outside of a running event loop.
+    """
+    
+    def __init__(
+        self,
+        timeout: Optional[int] = None,
+        retry_count: Optional[int] = None,
+        retry_delay: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        decoder: Optional[Decoder] = None
+    ):
+        """
+        Initialize async API client.
+        
+        Args:
+            timeout: Request timeout in seconds (default: from settings)
+            retry_count: Number of retry attempts (default: from settings)
+            retry_delay: Initial delay between retries (default: from settings)
+            max_connections: Maximum simultaneous connections (default: from settings)
+            single_flight: Optional coalescing registry, to share in-flight
+                requests between clients (default: private registry)
+            rate_limiter: Optional token bucket (default: the shared limiter
+                when RATE_LIMIT_PER_SECOND > 0)
+            circuit_breakers: Optional per-endpoint breakers (default: new registry)
+            decoder: Optional JSON decoder for response bodies (default:
+                from JSON_DECODER, orjson when installed)
+        """
+        super().__init__(
+            timeout, retry_count, retry_delay, rate_limiter, circuit_breakers, decoder
+        )
+        self.max_connections = max_connections or settings.ASYNC_MAX_CONNECTIONS
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.single_flight = single_flight or AsyncSingleFlight()
+        
+        logger.info(
+            f"AsyncAPIClient initialized: timeout={self.timeout}s, "
+            f"retry_count={self.retry_count}, "
+            f"max_connections={self.max_connections}"
+        )
+    
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared aiohttp session, creating it on first use.
+        
+        Returns:
+            Open aiohttp session
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                headers={"User-Agent": USER_AGENT}
+            )
+        return self.session
+    
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+        deadline: Optional[float] = None,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], bytes]:
+        """
+        Make GET request with retry logic.
+        
+        Falls back to the last-known-good response marked "stale": True
+        when the upstream fails, honours the deadline budget and supports
+        raw bodies, like APIClient.get.
+        
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+            timeout: Request timeout (overrides default)
+            deadline: Total time budget in seconds, retries and backoff
+                included (default: none)
+            raw: Return the undecoded body bytes instead of the parsed JSON
+        
+        Returns:
+            Parsed JSON response, or the raw body when raw is True
+        
+        Raises:
+            ValidationError: If parameters are invalid
+            RateLimitError: If rate limit exceeded (429)
+            CircuitOpenError: If the endpoint circuit is open
+            CustomTimeoutError: If request times out
+            APIError: For other API errors (including invalid JSON)
+        """
+        expires_at = deadline_expiry(deadline)
+        
+        # Validate parameters
+        if params:
+            self._validate_params(params)
+        
+        # Use provided timeout or default
+        request_timeout = timeout or self.timeout
+        
+        request_key = make_cache_key(url, params)
+        
+        # Identical concurrent requests share one upstream call
+        leader_decoded: Dict[str, Any] = {}
+        try:
+            body = await self.single_flight.do(
+                request_key,
+                lambda: self._fetch(
+                    url, params, request_timeout, request_key, expires_at,
+                    decoded=None if raw else leader_decoded
+                ),
+                timeout=deadline_remaining(expires_at)
+            )
+        except ValidationError:
+            raise
+        except APIError as e:
+            # Fall back to the last-known-good response when there is one
+            stale = None if raw else self._serve_stale(request_key, e)
+            if stale is None:
+                raise
+            return stale
+        
+        # The leader already decoded the body; followers decode their own copy
+        if "value" in leader_decoded:
+            return leader_decoded["value"]
+        return body if raw else self._decode(body)
+    
+    async def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        request_timeout: float,
+        request_key: str,
+        expires_at: Optional[float] = None,
+        decoded: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Perform the upstream GET with retries.
+        
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+            request_timeout: Per-attempt timeout in seconds
+            request_key: Normalized request key
+            expires_at: Monotonic time at which the deadline expires, if any
+            decoded: When given, the body is decoded before it is cached
+                (an invalid body counts as a failed attempt) and stored
+                under "value"
+        
+        Returns:
+            Raw response body
+        
+        Raises:
+            RateLimitError: If rate limit exceeded (429)
+            CircuitOpenError: If the endpoint circuit is open
+            CustomTimeoutError: If request times out
+            APIError: For other API errors
+            aiohttp.ClientResponseError: For other 4xx responses (not retried)
+        """
+        breaker = self.circuit_breakers.get(url)
+        
+        # Log request
+        logger.info(f"API call: GET {url} with params {params}")
+        
+        session = self._get_session()
+        query = _encode_params(params)
+        
+        # Retry loop
+        last_exception = None
+        previous_delay = None
+        for attempt in range(self.retry_count + 1):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(timeout=self._rate_limit_wait(expires_at))
+            
+            attempt_timeout = self._attempt_timeout(request_timeout, expires_at)
+            if attempt_timeout is None:
+                logger.warning(f"Deadline budget exhausted for {url}")
+                last_exception = last_exception or CustomTimeoutError("Request deadline exceeded")
+                break
+            
+            if not breaker.allow_request():
+                raise self._circuit_open_error(url, breaker)
+            
+            try:
+                start_time = time.time()
+                
+                async with session.get(
+                    url,
+                    params=query,
+                    timeout=aiohttp.ClientTimeout(total=attempt_timeout)
+                ) as response:
+                    body = await response.read()
+                    elapsed = time.time() - start_time
+                    
+                    # Any answer other than a server error means the upstream is up
+                    if response.status < 500:
+                        breaker.record_success()
+                    
+                    # Handle HTTP errors
+                    if response.status >= 400:
+                        self._check_status(
+                            response.status, response.headers, body.decode("utf-8", "replace")
+                        )
+                    
+                    response.raise_for_status()
+                    
+                    # Success
+                    logger.info(f"API call successful (status: 200, time: {elapsed:.2f}s)")
+                    
+                    # Never keep a body that cannot be decoded
+                    if decoded is not None:
+                        decoded["value"] = self._decode(body)
+                    
+                    self._remember_response(request_key, body)
+                    return body
+            
+            except asyncio.TimeoutError:
+                breaker.record_failure()
+                last_exception = CustomTimeoutError(
+                    f"Request timeout after {attempt_timeout:g}s"
+                )
+                logger.warning(
+                    f"Timeout on attempt {attempt + 1}/{self.retry_count + 1}"
+                )
+            
+            except aiohttp.ClientConnectionError as e:
+                breaker.record_failure()
+                last_exception = APIError(f"Connection failed: {e}")
+                logger.warning(
+                    f"Connection error on attempt {attempt + 1}/{self.retry_count + 1}: {e}"
+                )
+            
+            except aiohttp.ClientResponseError:
+                # Other 4xx answers come from a live upstream: neither
+                # retried nor counted as a breaker failure
+                raise
+            
+            except aiohttp.ClientError as e:
+                # Any other transport failure (e.g. payload error) must
+                # still settle the breaker, or a half-open probe stays in flight
+                breaker.record_failure()
+                last_exception = APIError(f"Request failed: {e}")
+                logger.warning(
+                    f"Request error on attempt {attempt + 1}/{self.retry_count + 1}: {e}"
+                )
+            
+            except RateLimitError as e:
+                # Only retried once the rate limiter pause is over
+                if not self._should_retry_rate_limit(e, attempt):
+                    raise
+                last_exception = e
+                logger.warning(
+                    f"Rate limited on attempt {attempt + 1}/{self.retry_count + 1}, "
+                    f"waiting {e.retry_after}s"
+                )
+                continue
+            
+            except ValidationError:
+                # Don't retry on validation errors
+                raise
+            
+            except APIError as e:
+                breaker.record_failure()
+                last_exception = e
+                logger.warning(
+                    f"API error on attempt {attempt + 1}/{self.retry_count + 1}: {e}"
+                )
+            
+            # Stop retrying once the circuit has opened
+            if breaker.state is CircuitState.OPEN:
+                break
+            
+            # Calculate backoff delay
+            if attempt < self.retry_count:
+                delay = self._calculate_backoff_delay(attempt, previous_delay)
+                if not self._retry_fits_budget(delay, expires_at):
+                    logger.warning(f"Skipping retry for {url}: not enough deadline budget left")
+                    break
+                previous_delay = delay
+                logger.info(f"Retrying in {delay:.2f}s...")
+                await asyncio.sleep(delay)
+        
+        # All retries exhausted (or circuit opened, or deadline reached)
+        logger.error(f"Request to {url} failed after {attempt + 1} attempts")
+        raise last_exception or APIError("Request failed after all retries")
+    
+    async def close(self):
+        """Close HTTP session."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        logger.info("AsyncAPIClient session closed")
+
+
+def _encode_params(params: Optional[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """
+    Encode query parameters the way requests does.
+    
+    List values are expanded into repeated keys and every value is
+    converted to a string, which aiohttp requires.
+    
+    Args:
+        params: Query parameters
+    
+    Returns:
+        List of (key, value) pairs
+    """
+    query = []
+    for key, value in (params or {}).items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        query.extend((key, str(item)) for item in values)
+    return query
@@ -0,0 +1,171 @@
+"""
+Multi-location request batching for Open-Meteo.
+
+Open-Meteo accepts comma-separated latitude/longitude lists and answers
+with one result per coordinate. This module splits arbitrarily long
+coordinate lists into chunks whose request URL stays below a safe length,
+and snaps coordinates to the upstream model grid so nearby points share
+cache entries and requests.
+"""
+
+import logging
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote, urlencode
+
+from ..config.settings import settings
+from .error_handler import DataNotFoundError
+
+logger = logging.getLogger(__name__)
+
+Coordinate = Tuple[float, float]
+
+# Length of an URL-encoded comma ("%2C") separating two coordinates
+_SEPARATOR_LENGTH = 3
+
+
+def iter_coordinate_chunks(
+    url: str,
+    params: Dict[str, Any],
+    locations: Sequence[Coordinate],
+    max_url_length: Optional[int] = None,
+    max_locations: Optional[int] = None
+) -> Iterator[Tuple[List[int], Dict[str, Any]]]:
+    """
+    Split locations into URL-length-safe multi-coordinate requests.
+    
+    Args:
+        url: API endpoint URL
+        params: Query parameters without latitude/longitude
+        locations: Sequence of (latitude, longitude) pairs
+        max_url_length: Maximum request URL length (default: from settings)
+        max_locations: Maximum coordinates per request (default: from settings)
+    
+    Yields:
+        Tuples of (indices into locations, request parameters)
+    """
+    max_url_length = max_url_length or settings.MAX_URL_LENGTH
+    max_locations = max_locations or settings.MAX_LOCATIONS_PER_REQUEST
+    
+    # "?" + "&latitude=" + "&longitude=" around the fixed parameters
+    base_length = len(url) + 1 + len(urlencode(params, doseq=True)) + len("&latitude=&longitude=")
+    
+    indices: List[int] = []
+    latitudes: List[str] = []
+    longitudes: List[str] = []
+    length = base_length
+    
+    for index, (latitude, longitude) in enumerate(locations):
+        lat_str = str(latitude)
+        lon_str = str(longitude)
+        added = len(quote(lat_str)) + len(quote(lon_str))
+        if indices:
+            added += 2 * _SEPARATOR_LENGTH
+        
+        if indices and (length + added > max_url_length or len(indices) >= max_locations):
+            yield indices, _with_coordinates(params, latitudes, longitudes)
+            indices, latitudes, longitudes = [], [], []
+            length = base_length
+            added -= 2 * _SEPARATOR_LENGTH
+        
+        indices.append(index)
+        latitudes.append(lat_str)
+        longitudes.append(lon_str)
+        length += added
+    
+    if indices:
+        yield indices, _with_coordinates(params, latitudes, longitudes)
+
+
+def snap_coordinate(latitude: float, longitude: float, resolution: Optional[float]) -> Coordinate:
+    """
+    Quantize a coordinate to the nearest multiple of the model resolution.
+    
+    Open-Meteo answers from the nearest model grid point, so points closer
+    than one grid step return the same data; snapping makes their request
+    parameters (and cache keys) identical as well.
+    
+    Args:
+        latitude: Latitude (-90 to 90)
+        longitude: Longitude (-180 to 180)
+        resolution: Grid step in degrees (0 or None disables snapping)
+    
+    Returns:
+        Snapped (latitude, longitude)
+    """
+    if not resolution:
+        return latitude, longitude
+    return _snap(latitude, resolution, 90.0), _snap(longitude, resolution, 180.0)
+
+
+def group_by_cell(
+    locations: Sequence[Coordinate],
+    resolution: Optional[float]
+) -> Tuple[List[Coordinate], List[List[int]]]:
+    """
+    Snap locations and merge those falling in the same grid cell.
+    
+    Args:
+        locations: Sequence of (latitude, longitude) pairs
+        resolution: Grid step in degrees (0 or None disables snapping)
+    
+    Returns:
+        Tuple of (unique snapped coordinates in first-seen order, indices
+        into locations of the points sharing each coordinate)
+    """
+    positions: Dict[Coordinate, int] = {}
+    members: List[List[int]] = []
+    
+    for index, (latitude, longitude) in enumerate(locations):
+        cell = snap_coordinate(latitude, longitude, resolution)
+        position = positions.setdefault(cell, len(members))
+        if position == len(members):
+            members.append([])
+        members[position].append(index)
+    
+    return list(positions), members
+
+
+def split_multi_response(response: Any, expected: int) -> List[Dict[str, Any]]:
+    """
+    Normalize a multi-coordinate response into one dict per location.
+    
+    Open-Meteo returns a plain object for a single coordinate and an
+    array of objects for several coordinates.
+    
+    Args:
+        response: Decoded API response
+        expected: Number of coordinates sent in the request
+    
+    Returns:
+        List of per-location responses, in request order
+    
+    Raises:
+        DataNotFoundError: If the number of results does not match the request
+    """
+    results = response if isinstance(response, list) else [response]
+    
+    if len(results) != expected:
+        raise DataNotFoundError(
+            f"Expected {expected} locations in response, got: {len(results)}"
+        )
+    
+    return results
+
+
+def _snap(value: float, resolution: float, limit: float) -> float:
+    """Round a value to the resolution grid, without float noise, within +/- limit."""
+    snapped = round(round(value / resolution) * resolution, 6)
+    return max(-limit, min(limit, snapped))
+
+
+def _with_coordinates(
+    params: Dict[str, Any],
+    latitudes: List[str],
+    longitudes: List[str]
+) -> Dict[str, Any]:
+    """Build request parameters for one chunk of coordinates."""
+    return {
+        "latitude": ",".join(latitudes),
+        "longitude": ",".join(longitudes),
+        **params
+    }
@@ -0,0 +1,746 @@
+"""
+Two-tier response cache for upstream API calls.
+
+This module provides a bounded in-process LRU cache placed in front of an
+optional second tier: Redis, or a SQLite file for single-node
+deployments that must keep a warm cache across restarts. Keys are normalized from (url, params) so that
+equivalent requests share an entry, and hit/miss counters are kept for
+monitoring. Forecast entries expire when the endpoint's next model run is
+published (flat per-endpoint TTLs otherwise); responses for settled
+historical dates are kept for a very long TTL. When Redis is unavailable the
+cache keeps serving from the local tier instead of failing requests.
+
+APIClient stores the raw response bodies, so entries go to Redis as the
+exact bytes received, without a decode/re-encode round trip.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+from ..config.settings import settings
+from .error_handler import CacheError
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis is an optional dependency
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Past dates this close to today may still be revised by the latest runs
+HISTORICAL_SETTLE_DAYS = 2
+
+_DAY = 86400.0
+
+
+def make_cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a normalized cache key for a GET request.
+    
+    Parameter order, list order and float formatting do not affect the
+    key, so equivalent requests map to the same entry.
+    
+    Args:
+        url: API endpoint URL
+        params: Query parameters
+    
+    Returns:
+        Cache key string
+    """
+    normalized = []
+    for key in sorted(params or {}):
+        value = params[key]
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ",".join(sorted(_normalize_value(item) for item in value))
+        else:
+            value = _normalize_value(value)
+        normalized.append((key, value))
+    
+    canonical = f"{url}?{urlencode(normalized)}"
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"{settings.CACHE_KEY_PREFIX}{digest}"
+
+
+def _normalize_value(value: Any) -> str:
+    """Return the canonical string form of a single parameter value."""
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe in-process cache with per-entry expiry.
+    
+    The least recently used entry is evicted when max_entries is reached.
+    Cached values are shared between callers and must be treated as
+    read-only.
+    """
+    
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Initialize LRU cache.
+        
+        Args:
+            max_entries: Maximum number of entries (default: from settings)
+        """
+        self.max_entries = max_entries or settings.CACHE_LOCAL_MAX_ENTRIES
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Tuple of (value, expires_at) with expires_at as a time.time()
+            timestamp, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def delete(self, key: str):
+        """Remove an entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCache:
+    """
+    Redis cache tier storing byte values with their expiry time.
+    
+    Entries are stored as the expiry timestamp, a newline, then the value.
+    Every Redis failure is raised as CacheError so callers can fall back
+    to another tier.
+    """
+    
+    def __init__(self, client: Any = None):
+        """
+        Initialize Redis cache.
+        
+        Args:
+            client: Optional Redis client (default: built from settings)
+        
+        Raises:
+            CacheError: If the redis package is not installed
+        """
+        if client is None:
+            if redis is None:
+                raise CacheError("redis package is not installed")
+            client = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                password=settings.REDIS_PASSWORD or None,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT
+            )
+        self.client = client
+    
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Tuple of (value, expires_at), or None if missing or expired
+        
+        Raises:
+            CacheError: If Redis cannot be reached or the entry is invalid
+        """
+        try:
+            raw = self.client.get(key)
+        except Exception as e:
+            raise CacheError(f"Redis get failed: {e}") from e
+        
+        if raw is None:
+            return None
+        
+        header, _, value = raw.partition(b"\n")
+        try:
+            expires_at = float(header)
+        except ValueError as e:
+            raise CacheError(f"Invalid cache entry for {key}: {e}") from e
+        
+        if expires_at <= time.time():
+            return None
+        return value, expires_at
+    
+    def set(self, key: str, value: bytes, ttl: float):
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: Bytes to store (e.g. a raw response body)
+            ttl: Time to live in seconds
+        
+        Raises:
+            CacheError: If Redis cannot be reached
+        """
+        entry = b"%r\n" % (time.time() + ttl) + bytes(value)
+        try:
+            self.client.set(key, entry, ex=max(1, int(ttl)))
+        except Exception as e:
+            raise CacheError(f"Redis set failed: {e}") from e
+    
+    def delete(self, key: str):
+        """
+        Remove an entry if present.
+        
+        Raises:
+            CacheError: If Redis cannot be reached
+        """
+        try:
+            self.client.delete(key)
+        except Exception as e:
+            raise CacheError(f"Redis delete failed: {e}") from e
+
+
+class SQLiteCache:
+    """
+    Disk cache tier storing byte values in a SQLite database.
+    
+    Same interface as RedisCache. The database runs in WAL mode so several
+    worker processes can read while one writes, and entries survive
+    restarts. When the stored values exceed max_bytes, expired entries and
+    then the entries closest to expiry are evicted; freed pages are
+    returned to the file system incrementally. Every SQLite failure is
+    raised as CacheError so callers can fall back to another tier.
+    """
+    
+    # Check the size bound every N writes per process
+    EVICTION_INTERVAL = 100
+    
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize SQLite cache.
+        
+        Args:
+            path: Database file (default: CACHE_DISK_PATH)
+            max_bytes: Maximum total size of stored values
+                (default: CACHE_DISK_MAX_BYTES)
+        
+        Raises:
+            CacheError: If the database cannot be opened
+        """
+        self.path = path or settings.CACHE_DISK_PATH
+        self.max_bytes = max_bytes or settings.CACHE_DISK_MAX_BYTES
+        self._local = threading.local()
+        self._writes = 0
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        try:
+            connection = self._connection()
+            connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, expires_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at)")
+        except sqlite3.Error as e:
+            raise CacheError(f"SQLite cache unavailable at {self.path}: {e}") from e
+        
+        self.evict()
+        logger.info(f"SQLite cache opened at {self.path} ({len(self)} entries)")
+    
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Tuple of (value, expires_at), or None if missing or expired
+        
+        Raises:
+            CacheError: If the database cannot be read
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT value, expires_at FROM entries WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        except sqlite3.Error as e:
+            raise CacheError(f"SQLite get failed: {e}") from e
+        
+        if row is None:
+            return None
+        return bytes(row[0]), row[1]
+    
+    def set(self, key: str, value: bytes, ttl: float):
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: Bytes to store (e.g. a raw response body)
+            ttl: Time to live in seconds
+        
+        Raises:
+            CacheError: If the database cannot be written
+        """
+        value = bytes(value)
+        try:
+            with self._connection() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, expires_at) VALUES (?, ?, ?, ?)",
+                    (key, value, len(value), time.time() + ttl)
+                )
+        except sqlite3.Error as e:
+            raise CacheError(f"SQLite set failed: {e}") from e
+        
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self.EVICTION_INTERVAL == 0
+        if due:
+            self.evict()
+    
+    def delete(self, key: str):
+        """
+        Remove an entry if present.
+        
+        Raises:
+            CacheError: If the database cannot be written
+        """
+        try:
+            with self._connection() as connection:
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            raise CacheError(f"SQLite delete failed: {e}") from e
+    
+    def evict(self) -> int:
+        """
+        Drop expired entries, then the entries closest to expiry until the
+        stored values fit in max_bytes, and release the freed pages.
+        
+        Returns:
+            Number of entries removed
+        
+        Raises:
+            CacheError: If the database cannot be written
+        """
+        try:
+            with self._connection() as connection:
+                removed = connection.execute(
+                    "DELETE FROM entries WHERE expires_at <= ?", (time.time(),)
+                ).rowcount
+                
+                total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+                if total > self.max_bytes:
+                    victims = []
+                    rows = connection.execute("SELECT key, size FROM entries ORDER BY expires_at")
+                    for key, size in rows:
+                        if total <= self.max_bytes:
+                            break
+                        victims.append((key,))
+                        total -= size
+                    connection.executemany("DELETE FROM entries WHERE key = ?", victims)
+                    removed += len(victims)
+            
+            if removed:
+                self._connection().execute("PRAGMA incremental_vacuum")
+        except sqlite3.Error as e:
+            raise CacheError(f"SQLite eviction failed: {e}") from e
+        
+        if removed:
+            logger.info(f"SQLite cache evicted {removed} entries")
+        return removed
+    
+    def compact(self):
+        """
+        Evict, rebuild the database file and truncate the WAL.
+        
+        Raises:
+            CacheError: If the database cannot be compacted
+        """
+        self.evict()
+        try:
+            connection = self._connection()
+            connection.execute("VACUUM")
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            raise CacheError(f"SQLite compaction failed: {e}") from e
+    
+    def close(self):
+        """Close this thread's database connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+    
+    def __len__(self) -> int:
+        try:
+            return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=settings.CACHE_DISK_BUSY_TIMEOUT)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+
+class ModelRunSchedule:
+    """
+    Publication schedule of an upstream forecast model.
+    
+    A run started at one of run_hours (UTC) becomes available delay_hours
+    later; until then, a fetched forecast cannot change.
+    """
+    
+    def __init__(self, run_hours: Sequence[int], delay_hours: float):
+        """
+        Initialize model run schedule.
+        
+        Args:
+            run_hours: Run start hours (UTC, 0-23)
+            delay_hours: Hours between a run start and its publication
+        """
+        self.run_hours = sorted(run_hours)
+        self.delay_hours = delay_hours
+        self._offsets = sorted((hour + delay_hours) * 3600.0 % _DAY for hour in self.run_hours)
+    
+    def next_publication(self, now: Optional[float] = None) -> float:
+        """
+        Get the time at which the next run becomes available.
+        
+        Args:
+            now: Current time.time() timestamp (default: now)
+        
+        Returns:
+            time.time() timestamp of the next publication
+        """
+        now = time.time() if now is None else now
+        day_start = now - now % _DAY
+        for day in (0, 1):
+            for offset in self._offsets:
+                published_at = day_start + day * _DAY + offset
+                if published_at > now:
+                    return published_at
+        return day_start + 2 * _DAY + self._offsets[0]
+    
+    def last_publication(self, now: Optional[float] = None) -> float:
+        """
+        Get the time at which the current run became available.
+        
+        Args:
+            now: Current time.time() timestamp (default: now)
+        
+        Returns:
+            time.time() timestamp of the latest publication at or before now
+        """
+        now = time.time() if now is None else now
+        day_start = now - now % _DAY
+        for day in (0, -1):
+            for offset in reversed(self._offsets):
+                published_at = day_start + day * _DAY + offset
+                if published_at <= now:
+                    return published_at
+        return day_start - 2 * _DAY + self._offsets[-1]
+    
+    def ttl(self, now: Optional[float] = None) -> float:
+        """
+        Get the TTL that expires an entry when the next run is published.
+        
+        Args:
+            now: Current time.time() timestamp (default: now)
+        
+        Returns:
+            Seconds until the next publication (at least 1)
+        """
+        now = time.time() if now is None else now
+        return max(1.0, self.next_publication(now) - now)
+
+
+def default_schedules() -> Dict[str, ModelRunSchedule]:
+    """
+    Build the model run schedules configured in settings.
+    
+    Returns:
+        Mapping of upstream endpoint to its schedule (endpoints without
+        MODEL_RUN_HOURS_* are left out)
+    """
+    schedules = {}
+    if settings.MODEL_RUN_HOURS_WEATHER:
+        schedules[settings.WEATHER_API_URL] = ModelRunSchedule(
+            settings.MODEL_RUN_HOURS_WEATHER, settings.MODEL_RUN_DELAY_WEATHER
+        )
+    if settings.MODEL_RUN_HOURS_MARINE:
+        schedules[settings.MARINE_API_URL] = ModelRunSchedule(
+            settings.MODEL_RUN_HOURS_MARINE, settings.MODEL_RUN_DELAY_MARINE
+        )
+    return schedules
+
+
+def is_settled_history(params: Optional[Dict[str, Any]], today: Optional[date] = None) -> bool:
+    """
+    Tell whether a request only covers past dates that no longer change.
+    
+    Args:
+        params: Query parameters
+        today: Current UTC date (default: today)
+    
+    Returns:
+        True if end_date is at least HISTORICAL_SETTLE_DAYS in the past
+    """
+    end_date = (params or {}).get("end_date")
+    if not end_date:
+        return False
+    try:
+        end = date.fromisoformat(str(end_date))
+    except ValueError:
+        return False
+    today = today or datetime.now(timezone.utc).date()
+    return end <= today - timedelta(days=HISTORICAL_SETTLE_DAYS)
+
+
+class ResponseCache:
+    """
+    Two-tier response cache: in-process LRU in front of an optional remote tier.
+    
+    Features:
+    - Local hits never leave the process
+    - Remote hits are promoted to the local tier with their remaining TTL
+    - TTLs that expire with the endpoint's next model run, flat
+      per-endpoint TTLs as a fallback
+    - Very long TTLs for settled historical dates
+    - Hit/miss/error counters
+    - Remote tier failures fall back to the local tier and the remote tier
+      is skipped for REDIS_RETRY_INTERVAL seconds
+    """
+    
+    def __init__(
+        self,
+        local: Optional[LRUCache] = None,
+        remote: Optional[RedisCache] = None,
+        endpoint_ttls: Optional[Dict[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        schedules: Optional[Dict[str, ModelRunSchedule]] = None,
+        historical_ttl: Optional[float] = None
+    ):
+        """
+        Initialize response cache.
+        
+        Args:
+            local: In-process tier (default: new LRUCache)
+            remote: Optional second tier (RedisCache or SQLiteCache)
+            endpoint_ttls: TTL in seconds per endpoint URL
+            default_ttl: TTL for endpoints not listed (default: CACHE_TTL)
+            schedules: Model run schedule per endpoint URL; takes precedence
+                over endpoint_ttls for forecast requests
+            historical_ttl: TTL for settled historical requests
+                (default: CACHE_TTL_HISTORICAL)
+        """
+        self.local = local if local is not None else LRUCache()
+        self.remote = remote
+        self.endpoint_ttls = endpoint_ttls or {}
+        self.default_ttl = default_ttl or settings.CACHE_TTL
+        self.schedules = schedules or {}
+        self.historical_ttl = historical_ttl or settings.CACHE_TTL_HISTORICAL
+        self._remote_retry_at = 0.0
+        self._lock = threading.Lock()
+        self._stats = {
+            "local_hits": 0,
+            "remote_hits": 0,
+            "misses": 0,
+            "remote_errors": 0,
+        }
+    
+    @classmethod
+    def from_settings(cls) -> "ResponseCache":
+        """
+        Build the response cache configured in settings.
+        
+        Returns:
+            ResponseCache with the CACHE_BACKEND tier (Redis or SQLite)
+            when it can be created
+        """
+        remote = None
+        try:
+            if settings.CACHE_BACKEND == "redis":
+                remote = RedisCache()
+            elif settings.CACHE_BACKEND == "sqlite":
+                remote = SQLiteCache()
+        except CacheError as e:
+            logger.warning(f"{settings.CACHE_BACKEND} cache tier disabled: {e}")
+        
+        return cls(
+            remote=remote,
+            endpoint_ttls={
+                settings.WEATHER_API_URL: settings.CACHE_TTL_WEATHER,
+                settings.MARINE_API_URL: settings.CACHE_TTL_MARINE,
+            },
+            schedules=default_schedules()
+        )
+    
+    def ttl_for(self, url: str, params: Optional[Dict[str, Any]] = None) -> float:
+        """
+        Return the TTL of a response.
+        
+        Settled historical requests get historical_ttl; forecasts expire
+        when the endpoint's next model run is published, or after the flat
+        endpoint TTL when no schedule is known.
+        
+        Args:
+            url: API endpoint URL
+            params: Query parameters of the request
+        
+        Returns:
+            TTL in seconds
+        """
+        if is_settled_history(params):
+            return self.historical_ttl
+        
+        schedule = self.schedules.get(url)
+        if schedule is not None:
+            return schedule.ttl()
+        
+        return self.endpoint_ttls.get(url, self.default_ttl)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look a key up in the local tier, then in the remote tier.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached value, or None on miss
+        """
+        entry = self.local.get(key)
+        if entry is not None:
+            self._count("local_hits")
+            return entry[0]
+        
+        if self._remote_available():
+            try:
+                entry = self.remote.get(key)
+            except CacheError as e:
+                self._remote_failed(e)
+                entry = None
+            
+            if entry is not None:
+                value, expires_at = entry
+                self.local.set(key, value, expires_at - time.time())
+                self._count("remote_hits")
+                return value
+        
+        self._count("misses")
+        return None
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """
+        Store a value in both tiers.
+        
+        Args:
+            key: Cache key
+            value: Value to cache (bytes when a remote tier is used)
+            ttl: Time to live in seconds
+        """
+        self.local.set(key, value, ttl)
+        
+        if self._remote_available():
+            try:
+                self.remote.set(key, value, ttl)
+            except CacheError as e:
+                self._remote_failed(e)
+    
+    def delete(self, key: str):
+        """Remove a key from both tiers."""
+        self.local.delete(key)
+        
+        if self._remote_available():
+            try:
+                self.remote.delete(key)
+            except CacheError as e:
+                self._remote_failed(e)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache counters.
+        
+        Returns:
+            Dictionary with hit/miss/error counts, hit ratio and local size
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["local_hits"] + stats["remote_hits"] + stats["misses"]
+        hits = stats["local_hits"] + stats["remote_hits"]
+        stats["hit_ratio"] = hits / lookups if lookups else 0.0
+        stats["local_entries"] = len(self.local)
+        stats["remote_enabled"] = self.remote is not None
+        return stats
+    
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+    
+    def _remote_available(self) -> bool:
+        return self.remote is not None and time.monotonic() >= self._remote_retry_at
+    
+    def _remote_failed(self, error: CacheError):
+        """Record a remote tier failure and pause the remote tier."""
+        self._count("remote_errors")
+        self._remote_retry_at = time.monotonic() + settings.REDIS_RETRY_INTERVAL
+        logger.warning(
+            f"Remote cache unavailable, using local tier for "
+            f"{settings.REDIS_RETRY_INTERVAL}s: {error}"
+        )
@@ -0,0 +1,180 @@
+"""
+Per-endpoint circuit breaker for upstream API calls.
+
+When an endpoint keeps failing, the breaker opens and calls fail fast
+instead of burning every retry and backoff delay. After a recovery
+timeout a single probe request is let through (half-open); its outcome
+closes the breaker again or re-opens it.
+"""
+
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Dict, Any, Optional
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed/open/half-open circuit breaker.
+    
+    - CLOSED: requests flow, consecutive failures are counted
+    - OPEN: requests are rejected until recovery_timeout has elapsed
+    - HALF_OPEN: one probe request is allowed; success closes the
+      breaker, failure re-opens it
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: Optional[float] = None
+    ):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            name: Breaker name (usually the endpoint URL)
+            failure_threshold: Consecutive failures before opening (default: from settings)
+            recovery_timeout: Seconds to stay open before probing (default: from settings)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_FAILURE_THRESHOLD
+        self.recovery_timeout = recovery_timeout or settings.CIRCUIT_RECOVERY_TIMEOUT
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an expired OPEN state is reported as HALF_OPEN)."""
+        with self._lock:
+            if self._state is CircuitState.OPEN and self._recovery_elapsed():
+                return CircuitState.HALF_OPEN
+            return self._state
+    
+    def allow_request(self) -> bool:
+        """
+        Decide whether a request may be sent now.
+        
+        Returns:
+            True if the request may proceed
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+            
+            if self._state is CircuitState.OPEN:
+                if not self._recovery_elapsed():
+                    return False
+                self._state = CircuitState.HALF_OPEN
+                logger.info(f"Circuit {self.name} half-open, probing upstream")
+            
+            # HALF_OPEN: only one probe at a time
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+    
+    def record_success(self):
+        """Record a successful call and close the breaker."""
+        with self._lock:
+            if self._state is not CircuitState.CLOSED:
+                logger.info(f"Circuit {self.name} closed")
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+    
+    def record_failure(self):
+        """Record a failed call and open the breaker if needed."""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            
+            if self._state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state is not CircuitState.OPEN:
+                    logger.warning(
+                        f"Circuit {self.name} opened after {self._failures} failures, "
+                        f"failing fast for {self.recovery_timeout}s"
+                    )
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+    
+    def retry_after(self) -> float:
+        """Return the seconds left before the next probe is allowed."""
+        with self._lock:
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the breaker state for monitoring."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+            "retry_after": round(self.retry_after(), 1),
+        }
+    
+    def _recovery_elapsed(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.recovery_timeout
+
+
+class CircuitBreakerRegistry:
+    """Lazily created circuit breakers, one per endpoint."""
+    
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: Optional[float] = None
+    ):
+        """
+        Initialize registry.
+        
+        Args:
+            failure_threshold: Threshold for new breakers (default: from settings)
+            recovery_timeout: Recovery timeout for new breakers (default: from settings)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """
+        Return the breaker for an endpoint, creating it on first use.
+        
+        Args:
+            endpoint: API endpoint URL
+        
+        Returns:
+            CircuitBreaker for the endpoint
+        """
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    endpoint,
+                    failure_threshold=self.failure_threshold,
+                    recovery_timeout=self.recovery_timeout
+                )
+                self._breakers[endpoint] = breaker
+            return breaker
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the state of every breaker, keyed by endpoint."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {endpoint: breaker.snapshot() for endpoint, breaker in breakers.items()}
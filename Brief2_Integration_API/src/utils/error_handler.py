@@ -4,6 +4,8 @@ Custom exception classes for Cyclone Tracker.
 This module defines a hierarchy of exceptions for different error scenarios.
 """
 
+from typing import Optional
+
 
 class APIError(Exception):
     """Base exception for API-related errors."""
@@ -17,7 +19,10 @@ class ValidationError(APIError):
 
 class RateLimitError(APIError):
     """Raised when API rate limit is exceeded (HTTP 429)."""
-    pass
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class TimeoutError(APIError):
@@ -25,6 +30,14 @@ class TimeoutError(APIError):
     pass
 
 
+class CircuitOpenError(APIError):
+    """Raised when a call is rejected because the endpoint circuit is open."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class CacheError(Exception):
     """Raised when cache operations fail."""
     pass
@@ -0,0 +1,160 @@
+"""
+Latency tracking and hedge budget for upstream calls.
+
+A hedged request sends one duplicate GET when the first has not answered
+after the endpoint's rolling latency percentile, and keeps whichever
+response arrives first. The hedge budget bounds how many duplicates are
+sent so the extra quota use stays a small fraction of the traffic.
+"""
+
+import logging
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Any, Optional
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker:
+    """
+    Thread-safe rolling latency samples, one window per endpoint.
+    """
+    
+    def __init__(self, window: Optional[int] = None, min_samples: Optional[int] = None):
+        """
+        Initialize latency tracker.
+        
+        Args:
+            window: Samples kept per endpoint (default: from settings)
+            min_samples: Samples needed before percentiles are reported
+                (default: from settings)
+        """
+        self.window = window or settings.LATENCY_WINDOW
+        self.min_samples = min_samples or settings.HEDGE_MIN_SAMPLES
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, endpoint: str, seconds: float):
+        """
+        Record the latency of a completed call.
+        
+        Args:
+            endpoint: API endpoint URL
+            seconds: Observed latency in seconds
+        """
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+    
+    def percentile(self, endpoint: str, percentile: float) -> Optional[float]:
+        """
+        Return a latency percentile for an endpoint (nearest-rank method).
+        
+        Args:
+            endpoint: API endpoint URL
+            percentile: Percentile between 0 and 100
+        
+        Returns:
+            Latency in seconds, or None if fewer than min_samples were recorded
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        
+        if len(samples) < self.min_samples:
+            return None
+        
+        rank = max(1, math.ceil(percentile / 100 * len(samples)))
+        return samples[rank - 1]
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return p50/p95/p99 latencies per endpoint for monitoring."""
+        with self._lock:
+            endpoints = list(self._samples)
+        
+        return {
+            endpoint: {
+                "samples": len(self._samples[endpoint]),
+                "p50": self.percentile(endpoint, 50),
+                "p95": self.percentile(endpoint, 95),
+                "p99": self.percentile(endpoint, 99),
+            }
+            for endpoint in endpoints
+        }
+
+
+class HedgeBudget:
+    """
+    Thread-safe budget limiting hedges to a fraction of requests.
+    
+    Every request earns `ratio` of a hedge token (up to `max_tokens`), and
+    each hedge spends a whole token, so hedges never exceed `ratio` of the
+    traffic over time plus a small burst.
+    """
+    
+    def __init__(self, ratio: Optional[float] = None, max_tokens: Optional[float] = None):
+        """
+        Initialize hedge budget.
+        
+        Args:
+            ratio: Hedges allowed per request (default: from settings)
+            max_tokens: Maximum saved-up hedges (default: from settings)
+        """
+        self.ratio = settings.HEDGE_BUDGET_RATIO if ratio is None else ratio
+        self.max_tokens = max_tokens or settings.HEDGE_BUDGET_BURST
+        self._tokens = 0.0
+        self._requests = 0
+        self._hedges = 0
+        self._lock = threading.Lock()
+    
+    def record_request(self):
+        """Credit the budget for one outgoing request."""
+        with self._lock:
+            self._requests += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+    
+    def try_acquire(self) -> bool:
+        """
+        Spend one hedge token if available.
+        
+        Returns:
+            True if a hedge may be sent
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self._hedges += 1
+            return True
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return request and hedge counters for monitoring."""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hedges": self._hedges,
+                "tokens": round(self._tokens, 2),
+            }
+
+
+_shared_budget: Optional[HedgeBudget] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_hedge_budget() -> HedgeBudget:
+    """
+    Return the process-wide hedge budget configured in settings.
+    
+    Returns:
+        Shared HedgeBudget
+    """
+    global _shared_budget
+    
+    with _shared_lock:
+        if _shared_budget is None:
+            _shared_budget = HedgeBudget()
+        return _shared_budget
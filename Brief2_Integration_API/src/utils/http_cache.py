@@ -0,0 +1,149 @@
+"""
+HTTP caching of detection results.
+
+A real-time detection only changes when a new model run is published or
+the detector thresholds change, and a settled historical one never does.
+The validator of a GET /api/detect response is therefore a hash of what
+the result depends on: the request, the model grid cells it snaps to, the
+current runs and the thresholds. It is computed without any upstream call,
+so a matching If-None-Match is answered with 304 before detection runs,
+and max-age lasts until the next run is published.
+"""
+
+import hashlib
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from ..config.settings import settings
+from .batching import snap_coordinate
+from .cache import ModelRunSchedule, default_schedules, is_settled_history
+
+# Bump when the /api/detect response format changes
+ETAG_VERSION = 1
+
+
+class DetectionValidator:
+    """
+    Strong ETag and freshness lifetime of one detection request.
+    """
+    
+    def __init__(self, etag: str, max_age: int, model_run: Optional[float]):
+        """
+        Initialize detection validator.
+        
+        Args:
+            etag: Unquoted strong entity tag
+            max_age: Seconds the response stays fresh
+            model_run: time.time() timestamp of the run the result is
+                based on, or None for settled history
+        """
+        self.etag = etag
+        self.max_age = max_age
+        self.model_run = model_run
+    
+    @property
+    def model_run_iso(self) -> Optional[str]:
+        """ISO 8601 UTC time of the model run, or None for settled history."""
+        if self.model_run is None:
+            return None
+        return datetime.fromtimestamp(self.model_run, timezone.utc).isoformat()
+
+
+def current_model_run(
+    schedules: Optional[Dict[str, ModelRunSchedule]] = None,
+    now: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Identify the model runs currently served upstream.
+    
+    Without a configured schedule, runs are approximated by consecutive
+    CACHE_TTL_WEATHER windows, matching the response cache expiry.
+    
+    Args:
+        schedules: Schedule per upstream endpoint (default: from settings)
+        now: Current time.time() timestamp (default: now)
+    
+    Returns:
+        Dictionary with "runs" (endpoint to publication timestamp),
+        "published_at" (latest publication) and "max_age" (seconds until
+        the next publication)
+    """
+    now = time.time() if now is None else now
+    schedules = default_schedules() if schedules is None else schedules
+    
+    if not schedules:
+        window = float(settings.CACHE_TTL_WEATHER)
+        published_at = now - now % window
+        return {
+            "runs": {settings.WEATHER_API_URL: published_at},
+            "published_at": published_at,
+            "max_age": max(1.0, published_at + window - now)
+        }
+    
+    runs = {url: schedule.last_publication(now) for url, schedule in schedules.items()}
+    return {
+        "runs": runs,
+        "published_at": max(runs.values()),
+        "max_age": min(schedule.ttl(now) for schedule in schedules.values())
+    }
+
+
+def detection_validator(
+    latitude: float,
+    longitude: float,
+    thresholds: Dict[str, float],
+    analysis_date: Optional[str] = None,
+    horizon: bool = False,
+    location_name: Optional[str] = None,
+    weather_resolution: Optional[float] = None,
+    marine_resolution: Optional[float] = None,
+    schedules: Optional[Dict[str, ModelRunSchedule]] = None,
+    now: Optional[float] = None
+) -> DetectionValidator:
+    """
+    Compute the validator of a detection request without fetching data.
+    
+    Args:
+        latitude: Requested latitude
+        longitude: Requested longitude
+        thresholds: Detector thresholds by condition name
+        analysis_date: Optional historical date (YYYY-MM-DD)
+        horizon: Whether every forecast day is scored
+        location_name: Location name echoed in the response
+        weather_resolution: Weather grid step (default: SNAP_RESOLUTION_WEATHER)
+        marine_resolution: Marine grid step (default: SNAP_RESOLUTION_MARINE)
+        schedules: Schedule per upstream endpoint (default: from settings)
+        now: Current time.time() timestamp (default: now)
+    
+    Returns:
+        DetectionValidator
+    """
+    weather_resolution = settings.SNAP_RESOLUTION_WEATHER if weather_resolution is None else weather_resolution
+    marine_resolution = settings.SNAP_RESOLUTION_MARINE if marine_resolution is None else marine_resolution
+    
+    now = time.time() if now is None else now
+    today = datetime.fromtimestamp(now, timezone.utc).date()
+    
+    if analysis_date and is_settled_history({"end_date": analysis_date}, today):
+        runs: Any = "historical"
+        model_run = None
+        max_age = settings.CACHE_TTL_HISTORICAL
+    else:
+        current = current_model_run(schedules, now)
+        runs = current["runs"]
+        model_run = current["published_at"]
+        max_age = current["max_age"]
+    
+    key = json.dumps({
+        "version": ETAG_VERSION,
+        "request": [latitude, longitude, analysis_date, bool(horizon), location_name],
+        "weather_cell": snap_coordinate(latitude, longitude, weather_resolution),
+        "marine_cell": snap_coordinate(latitude, longitude, marine_resolution),
+        "runs": runs,
+        "thresholds": thresholds
+    }, sort_keys=True)
+    etag = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    
+    return DetectionValidator(etag, int(max_age), model_run)
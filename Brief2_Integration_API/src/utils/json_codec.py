@@ -0,0 +1,63 @@
+"""
+JSON decoding backends for API responses.
+
+Responses are decoded straight from the raw body bytes. orjson is used
+when it is installed (several times faster on large hourly responses),
+with the standard library json module as fallback.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Union
+
+from ..config.settings import settings
+from .error_handler import ConfigurationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+Body = Union[bytes, bytearray, memoryview, str]
+Decoder = Callable[[Body], Any]
+
+
+def _json_loads(data: Body) -> Any:
+    """Decode JSON with the standard library (memoryview is not supported natively)."""
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+DECODERS: Dict[str, Decoder] = {"json": _json_loads}
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+
+
+def get_decoder(name: Optional[str] = None) -> Decoder:
+    """
+    Return a JSON decoder by name.
+    
+    Args:
+        name: "orjson", "json" or "auto" (default: JSON_DECODER setting);
+            "auto" picks orjson when it is installed
+    
+    Returns:
+        Callable decoding bytes, bytearray, memoryview or str
+    
+    Raises:
+        ConfigurationError: If the decoder is unknown or not installed
+    """
+    name = name or settings.JSON_DECODER
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    
+    try:
+        return DECODERS[name]
+    except KeyError:
+        raise ConfigurationError(
+            f"JSON decoder '{name}' is not available (installed: {', '.join(DECODERS)})"
+        )
+
@@ -0,0 +1,256 @@
+"""
+Land/sea mask raster with O(1) coordinate lookup.
+
+The mask is a global uint8 grid (1 = land) stored as a NumPy .npy file
+and opened memory-mapped, so only the pages actually looked up are read
+from disk. Row 0 starts at latitude -90 and column 0 at longitude -180;
+the resolution follows from the shape (rows = 180 / resolution).
+
+Build the raster once from a land polygon GeoJSON (e.g. Natural Earth
+"land"):
+
+    python -m src.utils.land_mask ne_10m_land.geojson --resolution 0.1 --output data/land_mask.npy
+"""
+
+import argparse
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from ..config.settings import settings
+from .error_handler import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+
+class LandSeaMask:
+    """
+    Read-only land/sea lookup on a memory-mapped global raster.
+    """
+    
+    def __init__(self, grid: np.ndarray):
+        """
+        Initialize land/sea mask.
+        
+        Args:
+            grid: Global raster shaped (180 / resolution, 360 / resolution),
+                non-zero on land
+        
+        Raises:
+            ConfigurationError: If the raster is not a global 1:2 grid
+        """
+        rows, cols = grid.shape
+        if rows == 0 or cols != 2 * rows:
+            raise ConfigurationError(
+                f"Land mask must be a global grid with twice as many columns as rows, got: {grid.shape}"
+            )
+        
+        self.grid = grid
+        self.rows = rows
+        self.cols = cols
+        self.resolution = 180.0 / rows
+    
+    @classmethod
+    def load(cls, path: str) -> "LandSeaMask":
+        """
+        Open a mask raster memory-mapped.
+        
+        Args:
+            path: Path to the .npy raster
+        
+        Returns:
+            LandSeaMask
+        """
+        grid = np.load(path, mmap_mode="r")
+        mask = cls(grid)
+        logger.info(f"Land mask loaded from {path} ({mask.resolution:g}° resolution)")
+        return mask
+    
+    def is_land(self, latitude: float, longitude: float) -> bool:
+        """
+        Tell whether a coordinate falls in a land cell.
+        
+        Args:
+            latitude: Latitude (-90 to 90)
+            longitude: Longitude (-180 to 180)
+        
+        Returns:
+            True if the cell containing the coordinate is land
+        """
+        row = min(int((latitude + 90.0) / self.resolution), self.rows - 1)
+        col = int((longitude + 180.0) / self.resolution) % self.cols
+        return bool(self.grid[row, col])
+    
+    def is_land_many(self, latitudes: Any, longitudes: Any) -> np.ndarray:
+        """
+        Vectorized is_land for coordinate arrays.
+        
+        Args:
+            latitudes: Latitudes (-90 to 90)
+            longitudes: Longitudes (-180 to 180), same shape as latitudes
+        
+        Returns:
+            Boolean array, True on land
+        """
+        latitudes = np.asarray(latitudes, dtype=float)
+        longitudes = np.asarray(longitudes, dtype=float)
+        rows = np.minimum(((latitudes + 90.0) / self.resolution).astype(int), self.rows - 1)
+        cols = ((longitudes + 180.0) / self.resolution).astype(int) % self.cols
+        return self.grid[rows, cols] != 0
+    
+    def is_all_land_many(self, latitudes: Any, longitudes: Any, size: float) -> np.ndarray:
+        """
+        Tell whether square cells are land over their whole footprint.
+        
+        Args:
+            latitudes: Cell-center latitudes
+            longitudes: Cell-center longitudes, same length as latitudes
+            size: Cell size in degrees
+        
+        Returns:
+            Boolean array, True when every raster cell the footprint
+            overlaps is land
+        """
+        half = size / 2
+        result = np.zeros(len(latitudes), dtype=bool)
+        
+        for index, (latitude, longitude) in enumerate(zip(latitudes, longitudes)):
+            # The epsilon keeps a footprint edge on a raster edge from
+            # pulling in the neighbouring raster cell
+            first_row = max(int(np.floor((latitude - half + 90.0) / self.resolution + 1e-9)), 0)
+            last_row = min(int(np.ceil((latitude + half + 90.0) / self.resolution - 1e-9)), self.rows)
+            first_col = int(np.floor((longitude - half + 180.0) / self.resolution + 1e-9))
+            last_col = int(np.ceil((longitude + half + 180.0) / self.resolution - 1e-9))
+            cols = np.arange(first_col, max(last_col, first_col + 1)) % self.cols
+            rows = slice(first_row, max(last_row, first_row + 1))
+            result[index] = bool(np.all(self.grid[rows][:, cols]))
+        
+        return result
+
+
+_shared_mask: Optional[LandSeaMask] = None
+_shared_loaded = False
+_shared_lock = threading.Lock()
+
+
+def get_land_mask() -> Optional[LandSeaMask]:
+    """
+    Return the process-wide land mask configured by LAND_MASK_PATH.
+    
+    Returns:
+        Shared LandSeaMask, or None if LAND_MASK_PATH is empty or the file
+        is missing (every location is then treated as ocean)
+    """
+    global _shared_mask, _shared_loaded
+    
+    with _shared_lock:
+        if not _shared_loaded:
+            _shared_loaded = True
+            path = settings.LAND_MASK_PATH
+            if path and Path(path).exists():
+                _shared_mask = LandSeaMask.load(path)
+            elif path:
+                logger.warning(f"Land mask not found at {path}, inland points will not be skipped")
+        return _shared_mask
+
+
+def rasterize_land(rings: Iterable[Sequence[Sequence[float]]], resolution: float) -> np.ndarray:
+    """
+    Rasterize polygon rings into a global land mask (even-odd rule).
+    
+    A cell is land when its center lies inside an odd number of rings, so
+    holes (lakes) given as separate rings are carved out. Each ring is
+    filled one scanline per raster row.
+    
+    Args:
+        rings: Closed or open rings of (longitude, latitude) vertices
+        resolution: Cell size in degrees (must divide 180)
+    
+    Returns:
+        uint8 raster shaped (180 / resolution, 360 / resolution)
+    """
+    rows = int(round(180.0 / resolution))
+    cols = 2 * rows
+    grid = np.zeros((rows, cols), dtype=np.uint8)
+    lat_centers = -90.0 + (np.arange(rows) + 0.5) * resolution
+    lon_centers = -180.0 + (np.arange(cols) + 0.5) * resolution
+    
+    for ring in rings:
+        points = np.asarray(ring, dtype=float)
+        if len(points) < 3:
+            continue
+        start = points
+        end = np.roll(points, -1, axis=0)
+        
+        first_row = np.searchsorted(lat_centers, points[:, 1].min())
+        last_row = np.searchsorted(lat_centers, points[:, 1].max())
+        for row in range(first_row, last_row):
+            y = lat_centers[row]
+            crossing = (start[:, 1] <= y) != (end[:, 1] <= y)
+            if not crossing.any():
+                continue
+            x0, y0 = start[crossing, 0], start[crossing, 1]
+            x1, y1 = end[crossing, 0], end[crossing, 1]
+            xs = np.sort(x0 + (y - y0) * (x1 - x0) / (y1 - y0))
+            
+            for left, right in zip(xs[0::2], xs[1::2]):
+                first_col = np.searchsorted(lon_centers, left)
+                last_col = np.searchsorted(lon_centers, right)
+                grid[row, first_col:last_col] ^= 1
+    
+    return grid
+
+
+def read_geojson_rings(path: str) -> List[List[List[float]]]:
+    """
+    Collect all polygon rings (outer boundaries and holes) of a GeoJSON file.
+    
+    Args:
+        path: GeoJSON FeatureCollection, Feature or geometry file
+    
+    Returns:
+        List of rings of [longitude, latitude] vertices
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    
+    if data.get("type") == "FeatureCollection":
+        geometries = [feature["geometry"] for feature in data["features"]]
+    elif data.get("type") == "Feature":
+        geometries = [data["geometry"]]
+    else:
+        geometries = [data]
+    
+    rings: List[List[List[float]]] = []
+    for geometry in geometries:
+        if not geometry:
+            continue
+        if geometry["type"] == "Polygon":
+            rings.extend(geometry["coordinates"])
+        elif geometry["type"] == "MultiPolygon":
+            for polygon in geometry["coordinates"]:
+                rings.extend(polygon)
+    
+    return rings
+
+
+def main(argv=None):
+    """Build a land mask raster from a land polygon GeoJSON file."""
+    parser = argparse.ArgumentParser(description="Build the land/sea mask raster")
+    parser.add_argument("geojson", help="Land polygons (e.g. Natural Earth ne_10m_land.geojson)")
+    parser.add_argument("--resolution", type=float, default=0.1, help="Cell size in degrees (default: 0.1)")
+    parser.add_argument("--output", default=settings.LAND_MASK_PATH or "data/land_mask.npy")
+    args = parser.parse_args(argv)
+    
+    grid = rasterize_land(read_geojson_rings(args.geojson), args.resolution)
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    np.save(args.output, grid)
+    print(f"Land mask written to {args.output}: {grid.shape[0]}x{grid.shape[1]}, {grid.mean():.1%} land")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Negative cache for failed upstream lookups.
+
+Remembers which (endpoint, coordinate) pairs recently failed so repeat
+requests fail instantly instead of replaying the whole retry sequence.
+Each error class gets its own time to live: missing data (out of
+coverage, empty response) stays bad far longer than a transient upstream
+failure. Rate limiting, open circuits and timeouts are never cached:
+they have their own back-off or depend on the caller's deadline.
+"""
+
+import logging
+from typing import Any, Dict, Optional, Type
+
+from ..config.settings import settings
+from .cache import LRUCache, make_cache_key
+from .error_handler import (
+    APIError,
+    CircuitOpenError,
+    DataNotFoundError,
+    RateLimitError,
+    TimeoutError,
+    ValidationError
+)
+
+logger = logging.getLogger(__name__)
+
+
+def default_error_ttls() -> Dict[Type[APIError], float]:
+    """
+    Build the per-error-class TTLs configured in settings.
+    
+    Returns:
+        Mapping of error class to TTL in seconds (0 disables caching)
+    """
+    return {
+        DataNotFoundError: settings.NEGATIVE_CACHE_TTL_NOT_FOUND,
+        ValidationError: settings.NEGATIVE_CACHE_TTL_BAD_REQUEST,
+        RateLimitError: 0,
+        CircuitOpenError: 0,
+        TimeoutError: 0,
+        APIError: settings.NEGATIVE_CACHE_TTL_UPSTREAM,
+    }
+
+
+class NegativeCache:
+    """
+    Bounded cache of recent upstream failures keyed by endpoint and coordinate.
+    
+    Errors are stored as (class, message) and re-raised as fresh instances,
+    so callers never share exception objects or tracebacks.
+    """
+    
+    def __init__(
+        self,
+        ttls: Optional[Dict[Type[APIError], float]] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Initialize negative cache.
+        
+        Args:
+            ttls: TTL in seconds per error class; the most specific class in
+                an error's MRO wins (default: from settings)
+            max_entries: Maximum number of remembered failures
+                (default: NEGATIVE_CACHE_MAX_ENTRIES)
+        """
+        self.ttls = ttls if ttls is not None else default_error_ttls()
+        self._entries = LRUCache(max_entries or settings.NEGATIVE_CACHE_MAX_ENTRIES)
+        self._stats = {"hits": 0, "stored": 0}
+    
+    def ttl_for(self, error: Exception) -> float:
+        """
+        Get the negative TTL for an error.
+        
+        Args:
+            error: Raised exception
+        
+        Returns:
+            TTL in seconds, 0 if this kind of error is not cached
+        """
+        for cls in type(error).__mro__:
+            if cls in self.ttls:
+                return self.ttls[cls]
+        return 0
+    
+    def get(self, url: str, params: Dict[str, Any]) -> Optional[APIError]:
+        """
+        Look up a remembered failure.
+        
+        Args:
+            url: Upstream endpoint
+            params: Single-location query parameters
+        
+        Returns:
+            New exception of the remembered class, or None
+        """
+        entry = self._entries.get(make_cache_key(url, params))
+        if entry is None:
+            return None
+        
+        (error_class, message), _ = entry
+        self._stats["hits"] += 1
+        logger.debug(
+            f"Negative cache hit for ({params.get('latitude')}, {params.get('longitude')}): {message}"
+        )
+        return error_class(f"{message} (cached failure)")
+    
+    def remember(self, url: str, params: Dict[str, Any], error: Exception) -> bool:
+        """
+        Remember a failure for its error-class TTL.
+        
+        Args:
+            url: Upstream endpoint
+            params: Single-location query parameters of the failed request
+            error: Raised exception
+        
+        Returns:
+            True if the failure was cached
+        """
+        ttl = self.ttl_for(error)
+        if ttl <= 0:
+            return False
+        
+        self._entries.set(make_cache_key(url, params), (type(error), str(error)), ttl)
+        self._stats["stored"] += 1
+        return True
+    
+    def clear(self):
+        """Forget all remembered failures."""
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get negative cache statistics.
+        
+        Returns:
+            Dictionary with hits, stored and current entries
+        """
+        return {**self._stats, "entries": len(self._entries)}
@@ -0,0 +1,160 @@
+"""
+Client-side token-bucket rate limiter.
+
+This module keeps outbound traffic under the Open-Meteo quota. Callers
+queue for a token instead of being rejected, and an upstream HTTP 429
+with Retry-After pauses every caller sharing the limiter.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+
+from ..config.settings import settings
+from .error_handler import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread-safe token bucket shared by sync and async clients.
+    
+    The bucket is implemented as a generic cell rate algorithm: each
+    caller reserves the next free slot, so waiting callers are served in
+    arrival order and bursts up to `capacity` requests are allowed.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            rate: Sustained rate in requests per second
+            capacity: Burst size in requests (default: max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got: {rate}")
+        
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._interval = 1.0 / rate
+        self._burst_tolerance = (self.capacity - 1) * self._interval
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        
+        logger.info(f"Rate limiter initialized: {rate} req/s, burst={self.capacity}")
+    
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Block until a token is available.
+        
+        Args:
+            timeout: Maximum wait in seconds (default: wait as long as needed)
+        
+        Raises:
+            RateLimitError: If the wait would exceed timeout
+        """
+        wait = self._reserve(timeout)
+        if wait > 0:
+            time.sleep(wait)
+    
+    def try_acquire(self) -> bool:
+        """
+        Take a token only if one is available right now.
+        
+        Returns:
+            True if a token was taken, False otherwise (nothing reserved)
+        """
+        try:
+            return self._reserve(0.0) == 0.0
+        except RateLimitError:
+            return False
+    
+    async def acquire_async(self, timeout: Optional[float] = None):
+        """
+        Wait without blocking the event loop until a token is available.
+        
+        Args:
+            timeout: Maximum wait in seconds (default: wait as long as needed)
+        
+        Raises:
+            RateLimitError: If the wait would exceed timeout
+        """
+        wait = self._reserve(timeout)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """
+        Stop handing out tokens for the given duration.
+        
+        Used when the upstream answers HTTP 429 with Retry-After.
+        
+        Args:
+            seconds: Pause duration in seconds
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.warning(f"Rate limiter paused for {seconds}s")
+    
+    def paused_for(self) -> float:
+        """Return the remaining pause in seconds (0 if not paused)."""
+        return max(0.0, self._paused_until - time.monotonic())
+    
+    def _reserve(self, timeout: Optional[float]) -> float:
+        """
+        Reserve the next slot and return how long to wait for it.
+        
+        Args:
+            timeout: Maximum acceptable wait in seconds
+        
+        Returns:
+            Wait in seconds (0 if a token is available now)
+        
+        Raises:
+            RateLimitError: If the wait would exceed timeout (no slot is reserved)
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            ready_at = max(slot - self._burst_tolerance, self._paused_until)
+            wait = ready_at - now
+            
+            if timeout is not None and wait > timeout:
+                raise RateLimitError(
+                    f"Client rate limit: next request slot in {wait:.1f}s "
+                    f"exceeds {timeout}s",
+                    retry_after=wait
+                )
+            
+            self._next_slot = max(slot, ready_at) + self._interval
+            return max(0.0, wait)
+
+
+_shared_limiter: Optional[TokenBucketRateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> Optional[TokenBucketRateLimiter]:
+    """
+    Return the process-wide limiter configured in settings.
+    
+    Returns:
+        Shared TokenBucketRateLimiter, or None if RATE_LIMIT_PER_SECOND is 0
+    """
+    global _shared_limiter
+    
+    if settings.RATE_LIMIT_PER_SECOND <= 0:
+        return None
+    
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = TokenBucketRateLimiter(
+                rate=settings.RATE_LIMIT_PER_SECOND,
+                capacity=settings.RATE_LIMIT_BURST or None
+            )
+        return _shared_limiter
@@ -0,0 +1,141 @@
+"""
+Single-flight coalescing of identical concurrent calls.
+
+When several callers request the same key at the same time, only the
+first one (the leader) runs the call; the others wait for it and share
+its result or exception. SingleFlight serves threaded callers (Flask
+worker threads) and AsyncSingleFlight serves asyncio callers.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .error_handler import TimeoutError as CustomTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Thread-safe request coalescing.
+    
+    Results are shared between all callers of a flight and must be
+    treated as read-only.
+    """
+    
+    def __init__(self):
+        """Initialize an empty in-flight registry."""
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+    
+    def do(self, key: str, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run fn once for all concurrent callers using the same key.
+        
+        Args:
+            key: Coalescing key (e.g. normalized url + params)
+            fn: Function performing the call
+            timeout: Seconds a follower waits for the leader (default: no
+                limit); the leader itself is never interrupted
+        
+        Returns:
+            Result of fn, shared with concurrent callers
+        
+        Raises:
+            CustomTimeoutError: If a follower's timeout expires first
+            Exception: Whatever fn raised, re-raised in every caller
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+        
+        if not leader:
+            logger.debug(f"Joining in-flight request {key}")
+            try:
+                return future.result(timeout=timeout)
+            except FutureTimeoutError:
+                raise CustomTimeoutError(f"In-flight request did not complete within {timeout:g}s")
+        
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+    
+    def in_flight(self) -> int:
+        """Return the number of calls currently in flight."""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio request coalescing.
+    
+    Results are shared between all callers of a flight and must be
+    treated as read-only.
+    """
+    
+    def __init__(self):
+        """Initialize an empty in-flight registry."""
+        self._calls: Dict[str, asyncio.Future] = {}
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]], timeout: Optional[float] = None) -> Any:
+        """
+        Await fn once for all concurrent callers using the same key.
+        
+        Args:
+            key: Coalescing key (e.g. normalized url + params)
+            fn: Coroutine function performing the call
+            timeout: Seconds a follower waits for the leader (default: no
+                limit); the leader itself is never interrupted
+        
+        Returns:
+            Result of fn, shared with concurrent callers
+        
+        Raises:
+            CustomTimeoutError: If a follower's timeout expires first
+            Exception: Whatever fn raised, re-raised in every caller
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            logger.debug(f"Joining in-flight request {key}")
+            # Shield so a cancelled follower does not cancel the leader's call
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                raise CustomTimeoutError(f"In-flight request did not complete within {timeout:g}s")
+        
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else awaited it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+    
+    def in_flight(self) -> int:
+        """Return the number of calls currently in flight."""
+        return len(self._calls)
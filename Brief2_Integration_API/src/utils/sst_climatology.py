@@ -0,0 +1,218 @@
+"""
+Monthly sea surface temperature climatology with O(1) coordinate lookup.
+
+The climatology is a float32 grid shaped (12, rows, cols) in °C, one
+layer per calendar month, NaN over land and where no data exists. It is
+stored as a NumPy .npy file and opened memory-mapped, so only the pages
+actually looked up are read from disk. Like the land mask, row 0 starts
+at latitude -90 and column 0 at longitude -180, and the resolution
+follows from the shape (rows = 180 / resolution).
+
+Build the grid once from a long-term monthly mean exported as .npz with
+"lat", "lon" (either -180..180 or 0..360) and "sst" (12, lat, lon)
+arrays, e.g. from NOAA OISST:
+
+    python -m src.utils.sst_climatology oisst_monthly_ltm.npz --resolution 0.25 --output data/sst_climatology.npy
+"""
+
+import argparse
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+from ..config.settings import settings
+from .error_handler import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+MONTHS = 12
+
+
+def month_index(date: str) -> int:
+    """
+    Get the climatology layer of an ISO date.
+    
+    Args:
+        date: Date as YYYY-MM-DD
+    
+    Returns:
+        Month index (0 for January)
+    
+    Raises:
+        ValueError: If the date has no valid month
+    """
+    month = int(str(date)[5:7])
+    if not 1 <= month <= MONTHS:
+        raise ValueError(f"Invalid month in date: {date}")
+    return month - 1
+
+
+class SSTClimatology:
+    """
+    Read-only monthly SST lookup on a memory-mapped global grid.
+    """
+    
+    def __init__(self, grid: np.ndarray):
+        """
+        Initialize SST climatology.
+        
+        Args:
+            grid: Monthly grid shaped (12, 180 / resolution, 360 / resolution)
+                in °C, NaN where unknown
+        
+        Raises:
+            ConfigurationError: If the grid is not 12 global 1:2 layers
+        """
+        if grid.ndim != 3 or grid.shape[0] != MONTHS or grid.shape[1] == 0 or grid.shape[2] != 2 * grid.shape[1]:
+            raise ConfigurationError(
+                f"SST climatology must be 12 global grids with twice as many columns as rows, got: {grid.shape}"
+            )
+        
+        self.grid = grid
+        self.rows = grid.shape[1]
+        self.cols = grid.shape[2]
+        self.resolution = 180.0 / self.rows
+    
+    @classmethod
+    def load(cls, path: str) -> "SSTClimatology":
+        """
+        Open a climatology grid memory-mapped.
+        
+        Args:
+            path: Path to the .npy grid
+        
+        Returns:
+            SSTClimatology
+        """
+        grid = np.load(path, mmap_mode="r")
+        climatology = cls(grid)
+        logger.info(f"SST climatology loaded from {path} ({climatology.resolution:g}° resolution)")
+        return climatology
+    
+    def lookup(self, latitude: float, longitude: float, month: int) -> Optional[float]:
+        """
+        Get the climatological SST of a coordinate.
+        
+        Args:
+            latitude: Latitude (-90 to 90)
+            longitude: Longitude (-180 to 180)
+            month: Month index (0 for January)
+        
+        Returns:
+            SST in °C, or None where the grid has no value
+        """
+        row = min(int((latitude + 90.0) / self.resolution), self.rows - 1)
+        col = int((longitude + 180.0) / self.resolution) % self.cols
+        value = float(self.grid[month, row, col])
+        return None if np.isnan(value) else value
+    
+    def lookup_many(self, latitudes: Any, longitudes: Any, months: Any) -> np.ndarray:
+        """
+        Vectorized lookup for broadcastable coordinate and month arrays.
+        
+        Args:
+            latitudes: Latitudes (-90 to 90)
+            longitudes: Longitudes (-180 to 180)
+            months: Month indices (0 for January)
+        
+        Returns:
+            Float array of SST in °C, NaN where the grid has no value
+        """
+        latitudes = np.asarray(latitudes, dtype=float)
+        longitudes = np.asarray(longitudes, dtype=float)
+        rows = np.minimum(((latitudes + 90.0) / self.resolution).astype(int), self.rows - 1)
+        cols = ((longitudes + 180.0) / self.resolution).astype(int) % self.cols
+        return np.asarray(self.grid[np.asarray(months, dtype=int), rows, cols], dtype=float)
+
+
+_shared_climatology: Optional[SSTClimatology] = None
+_shared_loaded = False
+_shared_lock = threading.Lock()
+
+
+def get_sst_climatology() -> Optional[SSTClimatology]:
+    """
+    Return the process-wide climatology configured by SST_CLIMATOLOGY_PATH.
+    
+    Returns:
+        Shared SSTClimatology, or None if SST_CLIMATOLOGY_PATH is empty or
+        the file is missing (SST is then estimated from air temperature)
+    """
+    global _shared_climatology, _shared_loaded
+    
+    with _shared_lock:
+        if not _shared_loaded:
+            _shared_loaded = True
+            path = settings.SST_CLIMATOLOGY_PATH
+            if path and Path(path).exists():
+                _shared_climatology = SSTClimatology.load(path)
+            elif path:
+                logger.warning(f"SST climatology not found at {path}, missing SST will be estimated")
+        return _shared_climatology
+
+
+def regrid_climatology(
+    latitudes: Any,
+    longitudes: Any,
+    sst: Any,
+    resolution: float
+) -> np.ndarray:
+    """
+    Resample a regular monthly SST grid onto the climatology layout.
+    
+    Each output cell takes the nearest source value (no interpolation), so
+    land stays NaN.
+    
+    Args:
+        latitudes: Source latitudes (ascending or descending)
+        longitudes: Source longitudes (-180..180 or 0..360)
+        sst: Source values shaped (12, latitudes, longitudes), NaN on land
+        resolution: Output cell size in degrees (must divide 180)
+    
+    Returns:
+        float32 grid shaped (12, 180 / resolution, 360 / resolution)
+    """
+    latitudes = np.asarray(latitudes, dtype=float)
+    longitudes = (np.asarray(longitudes, dtype=float) + 180.0) % 360.0 - 180.0
+    sst = np.asarray(sst, dtype=np.float32)
+    
+    rows = int(round(180.0 / resolution))
+    lat_centers = -90.0 + (np.arange(rows) + 0.5) * resolution
+    lon_centers = -180.0 + (np.arange(2 * rows) + 0.5) * resolution
+    
+    lat_order = np.argsort(latitudes)
+    lon_order = np.argsort(longitudes)
+    row_index = lat_order[_nearest(latitudes[lat_order], lat_centers)]
+    col_index = lon_order[_nearest(longitudes[lon_order], lon_centers)]
+    
+    return sst[:, row_index[:, None], col_index[None, :]]
+
+
+def _nearest(sorted_values: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Indices of the nearest sorted_values for each target."""
+    right = np.clip(np.searchsorted(sorted_values, targets), 1, len(sorted_values) - 1)
+    left = right - 1
+    closer_left = (targets - sorted_values[left]) <= (sorted_values[right] - targets)
+    return np.where(closer_left, left, right)
+
+
+def main(argv=None):
+    """Build the SST climatology grid from a monthly mean .npz file."""
+    parser = argparse.ArgumentParser(description="Build the monthly SST climatology grid")
+    parser.add_argument("source", help='.npz file with "lat", "lon" and "sst" (12, lat, lon) arrays')
+    parser.add_argument("--resolution", type=float, default=0.25, help="Cell size in degrees (default: 0.25)")
+    parser.add_argument("--output", default=settings.SST_CLIMATOLOGY_PATH or "data/sst_climatology.npy")
+    args = parser.parse_args(argv)
+    
+    with np.load(args.source) as source:
+        grid = regrid_climatology(source["lat"], source["lon"], source["sst"], args.resolution)
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    np.save(args.output, grid)
+    print(f"SST climatology written to {args.output}: 12x{grid.shape[1]}x{grid.shape[2]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Incremental result streaming.
+
+Long detections (big batches, basin scans) are split into work items
+that run on a thread pool with a bounded number in flight. Items are only
+submitted as the consumer pulls results, so a slow client slows the
+upstream fetches down instead of letting results pile up in memory, and
+closing the iterator (client disconnect) cancels every item not started
+yet. Results are framed as NDJSON lines or Server-Sent Events.
+"""
+
+import json
+import logging
+import math
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_EXHAUSTED = object()
+
+
+def iter_completed(
+    executor: Executor,
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_in_flight: int
+) -> Iterator[Tuple[Any, Future]]:
+    """
+    Run fn over items and yield them in completion order.
+    
+    At most max_in_flight items are submitted and not yet consumed; the
+    next item is only submitted when a finished one is handed to the
+    consumer. Closing the iterator cancels the items not started yet
+    (running ones finish in the background and are discarded).
+    
+    Args:
+        executor: Executor running the items
+        fn: Function called with each item
+        items: Work items, consumed lazily
+        max_in_flight: Maximum number of pending items (>= 1)
+    
+    Yields:
+        (item, future) tuples whose future is done; future.result()
+        returns fn's result or raises its exception
+    """
+    items = iter(items)
+    pending: Dict[Future, Any] = {}
+    
+    def submit_next() -> bool:
+        item = next(items, _EXHAUSTED)
+        if item is _EXHAUSTED:
+            return False
+        pending[executor.submit(fn, item)] = item
+        return True
+    
+    try:
+        while len(pending) < max(1, max_in_flight) and submit_next():
+            pass
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                submit_next()
+                yield item, future
+    finally:
+        if pending:
+            cancelled = sum(future.cancel() for future in pending)
+            logger.info(f"Stream closed with {len(pending)} items pending ({cancelled} cancelled)")
+
+
+def json_safe(value: Any) -> Any:
+    """
+    Replace NaN and infinities by None so a value serializes to valid JSON.
+    
+    Args:
+        value: JSON-like value (dicts, lists, tuples, scalars)
+    
+    Returns:
+        Copy of value without non-finite floats
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_safe(item) for item in value]
+    return value
+
+
+def ndjson_line(record: Dict[str, Any]) -> str:
+    """
+    Frame a record as one NDJSON line.
+    
+    Args:
+        record: JSON-serializable record
+    
+    Returns:
+        Compact JSON followed by a newline
+    """
+    return json.dumps(json_safe(record), ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def sse_event(record: Dict[str, Any], event: Optional[str] = None, event_id: Optional[Any] = None) -> str:
+    """
+    Frame a record as one Server-Sent Event.
+    
+    Args:
+        record: JSON-serializable record (sent as the data field)
+        event: Optional event type
+        event_id: Optional event id
+    
+    Returns:
+        SSE message terminated by a blank line
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.append("data: " + json.dumps(json_safe(record), ensure_ascii=False, separators=(",", ":")))
+    return "\n".join(lines) + "\n\n"
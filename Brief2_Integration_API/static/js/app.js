@@ -56,24 +56,19 @@ async function detectCyclone() {
     hideResult();
     
     try {
-        const requestData = {
+        const requestData = new URLSearchParams({
             location_name: locationName,
             latitude: latitude,
             longitude: longitude
-        };
+        });
         
         // Ajouter la date si fournie
         if (analysisDate) {
-            requestData.analysis_date = analysisDate;
+            requestData.set('analysis_date', analysisDate);
         }
         
-        const response = await fetch('/api/detect', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify(requestData)
-        });
+        // GET pour profiter du cache HTTP (ETag / Cache-Control)
+        const response = await fetch(`/api/detect?${requestData}`);
         
         if (!response.ok) {
             throw new Error(`Erreur HTTP: ${response.status}`);
@@ -1,12 +1,68 @@
 """
 Pytest fixtures for Cyclone Tracker tests.
 
-This module provides reusable fixtures for testing.
+This module provides reusable fixtures and helpers for testing.
 """
 
+import json
+
+import numpy as np
 import pytest
 from unittest.mock import Mock
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from src.services.forecast_frame import DICT_COLUMNS, GUST_FACTOR, ForecastFrame
+from src.utils.api_client import APIClient
+
+
+def make_response(
+    status_code: int = 200,
+    payload: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+    body: Optional[bytes] = None
+) -> Mock:
+    """
+    Build a requests.Response mock.
+    
+    Args:
+        status_code: HTTP status code
+        payload: JSON payload (default: {"ok": True})
+        headers: Response headers
+        body: Raw body, overriding payload
+    """
+    response = Mock(status_code=status_code, headers=headers or {}, text="")
+    response.content = body if body is not None else json.dumps(
+        {"ok": True} if payload is None else payload
+    ).encode()
+    return response
+
+
+def make_client(**kwargs) -> APIClient:
+    """Build an APIClient without cache or rate limiter unless given."""
+    client = APIClient(**kwargs)
+    client.cache = kwargs.get("cache")  # Independent of CACHE_ENABLED
+    client.rate_limiter = kwargs.get("rate_limiter")
+    return client
+
+
+def to_frame(forecast: Dict[str, Any]) -> ForecastFrame:
+    """
+    Build the ForecastFrame a get_forecast dictionary is the view of.
+    
+    Args:
+        forecast: {"location": {...}, "forecast": [per-day dicts]}; gusts
+            missing from a day are estimated as ForecastFrame does
+    """
+    days = forecast["forecast"]
+    columns = {
+        name: np.array([day.get(name) for day in days], dtype=float) for name in DICT_COLUMNS
+    }
+    gusts = columns["wind_gusts_10m_max"]
+    columns["wind_gusts_10m_max"] = np.where(np.isnan(gusts), columns["wind_speed_10m_max"] * GUST_FACTOR, gusts)
+    location = forecast["location"]
+    return ForecastFrame(
+        location.get("latitude"), location.get("longitude"), [day["date"] for day in days], columns
+    )
 
 
 @pytest.fixture
@@ -0,0 +1,163 @@
+"""
+Tests for APIClient retry timing.
+
+This module tests the jittered backoff and the per-request deadline
+budget (shrunk attempt timeouts and skipped retries).
+"""
+
+import time
+
+import pytest
+from unittest.mock import Mock
+import requests
+
+from src.utils.cache import LRUCache, ResponseCache
+from src.utils.error_handler import APIError, ConfigurationError, TimeoutError as CustomTimeoutError
+from src.utils.json_codec import get_decoder
+from tests.conftest import make_client, make_response
+
+
+class TestBackoffDelay:
+    """Test _calculate_backoff_delay."""
+    
+    def test_delay_within_decorrelated_bounds(self):
+        """Test delays stay between RETRY_DELAY and 3x the previous delay."""
+        client = make_client(retry_delay=1)
+        
+        previous = None
+        for attempt in range(5):
+            delay = client._calculate_backoff_delay(attempt, previous)
+            assert 1 <= delay <= 3 * (previous or 1)
+            previous = delay
+    
+    def test_delays_are_jittered(self):
+        """Test repeated calls do not all return the same delay."""
+        client = make_client(retry_delay=1)
+        
+        delays = {client._calculate_backoff_delay(0) for _ in range(20)}
+        
+        assert len(delays) > 1
+    
+    def test_delay_capped(self, monkeypatch):
+        """Test the delay never exceeds MAX_RETRY_DELAY."""
+        from src.config.settings import settings
+        monkeypatch.setattr(settings, "MAX_RETRY_DELAY", 5)
+        client = make_client(retry_delay=4)
+        
+        assert client._calculate_backoff_delay(3, previous_delay=100) <= 5
+
+
+class TestAPIClientDeadline:
+    """Test the deadline budget in APIClient.get."""
+    
+    def test_attempt_timeout_shrunk_to_budget(self):
+        """Test the per-attempt timeout never exceeds the remaining budget."""
+        client = make_client(timeout=10)
+        client.session.get = Mock(return_value=make_response())
+        
+        client.get("https://a", deadline=2)
+        
+        assert client.session.get.call_args.kwargs["timeout"] <= 2
+    
+    def test_retry_skipped_when_backoff_exceeds_budget(self):
+        """Test no retry is attempted when the backoff would miss the deadline."""
+        client = make_client(timeout=10, retry_count=3)
+        client._calculate_backoff_delay = Mock(return_value=5)
+        client.session.get = Mock(side_effect=requests.exceptions.Timeout())
+        
+        start = time.monotonic()
+        with pytest.raises(CustomTimeoutError):
+            client.get("https://a", deadline=1)
+        
+        assert client.session.get.call_count == 1
+        assert time.monotonic() - start < 0.5
+    
+    def test_exhausted_deadline_raises_timeout(self):
+        """Test a zero budget fails without calling the upstream."""
+        client = make_client()
+        client.session.get = Mock()
+        
+        with pytest.raises(CustomTimeoutError):
+            client.get("https://a", deadline=0)
+        
+        client.session.get.assert_not_called()
+    
+    def test_no_deadline_keeps_configured_timeout(self):
+        """Test the configured timeout is used without a deadline."""
+        client = make_client(timeout=7)
+        client.session.get = Mock(return_value=make_response())
+        
+        client.get("https://a")
+        
+        assert client.session.get.call_args.kwargs["timeout"] == 7
+
+
+class TestAPIClientDecoding:
+    """Test JSON decoding backends and raw bodies in APIClient.get."""
+    
+    def test_raw_returns_body_bytes(self):
+        """Test raw=True returns the exact body without decoding."""
+        client = make_client()
+        client.session.get = Mock(return_value=make_response(body=b'{"daily": {}}'))
+        
+        assert client.get("https://a", raw=True) == b'{"daily": {}}'
+    
+    def test_cache_stores_raw_body(self):
+        """Test the cache keeps the body bytes and decodes on hit."""
+        client = make_client()
+        client.cache = ResponseCache(local=LRUCache(max_entries=10))
+        client.session.get = Mock(return_value=make_response(body=b'{"daily": {}}'))
+        
+        first = client.get("https://a", params={"latitude": 1.0})
+        second = client.get("https://a", params={"latitude": 1.0})
+        
+        assert first == second == {"daily": {}}
+        assert first is not second
+        assert client.get("https://a", params={"latitude": 1.0}, raw=True) == b'{"daily": {}}'
+        assert client.session.get.call_count == 1
+    
+    def test_custom_decoder(self):
+        """Test a pluggable decoder is used for response bodies."""
+        decoder = Mock(return_value={"decoded": True})
+        client = make_client(decoder=decoder)
+        client.session.get = Mock(return_value=make_response(body=b"{}"))
+        
+        assert client.get("https://a") == {"decoded": True}
+        decoder.assert_called_once_with(b"{}")
+    
+    def test_invalid_json_raises_api_error(self):
+        """Test an undecodable body raises APIError."""
+        client = make_client()
+        client._calculate_backoff_delay = Mock(return_value=0)
+        client.session.get = Mock(return_value=make_response(body=b"<html>"))
+        
+        with pytest.raises(APIError):
+            client.get("https://a")
+    
+    def test_invalid_json_not_cached(self):
+        """Test an undecodable 200 body is neither cached nor kept as stale data."""
+        client = make_client(cache=ResponseCache(local=LRUCache(max_entries=10)))
+        client.retry_count = 0
+        client.session.get = Mock(side_effect=[
+            make_response(body=b"<html>"),
+            make_response(body=b'{"daily": {}}'),
+        ])
+        
+        with pytest.raises(APIError):
+            client.get("https://a", params={"latitude": 1.0})
+        
+        assert client.get("https://a", params={"latitude": 1.0}) == {"daily": {}}
+        assert client.get("https://a", params={"latitude": 1.0}) == {"daily": {}}
+        assert client.session.get.call_count == 2
+    
+    def test_decoders_accept_memoryview(self):
+        """Test every decoder backend decodes bytes and memoryview alike."""
+        for name in ("json", "auto"):
+            decoder = get_decoder(name)
+            assert decoder(memoryview(b'{"a": [1, 2]}')) == {"a": [1, 2]}
+    
+    def test_unknown_decoder_rejected(self):
+        """Test an unknown backend name raises ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            get_decoder("simdjson")
+
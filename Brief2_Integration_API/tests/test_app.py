@@ -0,0 +1,327 @@
+"""
+Tests for the Flask API.
+
+This module tests the detection endpoints with mocked upstream
+services.
+"""
+
+import json
+
+import pytest
+from unittest.mock import Mock
+
+import app as app_module
+from src.services.detection_pipeline import DetectionPipeline
+from src.utils.cache import ModelRunSchedule
+from src.utils.error_handler import RateLimitError
+from src.utils.http_cache import detection_validator
+
+
+@pytest.fixture
+def weather_service(cyclone_conditions):
+    """Weather service mock echoing each requested location."""
+    def forecast_many(locations, **kwargs):
+        return [
+            {**cyclone_conditions, "location": {"latitude": lat, "longitude": lon}}
+            for lat, lon in locations
+        ]
+    
+    service = Mock()
+    service.get_forecast_many.side_effect = forecast_many
+    service.get_forecast.side_effect = lambda latitude, longitude, **kwargs: forecast_many([(latitude, longitude)])[0]
+    return service
+
+
+@pytest.fixture
+def marine_service():
+    """Marine service mock without marine data."""
+    service = Mock()
+    service.get_marine_forecast_many.side_effect = lambda locations, **kwargs: [None] * len(locations)
+    service.get_marine_forecast.return_value = None
+    return service
+
+
+@pytest.fixture
+def client(monkeypatch, weather_service, marine_service):
+    """Flask test client with a pipeline on mocked services."""
+    pipeline = DetectionPipeline(weather_service, marine_service)
+    monkeypatch.setattr(app_module, "detection_pipeline", pipeline)
+    yield app_module.app.test_client()
+    pipeline.close()
+
+
+class TestDetectBatch:
+    """Test POST /api/detect/batch."""
+    
+    def test_batch_results(self, client, weather_service):
+        """Test per-point results come from one batched fetch."""
+        response = client.post("/api/detect/batch", json={"points": [
+            {"latitude": -21.1151, "longitude": 55.5364, "location_name": "La Réunion"},
+            {"latitude": -20.1609, "longitude": 57.5012}
+        ]})
+        
+        body = response.get_json()
+        assert response.status_code == 200
+        assert body["count"] == 2 and body["succeeded"] == 2
+        assert body["results"][0]["location_name"] == "La Réunion"
+        assert body["results"][1]["data"]["location"] == {"latitude": -20.1609, "longitude": 57.5012}
+        assert body["results"][0]["data"]["details"]["analysis_type"] == "real_time"
+        assert weather_service.get_forecast_many.call_count == 1
+    
+    def test_invalid_points_reported_individually(self, client, weather_service):
+        """Test invalid points get an error entry and are not fetched."""
+        response = client.post("/api/detect/batch", json={"points": [
+            {"latitude": 95, "longitude": 55.5},
+            {"latitude": -21.1, "longitude": 55.5, "analysis_date": "15/01/2024"},
+            {"latitude": -21.1, "longitude": 55.5}
+        ]})
+        
+        body = response.get_json()
+        assert response.status_code == 200
+        assert [result["success"] for result in body["results"]] == [False, False, True]
+        assert body["results"][0]["status"] == 400
+        assert weather_service.get_forecast_many.call_args.args[0] == [(-21.1, 55.5)]
+    
+    def test_dates_group_fetches(self, client, weather_service):
+        """Test the request date applies to every point unless overridden."""
+        response = client.post("/api/detect/batch", json={
+            "analysis_date": "2024-01-15",
+            "points": [
+                {"latitude": -21.1, "longitude": 55.5},
+                {"latitude": -20.2, "longitude": 57.5, "analysis_date": "2024-02-01"}
+            ]
+        })
+        
+        results = response.get_json()["results"]
+        assert [result["data"]["details"]["requested_date"] for result in results] == ["2024-01-15", "2024-02-01"]
+        assert weather_service.get_forecast_many.call_count == 2
+    
+    def test_upstream_error_per_point(self, client, weather_service):
+        """Test an upstream failure is mapped to the point's status."""
+        weather_service.get_forecast_many.side_effect = lambda locations, **kwargs: [
+            RateLimitError("slow down", retry_after=5)
+        ] * len(locations)
+        
+        response = client.post("/api/detect/batch", json={"points": [{"latitude": -21.1, "longitude": 55.5}]})
+        
+        result = response.get_json()["results"][0]
+        assert response.status_code == 200
+        assert result["status"] == 429
+        assert result["retry_after"] == 5
+    
+    def test_rejects_invalid_request(self, client, monkeypatch):
+        """Test missing, empty and oversized point lists."""
+        monkeypatch.setattr(app_module.settings, "DETECTION_BATCH_MAX_POINTS", 2)
+        
+        assert client.post("/api/detect/batch", json={}).status_code == 400
+        assert client.post("/api/detect/batch", json={"points": []}).status_code == 400
+        points = [{"latitude": 0, "longitude": 0}] * 3
+        assert client.post("/api/detect/batch", json={"points": points}).status_code == 400
+    
+    def test_horizon_flag_parsed(self, client):
+        """Test a "false" string does not enable horizon scoring."""
+        points = [{"latitude": -21.1, "longitude": 55.5}]
+        
+        disabled = client.post("/api/detect/batch", json={"points": points, "horizon": "false"})
+        enabled = client.post("/api/detect/batch", json={"points": points, "horizon": "true"})
+        streamed = client.post("/api/detect/batch/stream", json={"points": points, "horizon": "false"})
+        
+        assert "horizon" not in disabled.get_json()["results"][0]["data"]
+        assert "horizon" in enabled.get_json()["results"][0]["data"]
+        assert "horizon" not in json.loads(streamed.get_data(as_text=True).splitlines()[0])["data"]
+
+
+class TestStreaming:
+    """Test the streaming endpoints."""
+    
+    def test_batch_stream_ndjson(self, client):
+        """Test one line per point, then a summary line."""
+        response = client.post("/api/detect/batch/stream", json={"points": [
+            {"latitude": -21.1, "longitude": 55.5},
+            {"latitude": 95, "longitude": 55.5}
+        ]})
+        
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert response.mimetype == "application/x-ndjson"
+        assert sorted(line["index"] for line in lines[:-1]) == [0, 1]
+        assert lines[-1] == {"done": True, "count": 2, "succeeded": 1, "failed": 1}
+    
+    def test_batch_stream_sse(self, client):
+        """Test SSE events are selected by the Accept header."""
+        response = client.post(
+            "/api/detect/batch/stream",
+            json={"points": [{"latitude": -21.1, "longitude": 55.5}]},
+            headers={"Accept": "text/event-stream"}
+        )
+        
+        body = response.get_data(as_text=True)
+        assert response.mimetype == "text/event-stream"
+        assert body.startswith("id: 0\nevent: result\ndata: ")
+        assert "event: done\n" in body
+    
+    def test_scan_stream(self, client, monkeypatch):
+        """Test a scan streams every cell and a summary."""
+        scanner = Mock()
+        cells = [
+            {"latitude": -21.0, "longitude": 55.0, "land": False, "missing": False, "severity_series": [0.1]},
+            {"latitude": -21.0, "longitude": 56.0, "land": True, "missing": True, "severity_series": [float("nan")]}
+        ]
+        scanner.iter_scan.return_value = (cell for cell in cells)
+        monkeypatch.setattr(app_module, "grid_scanner", scanner)
+        
+        response = client.get("/api/scan/stream?lat_min=-21&lat_max=-21&lon_min=55&lon_max=56&resolution=1&days=1")
+        
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert lines[1]["severity_series"] == [None]
+        assert lines[-1] == {"done": True, "count": 2, "scored": 1, "land": 1, "missing": 0}
+        assert scanner.iter_scan.call_args.args == ((-21.0, -21.0, 55.0, 56.0), 1.0, 1)
+    
+    def test_scan_stream_invalid(self, client):
+        """Test an invalid bounding box is rejected before streaming."""
+        assert client.get("/api/scan/stream?lat_min=10&lat_max=-10").status_code == 400
+        assert client.get("/api/scan/stream?resolution=abc").status_code == 400
+    
+    @pytest.mark.parametrize("days", [0, -2, 30])
+    def test_scan_stream_days_out_of_range(self, client, monkeypatch, days):
+        """Test days outside 1-16 is rejected before the scan starts."""
+        scanner = Mock()
+        monkeypatch.setattr(app_module, "grid_scanner", scanner)
+        
+        response = client.get(f"/api/scan/stream?lat_min=-21&lat_max=-21&lon_min=55&lon_max=56&days={days}")
+        
+        assert response.status_code == 400
+        assert "days must be between 1 and 16" in response.get_json()["error"]
+        scanner.iter_scan.assert_not_called()
+
+
+class TestDetectHTTPCache:
+    """Test the cacheable GET /api/detect."""
+    
+    URL = "/api/detect?latitude=-21.1151&longitude=55.5364&location_name=La%20R%C3%A9union"
+    
+    @pytest.fixture(autouse=True)
+    def marine_data(self, marine_service, mock_marine_response):
+        """Serve marine data, so complete detections are cacheable."""
+        marine_service.get_marine_forecast.return_value = mock_marine_response
+    
+    def test_get_without_coordinates_returns_info(self, client, weather_service):
+        """Test the plain GET still describes the API."""
+        response = client.get("/api/detect")
+        
+        assert response.get_json()["status"] == "operational"
+        assert "ETag" not in response.headers
+        weather_service.get_forecast.assert_not_called()
+    
+    def test_get_detection_headers(self, client):
+        """Test a detection carries a strong ETag and a max-age until the next run."""
+        response = client.get(self.URL)
+        
+        body = response.get_json()
+        etag, weak = response.get_etag()
+        assert response.status_code == 200
+        assert body["location_name"] == "La Réunion"
+        assert etag and not weak
+        assert response.cache_control.public
+        assert 0 < response.cache_control.max_age <= 24 * 3600
+        assert body["data"]["details"]["analysis_type"] == "real_time"
+    
+    def test_repeat_get_is_identical(self, client):
+        """Test the body only depends on the model run, not on the request time."""
+        first = client.get(self.URL)
+        second = client.get(self.URL)
+        
+        assert first.get_etag() == second.get_etag()
+        assert first.get_data() == second.get_data()
+    
+    def test_if_none_match_skips_detection(self, client, weather_service):
+        """Test a matching If-None-Match answers 304 without fetching data."""
+        etag = client.get(self.URL).get_etag()[0]
+        weather_service.get_forecast.reset_mock()
+        
+        response = client.get(self.URL, headers={"If-None-Match": f'"other", "{etag}"'})
+        
+        assert response.status_code == 304
+        assert response.get_data() == b""
+        assert response.get_etag()[0] == etag
+        assert response.cache_control.max_age > 0
+        weather_service.get_forecast.assert_not_called()
+    
+    def test_stale_data_not_cached(self, client, weather_service, cyclone_conditions):
+        """Test fallback data is served with no-store and no validator."""
+        weather_service.get_forecast.side_effect = None
+        weather_service.get_forecast.return_value = {**cyclone_conditions, "stale": True}
+        
+        response = client.get(self.URL)
+        
+        assert response.status_code == 200
+        assert response.cache_control.no_store
+        assert "ETag" not in response.headers
+    
+    def test_weather_only_not_cached(self, client, marine_service):
+        """Test a detection without marine data is served with no-store and no validator."""
+        marine_service.get_marine_forecast.return_value = None
+        
+        response = client.get(self.URL)
+        
+        assert response.status_code == 200
+        assert response.get_json()["data"]["details"]["marine_data_available"] is False
+        assert response.cache_control.no_store
+        assert "ETag" not in response.headers
+    
+    def test_get_invalid_coordinates(self, client):
+        """Test query string validation matches POST."""
+        response = client.get("/api/detect?latitude=abc&longitude=55.5")
+        
+        assert response.status_code == 400
+        assert "ETag" not in response.headers
+    
+    def test_prefetch_status(self, client, monkeypatch):
+        """Test the prefetch status exposes the last refresh."""
+        scheduler = Mock()
+        scheduler.status.return_value = {"running": True, "last_refresh": {"refreshed": 4, "failed": 0}}
+        monkeypatch.setattr(app_module, "prefetch_scheduler", scheduler)
+        
+        body = client.get("/api/prefetch/status").get_json()
+        
+        assert body["running"] and body["last_refresh"]["refreshed"] == 4
+        assert "enabled" in body
+
+
+class TestDetectionValidator:
+    """Test ETag inputs and freshness lifetime."""
+    
+    SCHEDULES = {"https://a": ModelRunSchedule([0, 6, 12, 18], delay_hours=4)}
+    THRESHOLDS = {"sst": 26.5, "pressure": 980.0, "wind": 117.0}
+    
+    def validator(self, latitude=-21.1151, longitude=55.5364, now=None, **kwargs):
+        """Validator at 2024-01-15 05:00 UTC on a 0.1° grid."""
+        options = {"thresholds": self.THRESHOLDS, "weather_resolution": 0.1, "marine_resolution": 0.1}
+        options.update(kwargs)
+        return detection_validator(
+            latitude, longitude, schedules=self.SCHEDULES, now=now or 1705294800.0, **options
+        )
+    
+    def test_stable_within_run(self):
+        """Test the ETag holds until the next publication."""
+        first = self.validator()
+        later = self.validator(now=1705294800.0 + 3600)
+        
+        assert first.etag == later.etag
+        assert first.max_age == 5 * 3600
+        assert first.model_run_iso == "2024-01-15T04:00:00+00:00"
+    
+    def test_changes_with_run_and_thresholds(self):
+        """Test a new run or new thresholds change the ETag."""
+        etag = self.validator().etag
+        
+        assert self.validator(now=1705294800.0 + 5 * 3600).etag != etag
+        assert self.validator(thresholds={**self.THRESHOLDS, "sst": 27.0}).etag != etag
+        assert self.validator(horizon=True).etag != etag
+    
+    def test_settled_history(self):
+        """Test settled historical dates get the historical TTL and no run."""
+        validator = self.validator(analysis_date="2020-01-15")
+        
+        assert validator.model_run is None
+        assert validator.max_age == app_module.settings.CACHE_TTL_HISTORICAL
+        assert self.validator(analysis_date="2020-01-15", now=1705294800.0 + 5 * 3600).etag == validator.etag
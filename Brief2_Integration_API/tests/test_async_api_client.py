@@ -0,0 +1,195 @@
+"""
+Tests for AsyncAPIClient and the async services.
+
+This module tests the asyncio client retry semantics with a fake
+aiohttp session, and the async Weather/Marine service counterparts.
+"""
+
+import asyncio
+import json
+
+import aiohttp
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.utils.async_api_client import AsyncAPIClient, _encode_params
+from src.utils.circuit_breaker import CircuitState
+from src.services.weather_service import AsyncWeatherService
+from src.services.marine_service import AsyncMarineService
+from src.utils.error_handler import (
+    RateLimitError,
+    ValidationError,
+    TimeoutError as CustomTimeoutError,
+)
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response context manager."""
+    
+    def __init__(self, status, payload=None, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = json.dumps(payload if payload is not None else {}).encode()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+    
+    async def read(self):
+        return self._body
+    
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                Mock(real_url="https://example.com"), (), status=self.status, message="Client Error"
+            )
+
+
+class FakeSession:
+    """Fake aiohttp session returning queued responses or raising errors."""
+    
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+        self.closed = False
+    
+    def get(self, url, params=None, timeout=None):
+        self.calls.append((url, params))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    async def close(self):
+        self.closed = True
+
+
+def make_client(outcomes, **kwargs):
+    """Build an AsyncAPIClient wired to a FakeSession."""
+    client = AsyncAPIClient(retry_delay=1, **kwargs)
+    client.session = FakeSession(outcomes)
+    client._calculate_backoff_delay = Mock(return_value=0)
+    return client
+
+
+class TestAsyncAPIClient:
+    """Test AsyncAPIClient.get."""
+    
+    def test_get_success(self):
+        """Test successful GET returns decoded JSON."""
+        client = make_client([FakeResponse(200, {"ok": True})])
+        
+        result = asyncio.run(client.get("https://example.com", params={"latitude": 1.0}))
+        
+        assert result == {"ok": True}
+        assert client.session.calls[0][1] == [("latitude", "1.0")]
+    
+    def test_get_retries_server_errors(self):
+        """Test 5xx responses are retried until success."""
+        client = make_client([FakeResponse(503), FakeResponse(200, {"ok": True})])
+        
+        result = asyncio.run(client.get("https://example.com"))
+        
+        assert result == {"ok": True}
+        assert len(client.session.calls) == 2
+    
+    def test_get_timeout_exhausts_retries(self):
+        """Test repeated timeouts raise TimeoutError after all attempts."""
+        client = make_client([asyncio.TimeoutError()] * 3, retry_count=2)
+        
+        with pytest.raises(CustomTimeoutError):
+            asyncio.run(client.get("https://example.com"))
+        
+        assert len(client.session.calls) == 3
+    
+    def test_get_payload_error_retried(self):
+        """Test other aiohttp errors are retried as APIError and settle the breaker."""
+        client = make_client([aiohttp.ClientPayloadError("truncated body"), FakeResponse(200, {"ok": True})])
+        
+        result = asyncio.run(client.get("https://example.com"))
+        
+        assert result == {"ok": True}
+        assert len(client.session.calls) == 2
+        assert client.circuit_breakers.get("https://example.com").state is CircuitState.CLOSED
+    
+    def test_get_rate_limit_not_retried(self):
+        """Test HTTP 429 raises RateLimitError without retrying."""
+        client = make_client([FakeResponse(429, headers={"Retry-After": "5"})])
+        
+        with pytest.raises(RateLimitError, match="5 seconds"):
+            asyncio.run(client.get("https://example.com"))
+        
+        assert len(client.session.calls) == 1
+    
+    def test_get_bad_request(self):
+        """Test HTTP 400 raises ValidationError with upstream reason."""
+        client = make_client([FakeResponse(400, {"reason": "bad latitude"})])
+        
+        with pytest.raises(ValidationError, match="bad latitude"):
+            asyncio.run(client.get("https://example.com"))
+    
+    def test_get_not_found_not_retried(self):
+        """Test other 4xx responses are raised at once without a breaker failure."""
+        client = make_client([FakeResponse(404), FakeResponse(200, {"ok": True})])
+        
+        with pytest.raises(aiohttp.ClientResponseError):
+            asyncio.run(client.get("https://example.com"))
+        
+        assert len(client.session.calls) == 1
+        assert client.circuit_breakers.get("https://example.com").snapshot()["consecutive_failures"] == 0
+    
+    def test_get_invalid_params(self):
+        """Test invalid coordinates are rejected before any call."""
+        client = make_client([])
+        
+        with pytest.raises(ValidationError):
+            asyncio.run(client.get("https://example.com", params={"latitude": 95}))
+    
+    def test_encode_params_expands_lists(self):
+        """Test list parameters are expanded into repeated keys."""
+        query = _encode_params({"daily": ["a", "b"], "timezone": "auto", "x": None})
+        
+        assert query == [("daily", "a"), ("daily", "b"), ("timezone", "auto")]
+
+
+class TestAsyncServices:
+    """Test AsyncWeatherService and AsyncMarineService."""
+    
+    def test_async_weather_forecast(self, mock_weather_response, valid_coordinates):
+        """Test async forecast shares the sync parsing."""
+        client = Mock()
+        client.get = AsyncMock(return_value=mock_weather_response)
+        service = AsyncWeatherService(api_client=client)
+        
+        result = asyncio.run(service.get_forecast(
+            latitude=valid_coordinates["latitude"],
+            longitude=valid_coordinates["longitude"],
+            forecast_days=3
+        ))
+        
+        assert len(result["forecast"]) == 3
+        assert result["location"]["latitude"] == valid_coordinates["latitude"]
+    
+    def test_async_weather_invalid_coordinates(self):
+        """Test async forecast validates coordinates."""
+        service = AsyncWeatherService(api_client=Mock())
+        
+        with pytest.raises(ValidationError):
+            asyncio.run(service.get_forecast(latitude=-95.0, longitude=55.5))
+    
+    def test_async_marine_forecast(self, mock_marine_response, valid_coordinates):
+        """Test async marine forecast trims to forecast_days."""
+        client = Mock()
+        client.get = AsyncMock(return_value=mock_marine_response)
+        service = AsyncMarineService(api_client=client)
+        
+        result = asyncio.run(service.get_marine_forecast(
+            latitude=valid_coordinates["latitude"],
+            longitude=valid_coordinates["longitude"],
+            forecast_days=2
+        ))
+        
+        assert len(result["marine_forecast"]) == 2
+        assert "wave_height" in result["marine_forecast"][0]
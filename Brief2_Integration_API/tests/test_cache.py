@@ -0,0 +1,303 @@
+"""
+Tests for the two-tier response cache.
+
+This module tests key normalization, the LRU tier, Redis fallback and
+the cache integration in APIClient.
+"""
+
+import json
+import multiprocessing
+import time
+from datetime import date, datetime, timezone
+from unittest.mock import Mock
+
+from src.utils.api_client import APIClient
+from src.utils.cache import (
+    LRUCache,
+    ModelRunSchedule,
+    RedisCache,
+    ResponseCache,
+    SQLiteCache,
+    is_settled_history,
+    make_cache_key
+)
+
+
+def utc(*args):
+    """Build a time.time() timestamp from UTC date/time fields."""
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+class FakeRedis:
+    """In-memory stand-in for a redis.Redis client."""
+    
+    def __init__(self):
+        self.data = {}
+    
+    def get(self, key):
+        return self.data.get(key)
+    
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+    
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class BrokenRedis:
+    """Redis client whose every call fails like a server that is down."""
+    
+    def get(self, key):
+        raise ConnectionError("Connection refused")
+    
+    set = delete = get
+
+
+class TestMakeCacheKey:
+    """Test cache key normalization."""
+    
+    def test_param_order_does_not_matter(self):
+        """Test parameter and list order produce the same key."""
+        key1 = make_cache_key("https://a", {"latitude": -21.1, "daily": ["x", "y"]})
+        key2 = make_cache_key("https://a", {"daily": ["y", "x"], "latitude": -21.1})
+        assert key1 == key2
+    
+    def test_float_formatting_does_not_matter(self):
+        """Test int/float spellings of the same coordinate share a key."""
+        assert make_cache_key("https://a", {"latitude": -21.10}) == make_cache_key("https://a", {"latitude": -21.1})
+    
+    def test_different_requests_differ(self):
+        """Test different URLs or params produce different keys."""
+        assert make_cache_key("https://a", {"latitude": 1.0}) != make_cache_key("https://b", {"latitude": 1.0})
+        assert make_cache_key("https://a", {"latitude": 1.0}) != make_cache_key("https://a", {"latitude": 2.0})
+
+
+class TestLRUCache:
+    """Test the in-process tier."""
+    
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted first."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        cache.get("a")
+        cache.set("c", 3, 60)
+        
+        assert cache.get("b") is None
+        assert cache.get("a")[0] == 1
+        assert cache.get("c")[0] == 3
+    
+    def test_expired_entries_are_missing(self):
+        """Test entries disappear after their TTL."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1, -1)
+        assert cache.get("a") is None
+
+
+class TestResponseCache:
+    """Test the two-tier cache."""
+    
+    def test_remote_hit_is_promoted(self):
+        """Test a Redis hit is copied into the local tier."""
+        remote = RedisCache(client=FakeRedis())
+        remote.set("k", b'{"v": 1}', 60)
+        cache = ResponseCache(remote=remote)
+        
+        assert cache.get("k") == b'{"v": 1}'
+        assert cache.get("k") == b'{"v": 1}'
+        
+        stats = cache.stats()
+        assert stats["remote_hits"] == 1
+        assert stats["local_hits"] == 1
+    
+    def test_redis_down_falls_back_to_local(self):
+        """Test Redis failures do not fail lookups or writes."""
+        cache = ResponseCache(remote=RedisCache(client=BrokenRedis()))
+        
+        assert cache.get("k") is None
+        cache.set("k", b'{"v": 1}', 60)
+        assert cache.get("k") == b'{"v": 1}'
+        assert cache.stats()["remote_errors"] == 1
+    
+    def test_redis_stores_exact_bytes(self):
+        """Test Redis keeps the value bytes untouched next to the expiry."""
+        redis_client = FakeRedis()
+        remote = RedisCache(client=redis_client)
+        body = b'{"daily":{"time":["2024-01-15"]}}'
+        
+        remote.set("k", body, 60)
+        
+        assert redis_client.data["k"].endswith(b"\n" + body)
+        assert remote.get("k")[0] == body
+    
+    def test_per_endpoint_ttl(self):
+        """Test endpoint TTLs override the default."""
+        cache = ResponseCache(endpoint_ttls={"https://a": 10}, default_ttl=99)
+        assert cache.ttl_for("https://a") == 10
+        assert cache.ttl_for("https://b") == 99
+
+
+class TestModelRunTTL:
+    """Test model-run-aware and historical TTLs."""
+    
+    def test_next_publication(self):
+        """Test the next run publication is found the same day and the next."""
+        schedule = ModelRunSchedule([0, 6, 12, 18], delay_hours=4)
+        
+        assert schedule.next_publication(utc(2024, 1, 15, 3, 0)) == utc(2024, 1, 15, 4, 0)
+        assert schedule.next_publication(utc(2024, 1, 15, 4, 0)) == utc(2024, 1, 15, 10, 0)
+        assert schedule.next_publication(utc(2024, 1, 15, 22, 30)) == utc(2024, 1, 16, 4, 0)
+    
+    def test_delay_past_midnight(self):
+        """Test a publication delay crossing midnight wraps to the next day."""
+        schedule = ModelRunSchedule([12, 18], delay_hours=7)
+        
+        assert schedule.next_publication(utc(2024, 1, 15, 0, 30)) == utc(2024, 1, 15, 1, 0)
+        assert schedule.next_publication(utc(2024, 1, 15, 20, 0)) == utc(2024, 1, 16, 1, 0)
+        assert schedule.ttl(utc(2024, 1, 15, 19, 0)) == 6 * 3600
+    
+    def test_last_publication(self):
+        """Test the current run is the latest publication, wrapping to the previous day."""
+        schedule = ModelRunSchedule([0, 6, 12, 18], delay_hours=4)
+        
+        assert schedule.last_publication(utc(2024, 1, 15, 4, 0)) == utc(2024, 1, 15, 4, 0)
+        assert schedule.last_publication(utc(2024, 1, 15, 9, 59)) == utc(2024, 1, 15, 4, 0)
+        assert schedule.last_publication(utc(2024, 1, 15, 3, 0)) == utc(2024, 1, 14, 22, 0)
+    
+    def test_ttl_until_next_run(self):
+        """Test the TTL ends exactly at the next publication."""
+        schedule = ModelRunSchedule([0, 12], delay_hours=7)
+        
+        assert schedule.ttl(utc(2024, 1, 15, 6, 0)) == 3600
+        assert schedule.ttl(utc(2024, 1, 15, 7, 0)) == 12 * 3600
+    
+    def test_settled_history(self):
+        """Test only end dates safely in the past count as historical."""
+        today = date(2024, 3, 10)
+        
+        assert is_settled_history({"start_date": "2024-01-01", "end_date": "2024-01-31"}, today)
+        assert not is_settled_history({"start_date": "2024-03-01", "end_date": "2024-03-09"}, today)
+        assert not is_settled_history({"forecast_days": 7}, today)
+        assert not is_settled_history({"end_date": "not-a-date"}, today)
+        assert not is_settled_history(None, today)
+    
+    def test_ttl_for_request(self):
+        """Test historical requests, scheduled endpoints and flat TTLs."""
+        schedule = ModelRunSchedule([0, 6, 12, 18], delay_hours=4)
+        cache = ResponseCache(
+            endpoint_ttls={"https://a": 10, "https://b": 20},
+            schedules={"https://a": schedule},
+            historical_ttl=1000000
+        )
+        
+        assert cache.ttl_for("https://a", {"start_date": "2020-01-01", "end_date": "2020-01-31"}) == 1000000
+        assert 0 < cache.ttl_for("https://a", {"forecast_days": 7}) <= 6 * 3600
+        assert cache.ttl_for("https://b", {"forecast_days": 7}) == 20
+
+
+class TestAPIClientCache:
+    """Test cache integration in APIClient.get."""
+    
+    def test_second_call_served_from_cache(self):
+        """Test identical requests reach the network once."""
+        client = APIClient(cache=ResponseCache(local=LRUCache(max_entries=10)))
+        response = Mock(status_code=200)
+        response.content = json.dumps({"daily": {}}).encode()
+        client.session.get = Mock(return_value=response)
+        
+        first = client.get("https://a", params={"latitude": -21.1})
+        second = client.get("https://a", params={"latitude": -21.1})
+        
+        assert first == second == {"daily": {}}
+        assert client.session.get.call_count == 1
+    
+    def test_historical_response_stored_with_long_ttl(self):
+        """Test the TTL is chosen from the request parameters."""
+        local = LRUCache(max_entries=10)
+        client = APIClient(cache=ResponseCache(local=local, default_ttl=60, historical_ttl=1000000))
+        response = Mock(status_code=200)
+        response.content = json.dumps({"daily": {}}).encode()
+        client.session.get = Mock(return_value=response)
+        
+        params = {"latitude": -21.1, "start_date": "2020-01-01", "end_date": "2020-01-31"}
+        client.get("https://a", params=params)
+        
+        _, expires_at = local.get(make_cache_key("https://a", params))
+        assert expires_at - datetime.now(timezone.utc).timestamp() > 999000
+
+
+class TestSQLiteCache:
+    """Test the on-disk SQLite tier."""
+    
+    def test_roundtrip_and_expiry(self, tmp_path):
+        """Test values are stored as exact bytes and expire."""
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+        
+        cache.set("k", b'{"v": 1}', 60)
+        cache.set("old", b"x", -1)
+        
+        value, expires_at = cache.get("k")
+        assert value == b'{"v": 1}'
+        assert expires_at > time.time()
+        assert cache.get("old") is None
+        cache.delete("k")
+        assert cache.get("k") is None
+    
+    def test_survives_restart(self, tmp_path):
+        """Test a new instance on the same file sees the entries."""
+        path = str(tmp_path / "cache.sqlite3")
+        SQLiteCache(path).set("k", b"warm", 60)
+        
+        assert SQLiteCache(path).get("k")[0] == b"warm"
+    
+    def test_size_bound_evicts_closest_to_expiry(self, tmp_path):
+        """Test eviction keeps the total size under max_bytes."""
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), max_bytes=250)
+        for i in range(5):
+            cache.set(f"k{i}", b"x" * 100, 60 + i)
+        
+        assert cache.evict() == 3
+        assert cache.get("k0") is None and cache.get("k2") is None
+        assert cache.get("k3") is not None and cache.get("k4") is not None
+    
+    def test_compact(self, tmp_path):
+        """Test compaction drops expired entries and shrinks the file."""
+        path = tmp_path / "cache.sqlite3"
+        cache = SQLiteCache(str(path))
+        for i in range(200):
+            cache.set(f"k{i}", b"x" * 4096, 60 if i == 0 else 0.01)
+        time.sleep(0.02)
+        size_before = path.stat().st_size + (tmp_path / "cache.sqlite3-wal").stat().st_size
+        
+        cache.compact()
+        
+        assert len(cache) == 1
+        assert path.stat().st_size < size_before / 10
+    
+    def test_shared_between_processes(self, tmp_path):
+        """Test a write from another process is visible."""
+        path = str(tmp_path / "cache.sqlite3")
+        cache = SQLiteCache(path)
+        
+        process = multiprocessing.get_context("spawn").Process(target=_write_entry, args=(path,))
+        process.start()
+        process.join(30)
+        
+        assert process.exitcode == 0
+        assert cache.get("from-child")[0] == b"child"
+    
+    def test_response_cache_falls_back_on_sqlite_error(self, tmp_path):
+        """Test a broken database is treated like an unreachable Redis."""
+        remote = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+        remote._connection().execute("DROP TABLE entries")
+        cache = ResponseCache(local=LRUCache(max_entries=10), remote=remote)
+        
+        cache.set("k", b"v", 60)
+        
+        assert cache.get("k") == b"v"
+        assert cache.stats()["remote_errors"] == 1
+
+
+def _write_entry(path):
+    """Write one entry from a separate process."""
+    SQLiteCache(path).set("from-child", b"child", 60)
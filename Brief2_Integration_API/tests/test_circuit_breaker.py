@@ -0,0 +1,189 @@
+"""
+Tests for the circuit breaker and the stale-response fallback.
+
+This module tests breaker state transitions and their integration in
+APIClient: fail-fast while open and last-known-good responses served
+when the upstream is unavailable.
+"""
+
+import time
+
+import pytest
+import requests
+from unittest.mock import Mock
+
+from src.utils.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState
+from src.utils.error_handler import APIError, CircuitOpenError, ValidationError
+from tests.conftest import make_client, make_response
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions."""
+    
+    def test_opens_after_threshold(self):
+        """Test the breaker opens after consecutive failures."""
+        breaker = CircuitBreaker("api", failure_threshold=3, recovery_timeout=60)
+        
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        
+        breaker.record_failure()
+        
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+        assert breaker.retry_after() > 59
+    
+    def test_success_resets_failures(self):
+        """Test a success resets the consecutive failure count."""
+        breaker = CircuitBreaker("api", failure_threshold=2, recovery_timeout=60)
+        
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        
+        assert breaker.state is CircuitState.CLOSED
+    
+    def test_half_open_allows_single_probe(self):
+        """Test only one probe is let through after the recovery timeout."""
+        breaker = CircuitBreaker("api", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+    
+    def test_probe_outcome(self):
+        """Test a failed probe re-opens the breaker and a successful one closes it."""
+        breaker = CircuitBreaker("api", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        
+        breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        
+        time.sleep(0.06)
+        breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+    
+    def test_registry_one_breaker_per_endpoint(self):
+        """Test the registry reuses breakers per endpoint."""
+        registry = CircuitBreakerRegistry(failure_threshold=1, recovery_timeout=60)
+        
+        registry.get("https://a").record_failure()
+        
+        assert registry.get("https://a") is registry.get("https://a")
+        assert registry.get("https://b").state is CircuitState.CLOSED
+        assert registry.snapshot()["https://a"]["state"] == "open"
+
+
+class TestAPIClientCircuitBreaker:
+    """Test circuit breaker and stale fallback integration in APIClient."""
+    
+    def _client(self, failure_threshold=2, recovery_timeout=60):
+        client = make_client(
+            retry_count=3,
+            circuit_breakers=CircuitBreakerRegistry(
+                failure_threshold=failure_threshold,
+                recovery_timeout=recovery_timeout
+            )
+        )
+        client._calculate_backoff_delay = Mock(return_value=0)
+        return client
+    
+    def test_open_circuit_stops_retries(self):
+        """Test retries stop as soon as the breaker opens."""
+        client = self._client(failure_threshold=2)
+        client.session.get = Mock(return_value=make_response(503))
+        
+        with pytest.raises(APIError):
+            client.get("https://a")
+        
+        assert client.session.get.call_count == 2
+    
+    def test_open_circuit_fails_fast(self):
+        """Test an open circuit rejects calls without hitting the upstream."""
+        client = self._client(failure_threshold=1)
+        client.circuit_breakers.get("https://a").record_failure()
+        client.session.get = Mock()
+        
+        with pytest.raises(CircuitOpenError) as exc_info:
+            client.get("https://a")
+        
+        assert exc_info.value.retry_after > 0
+        client.session.get.assert_not_called()
+    
+    def test_client_errors_do_not_open_circuit(self):
+        """Test 4xx responses are not counted as upstream failures."""
+        client = self._client(failure_threshold=1)
+        response = make_response(400)
+        response.text = '{"reason": "Invalid latitude"}'
+        client.session.get = Mock(return_value=response)
+        
+        with pytest.raises(ValidationError):
+            client.get("https://a")
+        
+        assert client.circuit_breakers.get("https://a").state is CircuitState.CLOSED
+    
+    def test_other_client_errors_not_retried(self):
+        """Test a 404 on a half-open probe is raised at once and closes the circuit."""
+        client = self._client(failure_threshold=1, recovery_timeout=0.05)
+        breaker = client.circuit_breakers.get("https://a")
+        breaker.record_failure()
+        time.sleep(0.06)
+        response = make_response(404)
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Client Error")
+        client.session.get = Mock(return_value=response)
+        
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get("https://a")
+        
+        assert client.session.get.call_count == 1
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.snapshot()["consecutive_failures"] == 0
+    
+    def test_serves_stale_response_on_failure(self):
+        """Test the last-known-good response is returned marked as stale."""
+        client = self._client(failure_threshold=1)
+        client.session.get = Mock(return_value=make_response(200, {"daily": {}}))
+        client.get("https://a", params={"latitude": 1, "longitude": 2})
+        
+        client.session.get = Mock(return_value=make_response(503))
+        first = client.get("https://a", params={"latitude": 1, "longitude": 2})
+        second = client.get("https://a", params={"latitude": 1, "longitude": 2})
+        
+        assert first["stale"] is True
+        assert first["daily"] == {}
+        assert second["stale"] is True
+        assert client.session.get.call_count == 1  # Second call failed fast
+    
+    def test_no_stale_response_raises(self):
+        """Test the error is raised when no last-known-good response exists."""
+        client = self._client(failure_threshold=1)
+        client.session.get = Mock(return_value=make_response(503))
+        
+        with pytest.raises(APIError):
+            client.get("https://a", params={"latitude": 1, "longitude": 2})
+    
+    def test_transport_error_settles_half_open_probe(self):
+        """Test a non-connection transport error on the probe does not wedge the breaker."""
+        client = self._client(failure_threshold=1, recovery_timeout=0.05)
+        client.session.get = Mock(side_effect=[
+            requests.exceptions.ConnectionError("refused"),
+            requests.exceptions.ChunkedEncodingError("truncated body"),
+            make_response(200),
+        ])
+        
+        with pytest.raises(APIError):
+            client.get("https://a")
+        time.sleep(0.06)
+        with pytest.raises(APIError) as exc_info:
+            client.get("https://a")  # Half-open probe
+        time.sleep(0.06)
+        
+        assert not isinstance(exc_info.value, CircuitOpenError)
+        assert client.get("https://a") == {"ok": True}
+        assert client.session.get.call_count == 3
@@ -4,10 +4,11 @@ Tests for CycloneDetector.
 This module tests cyclone detection algorithm and classification.
 """
 
+import numpy as np
 import pytest
 from unittest.mock import Mock
 
-from src.services.cyclone_detector import CycloneDetector, CycloneCategory
+from src.services.cyclone_detector import CycloneDetector, CycloneCategory, CATEGORY_CODES
 from src.utils.error_handler import ValidationError
 
 
@@ -169,3 +170,173 @@ class TestCycloneDetectorAlgorithm:
         
         score = detector._calculate_severity_score(conditions)
         assert score < 0.3
+
+
+class TestCycloneDetectorBatch:
+    """Test vectorized batch detection."""
+    
+    def _scalar(self, detector, sst, pressure, wind_speed, wind_gusts):
+        conditions = detector._analyze_conditions(sst, pressure, wind_speed, wind_gusts)
+        score = detector._calculate_severity_score(conditions)
+        return conditions, score, detector._classify_cyclone(conditions, score)
+    
+    def test_batch_matches_scalar_path(self):
+        """Test scores, masks and categories are identical to the scalar path."""
+        detector = CycloneDetector()
+        rng = np.random.default_rng(42)
+        shape = (50, 16)
+        sst = rng.uniform(22, 32, shape).round(1)
+        pressure = rng.uniform(890, 1020, shape).round(1)
+        wind = rng.uniform(0, 280, shape).round(1)
+        gusts = rng.uniform(0, 320, shape).round(1)
+        
+        result = detector.detect_batch(sst, pressure, wind, gusts)
+        
+        for index in np.ndindex(shape):
+            conditions, score, category = self._scalar(
+                detector, float(sst[index]), float(pressure[index]),
+                float(wind[index]), float(gusts[index])
+            )
+            assert result["severity_score"][index] == score
+            assert CATEGORY_CODES[result["category_code"][index]] == category
+            for name, condition in conditions.items():
+                assert result["conditions"][name][index] == condition["met"]
+    
+    def test_all_four_conditions_not_cyclone(self):
+        """Test the category follows the scalar rule when all 4 conditions are met."""
+        detector = CycloneDetector()
+        
+        result = detector.detect_batch([28.0], [975.0], [118.0], [121.0])
+        _, _, category = self._scalar(detector, 28.0, 975.0, 118.0, 121.0)
+        
+        assert result["met_count"][0] == 4
+        assert CATEGORY_CODES[result["category_code"][0]] == category
+    
+    def test_broadcast_sst_per_location(self):
+        """Test one SST per location is broadcast over the days."""
+        detector = CycloneDetector()
+        sst = np.array([[28.0], [20.0]])
+        pressure = np.full((2, 3), 970.0)
+        wind = np.full((2, 3), 130.0)
+        
+        result = detector.detect_batch(sst, pressure, wind)
+        
+        assert result["severity_score"].shape == (2, 3)
+        assert result["conditions"]["sst"].tolist() == [[True] * 3, [False] * 3]
+    
+    def test_missing_values_score_zero(self):
+        """Test NaN inputs are not met and do not add to the score."""
+        detector = CycloneDetector()
+        
+        result = detector.detect_batch([np.nan], [np.nan], [np.nan], [np.nan])
+        
+        assert result["severity_score"][0] == 0.0
+        assert result["met_count"][0] == 0
+        assert result["category_code"][0] == 0
+    
+    def test_incompatible_shapes(self):
+        """Test shapes that cannot broadcast raise ValidationError."""
+        with pytest.raises(ValidationError):
+            CycloneDetector().detect_batch(np.zeros((2, 3)), np.zeros((3, 2)), np.zeros((2, 3)))
+
+
+class TestCycloneDetectorHorizon:
+    """Test full-horizon detection."""
+    
+    def _forecast(self):
+        days = [
+            ("2024-01-15", 1012.0, 40.0, 55.0),
+            ("2024-01-16", 990.0, 100.0, 125.0),
+            ("2024-01-17", 965.0, 150.0, 210.0),
+            ("2024-01-18", 985.0, 90.0, 110.0),
+        ]
+        return [
+            {
+                "date": date,
+                "temperature_2m_max": 30.0,
+                "temperature_2m_min": 25.0,
+                "surface_pressure": pressure,
+                "wind_speed_10m_max": wind,
+                "wind_gusts_10m_max": gusts
+            }
+            for date, pressure, wind, gusts in days
+        ]
+    
+    def test_series_matches_per_day_detection(self):
+        """Test every day is scored exactly as detect() scores the first day."""
+        detector = CycloneDetector()
+        forecast = self._forecast()
+        
+        horizon = detector.detect_horizon(forecast, sst=27.0)
+        
+        for i, day in enumerate(forecast):
+            single = detector.detect({"location": {"latitude": 0, "longitude": 0}, "forecast": [day]}, sst=27.0)
+            assert horizon["severity_series"][i] == single["severity_score"]
+            assert horizon["category_series"][i] == single["category"]
+    
+    def test_peak_and_first_crossing(self):
+        """Test the peak day and the first threshold crossing are reported."""
+        horizon = CycloneDetector().detect_horizon(self._forecast(), sst=25.0)
+        
+        assert horizon["days"] == 4
+        assert horizon["peak"]["date"] == "2024-01-17"
+        assert horizon["peak"]["day_index"] == 2
+        assert horizon["first_threshold_crossing"] == {
+            "date": "2024-01-16",
+            "day_index": 1,
+            "conditions": ["wind_gusts"]
+        }
+    
+    def test_no_crossing(self, non_cyclone_conditions):
+        """Test no crossing is reported for normal conditions."""
+        horizon = CycloneDetector().detect_horizon(non_cyclone_conditions["forecast"])
+        
+        assert horizon["first_threshold_crossing"] is None
+        assert horizon["peak"]["day_index"] == 0
+    
+    def test_estimated_sst_per_day(self):
+        """Test SST is estimated from each day's air temperature when unknown."""
+        detector = CycloneDetector()
+        forecast = self._forecast()
+        forecast[3]["temperature_2m_max"] = 20.0
+        
+        result = detector.detect({"location": {"latitude": 0, "longitude": 0}, "forecast": forecast}, horizon=True)
+        single = detector.detect({"location": {"latitude": 0, "longitude": 0}, "forecast": [forecast[3]]})
+        
+        assert result["horizon"]["severity_series"][3] == single["severity_score"]
+    
+    def test_detect_without_horizon(self, non_cyclone_conditions):
+        """Test the horizon entry is only added on request."""
+        assert "horizon" not in CycloneDetector().detect(non_cyclone_conditions, sst=24.0)
+
+
+class TestCycloneDetectorMany:
+    """Test detect_many method."""
+    
+    def test_matches_detect(self, cyclone_conditions, non_cyclone_conditions):
+        """Test every location gets the same result as detect()."""
+        detector = CycloneDetector()
+        marine = {"marine_forecast": [{"date": "2024-01-15", "ocean_sst": 28.0}]}
+        
+        results = detector.detect_many(
+            [cyclone_conditions, non_cyclone_conditions],
+            [marine, None],
+            horizon=True
+        )
+        
+        assert results[0] == detector.detect(cyclone_conditions, marine, horizon=True)
+        assert results[1] == detector.detect(non_cyclone_conditions, horizon=True)
+    
+    def test_per_location_errors(self, cyclone_conditions):
+        """Test failed fetches pass through and malformed data becomes ValidationError."""
+        detector = CycloneDetector()
+        fetch_error = RuntimeError("fetch failed")
+        
+        results = detector.detect_many(
+            [fetch_error, {"location": {}, "forecast": []}, cyclone_conditions],
+            [None, None, RuntimeError("marine failed")]
+        )
+        
+        assert results[0] is fetch_error
+        assert isinstance(results[1], ValidationError)
+        assert results[2] == detector.detect(cyclone_conditions)
@@ -0,0 +1,190 @@
+"""
+Tests for DetectionPipeline.
+
+This module tests the concurrent weather + marine fetch, the deadline
+handling and the weather-only fallback.
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import DEFAULT, Mock
+
+from src.services.detection_pipeline import DetectionPipeline
+from src.utils.error_handler import APIError, TimeoutError as CustomTimeoutError
+from tests.conftest import to_frame
+
+
+@pytest.fixture
+def weather_service(cyclone_conditions):
+    """Weather service mock returning cyclone conditions."""
+    service = Mock()
+    service.get_forecast.return_value = cyclone_conditions
+    service.get_forecast_many.side_effect = lambda locations, **kwargs: [cyclone_conditions] * len(locations)
+    return service
+
+
+@pytest.fixture
+def marine_service():
+    """Marine service mock returning minimal marine data."""
+    service = Mock()
+    service.get_marine_forecast.return_value = {"marine_forecast": []}
+    service.get_marine_forecast_many.side_effect = lambda locations, **kwargs: [{"marine_forecast": []}] * len(locations)
+    return service
+
+
+class TestDetectLocation:
+    """Test detect_location method."""
+    
+    def test_fetches_both_sources_concurrently(self, weather_service, marine_service):
+        """Test both legs run at the same time."""
+        # Each leg only returns once the other one has started
+        barrier = threading.Barrier(2, timeout=2)
+        
+        def wait_for_other_leg(**kwargs):
+            barrier.wait()
+            return DEFAULT
+        
+        weather_service.get_forecast.side_effect = wait_for_other_leg
+        marine_service.get_marine_forecast.side_effect = wait_for_other_leg
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        
+        result = pipeline.detect_location(-21.1151, 55.5364, deadline=5)
+        
+        assert result["details"]["marine_data_available"] is True
+        pipeline.close()
+    
+    def test_marine_deadline_returns_weather_only(self, weather_service, marine_service):
+        """Test a slow marine leg does not block the detection."""
+        release = threading.Event()
+        marine_service.get_marine_forecast.side_effect = lambda **kwargs: release.wait(2)
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        
+        start = time.monotonic()
+        result = pipeline.detect_location(-21.1151, 55.5364, deadline=0.2)
+        release.set()
+        
+        assert time.monotonic() - start < 1
+        assert result["details"]["marine_data_available"] is False
+        assert "category" in result
+        pipeline.close()
+    
+    def test_marine_error_returns_weather_only(self, weather_service, marine_service):
+        """Test a failing marine leg falls back to weather-only detection."""
+        marine_service.get_marine_forecast.side_effect = APIError("marine down")
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        
+        result = pipeline.detect_location(-21.1151, 55.5364)
+        
+        assert result["details"]["marine_data_available"] is False
+        pipeline.close()
+    
+    def test_weather_deadline_raises_timeout(self, weather_service, marine_service):
+        """Test a weather leg missing the deadline raises TimeoutError."""
+        release = threading.Event()
+        weather_service.get_forecast.side_effect = lambda **kwargs: release.wait(2)
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        
+        with pytest.raises(CustomTimeoutError):
+            pipeline.detect_location(-21.1151, 55.5364, deadline=0.1)
+        release.set()
+        pipeline.close()
+    
+    def test_historical_date_forwarded(self, weather_service, marine_service):
+        """Test analysis_date becomes a start/end date range."""
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        
+        pipeline.detect_location(-21.1151, 55.5364, analysis_date="2024-01-15")
+        
+        kwargs = weather_service.get_forecast.call_args.kwargs
+        assert kwargs["start_date"] == kwargs["end_date"] == "2024-01-15"
+        pipeline.close()
+    
+    def test_horizon_uses_fetched_days(self, weather_service, marine_service):
+        """Test horizon mode scores the fetched days without extra calls."""
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        
+        result = pipeline.detect_location(-21.1151, 55.5364, horizon=True)
+        
+        assert result["horizon"]["days"] == 1
+        assert weather_service.get_forecast.call_count == 1
+        pipeline.close()
+
+
+class TestDetectMany:
+    """Test detect_many method."""
+    
+    def test_detect_many_uses_batched_fetch(self, weather_service, marine_service):
+        """Test several locations share one batched call per source."""
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        
+        results = pipeline.detect_many([(-21.1, 55.5), (-20.2, 57.5)])
+        
+        assert len(results) == 2
+        assert weather_service.get_forecast_many.call_count == 1
+        assert marine_service.get_marine_forecast_many.call_count == 1
+        assert all(r["details"]["marine_data_available"] for r in results)
+        pipeline.close()
+    
+    def test_detect_many_reads_frames(self, weather_service, marine_service, cyclone_conditions):
+        """Test frames are requested and score the same as their dict view."""
+        frame = to_frame(cyclone_conditions)
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        locations = [(-21.1, 55.5), (-20.2, 57.5)]
+        weather_service.get_forecast_many.side_effect = lambda locations, **kwargs: [frame.to_dict()] * len(locations)
+        expected = pipeline.detect_many(locations)
+        weather_service.get_forecast_many.side_effect = lambda locations, **kwargs: [frame] * len(locations)
+        
+        results = pipeline.detect_many(locations)
+        
+        assert weather_service.get_forecast_many.call_args.kwargs["as_frame"] is True
+        assert [r["severity_score"] for r in results] == [r["severity_score"] for r in expected]
+        assert [r["conditions"] for r in results] == [r["conditions"] for r in expected]
+        pipeline.close()
+    
+    def test_detect_many_groups_by_date(self, weather_service, marine_service):
+        """Test one batched call per distinct analysis date."""
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        
+        results = pipeline.detect_many(
+            [(-21.1, 55.5), (-20.2, 57.5), (-12.8, 45.2)],
+            analysis_dates=["2024-01-15", None, "2024-01-15"]
+        )
+        
+        assert len(results) == 3
+        calls = {
+            call.kwargs.get("start_date"): call.args[0]
+            for call in weather_service.get_forecast_many.call_args_list
+        }
+        assert calls == {"2024-01-15": [(-21.1, 55.5), (-12.8, 45.2)], None: [(-20.2, 57.5)]}
+        assert marine_service.get_marine_forecast_many.call_count == 2
+        pipeline.close()
+    
+    def test_detect_many_weather_error_per_location(self, weather_service, marine_service, cyclone_conditions):
+        """Test a failed date group only fails its own locations."""
+        def forecast_many(locations, **kwargs):
+            if kwargs.get("start_date"):
+                raise APIError("archive down")
+            return [cyclone_conditions] * len(locations)
+        
+        weather_service.get_forecast_many.side_effect = forecast_many
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        
+        results = pipeline.detect_many([(-21.1, 55.5), (-20.2, 57.5)], analysis_dates=["2024-01-15", None])
+        
+        assert isinstance(results[0], APIError)
+        assert "category" in results[1]
+        pipeline.close()
+    
+    def test_detect_many_weather_deadline_per_location(self, weather_service, marine_service):
+        """Test a weather leg missing the deadline fails its locations with TimeoutError."""
+        release = threading.Event()
+        weather_service.get_forecast_many.side_effect = lambda locations, **kwargs: release.wait(2)
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        
+        results = pipeline.detect_many([(-21.1, 55.5)], deadline=0.1)
+        release.set()
+        
+        assert isinstance(results[0], CustomTimeoutError)
+        pipeline.close()
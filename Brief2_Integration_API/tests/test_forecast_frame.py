@@ -0,0 +1,153 @@
+"""
+Tests for the columnar forecast representation.
+
+This module tests the vectorized hourly to daily aggregation and checks
+that the ForecastFrame dict view matches the per-day parsing it replaces.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.services.forecast_frame import ForecastFrame, aggregate_hourly
+from src.utils.error_handler import DataNotFoundError
+
+
+def reference_parse(response, latitude, longitude):
+    """Per-day loop parsing, as WeatherService did before ForecastFrame."""
+    daily = response["daily"]
+    hourly_pressure = response.get("hourly", {}).get("surface_pressure", [])
+    
+    forecast_list = []
+    for i in range(len(daily["time"])):
+        day_pressures = hourly_pressure[i * 24:(i + 1) * 24]
+        valid_pressures = [p for p in day_pressures if p is not None]
+        avg_pressure = sum(valid_pressures) / len(valid_pressures) if valid_pressures else None
+        
+        wind_gusts = None
+        if "wind_gusts_10m_max" in daily and daily["wind_gusts_10m_max"][i] is not None:
+            wind_gusts = daily["wind_gusts_10m_max"][i]
+        elif daily["wind_speed_10m_max"][i] is not None:
+            wind_gusts = daily["wind_speed_10m_max"][i] * 1.4
+        
+        forecast_list.append({
+            "date": daily["time"][i],
+            "temperature_2m_max": daily["temperature_2m_max"][i],
+            "temperature_2m_min": daily["temperature_2m_min"][i],
+            "surface_pressure": avg_pressure,
+            "wind_speed_10m_max": daily["wind_speed_10m_max"][i],
+            "wind_gusts_10m_max": wind_gusts
+        })
+    
+    return {
+        "location": {"latitude": latitude, "longitude": longitude},
+        "forecast": forecast_list
+    }
+
+
+def random_response(days, hours, with_gusts, seed):
+    """Build a forecast response with random values and missing entries."""
+    rng = random.Random(seed)
+    
+    def values(count, low, high):
+        return [None if rng.random() < 0.15 else round(rng.uniform(low, high), 1) for _ in range(count)]
+    
+    daily = {
+        "time": [f"2024-01-{day + 1:02d}" for day in range(days)],
+        "temperature_2m_max": values(days, 20, 35),
+        "temperature_2m_min": values(days, 10, 25),
+        "wind_speed_10m_max": values(days, 0, 200),
+    }
+    if with_gusts:
+        daily["wind_gusts_10m_max"] = values(days, 0, 250)
+    
+    return {"daily": daily, "hourly": {"surface_pressure": values(hours, 950, 1030)}}
+
+
+class TestAggregateHourly:
+    """Test aggregate_hourly."""
+    
+    def test_daily_statistics(self):
+        """Test mean/min/max per 24-hour block."""
+        hourly = np.concatenate([np.arange(24.0), np.full(24, 1000.0)])
+        
+        mean, minimum, maximum = aggregate_hourly(hourly, 2)
+        
+        assert mean.tolist() == [11.5, 1000.0]
+        assert minimum.tolist() == [0.0, 1000.0]
+        assert maximum.tolist() == [23.0, 1000.0]
+    
+    def test_missing_hours_ignored(self):
+        """Test NaN hours are skipped and empty days are NaN."""
+        hourly = np.array([np.nan] * 23 + [990.0] + [np.nan] * 24)
+        
+        mean, minimum, maximum = aggregate_hourly(hourly, 3)
+        
+        assert mean[0] == minimum[0] == maximum[0] == 990.0
+        assert np.isnan(mean[1:]).all()
+        assert np.isnan(minimum[1:]).all()
+        assert np.isnan(maximum[1:]).all()
+
+
+class TestForecastFrame:
+    """Test ForecastFrame parsing and dict view."""
+    
+    @pytest.mark.parametrize("days,hours,with_gusts", [
+        (7, 168, True),
+        (7, 168, False),
+        (16, 200, True),   # Fewer hours than days * 24
+        (3, 100, True),    # More hours than days * 24
+        (1, 0, False),     # No hourly data
+    ])
+    def test_dict_view_matches_reference(self, days, hours, with_gusts):
+        """Test the dict view is identical to the per-day loop output."""
+        for seed in range(5):
+            response = random_response(days, hours, with_gusts, seed)
+            
+            frame = ForecastFrame.from_response(response, -21.1, 55.5)
+            
+            assert frame.to_dict() == reference_parse(response, -21.1, 55.5)
+    
+    def test_columns_and_mask(self, mock_weather_response):
+        """Test columns are float arrays with a NaN mask."""
+        response = dict(mock_weather_response)
+        response["daily"] = dict(response["daily"], temperature_2m_max=[28.5, None, 29.1])
+        
+        frame = ForecastFrame.from_response(response, -21.1, 55.5)
+        
+        assert len(frame) == 3
+        assert frame["temperature_2m_max"].dtype == np.float64
+        assert frame.mask["temperature_2m_max"].tolist() == [False, True, False]
+        assert "surface_pressure_min" in frame.columns
+    
+    def test_head_limits_rows(self, mock_weather_response):
+        """Test head keeps the first rows only."""
+        frame = ForecastFrame.from_response(mock_weather_response, -21.1, 55.5)
+        
+        assert len(frame.head(1)) == 1
+        assert frame.head(1).to_dict()["forecast"] == frame.to_dict()["forecast"][:1]
+    
+    def test_stale_marker_carried(self, mock_weather_response):
+        """Test a stale response marks the frame and its dict view."""
+        response = dict(mock_weather_response, stale=True, stale_age=120.0)
+        
+        frame = ForecastFrame.from_response(response, -21.1, 55.5)
+        
+        assert frame.stale and frame.head(1).stale
+        assert frame.to_dict()["stale"] is True
+        assert frame.to_dict()["stale_age"] == 120.0
+        assert "stale" not in ForecastFrame.from_response(mock_weather_response, -21.1, 55.5).to_dict()
+    
+    def test_missing_field(self):
+        """Test a missing required field raises DataNotFoundError."""
+        with pytest.raises(DataNotFoundError):
+            ForecastFrame.from_response({"daily": {"time": ["2024-01-15"]}}, 0, 0)
+    
+    def test_short_column(self, mock_weather_response):
+        """Test a column shorter than the dates raises DataNotFoundError."""
+        response = dict(mock_weather_response)
+        response["daily"] = dict(response["daily"], wind_speed_10m_max=[10.0])
+        
+        with pytest.raises(DataNotFoundError):
+            ForecastFrame.from_response(response, 0, 0)
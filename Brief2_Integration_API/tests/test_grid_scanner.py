@@ -0,0 +1,320 @@
+"""
+Tests for GridScanner.
+
+This module tests the grid tiling, the bounded concurrent batch fetch,
+the vectorized scoring and the .npy/GeoJSON output.
+"""
+
+import json
+import threading
+import time
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from src.config.settings import settings
+from src.services.cyclone_detector import CycloneDetector
+from src.services.grid_scanner import GridScanner, build_grid, MISSING_CATEGORY
+from src.services.weather_service import WeatherService
+from src.utils.error_handler import APIError, ValidationError
+from src.utils.land_mask import LandSeaMask, rasterize_land
+from tests.conftest import to_frame
+
+
+def forecast_for(latitude, longitude, days=2):
+    """Build a forecast whose pressure and wind depend on the cell."""
+    return {
+        "location": {"latitude": latitude, "longitude": longitude},
+        "forecast": [
+            {
+                "date": f"2024-01-{15 + day}",
+                "temperature_2m_max": 30.0,
+                "temperature_2m_min": 25.0,
+                "surface_pressure": 1000.0 - 10 * latitude - day,
+                "wind_speed_10m_max": 40.0 + 20 * longitude + day,
+                "wind_gusts_10m_max": 60.0 + 20 * longitude
+            }
+            for day in range(days)
+        ]
+    }
+
+
+@pytest.fixture
+def weather_service():
+    """Weather service mock answering every batch from forecast_for."""
+    service = Mock()
+    service.get_forecast_many.side_effect = lambda cells, **kwargs: [
+        to_frame(forecast_for(latitude, longitude, kwargs["forecast_days"])) for latitude, longitude in cells
+    ]
+    return service
+
+
+class TestBuildGrid:
+    """Test build_grid."""
+    
+    def test_bounds_included(self):
+        """Test both bounds are cell centers."""
+        latitudes, longitudes = build_grid((-1.0, 0.0, 10.0, 11.0), 0.25)
+        
+        assert latitudes.tolist() == [-1.0, -0.75, -0.5, -0.25, 0.0]
+        assert longitudes.tolist() == [10.0, 10.25, 10.5, 10.75, 11.0]
+    
+    def test_invalid_resolution(self):
+        """Test a non-positive resolution raises ValidationError."""
+        with pytest.raises(ValidationError):
+            build_grid((0.0, 1.0, 0.0, 1.0), 0)
+    
+    def test_invalid_bbox(self):
+        """Test an inverted latitude range raises ValidationError."""
+        with pytest.raises(ValidationError):
+            build_grid((1.0, 0.0, 0.0, 1.0), 0.5)
+
+
+class TestGridScanner:
+    """Test GridScanner.scan."""
+    
+    def test_scores_match_detect(self, weather_service):
+        """Test each cell and day gets the score detect() gives that day."""
+        detector = CycloneDetector()
+        scanner = GridScanner(weather_service, detector, max_concurrency=2, batch_size=3)
+        
+        result = scanner.scan((0.0, 2.0, 0.0, 3.0), resolution=1.0, forecast_days=2)
+        
+        assert result.severity.shape == (2, 3, 4)
+        assert result.dates == ["2024-01-15", "2024-01-16"]
+        for i, latitude in enumerate(result.latitudes):
+            for j, longitude in enumerate(result.longitudes):
+                forecast = forecast_for(float(latitude), float(longitude))
+                for day in range(2):
+                    single = detector.detect({
+                        "location": forecast["location"],
+                        "forecast": forecast["forecast"][day:day + 1]
+                    })
+                    assert result.severity[day, i, j] == single["severity_score"]
+    
+    def test_batches_and_concurrency_bounded(self, weather_service):
+        """Test cells are fetched in batches with at most max_concurrency in flight."""
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+        answer = weather_service.get_forecast_many.side_effect
+        
+        def slow_batch(cells, **kwargs):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.02)
+            with lock:
+                in_flight.pop()
+            return answer(cells, **kwargs)
+        
+        weather_service.get_forecast_many.side_effect = slow_batch
+        scanner = GridScanner(weather_service, max_concurrency=2, batch_size=5)
+        
+        scanner.scan((0.0, 4.0, 0.0, 4.0), resolution=1.0, forecast_days=1)
+        
+        batches = weather_service.get_forecast_many.call_args_list
+        assert len(batches) == 5
+        assert all(len(call.args[0]) == 5 for call in batches)
+        assert max(peak) <= 2
+    
+    def test_failed_batch_leaves_cells_missing(self, weather_service):
+        """Test cells of a failing batch get NaN severity and no category."""
+        answer = weather_service.get_forecast_many.side_effect
+        
+        def failing_first(cells, **kwargs):
+            if cells[0] == (0.0, 0.0):
+                raise APIError("upstream down")
+            return answer(cells, **kwargs)
+        
+        weather_service.get_forecast_many.side_effect = failing_first
+        scanner = GridScanner(weather_service, max_concurrency=1, batch_size=2)
+        
+        result = scanner.scan((0.0, 1.0, 0.0, 1.0), resolution=1.0, forecast_days=1)
+        
+        assert result.failed_cells == 2
+        assert np.isnan(result.severity[0, 0]).all()
+        assert (result.category_code[0, 0] == MISSING_CATEGORY).all()
+        assert not np.isnan(result.severity[0, 1]).any()
+    
+    def test_save_npy_and_geojson(self, weather_service, tmp_path):
+        """Test the peak grid and the GeoJSON cells are written."""
+        scanner = GridScanner(weather_service, max_concurrency=2)
+        result = scanner.scan((0.0, 1.0, 0.0, 2.0), resolution=1.0, forecast_days=2)
+        
+        npy_path, geojson_path = result.save(str(tmp_path / "scan"))
+        
+        grid = np.load(npy_path)
+        assert grid.shape == (2, 3)
+        np.testing.assert_array_equal(grid, result.severity.max(axis=0))
+        
+        geojson = json.loads(geojson_path.read_text())
+        assert geojson["type"] == "FeatureCollection"
+        assert len(geojson["features"]) == 6
+        feature = geojson["features"][0]
+        assert feature["geometry"]["coordinates"][0][0] == [-0.5, -0.5]
+        assert feature["properties"]["severity_score"] == grid[0, 0]
+
+
+def hotspot_forecast(latitude, longitude, days=1):
+    """Build a forecast with a deep low centered on (-20, 55)."""
+    distance = abs(latitude + 20) + abs(longitude - 55)
+    strength = max(0.0, 1 - distance / 8)
+    return {
+        "location": {"latitude": latitude, "longitude": longitude},
+        "forecast": [
+            {
+                "date": f"2024-01-{15 + day}",
+                "temperature_2m_max": 28.0,
+                "temperature_2m_min": 24.0,
+                "surface_pressure": 1012.0 - 100 * strength,
+                "wind_speed_10m_max": 30.0 + 220 * strength,
+                "wind_gusts_10m_max": 40.0 + 260 * strength
+            }
+            for day in range(days)
+        ]
+    }
+
+
+@pytest.fixture
+def hotspot_service():
+    """Weather service mock answering with a single hotspot, one request per batch."""
+    def forecast_many(cells, forecast_days, stats=None, **kwargs):
+        if stats is not None:
+            stats["requests"] = stats.get("requests", 0) + 1
+        return [to_frame(hotspot_forecast(latitude, longitude, forecast_days)) for latitude, longitude in cells]
+    
+    service = Mock()
+    service.get_forecast_many.side_effect = forecast_many
+    return service
+
+
+class TestAdaptiveScan:
+    """Test GridScanner.scan_adaptive."""
+    
+    def _scan(self, service, **kwargs):
+        scanner = GridScanner(service, max_concurrency=2, batch_size=10)
+        return scanner.scan_adaptive(
+            (-30.0, -10.0, 45.0, 65.0),
+            coarse_resolution=4.0,
+            min_resolution=0.5,
+            severity_threshold=0.2,
+            gradient_threshold=100.0,
+            forecast_days=1,
+            **kwargs
+        )
+    
+    def test_refines_only_around_hotspot(self, hotspot_service):
+        """Test only cells near the hotspot reach the finest level."""
+        result = self._scan(hotspot_service)
+        cells = result.cells
+        
+        finest = cells["level"] == 3
+        distance = np.abs(cells["latitude"] + 20) + np.abs(cells["longitude"] - 55)
+        assert finest.any()
+        assert (distance[finest] < 8).all()
+        assert not cells["refined"][(cells["level"] == 0) & (distance >= 10)].any()
+        assert result.finest_resolution == 0.5
+    
+    def test_leaves_tile_the_box(self, hotspot_service):
+        """Test leaf cells cover the box exactly once."""
+        result = self._scan(hotspot_service)
+        
+        dense = result.to_dense()
+        sizes = result.cells["size"][result.leaves]
+        
+        assert dense.shape == (48, 48)  # 6x6 coarse cells of 4° at 0.5°
+        assert not np.isnan(dense).any()
+        assert float((sizes ** 2).sum()) == 24.0 * 24.0
+    
+    def test_call_report_against_uniform_grid(self, hotspot_service):
+        """Test far fewer cells and calls than the uniform finest grid."""
+        result = self._scan(hotspot_service)
+        report = result.call_report()
+        
+        assert report["uniform_cells"] == 48 * 48
+        assert report["uniform_calls"] == -(-48 * 48 // 10)
+        assert report["cells_fetched"] == len(result.cells["level"])
+        assert report["calls"] == hotspot_service.get_forecast_many.call_count
+        assert report["calls"] * 5 < report["uniform_calls"]
+    
+    def test_calls_count_split_requests(self, mock_api_client, mock_weather_response, monkeypatch):
+        """Test the call report counts the requests a batch is split into."""
+        def respond(url, params, deadline=None):
+            count = len(params["latitude"].split(","))
+            return [mock_weather_response] * count if count > 1 else mock_weather_response
+        
+        monkeypatch.setattr(settings, "MAX_LOCATIONS_PER_REQUEST", 10)
+        mock_api_client.get.side_effect = respond
+        scanner = GridScanner(WeatherService(mock_api_client, snap_resolution=0), batch_size=100)
+        
+        result = scanner.scan_adaptive(
+            (-30.0, -10.0, 45.0, 65.0), coarse_resolution=4.0, min_resolution=4.0, forecast_days=1
+        )
+        
+        assert result.call_report()["calls"] == mock_api_client.get.call_count == 4
+    
+    def test_pressure_gradient_triggers_refinement(self, hotspot_service):
+        """Test a steep pressure gradient alone triggers refinement."""
+        scanner = GridScanner(hotspot_service, batch_size=10)
+        
+        result = scanner.scan_adaptive(
+            (-30.0, -10.0, 45.0, 65.0),
+            coarse_resolution=4.0,
+            min_resolution=2.0,
+            severity_threshold=2.0,  # Never reached
+            gradient_threshold=5.0,
+            forecast_days=1
+        )
+        
+        coarse = result.cells["level"] == 0
+        assert result.cells["refined"][coarse].any()
+        assert (result.cells["pressure_gradient"][coarse][result.cells["refined"][coarse]] >= 5.0).all()
+    
+    def test_save_outputs(self, hotspot_service, tmp_path):
+        """Test the rasterized grid and leaf GeoJSON are written."""
+        result = self._scan(hotspot_service)
+        
+        npy_path, geojson_path = result.save(str(tmp_path / "adaptive"), min_severity=0.2)
+        
+        assert np.load(npy_path).shape == (48, 48)
+        features = json.loads(geojson_path.read_text())["features"]
+        assert features
+        assert all(feature["properties"]["severity_score"] >= 0.2 for feature in features)
+    
+    def test_land_centered_cell_refined(self, hotspot_service):
+        """Test the water around an island under a coarse cell center is still scanned."""
+        island = [[54.5, -20.5], [55.5, -20.5], [55.5, -19.5], [54.5, -19.5], [54.5, -20.5]]
+        land_mask = LandSeaMask(rasterize_land([island], 0.5))
+        scanner = GridScanner(hotspot_service, batch_size=10, land_mask=land_mask)
+        
+        result = scanner.scan_adaptive(
+            (-20.0, -20.0, 55.0, 55.0),
+            coarse_resolution=4.0,
+            min_resolution=0.5,
+            severity_threshold=0.2,
+            gradient_threshold=100.0,
+            forecast_days=1
+        )
+        
+        assert hotspot_service.get_forecast_many.called
+        assert int(np.isfinite(result.to_dense()).sum()) == 64 - 4
+        assert result.cells["refined"][result.cells["level"] == 0].all()
+    
+    def test_all_land_cell_skipped(self, hotspot_service):
+        """Test a cell entirely on land is neither fetched nor refined."""
+        island = [[52.0, -23.0], [58.0, -23.0], [58.0, -17.0], [52.0, -17.0], [52.0, -23.0]]
+        land_mask = LandSeaMask(rasterize_land([island], 0.5))
+        scanner = GridScanner(hotspot_service, batch_size=10, land_mask=land_mask)
+        
+        result = scanner.scan_adaptive((-20.0, -20.0, 55.0, 55.0), coarse_resolution=4.0, min_resolution=0.5)
+        
+        hotspot_service.get_forecast_many.assert_not_called()
+        assert result.cells["land"].tolist() == [True]
+        assert result.cells["refined"].tolist() == [False]
+    
+    def test_min_resolution_above_coarse(self, hotspot_service):
+        """Test an inverted resolution pair raises ValidationError."""
+        with pytest.raises(ValidationError):
+            GridScanner(hotspot_service).scan_adaptive(coarse_resolution=1.0, min_resolution=2.0)
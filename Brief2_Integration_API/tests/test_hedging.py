@@ -0,0 +1,185 @@
+"""
+Tests for latency tracking and hedged requests.
+
+This module tests the rolling latency percentiles, the hedge budget and
+the hedging integration in APIClient.
+"""
+
+import threading
+import time
+
+from unittest.mock import Mock
+
+from src.utils.hedging import HedgeBudget, LatencyTracker
+from src.utils.rate_limiter import TokenBucketRateLimiter
+from tests.conftest import make_client, make_response
+
+
+class TestLatencyTracker:
+    """Test LatencyTracker."""
+    
+    def test_percentile_needs_min_samples(self):
+        """Test no percentile is reported before min_samples."""
+        tracker = LatencyTracker(window=10, min_samples=3)
+        tracker.record("https://a", 0.1)
+        tracker.record("https://a", 0.2)
+        
+        assert tracker.percentile("https://a", 95) is None
+    
+    def test_percentile_nearest_rank(self):
+        """Test the nearest-rank percentile over the rolling window."""
+        tracker = LatencyTracker(window=100, min_samples=1)
+        for ms in range(1, 101):
+            tracker.record("https://a", ms / 1000)
+        
+        assert tracker.percentile("https://a", 95) == 0.095
+        assert tracker.percentile("https://a", 50) == 0.05
+    
+    def test_window_drops_old_samples(self):
+        """Test only the last `window` samples are kept per endpoint."""
+        tracker = LatencyTracker(window=2, min_samples=1)
+        for seconds in (5.0, 0.1, 0.2):
+            tracker.record("https://a", seconds)
+        tracker.record("https://b", 9.0)
+        
+        assert tracker.percentile("https://a", 100) == 0.2
+        assert tracker.snapshot()["https://b"]["samples"] == 1
+
+
+class TestHedgeBudget:
+    """Test HedgeBudget."""
+    
+    def test_hedges_bounded_by_ratio(self):
+        """Test hedges never exceed ratio of the requests."""
+        budget = HedgeBudget(ratio=0.25, max_tokens=5)
+        
+        hedges = 0
+        for _ in range(100):
+            budget.record_request()
+            hedges += budget.try_acquire()
+        
+        assert hedges == 25
+        assert budget.stats()["hedges"] == 25
+    
+    def test_no_hedge_without_tokens(self):
+        """Test a fresh budget does not allow a hedge."""
+        assert not HedgeBudget(ratio=0.5).try_acquire()
+
+
+class TestAPIClientHedging:
+    """Test hedged requests in APIClient."""
+    
+    def _client(self, budget, get, rate_limiter=None):
+        """Build a hedging client whose worker sessions all send through get."""
+        client = make_client(timeout=5, hedging=True, hedge_budget=budget, rate_limiter=rate_limiter)
+        client.latency_tracker = LatencyTracker(window=10, min_samples=1)
+        client.latency_tracker.record("https://a", 0.05)
+        sent = Mock(side_effect=get)
+        sessions = []
+        
+        def new_session():
+            session = Mock()
+            session.get = lambda *args, **kwargs: sent(session, *args, **kwargs)
+            sessions.append(session)
+            return session
+        
+        client._new_session = new_session
+        return client, sent, sessions
+    
+    def test_slow_request_is_hedged(self):
+        """Test a duplicate is sent after p95 and the first answer wins."""
+        release = threading.Event()
+        
+        def get(session, url, params=None, timeout=None):
+            if sent.call_count == 1:
+                release.wait(2)  # Stuck primary
+                return make_response(200, {"from": "primary"})
+            return make_response(200, {"from": "hedge"})
+        
+        client, sent, sessions = self._client(HedgeBudget(ratio=1, max_tokens=1), get)
+        
+        start = time.monotonic()
+        result = client.get("https://a")
+        
+        assert result == {"from": "hedge"}
+        assert sent.call_count == 2
+        assert time.monotonic() - start < 1
+        release.set()
+        client.close()
+    
+    def test_hedge_workers_use_own_sessions(self):
+        """Test the two requests are sent through distinct worker sessions."""
+        release = threading.Event()
+        
+        def get(session, url, params=None, timeout=None):
+            if sent.call_count == 1:
+                release.wait(2)
+            return make_response(200)
+        
+        client, sent, sessions = self._client(HedgeBudget(ratio=1, max_tokens=1), get)
+        client.session.get = Mock()
+        
+        client.get("https://a")
+        release.set()
+        client.close()
+        
+        used = [call.args[0] for call in sent.call_args_list]
+        assert len(used) == 2 and used[0] is not used[1]
+        assert all(session in sessions for session in used)
+        client.session.get.assert_not_called()
+        assert all(session.close.called for session in sessions)
+    
+    def test_primary_latency_tracked_after_hedge_wins(self):
+        """Test the slow primary's own latency is recorded, not the hedge's."""
+        def get(session, url, params=None, timeout=None):
+            if sent.call_count == 1:
+                time.sleep(0.3)  # Slow primary
+            return make_response(200)
+        
+        client, sent, sessions = self._client(HedgeBudget(ratio=1, max_tokens=1), get)
+        
+        client.get("https://a")
+        deadline = time.monotonic() + 2
+        while client.latency_tracker.snapshot()["https://a"]["samples"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        client.close()
+        
+        assert sent.call_count == 2
+        assert client.latency_tracker.snapshot()["https://a"]["samples"] == 2
+        assert client.latency_tracker.percentile("https://a", 100) >= 0.3
+    
+    def test_no_hedge_when_budget_exhausted(self):
+        """Test the slow request is awaited when the budget is empty."""
+        def get(session, url, params=None, timeout=None):
+            time.sleep(0.1)
+            return make_response(200, {"from": "primary"})
+        
+        client, sent, sessions = self._client(HedgeBudget(ratio=0, max_tokens=1), get)
+        
+        assert client.get("https://a") == {"from": "primary"}
+        assert sent.call_count == 1
+        client.close()
+    
+    def test_no_hedge_without_rate_limit_token(self):
+        """Test the duplicate is not sent when the rate limiter has no token ready."""
+        limiter = TokenBucketRateLimiter(rate=1, capacity=1)
+        
+        def get(session, url, params=None, timeout=None):
+            time.sleep(0.1)
+            return make_response(200, {"from": "primary"})
+        
+        client, sent, sessions = self._client(HedgeBudget(ratio=1, max_tokens=1), get, rate_limiter=limiter)
+        
+        assert client.get("https://a") == {"from": "primary"}
+        assert sent.call_count == 1
+        client.close()
+    
+    def test_latency_tracked_without_hedging(self):
+        """Test latency is recorded even when hedging is disabled."""
+        client = make_client(hedging=False)
+        client.session.get = Mock(return_value=make_response(200, {"ok": True}))
+        
+        client.get("https://a")
+        
+        assert client.latency_tracker.snapshot()["https://a"]["samples"] == 1
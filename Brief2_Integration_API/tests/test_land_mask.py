@@ -0,0 +1,153 @@
+"""
+Tests for the land/sea mask.
+
+This module tests the rasterization, the memory-mapped lookup and the
+inland short-circuit in MarineService and GridScanner.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from src.services.grid_scanner import GridScanner
+from src.services.marine_service import MarineService
+from src.utils.error_handler import ConfigurationError, DataNotFoundError
+from src.utils.land_mask import LandSeaMask, rasterize_land, read_geojson_rings
+from tests.conftest import to_frame
+
+
+# Rough box around Madagascar with a lake carved out
+ISLAND = [[43.0, -25.5], [50.5, -25.5], [50.5, -12.0], [43.0, -12.0], [43.0, -25.5]]
+LAKE = [[46.0, -20.0], [47.0, -20.0], [47.0, -19.0], [46.0, -19.0], [46.0, -20.0]]
+
+
+@pytest.fixture
+def land_mask():
+    """Land mask with one island at 0.5° resolution."""
+    return LandSeaMask(rasterize_land([ISLAND, LAKE], 0.5))
+
+
+class TestLandSeaMask:
+    """Test rasterization and lookup."""
+    
+    def test_lookup(self, land_mask):
+        """Test land, lake and ocean points."""
+        assert land_mask.is_land(-18.8792, 47.5079)  # Antananarivo
+        assert not land_mask.is_land(-19.5, 46.5)  # Lake
+        assert not land_mask.is_land(-21.1151, 55.5364)  # La Réunion offshore (0.5° cells)
+        assert not land_mask.is_land(-11.6986, 43.2551)  # Moroni, north of the box
+    
+    def test_lookup_edges(self, land_mask):
+        """Test the grid edges map to valid cells."""
+        assert not land_mask.is_land(90.0, 180.0)
+        assert not land_mask.is_land(-90.0, -180.0)
+    
+    def test_vectorized_lookup(self, land_mask):
+        """Test is_land_many agrees with is_land."""
+        latitudes = np.linspace(-30, -10, 41)
+        longitudes = np.linspace(40, 60, 41)
+        lat_grid, lon_grid = np.meshgrid(latitudes, longitudes)
+        
+        land = land_mask.is_land_many(lat_grid, lon_grid)
+        
+        expected = [[land_mask.is_land(lat, lon) for lat, lon in zip(row_lat, row_lon)]
+                    for row_lat, row_lon in zip(lat_grid, lon_grid)]
+        assert land.tolist() == expected
+    
+    def test_all_land_footprint(self, land_mask):
+        """Test a cell is all land only when its whole footprint is."""
+        all_land = land_mask.is_all_land_many([-22.0, -22.0, -19.5, -12.5], [47.0, 43.5, 46.5, 47.0], 2.0)
+        
+        assert all_land.tolist() == [True, False, False, False]  # Inland, coast, lake, north coast
+    
+    def test_load_memory_mapped(self, land_mask, tmp_path):
+        """Test a saved raster is opened memory-mapped."""
+        path = tmp_path / "land_mask.npy"
+        np.save(path, land_mask.grid)
+        
+        loaded = LandSeaMask.load(str(path))
+        
+        assert isinstance(loaded.grid, np.memmap)
+        assert loaded.resolution == 0.5
+        assert loaded.is_land(-18.8792, 47.5079)
+    
+    def test_invalid_shape(self):
+        """Test a non-global raster raises ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            LandSeaMask(np.zeros((10, 10), dtype=np.uint8))
+    
+    def test_read_geojson_rings(self, tmp_path):
+        """Test Polygon and MultiPolygon rings are collected."""
+        path = tmp_path / "land.geojson"
+        path.write_text(json.dumps({
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature", "geometry": {"type": "Polygon", "coordinates": [ISLAND, LAKE]}},
+                {"type": "Feature", "geometry": {"type": "MultiPolygon", "coordinates": [[ISLAND]]}},
+            ]
+        }))
+        
+        assert len(read_geojson_rings(str(path))) == 3
+
+
+class TestInlandSkipping:
+    """Test services skip inland points."""
+    
+    def test_marine_inland_no_api_call(self, land_mask):
+        """Test an inland marine request fails without calling the API."""
+        client = Mock()
+        service = MarineService(client, land_mask=land_mask)
+        
+        with pytest.raises(DataNotFoundError):
+            service.get_marine_forecast(-18.8792, 47.5079)
+        with pytest.raises(DataNotFoundError):
+            service.get_sst(-18.8792, 47.5079)
+        client.get.assert_not_called()
+    
+    def test_marine_many_skips_inland(self, land_mask, mock_marine_response):
+        """Test inland locations are left out of batched requests."""
+        client = Mock()
+        client.get.return_value = [mock_marine_response, mock_marine_response]
+        service = MarineService(client, land_mask=land_mask, snap_resolution=0)
+        locations = [(-21.1151, 55.5364), (-18.8792, 47.5079), (-20.1609, 57.5012)]
+        
+        results = service.get_marine_forecast_many(locations, forecast_days=1, return_exceptions=True)
+        
+        params = client.get.call_args.kwargs["params"]
+        assert params["latitude"] == "-21.1151,-20.1609"
+        assert isinstance(results[1], DataNotFoundError)
+        assert "marine_forecast" in results[0] and "marine_forecast" in results[2]
+    
+    def test_marine_many_inland_raises(self, land_mask):
+        """Test an inland location fails the batch without return_exceptions."""
+        client = Mock()
+        service = MarineService(client, land_mask=land_mask)
+        
+        with pytest.raises(DataNotFoundError):
+            service.get_marine_forecast_many([(-18.8792, 47.5079)])
+        client.get.assert_not_called()
+    
+    def test_grid_scan_drops_land_cells(self, land_mask):
+        """Test land cells are neither fetched nor scored."""
+        weather_service = Mock()
+        weather_service.get_forecast_many.side_effect = lambda cells, **kwargs: [
+            to_frame({"location": {}, "forecast": [{
+                "date": "2024-01-15",
+                "temperature_2m_max": 28.0,
+                "temperature_2m_min": 24.0,
+                "surface_pressure": 1010.0,
+                "wind_speed_10m_max": 20.0
+            }]})
+            for _ in cells
+        ]
+        scanner = GridScanner(weather_service, land_mask=land_mask, batch_size=100)
+        
+        result = scanner.scan((-20.0, -18.0, 44.0, 54.0), resolution=1.0, forecast_days=1)
+        
+        fetched = [cell for call in weather_service.get_forecast_many.call_args_list for cell in call.args[0]]
+        assert all(not land_mask.is_land(lat, lon) for lat, lon in fetched)
+        assert result.land.sum() + len(fetched) == 3 * 11
+        assert np.isnan(result.severity[0][result.land]).all()
+        assert result.failed_cells == 0
@@ -91,3 +91,37 @@ class TestMarineServiceGetSST:
         assert result["location"]["latitude"] == valid_coordinates["latitude"]
         assert "sst" in result
         assert "date" in result["sst"]
+
+
+class TestMarineServiceGetForecastMany:
+    """Test get_marine_forecast_many method."""
+    
+    def test_get_marine_forecast_many(self, mock_api_client, mock_marine_response):
+        """Test batched marine forecasts are parsed per location."""
+        mock_api_client.get.return_value = [mock_marine_response, mock_marine_response]
+        service = MarineService(api_client=mock_api_client)
+        
+        results = service.get_marine_forecast_many([(-21.1, 55.5), (-20.2, 57.5)], forecast_days=2)
+        
+        assert mock_api_client.get.call_count == 1
+        assert results[1]["location"]["longitude"] == 57.5
+        assert len(results[0]["marine_forecast"]) == 2
+    
+    def test_get_marine_forecast_many_mismatched_response(self, mock_api_client, mock_marine_response):
+        """Test a response with the wrong number of locations is rejected."""
+        mock_api_client.get.return_value = [mock_marine_response]
+        service = MarineService(api_client=mock_api_client)
+        
+        with pytest.raises(DataNotFoundError):
+            service.get_marine_forecast_many([(-21.1, 55.5), (-20.2, 57.5)])
+    
+    def test_get_marine_forecast_many_snaps_to_grid(self, mock_api_client, mock_marine_response):
+        """Test points in the same marine grid cell share one coordinate."""
+        mock_api_client.get.return_value = mock_marine_response
+        service = MarineService(api_client=mock_api_client, snap_resolution=0.25)
+        
+        results = service.get_marine_forecast_many([(-21.1151, 55.5364), (-21.05, 55.45)], forecast_days=2)
+        
+        params = mock_api_client.get.call_args.kwargs["params"]
+        assert (params["latitude"], params["longitude"]) == ("-21.0", "55.5")
+        assert results[1]["location"] == {"latitude": -21.05, "longitude": 55.45}
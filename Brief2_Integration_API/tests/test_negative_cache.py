@@ -0,0 +1,174 @@
+"""
+Tests for the negative cache.
+
+This module tests per-error-class TTLs and the fail-fast path for known
+bad locations in MarineService.
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.services.marine_service import AsyncMarineService, MarineService
+from src.utils.error_handler import (
+    APIError,
+    CircuitOpenError,
+    DataNotFoundError,
+    RateLimitError,
+    TimeoutError,
+    ValidationError
+)
+from src.utils.negative_cache import NegativeCache
+
+
+URL = "https://marine-api.open-meteo.com/v1/marine"
+PARAMS = {"latitude": -21.1151, "longitude": 55.5364, "daily": ["wave_height_max"]}
+
+
+@pytest.fixture
+def negative_cache():
+    """Negative cache with distinct TTLs per error class."""
+    return NegativeCache(ttls={
+        DataNotFoundError: 3600,
+        ValidationError: 600,
+        RateLimitError: 0,
+        CircuitOpenError: 0,
+        TimeoutError: 0,
+        APIError: 30,
+    })
+
+
+class TestNegativeCache:
+    """Test NegativeCache."""
+    
+    def test_ttl_per_error_class(self, negative_cache):
+        """Test the most specific class in the MRO decides the TTL."""
+        assert negative_cache.ttl_for(DataNotFoundError("empty")) == 3600
+        assert negative_cache.ttl_for(ValidationError("bad")) == 600
+        assert negative_cache.ttl_for(APIError("500")) == 30
+        assert negative_cache.ttl_for(RateLimitError("429")) == 0
+        assert negative_cache.ttl_for(KeyError("x")) == 0
+    
+    def test_remember_and_get(self, negative_cache):
+        """Test a remembered failure comes back as a new error of the same class."""
+        original = DataNotFoundError("Missing field in response: time")
+        
+        assert negative_cache.remember(URL, PARAMS, original)
+        error = negative_cache.get(URL, dict(reversed(list(PARAMS.items()))))
+        
+        assert isinstance(error, DataNotFoundError)
+        assert error is not original
+        assert "Missing field in response: time" in str(error)
+        assert negative_cache.stats() == {"hits": 1, "stored": 1, "entries": 1}
+    
+    def test_uncached_error_classes(self, negative_cache):
+        """Test rate limits, open circuits and timeouts are not remembered."""
+        for error in (RateLimitError("429"), CircuitOpenError("open"), TimeoutError("slow")):
+            assert not negative_cache.remember(URL, PARAMS, error)
+        
+        assert negative_cache.get(URL, PARAMS) is None
+    
+    def test_key_includes_request_parameters(self, negative_cache):
+        """Test other coordinates and dates are not affected."""
+        negative_cache.remember(URL, PARAMS, DataNotFoundError("empty"))
+        
+        assert negative_cache.get(URL, {**PARAMS, "latitude": -20.0}) is None
+        assert negative_cache.get(URL, {**PARAMS, "start_date": "2024-01-01"}) is None
+    
+    def test_expiry(self, negative_cache):
+        """Test failures are forgotten after their TTL."""
+        negative_cache.ttls[APIError] = 0.05
+        negative_cache.remember(URL, PARAMS, APIError("Server error"))
+        
+        assert negative_cache.get(URL, PARAMS) is not None
+        time.sleep(0.06)
+        assert negative_cache.get(URL, PARAMS) is None
+
+
+class TestMarineServiceNegativeCache:
+    """Test MarineService skips known bad locations."""
+    
+    def test_missing_data_not_refetched(self, negative_cache):
+        """Test a DataNotFoundError is answered from the cache on repeat."""
+        client = Mock()
+        client.get.return_value = {"daily": {}}
+        service = MarineService(client, negative_cache=negative_cache)
+        
+        for _ in range(3):
+            with pytest.raises(DataNotFoundError):
+                service.get_marine_forecast(-21.1151, 55.5364, forecast_days=3)
+        
+        assert client.get.call_count == 1
+    
+    def test_transient_error_cached_briefly(self, negative_cache):
+        """Test upstream errors are cached but rate limits are retried."""
+        client = Mock()
+        client.get.side_effect = [RateLimitError("429"), APIError("Server error: 502")]
+        service = MarineService(client, negative_cache=negative_cache)
+        
+        with pytest.raises(RateLimitError):
+            service.get_sst(-21.1151, 55.5364)
+        with pytest.raises(APIError):
+            service.get_sst(-21.1151, 55.5364)
+        with pytest.raises(APIError, match="cached failure"):
+            service.get_sst(-21.1151, 55.5364)
+        
+        assert client.get.call_count == 2
+    
+    def test_forecast_and_sst_cached_separately(self, negative_cache, mock_marine_response):
+        """Test a failed forecast does not block the SST request."""
+        client = Mock()
+        client.get.side_effect = [{"daily": {}}, mock_marine_response]
+        service = MarineService(client, negative_cache=negative_cache)
+        
+        with pytest.raises(DataNotFoundError):
+            service.get_marine_forecast(-21.1151, 55.5364)
+        result = service.get_sst(-21.1151, 55.5364)
+        
+        assert result["sst"]["date"] == mock_marine_response["daily"]["time"][0]
+    
+    def test_many_skips_known_failures(self, negative_cache, mock_marine_response):
+        """Test batch requests leave out locations that failed in a single request."""
+        client = Mock()
+        client.get.return_value = {"daily": {}}
+        service = MarineService(client, negative_cache=negative_cache, snap_resolution=0)
+        with pytest.raises(DataNotFoundError):
+            service.get_marine_forecast(-18.0, 60.0, forecast_days=2)
+        
+        client.get.return_value = [mock_marine_response, mock_marine_response]
+        locations = [(-21.1151, 55.5364), (-18.0, 60.0), (-20.1609, 57.5012)]
+        results = service.get_marine_forecast_many(locations, forecast_days=2, return_exceptions=True)
+        
+        params = client.get.call_args.kwargs["params"]
+        assert params["latitude"] == "-21.1151,-20.1609"
+        assert isinstance(results[1], DataNotFoundError)
+        assert "marine_forecast" in results[0] and "marine_forecast" in results[2]
+    
+    def test_many_remembers_parse_failures(self, negative_cache, mock_marine_response):
+        """Test a location failing inside a batch is skipped by later single requests."""
+        client = Mock()
+        client.get.return_value = [mock_marine_response, {"daily": {}}]
+        service = MarineService(client, negative_cache=negative_cache)
+        
+        results = service.get_marine_forecast_many(
+            [(-21.1151, 55.5364), (-18.0, 60.0)], forecast_days=2, return_exceptions=True
+        )
+        assert isinstance(results[1], DataNotFoundError)
+        
+        with pytest.raises(DataNotFoundError, match="cached failure"):
+            service.get_marine_forecast(-18.0, 60.0, forecast_days=2)
+        assert client.get.call_count == 1
+    
+    def test_async_missing_data_not_refetched(self, negative_cache):
+        """Test the async service shares the fail-fast path."""
+        client = Mock()
+        client.get = AsyncMock(return_value={"daily": {}})
+        service = AsyncMarineService(client, negative_cache=negative_cache)
+        
+        for _ in range(2):
+            with pytest.raises(DataNotFoundError):
+                asyncio.run(service.get_marine_forecast(-21.1151, 55.5364))
+        
+        assert client.get.await_count == 1
@@ -0,0 +1,141 @@
+"""
+Tests for the prefetch scheduler.
+
+This module tests the refresh timing, the refresh report and that a
+refreshed watchlist location is served from the cache afterwards.
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from src.config.settings import settings
+from src.services.detection_pipeline import DetectionPipeline
+from src.services.marine_service import MarineService
+from src.services.prefetch_scheduler import PrefetchScheduler
+from src.services.weather_service import WeatherService
+from src.utils.api_client import APIClient
+from src.utils.cache import LRUCache, ModelRunSchedule, ResponseCache
+from src.utils.error_handler import APIError
+
+WATCHLIST = [("La Réunion", -21.1151, 55.5364), ("Maurice (Île)", -20.1609, 57.5012)]
+
+
+def utc(*args):
+    """Build a time.time() timestamp from UTC date/time fields."""
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def pipeline_mock():
+    """Pipeline mock returning a fresh detection."""
+    pipeline = Mock()
+    pipeline.detect_location.return_value = {"details": {"stale_data": False}}
+    return pipeline
+
+
+class TestRefreshTiming:
+    """Test when refreshes fire."""
+    
+    def test_after_each_publication(self):
+        """Test the refresh follows the next publication by the delay."""
+        schedules = {"https://a": ModelRunSchedule([0, 6, 12, 18], delay_hours=4)}
+        scheduler = PrefetchScheduler(pipeline_mock(), WATCHLIST, schedules=schedules, delay=120)
+        
+        assert scheduler.next_refresh(utc(2024, 1, 15, 3, 0)) == utc(2024, 1, 15, 4, 2)
+        assert scheduler.next_refresh(utc(2024, 1, 15, 4, 1)) == utc(2024, 1, 15, 4, 2)
+        assert scheduler.next_refresh(utc(2024, 1, 15, 4, 2)) == utc(2024, 1, 15, 10, 2)
+    
+    def test_earliest_model_wins(self):
+        """Test a publication of any scheduled model triggers a refresh."""
+        schedules = {
+            "https://weather": ModelRunSchedule([0, 6, 12, 18], delay_hours=4),
+            "https://marine": ModelRunSchedule([0, 12], delay_hours=7)
+        }
+        scheduler = PrefetchScheduler(pipeline_mock(), WATCHLIST, schedules=schedules, delay=0)
+        
+        assert scheduler.next_refresh(utc(2024, 1, 15, 4, 30)) == utc(2024, 1, 15, 7, 0)
+    
+    def test_flat_ttl_windows(self):
+        """Test refreshes follow CACHE_TTL_WEATHER windows without a schedule."""
+        scheduler = PrefetchScheduler(pipeline_mock(), WATCHLIST, schedules={}, delay=0)
+        window = settings.CACHE_TTL_WEATHER
+        
+        assert scheduler.next_refresh(10 * window + 1) == 11 * window
+
+
+class TestRefresh:
+    """Test refresh runs and reports."""
+    
+    def test_refresh_report(self):
+        """Test every location is detected and failures are reported."""
+        pipeline = pipeline_mock()
+        pipeline.detect_location.side_effect = [{"details": {"stale_data": True}}, APIError("upstream down")]
+        scheduler = PrefetchScheduler(pipeline, WATCHLIST, schedules={}, spread=0)
+        
+        report = scheduler.refresh()
+        
+        assert pipeline.detect_location.call_args.kwargs == {
+            "latitude": -20.1609, "longitude": 57.5012, "forecast_days": 7
+        }
+        assert report["refreshed"] == 1 and report["stale"] == 1 and report["failed"] == 1
+        assert report["errors"] == [{"location_name": "Maurice (Île)", "error": "upstream down"}]
+        assert scheduler.status()["last_refresh"] == report
+    
+    def test_background_thread(self):
+        """Test start refreshes immediately and schedules the next refresh."""
+        pipeline = pipeline_mock()
+        scheduler = PrefetchScheduler(pipeline, WATCHLIST, schedules={}, spread=0)
+        
+        scheduler.start()
+        deadline = time.time() + 5
+        while scheduler.status()["next_refresh"] is None and time.time() < deadline:
+            time.sleep(0.01)
+        status = scheduler.status()
+        scheduler.stop(timeout=5)
+        
+        assert status["running"]
+        assert status["last_refresh"]["refreshed"] == 2
+        assert len(status["watchlist"]) == 2
+        assert not scheduler.status()["running"]
+    
+    def test_stop_interrupts_spread(self):
+        """Test stop ends a spread-out refresh early."""
+        pipeline = pipeline_mock()
+        scheduler = PrefetchScheduler(pipeline, WATCHLIST, schedules={}, spread=60)
+        
+        scheduler.start()
+        deadline = time.time() + 5
+        while not pipeline.detect_location.called and time.time() < deadline:
+            time.sleep(0.01)
+        scheduler.stop(timeout=5)
+        
+        assert pipeline.detect_location.call_count == 1
+        assert scheduler.status()["last_refresh"]["refreshed"] == 1
+    
+    def test_refreshed_location_is_cache_hit(self, mock_weather_response, mock_marine_response):
+        """Test an interactive detect after a refresh makes no upstream call."""
+        client = APIClient(cache=ResponseCache(local=LRUCache(max_entries=10)))
+        weather = {**mock_weather_response, "hourly": {"surface_pressure": [975.0] * 72}}
+        
+        def send(url, **kwargs):
+            response = Mock(status_code=200, headers={})
+            body = mock_marine_response if url == settings.MARINE_API_URL else weather
+            response.content = json.dumps(body).encode()
+            return response
+        
+        client.session.get = Mock(side_effect=send)
+        pipeline = DetectionPipeline(
+            WeatherService(client),
+            MarineService(client, land_mask=None, sst_climatology=None)
+        )
+        scheduler = PrefetchScheduler(pipeline, WATCHLIST[:1], schedules={}, spread=0)
+        
+        report = scheduler.refresh()
+        fetched = client.session.get.call_count
+        pipeline.detect_location(latitude=-21.1151, longitude=55.5364, forecast_days=7)
+        pipeline.close()
+        
+        assert report["refreshed"] == 1
+        assert fetched == 2
+        assert client.session.get.call_count == fetched
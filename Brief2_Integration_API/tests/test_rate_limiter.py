@@ -0,0 +1,103 @@
+"""
+Tests for the token-bucket rate limiter.
+
+This module tests token pacing, Retry-After pauses and the limiter
+integration in APIClient.
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from src.utils.rate_limiter import TokenBucketRateLimiter
+from src.utils.error_handler import RateLimitError
+from tests.conftest import make_client, make_response
+
+
+class TestTokenBucketRateLimiter:
+    """Test TokenBucketRateLimiter."""
+    
+    def test_burst_then_paced(self):
+        """Test the burst is immediate and later tokens are paced."""
+        limiter = TokenBucketRateLimiter(rate=20, capacity=3)
+        
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        burst_elapsed = time.monotonic() - start
+        for _ in range(2):
+            limiter.acquire()
+        total_elapsed = time.monotonic() - start
+        
+        assert burst_elapsed < 0.03
+        assert total_elapsed >= 0.09
+    
+    def test_pause_blocks_callers(self):
+        """Test a pause delays the next token."""
+        limiter = TokenBucketRateLimiter(rate=100, capacity=10)
+        limiter.pause(0.1)
+        
+        start = time.monotonic()
+        limiter.acquire()
+        
+        assert time.monotonic() - start >= 0.09
+    
+    def test_timeout_raises_without_reserving(self):
+        """Test a wait longer than timeout raises RateLimitError."""
+        limiter = TokenBucketRateLimiter(rate=100)
+        limiter.pause(5)
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            limiter.acquire(timeout=0.01)
+        
+        assert exc_info.value.retry_after > 4
+    
+    def test_acquire_async(self):
+        """Test async acquisition honours pauses without blocking the loop."""
+        limiter = TokenBucketRateLimiter(rate=100)
+        limiter.pause(0.05)
+        
+        start = time.monotonic()
+        asyncio.run(limiter.acquire_async())
+        
+        assert time.monotonic() - start >= 0.04
+    
+    
+    def test_try_acquire_never_waits(self):
+        """Test try_acquire takes a ready token and refuses without reserving."""
+        limiter = TokenBucketRateLimiter(rate=1, capacity=1)
+        
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter._reserve(None) <= 1.0  # The refusal did not push the next slot back
+
+
+class TestAPIClientRateLimit:
+    """Test rate limiter integration in APIClient."""
+    
+    def test_429_pauses_and_retries(self):
+        """Test a 429 with Retry-After pauses the limiter and retries."""
+        limiter = TokenBucketRateLimiter(rate=100, capacity=10)
+        limiter.pause = Mock()
+        client = make_client(rate_limiter=limiter)
+        client.session.get = Mock(side_effect=[
+            make_response(429, headers={"Retry-After": "1"}),
+            make_response(200),
+        ])
+        
+        assert client.get("https://a") == {"ok": True}
+        limiter.pause.assert_called_once_with(1)
+        assert client.session.get.call_count == 2
+    
+    def test_429_without_limiter_raises(self):
+        """Test a 429 is not retried when no limiter is configured."""
+        client = make_client()
+        client.session.get = Mock(return_value=make_response(429, headers={"Retry-After": "7"}))
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            client.get("https://a")
+        
+        assert exc_info.value.retry_after == 7
+        assert client.session.get.call_count == 1
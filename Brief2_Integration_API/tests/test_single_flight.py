@@ -0,0 +1,183 @@
+"""
+Tests for single-flight request coalescing.
+
+This module tests that concurrent identical calls share one upstream
+request in both the threaded and the asyncio implementations.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import Mock
+
+from src.utils.api_client import APIClient
+from src.utils.single_flight import SingleFlight, AsyncSingleFlight
+from src.utils.error_handler import APIError, TimeoutError as CustomTimeoutError
+
+
+class TestSingleFlight:
+    """Test thread-based coalescing."""
+    
+    def test_concurrent_callers_share_one_call(self):
+        """Test many threads with the same key run fn once."""
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+        
+        def fetch():
+            calls.append(1)
+            release.wait(timeout=2)
+            return {"value": 42}
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(flight.do, "key", fetch) for _ in range(8)]
+            while flight.in_flight() == 0:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+        
+        assert len(calls) == 1
+        assert all(r == {"value": 42} for r in results)
+        assert flight.in_flight() == 0
+    
+    def test_exception_shared_and_flight_cleared(self):
+        """Test errors propagate and the next call starts a new flight."""
+        flight = SingleFlight()
+        
+        with pytest.raises(APIError):
+            flight.do("key", Mock(side_effect=APIError("down")))
+        
+        assert flight.do("key", lambda: "ok") == "ok"
+    
+    
+    def test_follower_timeout_leaves_leader_running(self):
+        """Test a follower gives up at its timeout while the leader completes."""
+        flight = SingleFlight()
+        release = threading.Event()
+        
+        def fetch():
+            release.wait(timeout=2)
+            return "ok"
+        
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(flight.do, "key", fetch)
+            while flight.in_flight() == 0:
+                time.sleep(0.01)
+            
+            start = time.monotonic()
+            with pytest.raises(CustomTimeoutError):
+                flight.do("key", fetch, timeout=0.05)
+            waited = time.monotonic() - start
+            
+            release.set()
+            assert leader.result() == "ok"
+        
+        assert waited < 0.5
+
+
+class TestAsyncSingleFlight:
+    """Test asyncio coalescing."""
+    
+    def test_concurrent_tasks_share_one_call(self):
+        """Test concurrent coroutines with the same key await fn once."""
+        flight = AsyncSingleFlight()
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "payload"
+        
+        async def run():
+            return await asyncio.gather(*(flight.do("key", fetch) for _ in range(20)))
+        
+        results = asyncio.run(run())
+        
+        assert len(calls) == 1
+        assert results == ["payload"] * 20
+    
+    
+    def test_follower_timeout(self):
+        """Test an awaiting follower gives up at its timeout without cancelling the leader."""
+        flight = AsyncSingleFlight()
+        
+        async def fetch():
+            await asyncio.sleep(0.2)
+            return "payload"
+        
+        async def run():
+            leader = asyncio.ensure_future(flight.do("key", fetch))
+            await asyncio.sleep(0)
+            with pytest.raises(CustomTimeoutError):
+                await flight.do("key", fetch, timeout=0.02)
+            return await leader
+        
+        assert asyncio.run(run()) == "payload"
+
+
+class TestAPIClientCoalescing:
+    """Test coalescing in APIClient.get."""
+    
+    def test_identical_concurrent_gets_hit_network_once(self):
+        """Test concurrent identical GETs issue a single upstream request."""
+        client = APIClient()
+        client.cache = None  # Independent of CACHE_ENABLED
+        release = threading.Event()
+        response = Mock(status_code=200)
+        response.content = json.dumps({"daily": {}}).encode()
+        
+        def slow_get(*args, **kwargs):
+            release.wait(timeout=2)
+            return response
+        
+        client.session.get = Mock(side_effect=slow_get)
+        
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [
+                pool.submit(client.get, "https://a", {"latitude": -21.1, "longitude": 55.5})
+                for _ in range(5)
+            ]
+            while client.single_flight.in_flight() == 0:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+        
+        assert client.session.get.call_count == 1
+        assert all(r == {"daily": {}} for r in results)
+    
+    def test_follower_deadline_honoured(self):
+        """Test a follower with a deadline does not wait for a slower leader."""
+        client = APIClient()
+        client.cache = None  # Independent of CACHE_ENABLED
+        release = threading.Event()
+        response = Mock(status_code=200)
+        response.content = json.dumps({"daily": {}}).encode()
+        
+        def slow_get(*args, **kwargs):
+            release.wait(timeout=2)
+            return response
+        
+        client.session.get = Mock(side_effect=slow_get)
+        params = {"latitude": -21.1, "longitude": 55.5}
+        
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            leader = pool.submit(client.get, "https://a", params)
+            while client.single_flight.in_flight() == 0:
+                time.sleep(0.01)
+            
+            start = time.monotonic()
+            with pytest.raises(CustomTimeoutError):
+                client.get("https://a", params, deadline=0.1)
+            waited = time.monotonic() - start
+            
+            release.set()
+            assert leader.result() == {"daily": {}}
+        
+        assert waited < 0.5
+        assert client.session.get.call_count == 1
@@ -0,0 +1,234 @@
+"""
+Tests for the SST pipeline.
+
+This module tests the monthly SST climatology, the hourly SST aggregation
+in MarineService and the SST sources used by CycloneDetector and
+GridScanner.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.services.cyclone_detector import CycloneDetector
+from src.services.grid_scanner import GridScanner
+from src.services.marine_service import AsyncMarineService, MarineService
+from src.utils.error_handler import ConfigurationError
+from src.utils.sst_climatology import SSTClimatology, month_index, regrid_climatology
+from tests.conftest import to_frame
+
+
+@pytest.fixture
+def climatology():
+    """10° climatology at 20°C + month, with no data north of 60°N."""
+    grid = np.empty((12, 18, 36), dtype=np.float32)
+    grid[:] = 20.0 + np.arange(12, dtype=np.float32)[:, None, None]
+    grid[:, 15:, :] = np.nan
+    return SSTClimatology(grid)
+
+
+def hourly_sst(days, values):
+    """Hourly SST block with one constant value per day (None for a missing day)."""
+    return [value for value in values for _ in range(24)][:days * 24]
+
+
+class TestSSTClimatology:
+    """Test lookup, loading and regridding."""
+    
+    def test_month_index(self):
+        """Test dates map to zero-based months."""
+        assert month_index("2024-01-15") == 0
+        assert month_index("2024-12-31") == 11
+        with pytest.raises(ValueError):
+            month_index("2024-13-01")
+    
+    def test_lookup(self, climatology):
+        """Test values per month and NaN cells."""
+        assert climatology.lookup(-21.1, 55.5, 0) == 20.0
+        assert climatology.lookup(-21.1, 55.5, 2) == 22.0
+        assert climatology.lookup(75.0, 0.0, 0) is None
+        assert climatology.lookup(90.0, 180.0, 0) is None
+    
+    def test_lookup_many_broadcasts(self, climatology):
+        """Test (locations, 1) coordinates and per-day months give (locations, days)."""
+        latitudes = np.array([[-21.1], [75.0]])
+        longitudes = np.array([[55.5], [0.0]])
+        
+        sst = climatology.lookup_many(latitudes, longitudes, [0, 1, 11])
+        
+        assert sst.shape == (2, 3)
+        assert sst[0].tolist() == [20.0, 21.0, 31.0]
+        assert np.isnan(sst[1]).all()
+    
+    def test_load_memory_mapped(self, climatology, tmp_path):
+        """Test a saved grid is opened memory-mapped."""
+        path = tmp_path / "sst_climatology.npy"
+        np.save(path, climatology.grid)
+        
+        loaded = SSTClimatology.load(str(path))
+        
+        assert isinstance(loaded.grid, np.memmap)
+        assert loaded.resolution == 10.0
+        assert loaded.lookup(-21.1, 55.5, 5) == 25.0
+    
+    def test_invalid_shape(self):
+        """Test a grid without 12 global layers raises ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            SSTClimatology(np.zeros((12, 10, 10), dtype=np.float32))
+        with pytest.raises(ConfigurationError):
+            SSTClimatology(np.zeros((6, 10, 20), dtype=np.float32))
+    
+    def test_regrid_0_360_longitudes(self):
+        """Test a 0..360 source lands on the -180..180 layout."""
+        latitudes = np.array([60.0, 0.0, -60.0])  # Descending, as in OISST files
+        longitudes = np.arange(0.0, 360.0, 90.0)
+        sst = np.broadcast_to(longitudes, (12, 3, 4)).astype(np.float32)
+        
+        grid = regrid_climatology(latitudes, longitudes, sst, 90.0)
+        
+        assert grid.shape == (12, 2, 4)
+        assert grid[0, 0].tolist() == [180.0, 270.0, 0.0, 90.0]
+
+
+class TestMarineSST:
+    """Test hourly SST in MarineService."""
+    
+    def test_forecast_requests_hourly_sst(self, mock_marine_response):
+        """Test SST is fetched in the same call as waves and averaged per day."""
+        client = Mock()
+        client.get.return_value = {
+            **mock_marine_response,
+            "hourly": {"sea_surface_temperature": hourly_sst(3, [27.0, None, 28.5])}
+        }
+        service = MarineService(client, sst_climatology=None)
+        
+        result = service.get_marine_forecast(-21.1151, 55.5364, forecast_days=3)
+        
+        assert client.get.call_count == 1
+        assert client.get.call_args.kwargs["params"]["hourly"] == ["sea_surface_temperature"]
+        assert [day["ocean_sst"] for day in result["marine_forecast"]] == [27.0, None, 28.5]
+    
+    def test_get_sst_hourly_mean(self, mock_marine_response):
+        """Test get_sst returns the first day's hourly mean."""
+        client = Mock()
+        client.get.return_value = {
+            **mock_marine_response,
+            "hourly": {"sea_surface_temperature": [26.0] * 12 + [28.0] * 12}
+        }
+        service = MarineService(client)
+        
+        result = service.get_sst(-21.1151, 55.5364)
+        
+        assert result["sst"]["temperature"] == 27.0
+        assert result["sst"]["source"] == "marine"
+    
+    def test_get_sst_climatology_fallback(self, climatology, mock_marine_response):
+        """Test get_sst falls back to the climatology of the date's month."""
+        client = Mock()
+        client.get.return_value = mock_marine_response
+        service = MarineService(client, sst_climatology=climatology)
+        
+        result = service.get_sst(-21.1151, 55.5364)
+        
+        assert result["sst"]["date"] == "2024-01-15"
+        assert result["sst"]["temperature"] == 20.0
+        assert result["sst"]["source"] == "climatology"
+    
+    def test_async_get_sst_climatology_fallback(self, climatology, mock_marine_response):
+        """Test the async service accepts and falls back to a climatology."""
+        client = Mock()
+        client.get = AsyncMock(return_value=mock_marine_response)
+        service = AsyncMarineService(client, land_mask=None, sst_climatology=climatology)
+        
+        result = asyncio.run(service.get_sst(-21.1151, 55.5364))
+        
+        assert result["sst"]["temperature"] == 20.0
+        assert result["sst"]["source"] == "climatology"
+
+
+class TestDetectorSST:
+    """Test SST sources in CycloneDetector and GridScanner."""
+    
+    @pytest.fixture
+    def weather_data(self):
+        """Two-day forecast off La Réunion."""
+        day = {
+            "temperature_2m_max": 20.0,
+            "temperature_2m_min": 18.0,
+            "surface_pressure": 1010.0,
+            "wind_speed_10m_max": 20.0
+        }
+        return {
+            "location": {"latitude": -21.1151, "longitude": 55.5364},
+            "forecast": [{"date": "2024-01-15", **day}, {"date": "2024-02-01", **day}]
+        }
+    
+    def test_marine_forecast_sst(self, weather_data):
+        """Test the daily SST of a marine forecast is used first."""
+        detector = CycloneDetector(sst_climatology=None)
+        marine_data = {"marine_forecast": [
+            {"date": "2024-01-15", "ocean_sst": 28.5},
+            {"date": "2024-02-01", "ocean_sst": None}
+        ]}
+        
+        result = detector.detect(weather_data, marine_data=marine_data, horizon=True)
+        
+        assert result["conditions"]["sst"]["value"] == 28.5
+        assert result["details"]["sst_source"] == "marine"
+        # Second day has no marine SST and falls back to the estimate
+        assert result["horizon"]["severity_series"][1] == detector.detect_horizon(
+            weather_data["forecast"][1:]
+        )["severity_series"][0]
+    
+    def test_climatology_sst(self, climatology, weather_data):
+        """Test the climatology replaces the air temperature estimate, per month."""
+        detector = CycloneDetector(sst_climatology=climatology)
+        
+        result = detector.detect(weather_data, horizon=True)
+        
+        assert result["conditions"]["sst"]["value"] == 20.0
+        assert result["details"]["sst_source"] == "climatology"
+        expected = detector.detect_horizon(weather_data["forecast"], [20.0, 21.0])
+        assert result["horizon"]["severity_series"] == expected["severity_series"]
+    
+    def test_estimated_sst(self, weather_data):
+        """Test the estimate is the last resort."""
+        detector = CycloneDetector(sst_climatology=None)
+        
+        result = detector.detect(weather_data)
+        
+        assert result["conditions"]["sst"]["value"] == 20.5
+        assert result["details"]["sst_source"] == "estimated"
+    
+    def test_provided_sst(self, climatology, weather_data):
+        """Test an explicit SST wins over every other source."""
+        detector = CycloneDetector(sst_climatology=climatology)
+        
+        result = detector.detect(weather_data, sst=29.0)
+        
+        assert result["conditions"]["sst"]["value"] == 29.0
+        assert result["details"]["sst_source"] == "provided"
+    
+    def test_grid_scan_uses_climatology(self, climatology):
+        """Test grid cells score climatological SST where available."""
+        weather_service = Mock()
+        weather_service.get_forecast_many.side_effect = lambda cells, **kwargs: [
+            to_frame({"location": {}, "forecast": [{
+                "date": "2024-12-15",
+                "temperature_2m_max": 20.0,
+                "temperature_2m_min": 18.0,
+                "surface_pressure": 1010.0,
+                "wind_speed_10m_max": 20.0
+            }]})
+            for _ in cells
+        ]
+        detector = CycloneDetector(sst_climatology=climatology)
+        scanner = GridScanner(weather_service, detector, skip_land=False, batch_size=100)
+        
+        result = scanner.scan((55.0, 65.0, 0.0, 10.0), resolution=10.0, forecast_days=1)
+        
+        # 31°C from the December climatology at 55°N, estimated 20.5°C at 65°N
+        expected = detector.detect_batch([31.0, 20.5], 1010.0, 20.0)["severity_score"]
+        assert result.severity[0, :, 0].tolist() == expected.tolist()
@@ -0,0 +1,159 @@
+"""
+Tests for incremental result streaming.
+
+This module tests bounded lazy submission, cancellation on close and the
+NDJSON/SSE framing, plus the streaming detection and scan iterators.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from unittest.mock import Mock
+
+from src.services.detection_pipeline import DetectionPipeline
+from src.services.grid_scanner import GridScanner
+from src.utils.streaming import iter_completed, json_safe, ndjson_line, sse_event
+from tests.conftest import to_frame
+
+
+class TestIterCompleted:
+    """Test bounded lazy submission."""
+    
+    def test_yields_every_item(self):
+        """Test all results come back with their item."""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = {item: future.result() for item, future in iter_completed(executor, lambda x: x * 2, range(10), 3)}
+        
+        assert results == {x: x * 2 for x in range(10)}
+    
+    def test_bounded_in_flight(self):
+        """Test items are only submitted as results are consumed."""
+        submitted = []
+        items = (submitted.append(x) or x for x in range(10))
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            stream = iter_completed(executor, lambda x: x, items, 2)
+            next(stream)
+            
+            # Two submitted up front, one more when the first is handed out
+            assert len(submitted) == 3
+            stream.close()
+    
+    def test_close_cancels_pending(self):
+        """Test closing the iterator cancels items not started yet."""
+        release = threading.Event()
+        calls = []
+        
+        def work(x):
+            calls.append(x)
+            if x > 0:
+                release.wait(2)
+            return x
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            stream = iter_completed(executor, work, range(5), 3)
+            item, _ = next(stream)
+            stream.close()
+            release.set()
+        
+        assert item == 0
+        # Items 2 and 3 were cancelled before starting, item 4 never submitted
+        assert set(calls) <= {0, 1}
+    
+    def test_errors_in_future(self):
+        """Test exceptions are delivered through the future."""
+        def fail(x):
+            raise ValueError(x)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            (item, future), = list(iter_completed(executor, fail, [1], 1))
+        
+        assert isinstance(future.exception(), ValueError)
+
+
+class TestFraming:
+    """Test NDJSON and SSE framing."""
+    
+    def test_json_safe(self):
+        """Test non-finite floats become None."""
+        assert json_safe({"a": [1.0, float("nan")], "b": (float("inf"), "x")}) == {"a": [1.0, None], "b": [None, "x"]}
+    
+    def test_ndjson_line(self):
+        """Test one compact JSON document per line."""
+        line = ndjson_line({"name": "La Réunion", "value": float("nan")})
+        
+        assert line.endswith("\n") and line.count("\n") == 1
+        assert json.loads(line) == {"name": "La Réunion", "value": None}
+    
+    def test_sse_event(self):
+        """Test id, event and data fields."""
+        assert sse_event({"a": 1}, "result", 3) == 'id: 3\nevent: result\ndata: {"a":1}\n\n'
+        assert sse_event({"done": True}) == 'data: {"done":true}\n\n'
+
+
+class TestStreamingServices:
+    """Test iter_detect_many and iter_scan."""
+    
+    def test_iter_detect_many_chunks(self, cyclone_conditions):
+        """Test chunks are fetched separately and every location is yielded once."""
+        weather_service = Mock()
+        weather_service.get_forecast_many.side_effect = lambda locations, **kwargs: [cyclone_conditions] * len(locations)
+        marine_service = Mock()
+        marine_service.get_marine_forecast_many.side_effect = lambda locations, **kwargs: [None] * len(locations)
+        pipeline = DetectionPipeline(weather_service, marine_service)
+        locations = [(-21.0 + i * 0.1, 55.0) for i in range(5)]
+        
+        results = dict(pipeline.iter_detect_many(
+            locations,
+            analysis_dates=[None, None, "2024-01-15", None, None],
+            chunk_size=2
+        ))
+        
+        assert sorted(results) == list(range(5))
+        assert all(result["category"] for result in results.values())
+        # Real-time group of 4 in 2 chunks, historical group of 1
+        assert weather_service.get_forecast_many.call_count == 3
+        pipeline.close()
+    
+    def test_iter_detect_many_chunk_error(self, cyclone_conditions):
+        """Test a failing chunk yields its error for each of its locations."""
+        weather_service = Mock()
+        weather_service.get_forecast_many.side_effect = RuntimeError("boom")
+        pipeline = DetectionPipeline(weather_service, Mock())
+        
+        results = dict(pipeline.iter_detect_many([(-21.0, 55.0), (-20.0, 55.0)]))
+        
+        assert all(isinstance(result, RuntimeError) for result in results.values())
+        pipeline.close()
+    
+    def test_iter_scan_matches_scan(self):
+        """Test streamed cells carry the same severities as a dense scan."""
+        def forecast_many(cells, **kwargs):
+            return [
+                to_frame({"location": {}, "forecast": [{
+                    "date": "2024-01-15",
+                    "temperature_2m_max": 28.0,
+                    "temperature_2m_min": 24.0,
+                    "surface_pressure": 1000.0 - lat,
+                    "wind_speed_10m_max": 60.0
+                }]})
+                for lat, _ in cells
+            ]
+        
+        weather_service = Mock()
+        weather_service.get_forecast_many.side_effect = forecast_many
+        scanner = GridScanner(weather_service, skip_land=False, batch_size=4)
+        bbox = (-22.0, -20.0, 54.0, 56.0)
+        
+        cells = list(scanner.iter_scan(bbox, resolution=1.0, forecast_days=1))
+        dense = scanner.scan(bbox, resolution=1.0, forecast_days=1)
+        
+        assert len(cells) == 9
+        for cell in cells:
+            row = int(np.flatnonzero(dense.latitudes == cell["latitude"])[0])
+            col = int(np.flatnonzero(dense.longitudes == cell["longitude"])[0])
+            assert cell["severity_series"] == [dense.severity[0, row, col]]
+            assert cell["min_pressure"] == 1000.0 - cell["latitude"]
+            assert cell["dates"] == ["2024-01-15"]
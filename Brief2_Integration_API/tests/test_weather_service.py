@@ -7,7 +7,9 @@ This module tests weather API integration and data parsing.
 import pytest
 from unittest.mock import Mock, patch
 
+from src.services.forecast_frame import ForecastFrame
 from src.services.weather_service import WeatherService
+from src.utils.batching import snap_coordinate
 from src.utils.error_handler import ValidationError, DataNotFoundError
 
 
@@ -46,6 +48,16 @@ class TestWeatherServiceGetForecast:
         assert "date" in result["forecast"][0]
         assert "temperature_2m_max" in result["forecast"][0]
     
+    def test_get_forecast_frame(self, mock_api_client, mock_weather_response, valid_coordinates):
+        """Test get_forecast_frame returns the frame get_forecast flattens."""
+        mock_api_client.get.return_value = mock_weather_response
+        service = WeatherService(api_client=mock_api_client)
+        
+        frame = service.get_forecast_frame(valid_coordinates["latitude"], valid_coordinates["longitude"])
+        
+        assert isinstance(frame, ForecastFrame)
+        assert frame.to_dict() == service.get_forecast(valid_coordinates["latitude"], valid_coordinates["longitude"])
+    
     @pytest.mark.parametrize("forecast_days", [1, 7, 16])
     def test_get_forecast_various_days(self, mock_api_client, mock_weather_response, valid_coordinates, forecast_days):
         """Test forecast with various day counts."""
@@ -157,3 +169,111 @@ class TestWeatherServiceValidation:
         
         with pytest.raises(ValidationError):
             service._validate_coordinates(lat, lon)
+
+
+class TestWeatherServiceGetForecastMany:
+    """Test get_forecast_many method."""
+    
+    def test_get_forecast_many_single_request(self, mock_api_client, mock_weather_response):
+        """Test several locations are fetched with one multi-coordinate call."""
+        mock_api_client.get.return_value = [mock_weather_response, mock_weather_response]
+        service = WeatherService(api_client=mock_api_client)
+        
+        results = service.get_forecast_many([(-21.1, 55.5), (-20.2, 57.5)], forecast_days=3)
+        
+        assert mock_api_client.get.call_count == 1
+        params = mock_api_client.get.call_args.kwargs["params"]
+        assert params["latitude"] == "-21.1,-20.2"
+        assert params["longitude"] == "55.5,57.5"
+        assert [r["location"]["latitude"] for r in results] == [-21.1, -20.2]
+        assert len(results[1]["forecast"]) == 3
+    
+    def test_get_forecast_many_chunks_long_lists(self, mock_api_client, mock_weather_response):
+        """Test long coordinate lists are split into several requests."""
+        def respond(url, params, deadline=None):
+            count = len(params["latitude"].split(","))
+            return [mock_weather_response] * count if count > 1 else mock_weather_response
+        
+        mock_api_client.get.side_effect = respond
+        service = WeatherService(api_client=mock_api_client, snap_resolution=0)
+        locations = [(-20.0 - i * 0.01, 55.0 + i * 0.01) for i in range(250)]
+        
+        stats = {}
+        
+        results = service.get_forecast_many(locations, stats=stats)
+        
+        assert mock_api_client.get.call_count == 3
+        assert stats == {"requests": 3}
+        assert len(results) == 250
+        assert results[249]["location"]["latitude"] == locations[249][0]
+    
+    def test_get_forecast_many_as_frame(self, mock_api_client, mock_weather_response):
+        """Test as_frame returns ForecastFrames with the same dict view."""
+        mock_api_client.get.return_value = [mock_weather_response, mock_weather_response]
+        service = WeatherService(api_client=mock_api_client)
+        locations = [(-21.1, 55.5), (-20.2, 57.5)]
+        
+        frames = service.get_forecast_many(locations, forecast_days=3, as_frame=True)
+        
+        assert all(isinstance(frame, ForecastFrame) for frame in frames)
+        assert frames[1].latitude == -20.2
+        assert [frame.to_dict() for frame in frames] == service.get_forecast_many(locations, forecast_days=3)
+    
+    def test_get_forecast_many_return_exceptions(self, mock_api_client, mock_weather_response):
+        """Test per-location parse errors are returned instead of raised."""
+        mock_api_client.get.return_value = [mock_weather_response, {"daily": {}}]
+        service = WeatherService(api_client=mock_api_client)
+        
+        results = service.get_forecast_many([(-21.1, 55.5), (-20.2, 57.5)], return_exceptions=True)
+        
+        assert "forecast" in results[0]
+        assert isinstance(results[1], DataNotFoundError)
+    
+    def test_get_forecast_many_invalid_location(self, mock_api_client):
+        """Test an invalid location rejects the whole batch before any call."""
+        service = WeatherService(api_client=mock_api_client)
+        
+        with pytest.raises(ValidationError):
+            service.get_forecast_many([(-21.1, 55.5), (-95.0, 57.5)])
+        
+        mock_api_client.get.assert_not_called()
+
+
+class TestWeatherServiceSnapping:
+    """Test coordinate snapping to the model grid."""
+    
+    def test_snap_coordinate(self):
+        """Test coordinates round to the grid without float noise."""
+        assert snap_coordinate(-21.1151, 55.5364, 0.1) == (-21.1, 55.5)
+        assert snap_coordinate(-21.1149, 55.5361, 0.1) == (-21.1, 55.5)
+        assert snap_coordinate(-12.376, 45.126, 0.25) == (-12.5, 45.25)
+        assert snap_coordinate(89.99, 179.99, 0.25) == (90.0, 180.0)
+        assert snap_coordinate(-21.1151, 55.5364, 0) == (-21.1151, 55.5364)
+    
+    def test_nearby_points_share_request(self, mock_api_client, mock_weather_response):
+        """Test nearby points send identical parameters but keep their own location."""
+        mock_api_client.get.return_value = mock_weather_response
+        service = WeatherService(api_client=mock_api_client, snap_resolution=0.1)
+        
+        first = service.get_forecast(-21.1151, 55.5364, forecast_days=3)
+        second = service.get_forecast(-21.1149, 55.5361, forecast_days=3)
+        
+        first_params, second_params = (call.kwargs["params"] for call in mock_api_client.get.call_args_list)
+        assert first_params == second_params
+        assert (first_params["latitude"], first_params["longitude"]) == (-21.1, 55.5)
+        assert first["location"] == {"latitude": -21.1151, "longitude": 55.5364}
+        assert second["location"] == {"latitude": -21.1149, "longitude": 55.5361}
+    
+    def test_many_coalesces_same_cell(self, mock_api_client, mock_weather_response):
+        """Test points in the same grid cell are requested once."""
+        mock_api_client.get.return_value = [mock_weather_response, mock_weather_response]
+        service = WeatherService(api_client=mock_api_client, snap_resolution=0.1)
+        locations = [(-21.1151, 55.5364), (-20.1609, 57.5012), (-21.1149, 55.5361)]
+        
+        results = service.get_forecast_many(locations, forecast_days=3)
+        
+        params = mock_api_client.get.call_args.kwargs["params"]
+        assert params["latitude"] == "-21.1,-20.2"
+        assert params["longitude"] == "55.5,57.5"
+        assert [result["location"]["latitude"] for result in results] == [-21.1151, -20.1609, -21.1149]
+        assert results[0] is not results[2]